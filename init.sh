@@ -474,13 +474,29 @@ start_daemon() {
     # CRITICAL: Pass --project-root and export env vars so the CLI uses the
     # same paths we computed above. Without this, the CLI re-discovers the
     # project from CWD which may find a worktree's .claude/ instead of ours.
-    CLAUDE_HOOKS_SOCKET_PATH="$SOCKET_PATH" \
-    CLAUDE_HOOKS_PID_PATH="$PID_PATH" \
-    $PYTHON_CMD -m claude_code_hooks_daemon.daemon.cli \
-        --project-root "$PROJECT_PATH" start \
-        > /dev/null 2>&1
+    # `start` blocks until the daemon reports readiness over a pipe, so a zero
+    # exit means the socket is accepting requests and a non-zero exit carries
+    # the startup error. Safe to capture: the daemon itself detaches from our
+    # stdout/stderr.
+    local start_output
+    if ! start_output=$(
+        CLAUDE_HOOKS_SOCKET_PATH="$SOCKET_PATH" \
+        CLAUDE_HOOKS_PID_PATH="$PID_PATH" \
+        $PYTHON_CMD -m claude_code_hooks_daemon.daemon.cli \
+            --project-root "$PROJECT_PATH" start 2>&1
+    ); then
+        # Leave the PID file alone: it may belong to a daemon started by a
+        # concurrent hook, and is_daemon_running() clears stale ones
+        echo "${start_output:-ERROR: Daemon startup failed}" >&2
+        return 1
+    fi
+
+    if [[ -S "$SOCKET_PATH" ]]; then
+        return 0
+    fi
 
-    # Wait for socket to be ready (using deciseconds for integer arithmetic)
+    # Another start won the race ("already running") and may still be binding:
+    # wait for its socket (using deciseconds for integer arithmetic)
     local elapsed=0
     while [[ $elapsed -lt $DAEMON_STARTUP_TIMEOUT ]]; do
         if [[ -S "$SOCKET_PATH" ]]; then
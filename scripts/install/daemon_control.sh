@@ -166,10 +166,10 @@ check_daemon_running() {
 # restart_daemon_verified() - Restart daemon and verify it's running
 #
 # Performs full restart cycle with verification:
-# 1. Stop daemon (safe)
-# 2. Start daemon
-# 3. Check status
-# 4. Verify config validation passes
+# 1. Restart daemon with socket handoff (hooks never find it down; the CLI
+#    falls back to stop + start when no daemon is running or handoff fails)
+# 2. Check status
+# 3. Verify config validation passes
 #
 # This is the recommended high-level function for daemon restarts.
 #
@@ -198,25 +198,27 @@ restart_daemon_verified() {
 
     print_info "Restarting daemon..."
 
-    # Step 1: Stop daemon
-    stop_daemon_safe "$venv_python"
-    sleep 1
-
-    # Step 2: Start daemon
-    if ! start_daemon_safe "$venv_python"; then
+    # Step 1: Restart daemon, handing over the socket (capture output so errors are visible)
+    local restart_output
+    if ! restart_output=$("$venv_python" -m claude_code_hooks_daemon.daemon.cli restart --handoff 2>&1); then
         print_error "Failed to start daemon"
+        if [ -n "$restart_output" ]; then
+            echo ""
+            echo "$restart_output"
+            echo ""
+        fi
         return 1
     fi
 
     # Give daemon time to start
     sleep 2
 
-    # Step 3: Get status
+    # Step 2: Get status
     print_verbose "Checking daemon status..."
     local status_output
     status_output=$(get_daemon_status "$venv_python")
 
-    # Step 4: Verify running
+    # Step 3: Verify running
     if ! echo "$status_output" | grep -qE "(Daemon|Status): RUNNING"; then
         print_error "Daemon is not running after restart"
         echo ""
@@ -227,7 +229,7 @@ restart_daemon_verified() {
 
     print_success "Daemon is running"
 
-    # Step 5: Check for config validation errors (if requested)
+    # Step 4: Check for config validation errors (if requested)
     if [ "$verify_config" = "true" ]; then
         if echo "$status_output" | grep -qi "config.*error\|validation.*failed\|invalid.*config"; then
             print_warning "Daemon started but config validation may have issues"
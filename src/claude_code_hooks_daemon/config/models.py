@@ -345,6 +345,221 @@ class InputValidationConfig(BaseModel):
     )
 
 
+class TrafficCaptureConfig(BaseModel):
+    """Configuration for opt-in request/response traffic capture.
+
+    When enabled, every hook request the daemon serves is appended to a
+    JSONL capture file together with its response, decision, latency and
+    per-handler timings. Captures feed the ``replay`` CLI command.
+
+    Attributes:
+        enabled: Record traffic to the capture file
+        path: Capture file path (None = daemon untracked directory)
+        max_file_bytes: Rotate the capture file once it exceeds this size
+        backup_count: Number of rotated capture files to keep
+        redact: Content redaction mode - none, redact (placeholder) or hash
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = Field(default=False, description="Record request/response traffic")
+    path: str | None = Field(
+        default=None,
+        description="Capture file path (None = capture-{hostname}.jsonl in untracked dir)",
+    )
+    max_file_bytes: Annotated[int, Field(ge=1024)] = Field(
+        default=10 * 1024 * 1024,
+        description="Rotate capture file after this many bytes",
+    )
+    backup_count: Annotated[int, Field(ge=0, le=100)] = Field(
+        default=3,
+        description="Rotated capture files to keep",
+    )
+    redact: Literal["none", "redact", "hash"] = Field(
+        default="none",
+        description="Redact file contents and prompts: 'none', 'redact' (placeholder) or 'hash' (sha256 prefix)",
+    )
+
+
+class SessionSnapshotConfig(BaseModel):
+    """Configuration for carrying warm session state across daemon restarts.
+
+    On shutdown (idle timeout, stop, restart) the daemon writes its handler
+    decision history, StatusLine session state, pseudo-event counters and
+    nitpick transcript offsets to a snapshot file. The next daemon restores
+    it when it serves its first request.
+
+    Attributes:
+        enabled: Write a snapshot on shutdown and restore it on start
+        path: Snapshot file path (None = daemon untracked directory)
+        max_age_hours: Discard snapshots, and history records, older than this
+        max_sessions: Keep per-session state for this many most recent sessions
+        max_bytes: Upper bound on the snapshot size (oldest history dropped first)
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = Field(default=True, description="Persist session state across restarts")
+    path: str | None = Field(
+        default=None,
+        description="Snapshot file path (None = session-snapshot-{hostname}.json in untracked dir)",
+    )
+    max_age_hours: Annotated[float, Field(gt=0, le=24 * 30)] = Field(
+        default=24.0,
+        description="Snapshots and history records older than this are not restored",
+    )
+    max_sessions: Annotated[int, Field(ge=1, le=1000)] = Field(
+        default=20,
+        description="Per-session state (pseudo-event counters, nitpick offsets) kept for this many most recent sessions",
+    )
+    max_bytes: Annotated[int, Field(ge=1024)] = Field(
+        default=1024 * 1024,
+        description="Maximum snapshot size; the oldest history records are dropped to fit",
+    )
+
+
+class HistoryStoreConfig(BaseModel):
+    """Configuration for the persistent handler decision store.
+
+    When enabled, every handler decision is also written (batched, from a
+    background thread) to a SQLite database that the ``history`` CLI
+    command queries for per-project analytics.
+
+    Attributes:
+        enabled: Persist handler decisions to SQLite
+        path: Database path (None = daemon untracked directory)
+        retention_days: Delete decisions older than this
+        flush_interval_seconds: Longest a decision waits in memory before being written
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = Field(default=False, description="Persist handler decisions to SQLite")
+    path: str | None = Field(
+        default=None,
+        description="Database path (None = handler-history-{hostname}.db in untracked dir)",
+    )
+    retention_days: Annotated[float, Field(gt=0, le=3650)] = Field(
+        default=30.0,
+        description="Decisions older than this are deleted",
+    )
+    flush_interval_seconds: Annotated[float, Field(gt=0, le=60)] = Field(
+        default=1.0,
+        description="Seconds between batched writes",
+    )
+
+
+class SessionRegistryConfig(BaseModel):
+    """Configuration for per-session data layer partitions.
+
+    Each Claude Code session gets its own handler decision history,
+    StatusLine state and transcript cache. A partition, and the session's
+    pseudo-event state, is dropped when the session ends, after it has
+    been idle for ``idle_timeout_minutes``, or when more than
+    ``max_sessions`` sessions are live (least recently used first).
+
+    Attributes:
+        max_sessions: Most session partitions kept in memory
+        idle_timeout_minutes: Drop a session's partition after this long without events
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    max_sessions: Annotated[int, Field(ge=1, le=10000)] = Field(
+        default=200,
+        description="Most session partitions kept in memory (least recently used dropped first)",
+    )
+    idle_timeout_minutes: Annotated[float, Field(gt=0, le=7 * 24 * 60)] = Field(
+        default=120.0,
+        description="Drop a session's partition after this many minutes without events",
+    )
+
+
+class ExecutorLaneConfig(BaseModel):
+    """One executor lane: a thread pool serving a class of hook events.
+
+    Lanes keep slow work (linting on PostToolUse, transcript parsing on
+    Stop) from delaying events that must answer in milliseconds (status
+    line, PreToolUse).
+
+    Attributes:
+        events: Event types served (e.g. "Status", "PreToolUse"); empty = every event no other lane lists
+        max_workers: Worker threads (None = daemon.executor_max_workers, or the Python default)
+        max_queue: Most requests waiting for a worker before new ones are rejected (None = no limit)
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    events: list[str] = Field(
+        default_factory=list,
+        description="Event types served by this lane; empty = all events not listed by another lane",
+    )
+    max_workers: Annotated[int, Field(ge=1, le=256)] | None = Field(
+        default=None,
+        description="Worker threads (None = daemon.executor_max_workers or the Python default)",
+    )
+    max_queue: Annotated[int, Field(ge=1)] | None = Field(
+        default=None,
+        description="Requests allowed to wait for a worker; more are rejected (None = no limit)",
+    )
+
+
+class LoadSheddingConfig(BaseModel):
+    """Configuration for shedding low-priority handlers under load.
+
+    While recent p95 request latency or the number of requests waiting
+    for a worker is over its threshold, non-terminal handlers at or above
+    ``min_priority`` are skipped (or run for one request in
+    ``sample_one_in``). Safety handlers (priority 20 and below), terminal
+    handlers and status line handlers are never shed.
+
+    Attributes:
+        enabled: Shed handlers under pressure
+        min_priority: Lowest handler priority that may be shed
+        p95_threshold_ms: Shed while recent p95 latency is at or over this
+        queue_depth_threshold: Shed while at least this many requests wait for a worker
+        latency_window: Recent requests the p95 is computed over
+        sample_one_in: Still run a shed handler for one request in N (None = skip always)
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = Field(
+        default=True,
+        description="Skip advisory and logging handlers while the daemon is saturated",
+    )
+    min_priority: Annotated[int, Field(ge=21)] = Field(
+        default=55,
+        description="Lowest handler priority that may be shed (safety band 0-20 is never shed)",
+    )
+    p95_threshold_ms: Annotated[float, Field(gt=0)] = Field(
+        default=250.0,
+        description="Shed while the p95 of recent request processing times is at or over this",
+    )
+    queue_depth_threshold: Annotated[int, Field(ge=1)] = Field(
+        default=8,
+        description="Shed while at least this many requests wait for an executor worker",
+    )
+    latency_window: Annotated[int, Field(ge=10, le=10000)] = Field(
+        default=200,
+        description="Number of recent requests the p95 latency is computed over",
+    )
+    sample_one_in: Annotated[int, Field(ge=2)] | None = Field(
+        default=None,
+        description="Run a shed handler for one request in N instead of never (None = never)",
+    )
+
+
+def _default_executor_lanes() -> dict[str, ExecutorLaneConfig]:
+    """Default lanes: latency-sensitive events apart from everything else."""
+    return {
+        "interactive": ExecutorLaneConfig(
+            events=["Status", "PreToolUse", "PermissionRequest", "UserPromptSubmit"]
+        ),
+        "background": ExecutorLaneConfig(),
+    }
+
+
 class ProjectHandlersConfig(BaseModel):
     """Configuration for project-level handlers.
 
@@ -411,6 +626,16 @@ class DaemonConfig(BaseModel):
         self_install_mode: Whether daemon runs from project root (vs .claude/hooks-daemon/)
         strict_mode: Fail-fast on ALL errors (handler exceptions, validation errors, etc.)
         input_validation: Input validation configuration
+        traffic_capture: Request/response traffic capture configuration
+        executor_max_workers: Worker threads for handler execution (None = Python default)
+        progressive_startup: Serve critical handlers first, load the rest in the background
+        enforcement_discovery: How single-daemon enforcement finds other daemons
+        config_reload_interval_seconds: Seconds between config file change checks (0 = off)
+        session_snapshot: Session state persistence across restarts
+        history_store: Persistent SQLite store of handler decisions
+        session_registry: Per-session data layer partitions and their eviction
+        executor_lanes: Thread pools per class of hook event, keyed by lane name
+        load_shedding: Skipping of low-priority handlers under latency pressure
     """
 
     model_config = ConfigDict(extra="allow")
@@ -462,6 +687,73 @@ class DaemonConfig(BaseModel):
         default=7,
         description="Number of days before daemon runtime files (sock, pid, socket-path) are considered stale and removed on startup. Active daemons touch their files periodically to stay fresh.",
     )
+    traffic_capture: TrafficCaptureConfig = Field(
+        default_factory=TrafficCaptureConfig,
+        description="Opt-in request/response capture for replay benchmarking",
+    )
+    executor_max_workers: Annotated[int, Field(ge=1, le=256)] | None = Field(
+        default=None,
+        description="Worker threads used to run handler chains. None = Python default (min(32, cpu_count + 4)).",
+    )
+    progressive_startup: bool = Field(
+        default=True,
+        description="Start listening once critical safety handlers (priority 0-19) are registered and load the remaining handlers, plugins, project handlers and CLAUDE.md injection in the background. Responses carry a 'warming' context line until loading finishes.",
+    )
+    session_snapshot: SessionSnapshotConfig = Field(
+        default_factory=SessionSnapshotConfig,
+        description="Persist handler history and per-session state across idle shutdown and restart",
+    )
+    history_store: HistoryStoreConfig = Field(
+        default_factory=HistoryStoreConfig,
+        description="Persist every handler decision to SQLite for the history command",
+    )
+    executor_lanes: dict[str, ExecutorLaneConfig] = Field(
+        default_factory=_default_executor_lanes,
+        description="Thread pools per class of hook event so slow handlers (PostToolUse linting, Stop transcript parsing) never take the threads status line and PreToolUse responses need. A session's own requests still run one at a time in arrival order across all lanes.",
+    )
+    load_shedding: LoadSheddingConfig = Field(
+        default_factory=LoadSheddingConfig,
+        description="Skip advisory and logging handlers while p95 latency or queue depth is over threshold",
+    )
+    session_registry: SessionRegistryConfig = Field(
+        default_factory=SessionRegistryConfig,
+        description="Per-session handler history and StatusLine state, evicted on SessionEnd, inactivity or an LRU cap",
+    )
+    config_reload_interval_seconds: Annotated[float, Field(ge=0, le=3600)] = Field(
+        default=2.0,
+        description="Seconds between checks of hooks-daemon.yaml for changes. Handler changes (enabled, priority, options, tags) are applied without a restart; other sections are reported as needing one. 0 disables watching (reload-config still works).",
+    )
+    enforcement_discovery: Literal["registry", "scan"] = Field(
+        default="registry",
+        description="How enforce_single_daemon_process finds other daemons. 'registry' checks only daemons recorded in the per-user live daemon registry (fast); 'scan' walks every process on the host (finds daemons started by older versions).",
+    )
+
+    @field_validator("executor_lanes")
+    @classmethod
+    def validate_executor_lanes(
+        cls, v: dict[str, ExecutorLaneConfig]
+    ) -> dict[str, ExecutorLaneConfig]:
+        """Check lanes name known events and no event is in two lanes.
+
+        Raises:
+            ValueError: If there are no lanes, an event is unknown or listed twice
+        """
+        from claude_code_hooks_daemon.core.event import EventType
+
+        if not v:
+            raise ValueError("executor_lanes needs at least one lane")
+        known = {event_type.value for event_type in EventType}
+        owner: dict[str, str] = {}
+        for name, lane in v.items():
+            for event in lane.events:
+                if event not in known:
+                    raise ValueError(f"executor lane {name!r}: unknown event {event!r}")
+                if event in owner:
+                    raise ValueError(
+                        f"event {event!r} is in executor lanes {owner[event]!r} and {name!r}"
+                    )
+                owner[event] = name
+        return v
 
     @field_validator("socket_path", "pid_file_path", mode="before")
     @classmethod
@@ -12,6 +12,7 @@ Provides exhaustive validation of configuration schema including:
 
 import difflib
 import importlib
+import inspect
 import logging
 import pkgutil
 import re
@@ -114,6 +115,7 @@ class ConfigValidator:
                             and issubclass(attr, Handler)
                             and attr is not Handler
                             and not attr.__name__.startswith("_")
+                            and not inspect.isabstract(attr)
                         ):
                             # Convert class name to snake_case config key
                             handler_config_name = ConfigValidator._to_snake_case(attr.__name__)
@@ -145,6 +145,10 @@ class PriorityRange:
     TEST_MIN = 0
     TEST_MAX = 9
 
+    # Handlers at or below this priority load before the daemon accepts
+    # requests under progressive startup; the rest load in the background
+    CRITICAL_MAX = 19
+
     SAFETY_MIN = 10
     SAFETY_MAX = 20
 
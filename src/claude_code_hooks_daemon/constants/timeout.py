@@ -55,6 +55,9 @@ class Timeout:
     VALIDATION_CHECK = 5  # 5 seconds (installation validation subprocess)
     VERSION_CHECK = 5  # 5 seconds (git ls-remote for version check)
 
+    # Async handler deadlines (seconds, whole handle_async() call)
+    GIT_BRANCH_DEADLINE = 2  # 2 seconds (status line must not wait on a slow repo)
+
     # QA runner timeouts (seconds)
     QA_TEST_TIMEOUT = 120  # 2 minutes (mypy, individual tool checks)
     QA_LONG_TIMEOUT = 300  # 5 minutes (pytest, full test suite)
@@ -5,19 +5,25 @@ building and running hook handlers.
 """
 
 from claude_code_hooks_daemon.core.acceptance_test import AcceptanceTest, RecommendedModel, TestType
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult, HandlerChain
 from claude_code_hooks_daemon.core.cli_acceptance_test import CliAcceptanceTest
 from claude_code_hooks_daemon.core.data_layer import (
     DaemonDataLayer,
+    SessionRegistry,
     get_data_layer,
+    get_session_registry,
     reset_data_layer,
+    use_data_layer,
 )
+from claude_code_hooks_daemon.core.deferred import append_line, defer, get_deferred_work
 from claude_code_hooks_daemon.core.error_response import generate_daemon_error_response
 from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput, ToolInput
 from claude_code_hooks_daemon.core.front_controller import FrontController
 from claude_code_hooks_daemon.core.handler import Handler
 from claude_code_hooks_daemon.core.handler_history import HandlerDecisionRecord, HandlerHistory
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
+from claude_code_hooks_daemon.core.load_shedding import LoadShedder
 from claude_code_hooks_daemon.core.mode import ModeManager
 from claude_code_hooks_daemon.core.project_context import ProjectContext
 from claude_code_hooks_daemon.core.pseudo_event import (
@@ -37,6 +43,7 @@ from claude_code_hooks_daemon.core.transcript_reader import (
 
 __all__ = [
     "AcceptanceTest",
+    "AsyncHandler",
     "ChainExecutionResult",
     "CliAcceptanceTest",
     "ContentBlock",
@@ -52,20 +59,27 @@ __all__ = [
     "HookEvent",
     "HookInput",
     "HookResult",
+    "LoadShedder",
     "ModeManager",
     "ProjectContext",
     "PseudoEventConfig",
     "PseudoEventDispatcher",
     "PseudoEventTrigger",
     "RecommendedModel",
+    "SessionRegistry",
     "SessionState",
     "TestType",
     "ToolInput",
     "ToolUse",
     "TranscriptMessage",
     "TranscriptReader",
+    "append_line",
+    "defer",
     "generate_daemon_error_response",
     "get_data_layer",
+    "get_deferred_work",
+    "get_session_registry",
     "merge_pseudo_results",
     "reset_data_layer",
+    "use_data_layer",
 ]
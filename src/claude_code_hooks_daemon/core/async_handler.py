@@ -0,0 +1,290 @@
+"""Async handlers for I/O-bound work.
+
+Handlers that mostly wait on subprocesses (git, linters) used
+subprocess.run() with no way to cancel the wait. An AsyncHandler
+implements handle_async() as a coroutine instead. Subprocesses started
+with run_process() are waited on by the event loop, a handler can run
+several of them concurrently (asyncio.gather), and a handler's deadline
+cancels the coroutine and kills its subprocess.
+
+In the daemon, a chain containing async handlers runs through
+HandlerChain.execute_async(): coroutines are awaited on the event loop
+and the synchronous handlers between them are offloaded to the request's
+executor lane, so no worker thread is held while git or a linter runs.
+Priority order and terminal semantics are unchanged.
+
+Synchronous callers (the CLI, pseudo-events, HandlerChain.execute()) go
+through handle(), which runs the coroutine on the daemon's event loop and
+waits for it, or in a fresh loop on the calling thread when no loop is
+attached.
+
+Usage:
+    class MyHandler(AsyncHandler):
+        async def handle_async(self, hook_input):
+            result = await run_process(["git", "status"], text=True, timeout=5)
+            return HookResult(context=[result.stdout])
+"""
+
+import asyncio
+import subprocess  # nosec B404 - only for CompletedProcess and TimeoutExpired
+import threading
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, TypeVar, overload
+
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+
+
+class Offload(Protocol):
+    """Runs a synchronous function on a worker thread from a coroutine."""
+
+    def __call__(self, func: Callable[..., T], /, *args: Any) -> Awaitable[T]:
+        """Start func(*args) on a worker thread.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments for func
+
+        Returns:
+            Awaitable resolving to func's result
+        """
+        ...
+
+
+class _EventLoopBridge:
+    """Runs coroutines from worker threads on the daemon's event loop."""
+
+    __slots__ = ("_in_flight", "_lock", "_loop")
+
+    def __init__(self) -> None:
+        """Create with no loop attached."""
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: set[Future[Any]] = set()
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run coroutines on a loop from now on.
+
+        Args:
+            loop: The daemon's running event loop
+        """
+        with self._lock:
+            self._loop = loop
+
+    def detach(self) -> None:
+        """Stop using the loop and cancel coroutines still running on it.
+
+        Called before the loop stops, so no worker thread is left waiting
+        for a result that never arrives.
+        """
+        with self._lock:
+            self._loop = None
+            in_flight = list(self._in_flight)
+        for future in in_flight:
+            future.cancel()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion and return its result.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        with self._lock:
+            loop = self._loop
+            if loop is not None and loop.is_running() and not _on_loop_thread(loop):
+                future = asyncio.run_coroutine_threadsafe(coro, loop)
+                self._in_flight.add(future)
+            else:
+                future = None
+        if future is None:
+            # No daemon loop (CLI, tests): run in a loop of our own
+            return asyncio.run(coro)
+        try:
+            return future.result()
+        finally:
+            with self._lock:
+                self._in_flight.discard(future)
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """Check whether the calling thread is running a given loop.
+
+    Args:
+        loop: Event loop to check
+
+    Returns:
+        True if called from inside the loop (waiting on it would deadlock)
+    """
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+_bridge = _EventLoopBridge()
+
+
+def attach_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run async handlers on the daemon's event loop.
+
+    Args:
+        loop: The daemon's running event loop
+    """
+    _bridge.attach(loop)
+
+
+def detach_event_loop() -> None:
+    """Stop using the daemon's event loop, cancelling unfinished handlers."""
+    _bridge.detach()
+
+
+@overload
+async def run_process(
+    args: Sequence[str],
+    *,
+    cwd: str | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+    check: bool = False,
+    text: Literal[True],
+) -> subprocess.CompletedProcess[str]: ...
+
+
+@overload
+async def run_process(
+    args: Sequence[str],
+    *,
+    cwd: str | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+    check: bool = False,
+    text: Literal[False] = False,
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+async def run_process(
+    args: Sequence[str],
+    *,
+    cwd: str | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+    check: bool = False,
+    text: bool = False,
+) -> subprocess.CompletedProcess[Any]:
+    """Run a command without blocking a thread, like subprocess.run().
+
+    Output is always captured. The process is killed if the timeout
+    passes or the calling coroutine is cancelled.
+
+    Args:
+        args: Command and arguments
+        cwd: Working directory
+        env: Environment (None = inherit the daemon's)
+        timeout: Seconds before the process is killed (None = no limit)
+        check: Raise CalledProcessError on a non-zero exit
+        text: Decode stdout and stderr as UTF-8
+
+    Returns:
+        Completed process with returncode, stdout and stderr
+
+    Raises:
+        FileNotFoundError: If the command does not exist
+        subprocess.TimeoutExpired: If the timeout passed
+        subprocess.CalledProcessError: If check is set and the exit code is non-zero
+    """
+    command = list(args)
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(command, timeout or 0) from None
+    except BaseException:
+        # Cancelled (e.g. handler deadline): do not leave the process running
+        if process.returncode is None:
+            process.kill()
+        raise
+
+    output: Any = stdout.decode(errors="replace") if text else stdout
+    errors: Any = stderr.decode(errors="replace") if text else stderr
+    completed = subprocess.CompletedProcess(command, process.returncode or 0, output, errors)
+    if check:
+        completed.check_returncode()
+    return completed
+
+
+class AsyncHandler(Handler):
+    """Handler whose work is a coroutine run on the daemon's event loop.
+
+    Subclasses implement handle_async() instead of handle(); matches()
+    stays synchronous and should be cheap.
+
+    Attributes:
+        handle_deadline_seconds: Class attribute: seconds handle_async() may
+                   run before it is cancelled (default None, no deadline).
+                   A handler that misses its deadline raises TimeoutError,
+                   which the chain treats like any other handler exception.
+    """
+
+    __slots__ = ()
+
+    # Seconds handle_async() may run before it is cancelled (None = no deadline)
+    handle_deadline_seconds: ClassVar[float | None] = None
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        """Run the handler to completion from synchronous code.
+
+        Blocks the calling thread until the coroutine finishes.
+
+        Args:
+            hook_input: Hook input dictionary
+
+        Returns:
+            HookResult from handle_in_time()
+        """
+        return _bridge.run(self.handle_in_time(hook_input))
+
+    async def handle_in_time(self, hook_input: dict[str, Any]) -> HookResult:
+        """Run handle_async() under the handler's deadline.
+
+        This is what chains await. Override it to turn a missed deadline
+        into a result instead of a handler error.
+
+        Args:
+            hook_input: Hook input dictionary
+
+        Returns:
+            HookResult from handle_async()
+
+        Raises:
+            TimeoutError: If handle_deadline_seconds passed
+        """
+        return await asyncio.wait_for(self.handle_async(hook_input), self.handle_deadline_seconds)
+
+    @abstractmethod
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
+        """Process the hook event without blocking a thread.
+
+        Args:
+            hook_input: Hook input dictionary
+
+        Returns:
+            HookResult with decision and optional reason/context
+        """
@@ -2,19 +2,36 @@
 
 This module provides the HandlerChain class that executes handlers
 in priority order with support for terminal and non-terminal handlers.
+
+Chains whose handlers cannot change each other's outcome (all
+non-terminal, or marked parallel_safe) can run every handler at once on a
+thread pool. Results are still merged in priority order, so the output is
+the same as running them one after another.
+
+Chains containing async handlers can run through execute_async() on the
+daemon's event loop: async handlers are awaited there and the synchronous
+handlers between them are offloaded to worker threads, so no thread waits
+on an async handler's subprocess.
 """
 
+import asyncio
+import contextvars
+import itertools
 import logging
 import time
-from collections.abc import Iterator
+from collections.abc import Awaitable, Hashable, Iterable, Iterator
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from claude_code_hooks_daemon.constants import Priority
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, Offload
 from claude_code_hooks_daemon.core.hook_result import HookResult
 
 if TYPE_CHECKING:
     from claude_code_hooks_daemon.core.handler import Handler
+    from claude_code_hooks_daemon.core.load_shedding import LoadShedder
+    from claude_code_hooks_daemon.core.segment_cache import SegmentCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +46,9 @@ class ChainExecutionResult:
         handlers_matched: List of handler names that matched
         execution_time_ms: Total execution time in milliseconds
         terminated_by: Handler name that terminated the chain (if any)
+        handler_timings_ms: Per-handler time (matches + handle) in milliseconds
+        handlers_shed: Handlers skipped by load shedding
+        parallel: Handlers ran concurrently on a thread pool
     """
 
     result: HookResult
@@ -36,6 +56,273 @@ class ChainExecutionResult:
     handlers_matched: list[str] = field(default_factory=list)
     execution_time_ms: float = 0.0
     terminated_by: str | None = None
+    handler_timings_ms: dict[str, float] = field(default_factory=dict)
+    handlers_shed: list[str] = field(default_factory=list)
+    parallel: bool = False
+
+
+@dataclass(slots=True)
+class _HandlerOutcome:
+    """What one handler did with an event, before merging.
+
+    Attributes:
+        matched: matches() returned True
+        result: Result of handle() (None if not matched, shed or raised)
+        error: Exception raised by matches() or handle()
+        elapsed_ms: Time spent in matches() and handle()
+        shed: Skipped by load shedding
+    """
+
+    matched: bool = False
+    result: HookResult | None = None
+    error: Exception | None = None
+    elapsed_ms: float = 0.0
+    shed: bool = False
+
+
+def _run_handler(
+    handler: "Handler", hook_input: dict[str, Any], segment_cache: "SegmentCache | None"
+) -> _HandlerOutcome:
+    """Run one handler against an event, capturing any exception.
+
+    Args:
+        handler: Handler to run
+        hook_input: Hook input dictionary
+        segment_cache: Reuses handler results within their segment TTL
+
+    Returns:
+        The handler's outcome
+    """
+    outcome = _HandlerOutcome()
+    handler_start = time.perf_counter()
+    try:
+        if handler.matches(hook_input):
+            outcome.matched = True
+            logger.debug("Handler %s matched event", handler.name)
+            outcome.result = (
+                segment_cache.handle(handler, hook_input)
+                if segment_cache is not None
+                else handler.handle(hook_input)
+            )
+    except Exception as e:
+        logger.exception("Handler %s raised exception", handler.name)
+        outcome.error = e
+    outcome.elapsed_ms = (time.perf_counter() - handler_start) * 1000
+    return outcome
+
+
+def _match_and_look_up(
+    handler: AsyncHandler, hook_input: dict[str, Any], segment_cache: "SegmentCache | None"
+) -> tuple[bool, Hashable, HookResult | None]:
+    """Check an async handler's match and cached segment (may touch files).
+
+    Args:
+        handler: Async handler to check
+        hook_input: Hook input dictionary
+        segment_cache: Reuses handler results within their segment TTL
+
+    Returns:
+        Whether it matched, its segment cache key and any cached result
+    """
+    if not handler.matches(hook_input):
+        return False, None, None
+    if segment_cache is None:
+        return True, None, None
+    key, cached = segment_cache.lookup(handler, hook_input)
+    return True, key, cached
+
+
+async def _run_async_handler(
+    handler: AsyncHandler,
+    hook_input: dict[str, Any],
+    segment_cache: "SegmentCache | None",
+    offload: Offload,
+) -> _HandlerOutcome:
+    """Run an async handler, awaiting its coroutine on the event loop.
+
+    matches() and the segment cache lookup run on a worker thread.
+
+    Args:
+        handler: Async handler to run
+        hook_input: Hook input dictionary
+        segment_cache: Reuses handler results within their segment TTL
+        offload: Runs synchronous steps on a worker thread
+
+    Returns:
+        The handler's outcome
+    """
+    outcome = _HandlerOutcome()
+    handler_start = time.perf_counter()
+    try:
+        outcome.matched, key, cached = await offload(
+            _match_and_look_up, handler, hook_input, segment_cache
+        )
+        if outcome.matched:
+            logger.debug("Handler %s matched event", handler.name)
+            if cached is None:
+                cached = await handler.handle_in_time(hook_input)
+                if segment_cache is not None:
+                    segment_cache.store(handler, key, cached)
+            outcome.result = cached
+    except Exception as e:
+        logger.exception("Handler %s raised exception", handler.name)
+        outcome.error = e
+    outcome.elapsed_ms = (time.perf_counter() - handler_start) * 1000
+    return outcome
+
+
+class _OutcomeMerger:
+    """Merges handler outcomes, in priority order, into the chain's result."""
+
+    __slots__ = (
+        "accumulated_context",
+        "final_result",
+        "handler_timings_ms",
+        "handlers_executed",
+        "handlers_matched",
+        "handlers_shed",
+        "strict_mode",
+        "terminated_by",
+    )
+
+    def __init__(self, strict_mode: bool) -> None:
+        """Start with no outcomes.
+
+        Args:
+            strict_mode: A handler exception blocks the operation (fail-closed)
+        """
+        self.strict_mode = strict_mode
+        self.accumulated_context: list[str] = []
+        self.handlers_executed: list[str] = []
+        self.handlers_matched: list[str] = []
+        self.final_result: HookResult | None = None
+        self.terminated_by: str | None = None
+        self.handler_timings_ms: dict[str, float] = {}
+        self.handlers_shed: list[str] = []
+
+    def add(self, handler: "Handler", outcome: _HandlerOutcome) -> bool:
+        """Merge the next handler's outcome.
+
+        Args:
+            handler: Handler the outcome belongs to
+            outcome: What the handler did
+
+        Returns:
+            True if the chain stops here (terminal result or strict-mode error)
+        """
+        if outcome.shed:
+            self.handlers_shed.append(handler.name)
+            return False
+        self.handler_timings_ms[handler.name] = outcome.elapsed_ms
+        if outcome.matched:
+            self.handlers_matched.append(handler.name)
+
+        if outcome.error is not None:
+            e = outcome.error
+            self.handlers_executed.append(handler.name)
+
+            if self.strict_mode:
+                # STRICT MODE: FAIL FAST - handler crash = BLOCK operation (fail-closed)
+                error_result = HookResult.deny(
+                    reason=f"SYSTEM ERROR: Handler {handler.name} crashed - blocking for safety",
+                )
+                error_result.context.append(f"Handler exception: {type(e).__name__}: {e}")
+                error_result.add_handler(handler.name)
+
+                # Stop chain immediately - this is terminal
+                if self.accumulated_context:
+                    error_result.context = self.accumulated_context + error_result.context
+                self.final_result = error_result
+                self.terminated_by = handler.name
+                return True
+            else:
+                # NON-STRICT MODE: Fail-open - log error and continue chain
+                error_context = f"Handler exception: {type(e).__name__}: {e}"
+                self.accumulated_context.append(error_context)
+                # Continue to next handler
+                return False
+
+        result = outcome.result
+        if result is None:
+            return False
+        logger.debug(
+            "Handler %s returned decision=%s, terminal=%s",
+            handler.name,
+            result.decision,
+            handler.terminal,
+        )
+        self.handlers_executed.append(handler.name)
+        result.add_handler(handler.name)
+
+        if handler.terminal:
+            # Terminal handler - stop chain
+            if self.accumulated_context:
+                result.context = self.accumulated_context + result.context
+            for h in self.handlers_matched[:-1]:
+                result.add_handler(h)
+            self.terminated_by = handler.name
+            self.final_result = result
+            return True
+
+        # Non-terminal - accumulate context
+        self.accumulated_context.extend(result.context)
+        self.final_result = result
+        return False
+
+    def finish(self, start_time: float, parallel: bool) -> ChainExecutionResult:
+        """Build the chain's result from the merged outcomes.
+
+        Args:
+            start_time: perf_counter() reading when the chain started
+            parallel: Handlers ran concurrently
+
+        Returns:
+            ChainExecutionResult with final result and metadata
+        """
+        final_result = self.final_result
+        if final_result is None:
+            final_result = HookResult.allow()
+
+        # Ensure all context is included
+        if self.accumulated_context and final_result.context != self.accumulated_context:
+            if self.terminated_by:
+                # Already merged above
+                pass
+            else:
+                final_result.context = self.accumulated_context
+
+        # Record all matched handlers
+        for h in self.handlers_matched:
+            final_result.add_handler(h)
+
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
+
+        return ChainExecutionResult(
+            result=final_result,
+            handlers_executed=self.handlers_executed,
+            handlers_matched=self.handlers_matched,
+            execution_time_ms=execution_time_ms,
+            terminated_by=self.terminated_by,
+            handler_timings_ms=self.handler_timings_ms,
+            handlers_shed=self.handlers_shed,
+            parallel=parallel,
+        )
+
+
+def _merge(merger: _OutcomeMerger, outcomes: Iterable[tuple["Handler", _HandlerOutcome]]) -> bool:
+    """Merge outcomes until the chain stops.
+
+    Stops pulling from outcomes once a handler terminates the chain, so
+    lazily run handlers after it never run.
+
+    Args:
+        merger: Merger collecting the chain's result
+        outcomes: Handlers and their outcomes, in priority order
+
+    Returns:
+        True if a handler terminated the chain
+    """
+    return any(merger.add(handler, outcome) for handler, outcome in outcomes)
 
 
 class HandlerChain:
@@ -142,8 +429,23 @@ class HandlerChain:
         """Iterate over handlers in priority order."""
         return iter(self.handlers)
 
+    def can_run_parallel(self) -> bool:
+        """Check whether the handlers may run concurrently.
+
+        Returns:
+            True if there are several handlers and each is non-terminal or
+            parallel_safe (no handler can stop the others from running)
+        """
+        handlers = self.handlers
+        return len(handlers) > 1 and all(h.parallel_safe or not h.terminal for h in handlers)
+
     def execute(
-        self, hook_input: dict[str, Any], strict_mode: bool = False
+        self,
+        hook_input: dict[str, Any],
+        strict_mode: bool = False,
+        shedder: "LoadShedder | None" = None,
+        segment_cache: "SegmentCache | None" = None,
+        pool: Executor | None = None,
     ) -> ChainExecutionResult:
         """Execute the handler chain for an event.
 
@@ -155,96 +457,202 @@ class HandlerChain:
             hook_input: Hook input dictionary to process
             strict_mode: If True, FAIL FAST on handler exceptions (fail-closed).
                         If False, log and continue (fail-open).
+            shedder: Skips low-priority handlers under load (None = run all)
+            segment_cache: Reuses handler results within their segment TTL
+                (status line only; None = always call handle())
+            pool: Runs the handlers concurrently when can_run_parallel()
+                (None = one after another)
 
         Returns:
             ChainExecutionResult with final result and metadata
         """
         start_time = time.perf_counter()
-        accumulated_context: list[str] = []
-        handlers_executed: list[str] = []
-        handlers_matched: list[str] = []
-        final_result: HookResult | None = None
-        terminated_by: str | None = None
+        merger = _OutcomeMerger(strict_mode)
 
-        for handler in self.handlers:
-            try:
-                if handler.matches(hook_input):
-                    handlers_matched.append(handler.name)
-                    logger.debug("Handler %s matched event", handler.name)
+        parallel = False
+        outcomes = self._sequential_outcomes(self.handlers, hook_input, shedder, segment_cache)
+        if pool is not None and self.can_run_parallel():
+            parallel = True
+            outcomes = self._parallel_outcomes(pool, hook_input, shedder, segment_cache)
 
-                    result = handler.handle(hook_input)
-                    logger.debug(
-                        "Handler %s returned decision=%s, terminal=%s",
-                        handler.name,
-                        result.decision,
-                        handler.terminal,
+        _merge(merger, outcomes)
+        return merger.finish(start_time, parallel)
+
+    def has_async_handlers(self) -> bool:
+        """Check whether execute_async() would await any handler on the loop.
+
+        Returns:
+            True if the chain contains an AsyncHandler
+        """
+        return any(isinstance(handler, AsyncHandler) for handler in self._handlers)
+
+    async def execute_async(
+        self,
+        hook_input: dict[str, Any],
+        offload: Offload,
+        strict_mode: bool = False,
+        shedder: "LoadShedder | None" = None,
+        segment_cache: "SegmentCache | None" = None,
+        pool: Executor | None = None,
+    ) -> ChainExecutionResult:
+        """Execute the handler chain on the event loop.
+
+        Same result as execute(), but async handlers' coroutines are
+        awaited here instead of blocking a thread. Each run of consecutive
+        synchronous handlers goes to a worker thread in one offload() call.
+
+        Args:
+            hook_input: Hook input dictionary to process
+            offload: Runs synchronous handlers on a worker thread
+            strict_mode: If True, FAIL FAST on handler exceptions (fail-closed).
+                        If False, log and continue (fail-open).
+            shedder: Skips low-priority handlers under load (None = run all)
+            segment_cache: Reuses handler results within their segment TTL
+                (status line only; None = always call the handler)
+            pool: Runs the synchronous handlers concurrently when
+                can_run_parallel(), alongside the async ones (None = one
+                after another)
+
+        Returns:
+            ChainExecutionResult with final result and metadata
+        """
+        start_time = time.perf_counter()
+        merger = _OutcomeMerger(strict_mode)
+
+        if pool is not None and self.can_run_parallel():
+            handlers = self.handlers
+            results = await asyncio.gather(
+                *(
+                    self._outcome_async(h, hook_input, shedder, segment_cache, offload, pool)
+                    for h in handlers
+                )
+            )
+            _merge(merger, zip(handlers, results, strict=True))
+            return merger.finish(start_time, True)
+
+        for is_async, group in itertools.groupby(
+            self.handlers, key=lambda h: isinstance(h, AsyncHandler)
+        ):
+            if is_async:
+                terminated = False
+                for handler in group:
+                    outcome = await self._outcome_async(
+                        handler, hook_input, shedder, segment_cache, offload
                     )
-                    handlers_executed.append(handler.name)
-                    result.add_handler(handler.name)
-
-                    if handler.terminal:
-                        # Terminal handler - stop chain
-                        if accumulated_context:
-                            result.context = accumulated_context + result.context
-                        for h in handlers_matched[:-1]:
-                            result.add_handler(h)
-                        terminated_by = handler.name
-                        final_result = result
+                    terminated = merger.add(handler, outcome)
+                    if terminated:
                         break
-                    else:
-                        # Non-terminal - accumulate context
-                        accumulated_context.extend(result.context)
-                        final_result = result
-
-            except Exception as e:
-                logger.exception("Handler %s raised exception", handler.name)
-                handlers_executed.append(handler.name)
-
-                if strict_mode:
-                    # STRICT MODE: FAIL FAST - handler crash = BLOCK operation (fail-closed)
-                    error_result = HookResult.deny(
-                        reason=f"SYSTEM ERROR: Handler {handler.name} crashed - blocking for safety",
-                    )
-                    error_result.context.append(f"Handler exception: {type(e).__name__}: {e}")
-                    error_result.add_handler(handler.name)
-
-                    # Stop chain immediately - this is terminal
-                    if accumulated_context:
-                        error_result.context = accumulated_context + error_result.context
-                    final_result = error_result
-                    terminated_by = handler.name
-                    break
-                else:
-                    # NON-STRICT MODE: Fail-open - log error and continue chain
-                    error_context = f"Handler exception: {type(e).__name__}: {e}"
-                    accumulated_context.append(error_context)
-                    # Continue to next handler
-
-        # Build final result
-        if final_result is None:
-            final_result = HookResult.allow()
+            else:
+                # One thread hop runs the whole group, stopping at a terminal result
+                outcomes = self._sequential_outcomes(
+                    list(group), hook_input, shedder, segment_cache
+                )
+                terminated = await offload(_merge, merger, outcomes)
+            if terminated:
+                break
+        return merger.finish(start_time, False)
+
+    async def _outcome_async(
+        self,
+        handler: "Handler",
+        hook_input: dict[str, Any],
+        shedder: "LoadShedder | None",
+        segment_cache: "SegmentCache | None",
+        offload: Offload,
+        pool: Executor | None = None,
+    ) -> _HandlerOutcome:
+        """Run one handler from the event loop.
 
-        # Ensure all context is included
-        if accumulated_context and final_result.context != accumulated_context:
-            if terminated_by:
-                # Already merged above
-                pass
+        Args:
+            handler: Handler to run
+            hook_input: Hook input dictionary
+            shedder: Skips low-priority handlers under load
+            segment_cache: Reuses handler results within their segment TTL
+            offload: Runs synchronous steps on a worker thread
+            pool: Runs a synchronous handler instead of offload() (None = offload())
+
+        Returns:
+            The handler's outcome
+        """
+        if shedder is not None and shedder.should_shed(handler):
+            return _HandlerOutcome(shed=True)
+        if isinstance(handler, AsyncHandler):
+            return await _run_async_handler(handler, hook_input, segment_cache, offload)
+        if pool is None:
+            return await offload(_run_handler, handler, hook_input, segment_cache)
+        context = contextvars.copy_context()
+        try:
+            started: Awaitable[_HandlerOutcome] = asyncio.get_running_loop().run_in_executor(
+                pool, context.run, _run_handler, handler, hook_input, segment_cache
+            )
+        except RuntimeError:
+            # Pool refused the handler (e.g. during shutdown): offload it instead
+            started = offload(_run_handler, handler, hook_input, segment_cache)
+        return await started
+
+    @staticmethod
+    def _sequential_outcomes(
+        handlers: list["Handler"],
+        hook_input: dict[str, Any],
+        shedder: "LoadShedder | None",
+        segment_cache: "SegmentCache | None",
+    ) -> Iterator[tuple["Handler", _HandlerOutcome]]:
+        """Run handlers one at a time, as the merge loop asks for them.
+
+        Handlers after a terminal one are never run.
+
+        Args:
+            handlers: Handlers to run, in priority order
+            hook_input: Hook input dictionary
+            shedder: Skips low-priority handlers under load
+            segment_cache: Reuses handler results within their segment TTL
+
+        Yields:
+            Each handler and its outcome, in priority order
+        """
+        for handler in handlers:
+            if shedder is not None and shedder.should_shed(handler):
+                yield handler, _HandlerOutcome(shed=True)
             else:
-                final_result.context = accumulated_context
+                yield handler, _run_handler(handler, hook_input, segment_cache)
 
-        # Record all matched handlers
-        for h in handlers_matched:
-            final_result.add_handler(h)
+    def _parallel_outcomes(
+        self,
+        pool: Executor,
+        hook_input: dict[str, Any],
+        shedder: "LoadShedder | None",
+        segment_cache: "SegmentCache | None",
+    ) -> Iterator[tuple["Handler", _HandlerOutcome]]:
+        """Start every handler on the pool, then yield outcomes in priority order.
 
-        execution_time_ms = (time.perf_counter() - start_time) * 1000
+        Each handler runs in a copy of the caller's context, so it sees
+        the session's bound data layer. A handler the pool refuses (e.g.
+        during shutdown) runs on the calling thread instead.
 
-        return ChainExecutionResult(
-            result=final_result,
-            handlers_executed=handlers_executed,
-            handlers_matched=handlers_matched,
-            execution_time_ms=execution_time_ms,
-            terminated_by=terminated_by,
-        )
+        Args:
+            pool: Thread pool to run handlers on
+            hook_input: Hook input dictionary
+            shedder: Skips low-priority handlers under load
+            segment_cache: Reuses handler results within their segment TTL
+
+        Yields:
+            Each handler and its outcome, in priority order
+        """
+        pending: list[tuple[Handler, Future[_HandlerOutcome] | _HandlerOutcome]] = []
+        for handler in self.handlers:
+            if shedder is not None and shedder.should_shed(handler):
+                pending.append((handler, _HandlerOutcome(shed=True)))
+                continue
+            context = contextvars.copy_context()
+            try:
+                future = pool.submit(context.run, _run_handler, handler, hook_input, segment_cache)
+            except RuntimeError:
+                pending.append((handler, _run_handler(handler, hook_input, segment_cache)))
+            else:
+                pending.append((handler, future))
+
+        for handler, started in pending:
+            yield handler, started.result() if isinstance(started, Future) else started
 
     def execute_legacy(self, hook_input: dict[str, Any]) -> HookResult:
         """Execute chain with legacy dict input.
@@ -4,6 +4,7 @@ Single entry point for handlers to access session-wide data:
 - SessionState: Model info and context usage from StatusLine events
 - TranscriptReader: Conversation history from JSONL transcripts
 - HandlerHistory: Previous handler decisions within the session
+- SegmentCache: Status line segments reused within their TTL
 
 Usage:
     from claude_code_hooks_daemon.core.data_layer import get_data_layer
@@ -12,11 +13,26 @@ Usage:
         dl = get_data_layer()
         if dl.session.is_opus(): ...
         if dl.history.was_blocked("Bash"): ...
+
+Each Claude Code session gets its own DaemonDataLayer partition from the
+SessionRegistry. The controller binds the partition while it processes an
+event (use_data_layer), so get_data_layer() returns the current session's
+data. Events without a session ID use the global instance. Partitions are
+evicted when their session ends, after a period of inactivity, or when the
+registry is over its size cap (least recently used first).
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
 
-from claude_code_hooks_daemon.core.handler_history import HandlerHistory
+from claude_code_hooks_daemon.core.handler_history import DecisionStore, HandlerHistory
+from claude_code_hooks_daemon.core.segment_cache import SegmentCache
 from claude_code_hooks_daemon.core.session_state import SessionState
 from claude_code_hooks_daemon.core.transcript_reader import TranscriptReader
 
@@ -30,13 +46,14 @@ class DaemonDataLayer:
     Each component is created once and reused for the session lifetime.
     """
 
-    __slots__ = ("_history", "_session", "_transcript")
+    __slots__ = ("_history", "_session", "_status_segments", "_transcript")
 
     def __init__(self) -> None:
         """Initialise with fresh component instances."""
         self._session = SessionState()
         self._transcript = TranscriptReader()
         self._history = HandlerHistory()
+        self._status_segments = SegmentCache()
 
     @property
     def session(self) -> SessionState:
@@ -65,6 +82,23 @@ class DaemonDataLayer:
         """
         return self._history
 
+    @property
+    def status_segments(self) -> SegmentCache:
+        """Access the status line segment cache.
+
+        Returns:
+            SegmentCache used by the status line chain
+        """
+        return self._status_segments
+
+    def approximate_bytes(self) -> int:
+        """Estimate the memory held by this data layer.
+
+        Returns:
+            Approximate size in bytes of the history and cached transcript
+        """
+        return self._history.approximate_bytes() + self._transcript.approximate_bytes()
+
     def reset(self) -> None:
         """Reset all data layer state.
 
@@ -73,30 +107,288 @@ class DaemonDataLayer:
         self._session.reset()
         self._history.reset()
         self._transcript = TranscriptReader()
+        self._status_segments.clear()
+
+
+# Default cap on live session partitions (least recently used evicted first)
+DEFAULT_MAX_SESSIONS = 200
+
+# Default inactivity after which a session partition is evicted
+DEFAULT_SESSION_IDLE_TIMEOUT_SECONDS = 2 * 60 * 60
+
+# Idle partitions are looked for at most this often
+_IDLE_SWEEP_INTERVAL_SECONDS = 60
+
+# Largest partitions listed in health
+_HEALTH_TOP_SESSIONS = 5
+
+
+class _Partition:
+    """A session's data layer and when it was last used."""
+
+    __slots__ = ("data_layer", "last_seen")
+
+    def __init__(self, data_layer: DaemonDataLayer, last_seen: float) -> None:
+        self.data_layer = data_layer
+        self.last_seen = last_seen
+
+
+class SessionRegistry:
+    """Per-session DaemonDataLayer partitions with lifecycle eviction.
+
+    Thread-safe: partitions are acquired from executor threads.
+    """
+
+    __slots__ = (
+        "_evicted",
+        "_evicted_total",
+        "_idle_timeout_seconds",
+        "_last_sweep",
+        "_lock",
+        "_max_sessions",
+        "_partitions",
+        "_store",
+    )
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout_seconds: float = DEFAULT_SESSION_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        """Create an empty registry.
+
+        Args:
+            max_sessions: Most partitions kept (least recently used evicted first)
+            idle_timeout_seconds: Evict partitions unused for this long
+        """
+        self._lock = threading.Lock()
+        # Least recently used first
+        self._partitions: OrderedDict[str, _Partition] = OrderedDict()
+        self._max_sessions = max_sessions
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._last_sweep = time.monotonic()
+        self._evicted: list[str] = []
+        self._evicted_total = 0
+        self._store: DecisionStore | None = None
+
+    def configure(self, *, max_sessions: int, idle_timeout_seconds: float) -> None:
+        """Change the eviction limits (applied from the next acquire()).
+
+        Args:
+            max_sessions: Most partitions kept
+            idle_timeout_seconds: Evict partitions unused for this long
+        """
+        with self._lock:
+            self._max_sessions = max_sessions
+            self._idle_timeout_seconds = idle_timeout_seconds
+
+    def attach_store(self, store: DecisionStore | None) -> None:
+        """Persist the decisions of every partition, current and future.
+
+        Args:
+            store: Store to write to, or None to stop persisting
+        """
+        with self._lock:
+            self._store = store
+            for partition in self._partitions.values():
+                partition.data_layer.history.attach_store(store)
+
+    def acquire(self, session_id: str) -> DaemonDataLayer:
+        """Get a session's partition, creating it on first sight.
+
+        Marks the session as used now and evicts partitions over the cap
+        or idle for too long (see pop_evicted()).
+
+        Args:
+            session_id: Claude Code session ID
+
+        Returns:
+            The session's data layer
+        """
+        now = time.monotonic()
+        with self._lock:
+            partition = self._partitions.get(session_id)
+            if partition is None:
+                data_layer = DaemonDataLayer()
+                data_layer.history.attach_store(self._store)
+                partition = self._partitions[session_id] = _Partition(data_layer, now)
+            else:
+                partition.last_seen = now
+                self._partitions.move_to_end(session_id)
 
+            while len(self._partitions) > self._max_sessions:
+                oldest, _ = self._partitions.popitem(last=False)
+                self._evict(oldest, "over max_sessions")
+            if now - self._last_sweep >= _IDLE_SWEEP_INTERVAL_SECONDS:
+                self._last_sweep = now
+                self._evict_idle(now)
+            return partition.data_layer
 
-# Global singleton instance
+    def end_session(self, session_id: str) -> bool:
+        """Evict a session's partition because the session ended.
+
+        Args:
+            session_id: Claude Code session ID
+
+        Returns:
+            True if the session had a partition
+        """
+        with self._lock:
+            if self._partitions.pop(session_id, None) is None:
+                return False
+            self._evict(session_id, "session ended")
+            return True
+
+    def pop_evicted(self) -> list[str]:
+        """Get and clear the sessions evicted since the last call.
+
+        Lets owners of other per-session state (pseudo-event counters)
+        drop it too.
+
+        Returns:
+            Evicted session IDs, oldest eviction first
+        """
+        with self._lock:
+            evicted, self._evicted = self._evicted, []
+            return evicted
+
+    def items(self) -> list[tuple[str, DaemonDataLayer]]:
+        """Get all partitions.
+
+        Returns:
+            (session ID, data layer) pairs, least recently used first
+        """
+        with self._lock:
+            return [(sid, p.data_layer) for sid, p in self._partitions.items()]
+
+    def __len__(self) -> int:
+        """Number of live partitions."""
+        return len(self._partitions)
+
+    def stats(self) -> dict[str, Any]:
+        """Get partition counts and memory for health reporting.
+
+        Returns:
+            Live session count, limits, evictions since startup, total
+            approximate bytes and the largest partitions
+        """
+        now = time.monotonic()
+        with self._lock:
+            sizes = [
+                (
+                    sid,
+                    p.data_layer.approximate_bytes(),
+                    len(p.data_layer.history),
+                    now - p.last_seen,
+                )
+                for sid, p in self._partitions.items()
+            ]
+            stats: dict[str, Any] = {
+                "live": len(self._partitions),
+                "max_sessions": self._max_sessions,
+                "idle_timeout_seconds": self._idle_timeout_seconds,
+                "evicted_total": self._evicted_total,
+            }
+        sizes.sort(key=lambda size: size[1], reverse=True)
+        stats["approx_bytes"] = sum(size[1] for size in sizes)
+        stats["largest"] = [
+            {
+                "session_id": sid,
+                "approx_bytes": approx_bytes,
+                "history_records": records,
+                "idle_seconds": round(idle, 1),
+            }
+            for sid, approx_bytes, records, idle in sizes[:_HEALTH_TOP_SESSIONS]
+        ]
+        return stats
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict partitions unused for longer than the idle timeout (lock held).
+
+        Args:
+            now: Current time.monotonic()
+        """
+        cutoff = now - self._idle_timeout_seconds
+        # Least recently used first: stop at the first recent one
+        while self._partitions:
+            oldest, partition = next(iter(self._partitions.items()))
+            if partition.last_seen > cutoff:
+                break
+            del self._partitions[oldest]
+            self._evict(oldest, "idle")
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        """Record an eviction (lock held, partition already removed).
+
+        Args:
+            session_id: Evicted session ID
+            reason: Why, for the debug log
+        """
+        self._evicted.append(session_id)
+        self._evicted_total += 1
+        logger.debug("Evicted data layer for session %s (%s)", session_id, reason)
+
+
+# Global singleton instances
 _data_layer: DaemonDataLayer | None = None
+_session_registry: SessionRegistry | None = None
+
+# Partition bound while an event is processed (see use_data_layer)
+_bound_data_layer: ContextVar[DaemonDataLayer | None] = ContextVar("bound_data_layer", default=None)
 
 
 def get_data_layer() -> DaemonDataLayer:
-    """Get the global DaemonDataLayer singleton.
+    """Get the data layer for the event being processed.
 
-    Creates the instance on first access.
+    Returns the session partition bound by use_data_layer(), otherwise
+    the global DaemonDataLayer singleton (created on first access).
 
     Returns:
-        Global DaemonDataLayer instance
+        DaemonDataLayer instance
     """
+    bound = _bound_data_layer.get()
+    if bound is not None:
+        return bound
     global _data_layer
     if _data_layer is None:
         _data_layer = DaemonDataLayer()
     return _data_layer
 
 
+@contextmanager
+def use_data_layer(data_layer: DaemonDataLayer) -> Iterator[DaemonDataLayer]:
+    """Make get_data_layer() return a given data layer in this context.
+
+    Args:
+        data_layer: Data layer to bind (normally a session partition)
+
+    Yields:
+        The bound data layer
+    """
+    token = _bound_data_layer.set(data_layer)
+    try:
+        yield data_layer
+    finally:
+        _bound_data_layer.reset(token)
+
+
+def get_session_registry() -> SessionRegistry:
+    """Get the global SessionRegistry singleton.
+
+    Returns:
+        Global SessionRegistry instance
+    """
+    global _session_registry
+    if _session_registry is None:
+        _session_registry = SessionRegistry()
+    return _session_registry
+
+
 def reset_data_layer() -> None:
-    """Reset the global data layer (for testing).
+    """Reset the global data layer and session partitions (for testing).
 
     WARNING: Only use in test teardown.
     """
-    global _data_layer
+    global _data_layer, _session_registry
     _data_layer = None
+    _session_registry = None
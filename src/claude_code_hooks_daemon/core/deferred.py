@@ -0,0 +1,386 @@
+"""Deferred side-effect work, run after the response is sent.
+
+Logging and archival handlers used to write their files inside the
+request, so the agent waited on disk I/O that has no bearing on the
+answer. Handlers now hand that work to defer(). While the daemon is
+serving a request, deferred tasks are collected and released to a
+background worker once the response has been written to the client. The
+worker runs queued tasks in batches and flushes the shared appenders
+after each batch.
+
+JSONL logs go through append_line(), which keeps one buffered writer per
+file (shared by every handler appending to it) and rotates the file when
+it grows past a size limit.
+
+Outside the daemon (CLI, tests) no worker is started and deferred tasks
+run immediately on the calling thread, with files flushed and closed
+straight after.
+
+Tasks let their errors propagate: the worker logs each failure with the
+task's name and counts it (``failed``, or ``write_errors`` for a failed
+flush or close), so a broken log file shows up in daemon metrics.
+
+Usage:
+    log_line = json.dumps(entry)
+    defer(lambda: append_line(log_path, log_line))
+"""
+
+import contextlib
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+DeferredTask = Callable[[], object]
+
+# Tasks run before the appenders are flushed
+_BATCH_SIZE = 100
+
+# Tasks queued before new ones are dropped (the worker has fallen behind)
+_MAX_QUEUED = 5000
+
+# Seconds shutdown() waits for queued tasks to run
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+# Size at which an appended file is rotated, and rotated copies kept
+_ROTATE_MAX_BYTES = 10 * 1024 * 1024
+_ROTATE_BACKUPS = 3
+
+_STOP = object()
+
+# Tasks deferred by the request being processed (None = not in a request)
+_request_tasks: ContextVar[list[DeferredTask] | None] = ContextVar(
+    "deferred_request_tasks", default=None
+)
+
+
+class BufferedAppender:
+    """Buffered line writer for one file, rotated by size (thread-safe)."""
+
+    __slots__ = ("_backups", "_file", "_lock", "_max_bytes", "_path", "_size")
+
+    def __init__(
+        self, path: Path, *, max_bytes: int = _ROTATE_MAX_BYTES, backups: int = _ROTATE_BACKUPS
+    ) -> None:
+        """Configure the appender (the file is opened on first write).
+
+        Args:
+            path: File to append to
+            max_bytes: Rotate once the file reaches this size
+            backups: Rotated copies to keep (path.1 is the newest)
+        """
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._size = 0
+
+    @property
+    def path(self) -> Path:
+        """File being appended to."""
+        return self._path
+
+    def write_line(self, line: str) -> None:
+        """Append a line (buffered until flush()).
+
+        Args:
+            line: Line to append, without the trailing newline
+
+        Raises:
+            OSError: If the file cannot be opened, written or rotated
+        """
+        data = line + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open()
+            assert self._file is not None  # nosec B101 - set by _open()
+            self._file.write(data)
+            self._size += len(data.encode())
+            if self._size >= self._max_bytes:
+                self._rotate()
+
+    def flush(self) -> None:
+        """Write buffered lines to disk.
+
+        Raises:
+            OSError: If the write fails
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file (reopened by the next write)."""
+        with self._lock:
+            self._close()
+
+    def _open(self) -> None:
+        """Open the file for appending, creating its directory."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("a", encoding="utf-8")
+        try:
+            self._size = self._path.stat().st_size
+        except OSError:
+            self._size = 0
+
+    def _close(self) -> None:
+        """Close the file if open (caller holds the lock)."""
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def _rotate(self) -> None:
+        """Shift rotated copies up by one and start a new file."""
+        self._close()
+        self._size = 0
+        if self._backups <= 0:
+            self._path.unlink(missing_ok=True)
+            return
+        for index in range(self._backups - 1, 0, -1):
+            older = self._path.with_name(f"{self._path.name}.{index}")
+            if older.exists():
+                older.replace(self._path.with_name(f"{self._path.name}.{index + 1}"))
+        self._path.replace(self._path.with_name(f"{self._path.name}.1"))
+
+
+class DeferredWork:
+    """Bounded queue of deferred tasks and the thread that runs them."""
+
+    __slots__ = (
+        "_appenders",
+        "_appenders_lock",
+        "_completed",
+        "_dropped",
+        "_failed",
+        "_queue",
+        "_thread",
+        "_write_errors",
+    )
+
+    def __init__(self) -> None:
+        """Create with no worker running (tasks run inline until start())."""
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=_MAX_QUEUED)
+        self._thread: threading.Thread | None = None
+        self._appenders: dict[Path, BufferedAppender] = {}
+        self._appenders_lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._write_errors = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether a background worker is running tasks."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="deferred-work", daemon=True)
+        self._thread.start()
+
+    def submit(self, task: DeferredTask) -> None:
+        """Queue a task for the worker (never blocks).
+
+        Without a running worker the task runs now and its files are
+        flushed and closed.
+
+        Args:
+            task: Zero-argument callable; exceptions are logged, not raised
+        """
+        if self._thread is None:
+            self._run_task(task)
+            self._close_appenders()
+            return
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            self._dropped += 1
+
+    def appender(self, path: Path) -> BufferedAppender:
+        """Get the shared appender for a file.
+
+        Args:
+            path: File to append to
+
+        Returns:
+            The one appender every task uses for this file
+        """
+        with self._appenders_lock:
+            appender = self._appenders.get(path)
+            if appender is None:
+                appender = BufferedAppender(path)
+                self._appenders[path] = appender
+            return appender
+
+    def shutdown(self, timeout: float = _SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Run queued tasks, flush and close files, and stop the worker.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        thread = self._thread
+        if thread is not None:
+            # Blocking put: the sentinel must not be dropped when the queue is full
+            with contextlib.suppress(queue.Full):
+                self._queue.put(_STOP, timeout=timeout)
+            thread.join(timeout)
+            self._thread = None
+        self._close_appenders()
+
+    def snapshot(self) -> dict[str, int | bool]:
+        """Get worker counters.
+
+        Returns:
+            Whether the worker runs, tasks queued, tasks completed, failed
+            and dropped since startup, and failed flushes and closes
+        """
+        return {
+            "running": self._thread is not None,
+            "queued": self._queue.qsize(),
+            "completed": self._completed,
+            "failed": self._failed,
+            "dropped": self._dropped,
+            "write_errors": self._write_errors,
+        }
+
+    def _run(self) -> None:
+        """Worker thread: run queued tasks in batches, flushing after each."""
+        while True:
+            item = self._queue.get()
+            batch: list[DeferredTask] = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)  # type: ignore[arg-type]
+                if len(batch) >= _BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            for task in batch:
+                self._run_task(task)
+            self._flush_appenders()
+            if stop:
+                return
+
+    def _run_task(self, task: DeferredTask) -> None:
+        """Run one task (fail-open).
+
+        Args:
+            task: Task to run
+        """
+        try:
+            task()
+            self._completed += 1
+        except Exception as e:
+            self._failed += 1
+            logger.warning(
+                "Deferred task %s failed: %s", getattr(task, "__qualname__", repr(task)), e
+            )
+
+    def _flush_appenders(self) -> None:
+        """Flush every appender (fail-open, counted in write_errors)."""
+        with self._appenders_lock:
+            appenders = list(self._appenders.values())
+        for appender in appenders:
+            try:
+                appender.flush()
+            except OSError as e:
+                self._write_errors += 1
+                logger.warning("Failed to flush %s: %s", appender.path, e)
+
+    def _close_appenders(self) -> None:
+        """Close and forget every appender (fail-open, counted in write_errors)."""
+        with self._appenders_lock:
+            appenders = list(self._appenders.values())
+            self._appenders.clear()
+        for appender in appenders:
+            try:
+                appender.close()
+            except OSError as e:
+                self._write_errors += 1
+                logger.warning("Failed to close %s: %s", appender.path, e)
+
+
+_deferred_work = DeferredWork()
+
+
+def get_deferred_work() -> DeferredWork:
+    """Get the process-wide deferred work queue.
+
+    Returns:
+        The DeferredWork the daemon starts and shuts down
+    """
+    return _deferred_work
+
+
+def defer(task: DeferredTask) -> None:
+    """Run a side-effect task after the current response is sent.
+
+    Args:
+        task: Zero-argument callable; exceptions are logged, not raised
+    """
+    tasks = _request_tasks.get()
+    if tasks is not None:
+        tasks.append(task)
+    else:
+        _deferred_work.submit(task)
+
+
+def append_line(path: Path, line: str) -> None:
+    """Append a line to a file through its shared buffered appender.
+
+    For use inside deferred tasks: the line reaches disk when the worker
+    flushes after its batch.
+
+    Args:
+        path: File to append to
+        line: Line to append, without the trailing newline
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    _deferred_work.appender(path).write_line(line)
+
+
+@contextlib.contextmanager
+def collect_deferred() -> Iterator[list[DeferredTask]]:
+    """Collect tasks deferred while serving a request.
+
+    The daemon wraps each request in this and passes the collected tasks
+    to release_deferred() once the response has been written. Worker
+    threads see the collection when the request's context is copied to
+    them.
+
+    Yields:
+        List the request's deferred tasks are appended to
+    """
+    tasks: list[DeferredTask] = []
+    token = _request_tasks.set(tasks)
+    try:
+        yield tasks
+    finally:
+        _request_tasks.reset(token)
+
+
+def release_deferred(tasks: list[DeferredTask]) -> None:
+    """Queue a request's collected tasks for the worker.
+
+    Args:
+        tasks: Tasks from collect_deferred() (emptied, so a second call is a no-op)
+    """
+    pending = tasks[:]
+    tasks.clear()
+    for task in pending:
+        _deferred_work.submit(task)
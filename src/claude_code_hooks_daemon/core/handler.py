@@ -8,9 +8,11 @@ hook events.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from claude_code_hooks_daemon.constants.handlers import HandlerIDMeta
     from claude_code_hooks_daemon.core.hook_result import HookResult
 
@@ -36,6 +38,12 @@ class Handler(ABC):
                             options as the parent handler (optional, default None).
         depends_on: List of handler names that must be enabled for this handler to work.
                    Used for validation at config load time (optional, default None).
+        segment_ttl_seconds: Class attribute for status line handlers: seconds a
+                   segment may be served from cache while segment_cache_key()
+                   is unchanged (default None, recompute every event).
+        parallel_safe: Class attribute: a terminal handler that may run
+                   concurrently with the rest of its chain (default False).
+                   Non-terminal handlers always may.
 
     Priority Ranges (Convention):
         0-19:  Critical safety (destructive git, dangerous commands)
@@ -59,6 +67,15 @@ class Handler(ABC):
 
     _project_languages: list[str] | None
 
+    # Status line handlers: seconds a computed segment may be reused while
+    # segment_cache_key() is unchanged (None = recompute on every event)
+    segment_ttl_seconds: ClassVar[float | None] = None
+
+    # Terminal handlers whose matches()/handle() have no side effects can
+    # set this so their chain still runs concurrently (results are merged
+    # in priority order, so a match still stops later handlers' output)
+    parallel_safe: ClassVar[bool] = False
+
     def __init__(
         self,
         handler_id: str | HandlerIDMeta | None = None,
@@ -153,6 +170,20 @@ class Handler(ABC):
         """
         ...
 
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        """Return a value that changes whenever the cached segment is stale.
+
+        Only used when segment_ttl_seconds is set. Must be much cheaper
+        than handle() (e.g. a file mtime or a field of the input).
+
+        Args:
+            hook_input: Status event input
+
+        Returns:
+            Invalidation key (default None: the TTL alone decides)
+        """
+        return None
+
     @abstractmethod
     def get_claude_md(self) -> str | None:
         """Return markdown content to inject into project CLAUDE.md.
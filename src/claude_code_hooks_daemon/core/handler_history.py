@@ -1,7 +1,9 @@
 """Handler decision history log.
 
 Tracks previous handler decisions within a session for cross-handler
-access via the DaemonDataLayer.
+access via the DaemonDataLayer. Block counts are kept as running counters
+so the hot queries (count_blocks_by_handler, was_blocked) are O(1). An
+optional DecisionStore (see daemon.history_store) persists every decision.
 
 Usage:
     history = HandlerHistory()
@@ -12,15 +14,21 @@ Usage:
 """
 
 import logging
+import sys
+import threading
 import time
-from collections import deque
-from dataclasses import dataclass
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
 # Default maximum number of decision records to retain
 DEFAULT_MAX_SIZE = 1000
 
+# Decisions that count as blocks
+BLOCK_DECISIONS = frozenset({"deny", "ask"})
+
 
 @dataclass(frozen=True, slots=True)
 class HandlerDecisionRecord:
@@ -33,6 +41,7 @@ class HandlerDecisionRecord:
         tool_name: Tool involved in the event
         reason: Optional reason for the decision
         timestamp: Unix timestamp when decision was made
+        session_id: Claude Code session the event came from, if known
     """
 
     handler_id: str
@@ -41,6 +50,15 @@ class HandlerDecisionRecord:
     tool_name: str
     reason: str | None
     timestamp: float
+    session_id: str | None = None
+
+
+class DecisionStore(Protocol):
+    """Persistent destination for decisions (must not block)."""
+
+    def add(self, record: HandlerDecisionRecord) -> None:
+        """Queue a decision for persistence."""
+        ...
 
 
 class HandlerHistory:
@@ -53,7 +71,16 @@ class HandlerHistory:
         total_count: Total number of decisions ever recorded (not limited by max_size)
     """
 
-    __slots__ = ("_max_size", "_records", "_total_count")
+    __slots__ = (
+        "_block_count",
+        "_blocks_by_handler",
+        "_blocks_by_tool",
+        "_lock",
+        "_max_size",
+        "_records",
+        "_store",
+        "_total_count",
+    )
 
     def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
         """Initialise with empty history.
@@ -64,12 +91,43 @@ class HandlerHistory:
         self._records: deque[HandlerDecisionRecord] = deque(maxlen=max_size)
         self._max_size = max_size
         self._total_count = 0
+        # Block counters over the retained records, updated on append and eviction
+        self._block_count = 0
+        self._blocks_by_handler: Counter[str] = Counter()
+        self._blocks_by_tool: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._store: DecisionStore | None = None
 
     @property
     def total_count(self) -> int:
         """Total number of decisions ever recorded."""
         return self._total_count
 
+    def __len__(self) -> int:
+        """Number of retained records."""
+        return len(self._records)
+
+    def approximate_bytes(self) -> int:
+        """Estimate the memory held by retained records.
+
+        Returns:
+            Size in bytes of the records and their reasons (shared strings
+            such as handler IDs are not counted)
+        """
+        with self._lock:
+            return sys.getsizeof(self._records) + sum(
+                sys.getsizeof(r) + (sys.getsizeof(r.reason) if r.reason else 0)
+                for r in self._records
+            )
+
+    def attach_store(self, store: DecisionStore | None) -> None:
+        """Send every decision recorded from now on to a persistent store.
+
+        Args:
+            store: Store to write to, or None to stop persisting
+        """
+        self._store = store
+
     def record(
         self,
         *,
@@ -78,6 +136,7 @@ class HandlerHistory:
         decision: str,
         tool_name: str,
         reason: str | None = None,
+        session_id: str | None = None,
     ) -> None:
         """Record a handler decision.
 
@@ -87,6 +146,7 @@ class HandlerHistory:
             decision: Decision made (allow, deny, ask)
             tool_name: Tool involved in the event
             reason: Optional reason for the decision
+            session_id: Claude Code session the event came from
         """
         record = HandlerDecisionRecord(
             handler_id=handler_id,
@@ -95,9 +155,17 @@ class HandlerHistory:
             tool_name=tool_name,
             reason=reason,
             timestamp=time.time(),
+            session_id=session_id,
         )
-        self._records.append(record)
-        self._total_count += 1
+        with self._lock:
+            if len(self._records) == self._max_size:
+                self._count(self._records[0], -1)
+            self._records.append(record)
+            self._count(record, 1)
+            self._total_count += 1
+        store = self._store
+        if store is not None:
+            store.add(record)
 
         logger.debug(
             "HandlerHistory: %s -> %s for %s (%s)",
@@ -129,7 +197,7 @@ class HandlerHistory:
         Returns:
             Number of deny and ask decisions
         """
-        return sum(1 for r in self._records if r.decision in ("deny", "ask"))
+        return self._block_count
 
     def count_blocks_by_handler(self, handler_id: str) -> int:
         """Count block decisions (deny + ask) from a specific handler.
@@ -140,9 +208,7 @@ class HandlerHistory:
         Returns:
             Number of deny and ask decisions from the specified handler
         """
-        return sum(
-            1 for r in self._records if r.handler_id == handler_id and r.decision in ("deny", "ask")
-        )
+        return self._blocks_by_handler.get(handler_id, 0)
 
     def was_blocked(self, tool_name: str) -> bool:
         """Check if a tool was ever blocked (deny or ask) in this session.
@@ -153,14 +219,71 @@ class HandlerHistory:
         Returns:
             True if tool was blocked at least once
         """
-        return any(
-            r.tool_name == tool_name and r.decision in ("deny", "ask") for r in self._records
-        )
+        return self._blocks_by_tool.get(tool_name, 0) > 0
+
+    def export(self, since: float | None = None, limit: int | None = None) -> dict[str, Any]:
+        """Serialise the history for transfer to another daemon process.
+
+        Args:
+            since: Only include records made at or after this Unix timestamp
+            limit: Only include this many of the most recent records
+
+        Returns:
+            JSON-compatible dictionary (see restore())
+        """
+        records = [r for r in self._records if since is None or r.timestamp >= since]
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return {
+            "total_count": self._total_count,
+            "records": [asdict(r) for r in records],
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load history exported by another daemon process, oldest first.
+
+        Restored records go before any recorded since this process started,
+        and total_count includes both.
+
+        Args:
+            data: Dictionary produced by export()
+        """
+        restored = [HandlerDecisionRecord(**r) for r in data.get("records", [])]
+        with self._lock:
+            current = list(self._records)
+            self._clear()
+            # Appending through a full deque evicts the oldest, restored first
+            self._records.extend(restored)
+            self._records.extend(current)
+            for record in self._records:
+                self._count(record, 1)
+            self._total_count += int(data.get("total_count", len(restored)))
 
     def reset(self) -> None:
         """Reset all history.
 
         WARNING: Only use in testing or session cleanup.
         """
+        with self._lock:
+            self._clear()
+            self._total_count = 0
+
+    def _clear(self) -> None:
+        """Drop retained records and their counters (caller holds the lock)."""
         self._records.clear()
-        self._total_count = 0
+        self._block_count = 0
+        self._blocks_by_handler.clear()
+        self._blocks_by_tool.clear()
+
+    def _count(self, record: HandlerDecisionRecord, delta: int) -> None:
+        """Apply a record to the block counters (caller holds the lock).
+
+        Args:
+            record: Record entering (delta 1) or leaving (delta -1) the window
+            delta: +1 or -1
+        """
+        if record.decision not in BLOCK_DECISIONS:
+            return
+        self._block_count += delta
+        self._blocks_by_handler[record.handler_id] += delta
+        self._blocks_by_tool[record.tool_name] += delta
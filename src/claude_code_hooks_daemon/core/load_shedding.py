@@ -0,0 +1,244 @@
+"""Priority-aware load shedding of low-priority handlers.
+
+When many sessions saturate the daemon, advisory and logging handlers
+(British English, critical-thinking advisory, notification logging) cost
+as much per request as safety handlers. A LoadShedder watches recent
+request latency (p95) and the number of requests waiting for a worker;
+while either is over its threshold, non-terminal handlers at or above a
+minimum priority are skipped, or run for only one request in N.
+
+Handlers in the safety band (priority up to PriorityRange.SAFETY_MAX) and
+terminal handlers are never shed, so load can never change a block
+decision. Every shed handler is counted and reported by the caller.
+
+Usage:
+    shedder = LoadShedder()
+    shedder.configure(enabled=True, min_priority=55, p95_threshold_ms=250.0)
+    if shedder.should_shed(handler):
+        ...  # skip it
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from claude_code_hooks_daemon.constants.priority import PriorityRange
+from claude_code_hooks_daemon.utils.latency import percentile
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.core.handler import Handler
+
+logger = logging.getLogger(__name__)
+
+# Handlers at or below this priority are never shed
+PROTECTED_MAX_PRIORITY = PriorityRange.SAFETY_MAX
+
+# Lowest priority shed by default: the advisory handlers (55-60) and
+# logging handlers (100+)
+DEFAULT_MIN_PRIORITY = 55
+
+DEFAULT_P95_THRESHOLD_MS = 250.0
+DEFAULT_QUEUE_DEPTH_THRESHOLD = 8
+DEFAULT_LATENCY_WINDOW = 200
+
+# Prefix of the context line added to responses that had handlers shed
+SHED_CONTEXT_PREFIX = "[hooks-daemon load shedding]"
+
+# Pressure is re-evaluated at most this often
+_EVALUATE_INTERVAL_SECONDS = 0.5
+
+# Once shedding starts it lasts at least this long, so it does not flap
+# as the latency it saves pulls p95 back under the threshold
+_MIN_ACTIVE_SECONDS = 5.0
+
+_LATENCY_PERCENTILE = 95
+
+
+class LoadShedder:
+    """Decides, per handler, whether to skip it under latency pressure.
+
+    Thread-safe: handler chains call should_shed() from executor threads.
+    Disabled until configure() enables it.
+    """
+
+    __slots__ = (
+        "_activations",
+        "_active",
+        "_active_since",
+        "_enabled",
+        "_evaluated_at",
+        "_latencies",
+        "_lock",
+        "_min_priority",
+        "_p95_ms",
+        "_p95_threshold_ms",
+        "_queue_depth",
+        "_queue_depth_provider",
+        "_queue_depth_threshold",
+        "_sample_one_in",
+        "_sampled_total",
+        "_seen",
+        "_shed",
+    )
+
+    def __init__(self) -> None:
+        """Create a disabled shedder with the default thresholds."""
+        self._lock = threading.Lock()
+        self._enabled = False
+        self._min_priority = DEFAULT_MIN_PRIORITY
+        self._p95_threshold_ms = DEFAULT_P95_THRESHOLD_MS
+        self._queue_depth_threshold = DEFAULT_QUEUE_DEPTH_THRESHOLD
+        self._sample_one_in: int | None = None
+        self._latencies: deque[float] = deque(maxlen=DEFAULT_LATENCY_WINDOW)
+        self._queue_depth_provider: Callable[[], int] | None = None
+        self._active = False
+        self._active_since = 0.0
+        self._evaluated_at = 0.0
+        self._p95_ms = 0.0
+        self._queue_depth = 0
+        self._activations = 0
+        self._sampled_total = 0
+        self._seen: Counter[str] = Counter()
+        self._shed: Counter[str] = Counter()
+
+    def configure(
+        self,
+        *,
+        enabled: bool,
+        min_priority: int = DEFAULT_MIN_PRIORITY,
+        p95_threshold_ms: float = DEFAULT_P95_THRESHOLD_MS,
+        queue_depth_threshold: int = DEFAULT_QUEUE_DEPTH_THRESHOLD,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
+        sample_one_in: int | None = None,
+    ) -> None:
+        """Set the thresholds and what may be shed.
+
+        Args:
+            enabled: Shed handlers under pressure (False = never)
+            min_priority: Lowest priority that may be shed (raised above the safety band)
+            p95_threshold_ms: Shed while recent p95 latency is at or over this
+            queue_depth_threshold: Shed while at least this many requests wait for a worker
+            latency_window: Recent requests the p95 is computed over
+            sample_one_in: Run a shed handler for one request in N (None = skip always)
+        """
+        with self._lock:
+            self._enabled = enabled
+            self._min_priority = max(min_priority, PROTECTED_MAX_PRIORITY + 1)
+            self._p95_threshold_ms = p95_threshold_ms
+            self._queue_depth_threshold = queue_depth_threshold
+            self._sample_one_in = sample_one_in
+            self._latencies = deque(self._latencies, maxlen=latency_window)
+            self._evaluated_at = 0.0
+            if not enabled:
+                self._active = False
+
+    def attach_queue_depth(self, provider: Callable[[], int] | None) -> None:
+        """Use a callable reporting how many requests wait for a worker.
+
+        Args:
+            provider: Returns the current queue depth (None = latency only)
+        """
+        with self._lock:
+            self._queue_depth_provider = provider
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Record one request's processing time.
+
+        Args:
+            latency_ms: Processing time in milliseconds
+        """
+        with self._lock:
+            self._latencies.append(latency_ms)
+
+    def should_shed(self, handler: "Handler") -> bool:
+        """Decide whether to skip a handler for the current request.
+
+        Args:
+            handler: Handler about to be matched
+
+        Returns:
+            True if the handler should be skipped (and is counted as shed)
+        """
+        if not self._enabled or handler.terminal or handler.priority < self._min_priority:
+            return False
+        if not self._under_pressure():
+            return False
+        with self._lock:
+            if self._sample_one_in is not None:
+                self._seen[handler.name] += 1
+                if self._seen[handler.name] % self._sample_one_in == 0:
+                    self._sampled_total += 1
+                    return False
+            self._shed[handler.name] += 1
+            return True
+
+    def _under_pressure(self) -> bool:
+        """Re-evaluate pressure if due and report whether shedding is on.
+
+        Returns:
+            True while handlers are being shed
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._evaluated_at < _EVALUATE_INTERVAL_SECONDS:
+                return self._active
+            self._evaluated_at = now
+            self._p95_ms = (
+                percentile(self._latencies, _LATENCY_PERCENTILE) if self._latencies else 0.0
+            )
+            try:
+                provider = self._queue_depth_provider
+                self._queue_depth = provider() if provider is not None else 0
+            except Exception:
+                logger.debug("Queue depth provider failed", exc_info=True)
+                self._queue_depth = 0
+
+            pressure = (
+                self._p95_ms >= self._p95_threshold_ms
+                or self._queue_depth >= self._queue_depth_threshold
+            )
+            if pressure and not self._active:
+                self._active = True
+                self._active_since = now
+                self._activations += 1
+                logger.warning(
+                    "Load shedding on (p95 %.1fms, queue depth %d): skipping handlers "
+                    "at priority %d and above",
+                    self._p95_ms,
+                    self._queue_depth,
+                    self._min_priority,
+                )
+            elif not pressure and self._active and now - self._active_since >= _MIN_ACTIVE_SECONDS:
+                self._active = False
+                logger.info(
+                    "Load shedding off (p95 %.1fms, queue depth %d)",
+                    self._p95_ms,
+                    self._queue_depth,
+                )
+            return self._active
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get shedding state and counters.
+
+        Returns:
+            Whether shedding is enabled and active, the last measured p95
+            and queue depth, thresholds, and shed/sampled counts
+        """
+        with self._lock:
+            return {
+                "enabled": self._enabled,
+                "active": self._active,
+                "min_priority": self._min_priority,
+                "p95_ms": self._p95_ms,
+                "p95_threshold_ms": self._p95_threshold_ms,
+                "queue_depth": self._queue_depth,
+                "queue_depth_threshold": self._queue_depth_threshold,
+                "sample_one_in": self._sample_one_in,
+                "activations": self._activations,
+                "shed_total": sum(self._shed.values()),
+                "sampled_total": self._sampled_total,
+                "shed_by_handler": dict(self._shed),
+            }
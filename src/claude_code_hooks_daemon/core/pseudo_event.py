@@ -12,16 +12,27 @@ Key concepts:
 - Setup functions: Shared preparation (e.g., transcript reading) runs ONCE
   per pseudo-event fire, then all handlers receive the prepared data
 - Result merging: DENY wins, context accumulates
+- Background evaluation: with ``background: true`` a fire is handed to the
+  dispatcher's own thread pool once the triggering event's response is
+  sent (see core.deferred). Its result is parked for the session and merged
+  into the next event of a trigger type, unless it is older than
+  ``max_staleness_seconds`` by then. Fires for one session (background or
+  not) run one at a time, so setup state such as transcript offsets is
+  never updated concurrently
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult, HandlerChain
+from claude_code_hooks_daemon.core.deferred import defer
 from claude_code_hooks_daemon.core.event import EventType
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
 
@@ -30,6 +41,29 @@ logger = logging.getLogger(__name__)
 # Type alias for setup functions: (hook_input, session_id) -> enriched_hook_input | None
 SetupFunction = Callable[[dict[str, Any], str], dict[str, Any] | None]
 
+# Seconds a background result may wait for the next eligible event by default
+DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+# Threads evaluating background pseudo-events once start_background() is called
+_BACKGROUND_WORKERS = 2
+
+
+@runtime_checkable
+class StatefulSetup(Protocol):
+    """Setup function whose per-session state can move to another daemon process."""
+
+    def export(self, max_sessions: int | None = None) -> dict[str, Any]:
+        """Serialise per-session state."""
+        ...
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load per-session state from export()."""
+        ...
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop a session's state (the session ended or was evicted)."""
+        ...
+
 
 @dataclass(frozen=True, slots=True)
 class PseudoEventTrigger:
@@ -104,12 +138,18 @@ class PseudoEventConfig:
         enabled: Whether this pseudo-event is active.
         triggers: List of trigger bindings to real events.
         handler_configs: Handler-specific config dict keyed by handler name.
+        background: Evaluate after the triggering response is sent and
+            deliver the result with the session's next eligible event.
+        max_staleness_seconds: Discard a background result not delivered
+            within this many seconds.
     """
 
     name: str
     enabled: bool
     triggers: tuple[PseudoEventTrigger, ...]
     handler_configs: dict[str, dict[str, Any]]
+    background: bool = False
+    max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS
 
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> PseudoEventConfig:
@@ -117,7 +157,8 @@ class PseudoEventConfig:
 
         Args:
             name: Pseudo-event name
-            data: Config dict with keys: enabled, triggers, handlers
+            data: Config dict with keys: enabled, triggers, handlers,
+                background, max_staleness_seconds
 
         Returns:
             Parsed PseudoEventConfig
@@ -134,11 +175,20 @@ class PseudoEventConfig:
         triggers = tuple(PseudoEventTrigger.from_string(s) for s in trigger_strs)
         handler_configs = data.get("handlers", {})
 
+        background = bool(data.get("background", False))
+        max_staleness = float(data.get("max_staleness_seconds", DEFAULT_MAX_STALENESS_SECONDS))
+        if max_staleness <= 0:
+            raise ValueError(
+                f"Pseudo-event {name!r}: max_staleness_seconds must be > 0, got {max_staleness}"
+            )
+
         return cls(
             name=name,
             enabled=enabled,
             triggers=triggers,
             handler_configs=handler_configs,
+            background=background,
+            max_staleness_seconds=max_staleness,
         )
 
 
@@ -151,20 +201,41 @@ class _RegisteredPseudoEvent:
     chain: HandlerChain
 
 
+@dataclass(frozen=True, slots=True)
+class _ParkedResult:
+    """Internal: a background pseudo-event result waiting for delivery."""
+
+    name: str
+    result: HookResult
+    parked_at: float
+
+
 class PseudoEventDispatcher:
     """Manages pseudo-event triggering, setup, and handler chain dispatch.
 
     Maintains per-session counters for each pseudo-event trigger and orchestrates
-    the setup → dispatch → result flow when a trigger fires.
+    the setup → dispatch → result flow when a trigger fires. Results of
+    background pseudo-events are parked per session until the next eligible
+    event.
+
+    Without start_background() (CLI, tests) background fires run inline
+    when the request's deferred work is released.
     """
 
-    __slots__ = ("_counters", "_registered")
+    __slots__ = ("_background", "_counters", "_fire_locks", "_lock", "_parked", "_registered")
 
     def __init__(self) -> None:
         """Initialise empty dispatcher."""
         self._registered: list[_RegisteredPseudoEvent] = []
+        # Guards counters, parked results, fire locks and the pool
+        self._lock = threading.Lock()
         # Counters: {session_id: {pseudo_event_name: {event_type_value: count}}}
         self._counters: dict[str, dict[str, dict[str, int]]] = {}
+        # Background results: {session_id: [parked result, ...]} (written by the pool)
+        self._parked: dict[str, list[_ParkedResult]] = {}
+        # Held while a session's setup and chain run: {session_id: lock}
+        self._fire_locks: dict[str, threading.Lock] = {}
+        self._background: ThreadPoolExecutor | None = None
 
     def register(
         self,
@@ -192,6 +263,10 @@ class PseudoEventDispatcher:
     ) -> list[HookResult]:
         """Check all pseudo-event triggers and fire those that match.
 
+        Background pseudo-events are queued to run after this event's
+        response; results they parked earlier for the session are returned
+        instead.
+
         Args:
             event_type: The real event type that just occurred
             hook_input: Original hook input from the real event
@@ -199,24 +274,127 @@ class PseudoEventDispatcher:
 
         Returns:
             List of HookResults from pseudo-event handler chains that fired
+            (or, for background pseudo-events, fired earlier)
         """
         results: list[HookResult] = []
 
         for registered in self._registered:
-            if not registered.config.enabled:
+            config = registered.config
+            if not config.enabled:
                 continue
 
-            for trigger in registered.config.triggers:
+            if config.background and any(t.event_type == event_type for t in config.triggers):
+                results.extend(self._take_parked(config, session_id))
+
+            for trigger in config.triggers:
                 if trigger.event_type != event_type:
                     continue
 
-                if self._should_fire(registered.config.name, trigger, session_id):
+                if self._should_fire(config.name, trigger, session_id):
+                    if config.background:
+                        self._fire_in_background(registered, hook_input, session_id)
+                        continue
                     result = self._fire(registered, hook_input, session_id)
                     if result is not None:
                         results.append(result)
 
         return results
 
+    def start_background(self, max_workers: int = _BACKGROUND_WORKERS) -> None:
+        """Evaluate background pseudo-events on a thread pool of their own.
+
+        Keeps slow fires (e.g. transcript audits) off the deferred-work
+        thread, which flushes log files.
+
+        Args:
+            max_workers: Pool size
+        """
+        with self._lock:
+            if self._background is None:
+                self._background = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="hooks-daemon-pseudo-event"
+                )
+
+    def shutdown_background(self) -> None:
+        """Stop the background pool, cancelling fires that have not started."""
+        with self._lock:
+            pool, self._background = self._background, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def export(self, max_sessions: int | None = None) -> dict[str, Any]:
+        """Serialise trigger counters and setup state for another daemon process.
+
+        Args:
+            max_sessions: Keep only the most recently started sessions
+
+        Returns:
+            JSON-compatible dictionary (see restore())
+        """
+        with self._lock:
+            session_ids = list(self._counters)
+            if max_sessions is not None:
+                session_ids = session_ids[-max_sessions:] if max_sessions > 0 else []
+            counters = {
+                session_id: {
+                    name: dict(counts) for name, counts in self._counters[session_id].items()
+                }
+                for session_id in session_ids
+            }
+        return {
+            "counters": counters,
+            "setup": {name: setup.export(max_sessions) for name, setup in self._stateful_setups()},
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load state exported by another daemon process.
+
+        Restored counts are added to any counted since this process started,
+        so trigger frequencies carry on where they left off.
+
+        Args:
+            data: Dictionary produced by export()
+        """
+        with self._lock:
+            for session_id, events in data.get("counters", {}).items():
+                session_counters = self._counters.setdefault(session_id, {})
+                for pseudo_event_name, counts in events.items():
+                    event_counters = session_counters.setdefault(pseudo_event_name, {})
+                    for event_key, count in counts.items():
+                        event_counters[event_key] = event_counters.get(event_key, 0) + int(count)
+
+        setup_state = data.get("setup", {})
+        for name, setup in self._stateful_setups():
+            state = setup_state.get(name)
+            if state:
+                setup.restore(state)
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop a session's trigger counters and setup state.
+
+        Args:
+            session_id: Session that ended or was evicted
+        """
+        with self._lock:
+            self._counters.pop(session_id, None)
+            self._parked.pop(session_id, None)
+            self._fire_locks.pop(session_id, None)
+        for _, setup in self._stateful_setups():
+            setup.forget_session(session_id)
+
+    def _stateful_setups(self) -> list[tuple[str, StatefulSetup]]:
+        """Registered setup functions that keep per-session state.
+
+        Returns:
+            (pseudo-event name, setup function) pairs
+        """
+        stateful: list[tuple[str, StatefulSetup]] = []
+        for registered in self._registered:
+            setup: object = registered.setup_fn
+            if isinstance(setup, StatefulSetup):
+                stateful.append((registered.config.name, setup))
+        return stateful
+
     def _should_fire(
         self,
         pseudo_event_name: str,
@@ -240,21 +418,22 @@ class PseudoEventDispatcher:
         """
         event_key = trigger.event_type.value
 
-        # Initialise counter path
-        if session_id not in self._counters:
-            self._counters[session_id] = {}
-        session_counters = self._counters[session_id]
+        with self._lock:
+            # Initialise counter path
+            if session_id not in self._counters:
+                self._counters[session_id] = {}
+            session_counters = self._counters[session_id]
 
-        if pseudo_event_name not in session_counters:
-            session_counters[pseudo_event_name] = {}
-        event_counters = session_counters[pseudo_event_name]
+            if pseudo_event_name not in session_counters:
+                session_counters[pseudo_event_name] = {}
+            event_counters = session_counters[pseudo_event_name]
 
-        if event_key not in event_counters:
-            event_counters[event_key] = 0
+            if event_key not in event_counters:
+                event_counters[event_key] = 0
 
-        # Increment
-        event_counters[event_key] += 1
-        count = event_counters[event_key]
+            # Increment
+            event_counters[event_key] += 1
+            count = event_counters[event_key]
 
         # Fire when count lands in the last N positions of each D-sized window
         # For 1/5: fires at 5, 10, 15 (remainder 0, which is in last 1 position)
@@ -274,6 +453,8 @@ class PseudoEventDispatcher:
     ) -> HookResult | None:
         """Run setup function and dispatch through handler chain.
 
+        Waits for any other fire of the same session to finish first.
+
         Args:
             registered: The registered pseudo-event
             hook_input: Original hook input
@@ -283,16 +464,17 @@ class PseudoEventDispatcher:
             HookResult from handler chain, or None if setup returned None
         """
         try:
-            enriched = registered.setup_fn(hook_input, session_id)
-            if enriched is None:
-                logger.debug(
-                    "Pseudo-event %s setup returned None, skipping dispatch",
-                    registered.config.name,
-                )
-                return None
-
-            chain_result = registered.chain.execute(enriched)
-            return chain_result.result
+            with self._fire_lock(session_id):
+                enriched = registered.setup_fn(hook_input, session_id)
+                if enriched is None:
+                    logger.debug(
+                        "Pseudo-event %s setup returned None, skipping dispatch",
+                        registered.config.name,
+                    )
+                    return None
+
+                chain_result = registered.chain.execute(enriched)
+                return chain_result.result
 
         except Exception:
             logger.exception(
@@ -301,6 +483,107 @@ class PseudoEventDispatcher:
             )
             return None
 
+    def _fire_lock(self, session_id: str) -> threading.Lock:
+        """Get the lock serialising a session's fires.
+
+        Args:
+            session_id: Current session
+
+        Returns:
+            The session's fire lock
+        """
+        with self._lock:
+            lock = self._fire_locks.get(session_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._fire_locks[session_id] = lock
+            return lock
+
+    def _fire_in_background(
+        self,
+        registered: _RegisteredPseudoEvent,
+        hook_input: dict[str, Any],
+        session_id: str,
+    ) -> None:
+        """Fire after the current response is sent, parking the result.
+
+        The deferred task only hands the fire to the background pool, so
+        the deferred-work thread is never held by a slow pseudo-event.
+
+        Args:
+            registered: The registered pseudo-event
+            hook_input: Original hook input
+            session_id: Current session
+        """
+        snapshot = dict(hook_input)
+
+        def fire() -> None:
+            result = self._fire(registered, snapshot, session_id)
+            if result is not None:
+                self._park(registered.config.name, session_id, result)
+
+        def submit() -> None:
+            with self._lock:
+                pool = self._background
+            if pool is None:
+                fire()
+                return
+            try:
+                pool.submit(fire)
+            except RuntimeError:
+                # Pool shut down (daemon stopping): the fire is dropped
+                logger.debug("Background pseudo-event %s dropped", registered.config.name)
+
+        defer(submit)
+
+    def _park(self, name: str, session_id: str, result: HookResult) -> None:
+        """Keep a background result for the session's next eligible event.
+
+        Args:
+            name: Pseudo-event name
+            session_id: Session the result belongs to
+            result: Result from the handler chain
+        """
+        with self._lock:
+            # Session forgotten while the pseudo-event ran: nobody to deliver to
+            if session_id not in self._counters:
+                return
+            self._parked.setdefault(session_id, []).append(
+                _ParkedResult(name=name, result=result, parked_at=time.monotonic())
+            )
+
+    def _take_parked(self, config: PseudoEventConfig, session_id: str) -> list[HookResult]:
+        """Remove a pseudo-event's parked results for a session.
+
+        Args:
+            config: Pseudo-event whose results to take
+            session_id: Current session
+
+        Returns:
+            Results parked within max_staleness_seconds (older ones are dropped)
+        """
+        with self._lock:
+            parked = self._parked.get(session_id)
+            if not parked:
+                return []
+            taken = [p for p in parked if p.name == config.name]
+            remaining = [p for p in parked if p.name != config.name]
+            if remaining:
+                self._parked[session_id] = remaining
+            else:
+                del self._parked[session_id]
+
+        oldest_allowed = time.monotonic() - config.max_staleness_seconds
+        fresh = [p.result for p in taken if p.parked_at >= oldest_allowed]
+        if len(fresh) < len(taken):
+            logger.debug(
+                "Dropped %d stale %s results for session %s",
+                len(taken) - len(fresh),
+                config.name,
+                session_id,
+            )
+        return fresh
+
 
 def merge_pseudo_results(
     real: ChainExecutionResult,
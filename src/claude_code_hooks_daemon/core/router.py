@@ -12,7 +12,12 @@ from claude_code_hooks_daemon.core.event import EventType
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from claude_code_hooks_daemon.core.async_handler import Offload
     from claude_code_hooks_daemon.core.handler import Handler
+    from claude_code_hooks_daemon.core.load_shedding import LoadShedder
+    from claude_code_hooks_daemon.core.segment_cache import SegmentCache
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +95,13 @@ class EventRouter:
         return self._chains[event_type].remove(handler_name)
 
     def route(
-        self, event_type: EventType, hook_input: dict[str, Any], strict_mode: bool = False
+        self,
+        event_type: EventType,
+        hook_input: dict[str, Any],
+        strict_mode: bool = False,
+        shedder: "LoadShedder | None" = None,
+        segment_cache: "SegmentCache | None" = None,
+        pool: "Executor | None" = None,
     ) -> ChainExecutionResult:
         """Route an event to its handler chain.
 
@@ -98,10 +109,75 @@ class EventRouter:
             event_type: Type of hook event
             hook_input: Hook input dictionary
             strict_mode: If True, FAIL FAST on handler exceptions (fail-closed)
+            shedder: Skips low-priority handlers under load (None = run all)
+            segment_cache: Reuses status segments within their TTL (None = off)
+            pool: Runs independent handlers concurrently (None = sequential)
 
         Returns:
             Execution result from the handler chain
         """
+        chain = self._chain_for(event_type, hook_input)
+        execution_result = chain.execute(
+            hook_input,
+            strict_mode=strict_mode,
+            shedder=shedder,
+            segment_cache=segment_cache,
+            pool=pool,
+        )
+
+        # Inject config key footer into DENY/ASK results
+        self._inject_config_key_footer(execution_result, event_type, chain)
+
+        return execution_result
+
+    async def route_async(
+        self,
+        event_type: EventType,
+        hook_input: dict[str, Any],
+        offload: "Offload",
+        strict_mode: bool = False,
+        shedder: "LoadShedder | None" = None,
+        segment_cache: "SegmentCache | None" = None,
+        pool: "Executor | None" = None,
+    ) -> ChainExecutionResult:
+        """Route an event to its handler chain from the event loop.
+
+        Async handlers are awaited on the loop (see HandlerChain.execute_async()).
+
+        Args:
+            event_type: Type of hook event
+            hook_input: Hook input dictionary
+            offload: Runs synchronous handlers on a worker thread
+            strict_mode: If True, FAIL FAST on handler exceptions (fail-closed)
+            shedder: Skips low-priority handlers under load (None = run all)
+            segment_cache: Reuses status segments within their TTL (None = off)
+            pool: Runs independent handlers concurrently (None = sequential)
+
+        Returns:
+            Execution result from the handler chain
+        """
+        chain = self._chain_for(event_type, hook_input)
+        execution_result = await chain.execute_async(
+            hook_input,
+            offload,
+            strict_mode=strict_mode,
+            shedder=shedder,
+            segment_cache=segment_cache,
+            pool=pool,
+        )
+        self._inject_config_key_footer(execution_result, event_type, chain)
+        return execution_result
+
+    def _chain_for(self, event_type: EventType, hook_input: dict[str, Any]) -> HandlerChain:
+        """Get the chain an event is routed to, logging the routing.
+
+        Args:
+            event_type: Type of hook event
+            hook_input: Hook input dictionary
+
+        Returns:
+            Handler chain for the event type
+        """
         chain = self._chains[event_type]
         logger.debug(
             "Routing %s event to chain with %d handlers",
@@ -117,13 +193,7 @@ class EventRouter:
                 "PRE_TOOL_USE hook_input:\n%s",
                 json.dumps(hook_input, indent=2, default=str),
             )
-
-        execution_result = chain.execute(hook_input, strict_mode=strict_mode)
-
-        # Inject config key footer into DENY/ASK results
-        self._inject_config_key_footer(execution_result, event_type, chain)
-
-        return execution_result
+        return chain
 
     def _inject_config_key_footer(
         self,
@@ -0,0 +1,148 @@
+"""Per-session cache of status line segments.
+
+Every Status event runs the whole status line chain, and several arrive
+within a few hundred milliseconds. Most segments (git branch, model and
+effort, usage, thinking mode) only change when something they read
+changes. A handler opts in by setting ``segment_ttl_seconds`` and, when
+its output depends on state that can change within the TTL, overriding
+``segment_cache_key()`` to return something cheap that changes with it
+(a file mtime, the context percentage). A cached segment is reused while
+it is younger than the TTL and its key is unchanged; handlers that set
+no TTL (e.g. the clock) run on every event.
+
+Usage:
+    cache = get_data_layer().status_segments
+    result = cache.handle(handler, hook_input)
+"""
+
+import threading
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.core.handler import Handler
+    from claude_code_hooks_daemon.core.hook_result import HookResult
+
+
+@dataclass(frozen=True, slots=True)
+class _Segment:
+    """A cached handler result.
+
+    Attributes:
+        key: Handler's cache key when the result was computed
+        expires_at: Monotonic time after which the result is recomputed
+        result: Result returned by the handler
+    """
+
+    key: Hashable
+    expires_at: float
+    result: "HookResult"
+
+
+def file_mtime_ns(path: Path) -> int | None:
+    """Get a file's modification time for use in a segment cache key.
+
+    Args:
+        path: File the segment reads
+
+    Returns:
+        Modification time in nanoseconds, or None if the file is missing
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class SegmentCache:
+    """Reuses status segment results within their TTL (thread-safe)."""
+
+    __slots__ = ("_hits", "_lock", "_misses", "_segments")
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._lock = threading.Lock()
+        self._segments: dict[str, _Segment] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def handle(self, handler: "Handler", hook_input: dict[str, Any]) -> "HookResult":
+        """Get a handler's result, from cache when still valid.
+
+        Args:
+            handler: Status line handler
+            hook_input: Status event input
+
+        Returns:
+            A copy of the cached result, or the handler's fresh result
+        """
+        if handler.segment_ttl_seconds is None:
+            return handler.handle(hook_input)
+
+        key, cached = self.lookup(handler, hook_input)
+        if cached is not None:
+            return cached
+        result = handler.handle(hook_input)
+        self.store(handler, key, result)
+        return result
+
+    def lookup(
+        self, handler: "Handler", hook_input: dict[str, Any]
+    ) -> "tuple[Hashable, HookResult | None]":
+        """Find a handler's cached result.
+
+        Split from handle() for callers that run the handler themselves
+        (async handlers are awaited on the event loop).
+
+        Args:
+            handler: Status line handler
+            hook_input: Status event input
+
+        Returns:
+            The handler's current cache key, and a copy of the cached
+            result (None on a miss or when the handler sets no TTL)
+        """
+        if handler.segment_ttl_seconds is None:
+            return None, None
+        key = handler.segment_cache_key(hook_input)
+        now = time.monotonic()
+        with self._lock:
+            segment = self._segments.get(handler.name)
+            if segment is not None and segment.key == key and now < segment.expires_at:
+                self._hits += 1
+                return key, segment.result.model_copy(deep=True)
+            self._misses += 1
+        return key, None
+
+    def store(self, handler: "Handler", key: Hashable, result: "HookResult") -> None:
+        """Cache a handler's fresh result.
+
+        Args:
+            handler: Status line handler (ignored when it sets no TTL)
+            key: Cache key returned by lookup()
+            result: Result the handler returned
+        """
+        ttl = handler.segment_ttl_seconds
+        if ttl is None:
+            return
+        with self._lock:
+            self._segments[handler.name] = _Segment(
+                key=key, expires_at=time.monotonic() + ttl, result=result.model_copy(deep=True)
+            )
+
+    def clear(self) -> None:
+        """Drop every cached segment."""
+        with self._lock:
+            self._segments.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Cached segment count, hits and misses
+        """
+        with self._lock:
+            return {"segments": len(self._segments), "hits": self._hits, "misses": self._misses}
@@ -145,6 +145,35 @@ class SessionState:
             return "Haiku"
         return self._model_display_name or "Unknown"
 
+    def export(self) -> dict[str, Any]:
+        """Serialise the state for another daemon process.
+
+        Returns:
+            JSON-compatible dictionary (see restore())
+        """
+        return {
+            "model_id": self._model_id,
+            "model_display_name": self._model_display_name,
+            "context_used_percentage": self._context_used_percentage,
+            "last_updated": self._last_updated.isoformat() if self._last_updated else None,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load state exported by another daemon process.
+
+        Ignored if this process has already seen a StatusLine event, which
+        is newer than anything restored.
+
+        Args:
+            data: Dictionary produced by export()
+        """
+        if self.is_populated or not data.get("last_updated"):
+            return
+        self._model_id = data.get("model_id")
+        self._model_display_name = data.get("model_display_name")
+        self._context_used_percentage = float(data.get("context_used_percentage") or 0.0)
+        self._last_updated = datetime.fromisoformat(data["last_updated"])
+
     def reset(self) -> None:
         """Reset all state to initial values.
 
@@ -12,6 +12,7 @@ Usage:
 
 import json
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -135,6 +136,24 @@ class TranscriptReader:
             transcript_path,
         )
 
+    def approximate_bytes(self) -> int:
+        """Estimate the memory held by the cached transcript (never loads it).
+
+        Returns:
+            Size in bytes of cached messages and their text (parsed JSON
+            dicts counted shallowly)
+        """
+        messages = self._messages
+        tool_uses = self._tool_uses
+        return (
+            sys.getsizeof(messages)
+            + sys.getsizeof(tool_uses)
+            + sum(
+                sys.getsizeof(m) + sys.getsizeof(m.content) + sys.getsizeof(m.raw) for m in messages
+            )
+            + sum(sys.getsizeof(t) + sys.getsizeof(t.raw) for t in tool_uses)
+        )
+
     def _parse(self, path: Path) -> None:
         """Parse JSONL file line by line.
 
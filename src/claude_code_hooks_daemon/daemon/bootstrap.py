@@ -0,0 +1,81 @@
+"""Controller bootstrap helpers shared by the daemon and offline tools.
+
+The daemon process (``start``) and in-process tooling such as ``replay``
+must build a DaemonController from configuration in exactly the same way,
+otherwise offline results would not reflect live behaviour.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claude_code_hooks_daemon.config.models import Config
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+# Event-type config sections passed to HandlerRegistry.register_all()
+HANDLER_CONFIG_SECTIONS: tuple[str, ...] = (
+    "pre_tool_use",
+    "post_tool_use",
+    "session_start",
+    "session_end",
+    "pre_compact",
+    "user_prompt_submit",
+    "permission_request",
+    "notification",
+    "stop",
+    "subagent_stop",
+)
+
+
+def build_handler_config(config: Config) -> dict[str, dict[str, dict[str, Any]]]:
+    """Convert the handlers section of a Config into registry format.
+
+    Args:
+        config: Loaded daemon configuration
+
+    Returns:
+        Mapping of event-type section -> handler name -> handler config dict
+    """
+    return {
+        section: {k: v.model_dump() for k, v in getattr(config.handlers, section).items()}
+        for section in HANDLER_CONFIG_SECTIONS
+    }
+
+
+def build_controller(
+    config: Config,
+    project_path: Path,
+    *,
+    progressive: bool = False,
+    defer_maintenance: bool = False,
+) -> "DaemonController":
+    """Create and initialise a DaemonController from configuration.
+
+    Args:
+        config: Loaded daemon configuration
+        project_path: Project root (workspace root for handlers)
+        progressive: Register critical handlers only; the caller must run
+            controller.complete_startup() to load the rest
+        defer_maintenance: Leave CLAUDE.md injection and config validation to
+            the caller (see DaemonController.maintenance_tasks())
+
+    Returns:
+        Initialised DaemonController
+    """
+    # Imported lazily: the controller pulls in the full handler tree
+    from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+    controller = DaemonController()
+    controller.initialise(
+        build_handler_config(config),
+        workspace_root=project_path,
+        plugins_config=config.plugins,
+        project_handlers_config=config.project_handlers,
+        project_languages=config.daemon.languages,
+        pseudo_events_config=config.pseudo_events or None,
+        plan_workflow=config.plan_workflow,
+        progressive=progressive,
+        defer_maintenance=defer_maintenance,
+    )
+    return controller
@@ -0,0 +1,274 @@
+"""Opt-in traffic capture for the hooks daemon.
+
+Records every hook request the daemon serves, together with its response,
+normalised decision, latency and per-handler timings, as one JSON object per
+line. Captures are replayed by the ``replay`` CLI command to benchmark the
+daemon against real traffic and to detect decision regressions.
+
+Capture record format (version 1)::
+
+    {
+        "v": 1,
+        "ts": 1730000000.123,          # wall-clock time the request arrived
+        "request": {...},              # full request (event + hook_input)
+        "response": {...},             # response returned to Claude Code
+        "decision": "allow",           # normalised decision (see below)
+        "elapsed_ms": 1.42,            # processing time inside the daemon
+        "handlers": {"name": 0.12},    # per-handler time in milliseconds
+        "redact": "none",              # redaction mode the record was written with
+    }
+
+Content-bearing fields (file contents, edit strings, prompts, tool output)
+can be redacted or hashed before they reach disk. Replay sends redacted
+records as written, so handlers that inspect those fields may decide
+differently; replay marks such records instead of trusting their diffs.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from claude_code_hooks_daemon.core.chain import ChainExecutionResult
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.config.models import TrafficCaptureConfig
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_FORMAT_VERSION = 1
+
+RedactMode = Literal["none", "redact", "hash"]
+
+# Fields whose values carry file contents or free text and are redacted
+# wherever they appear inside hook_input
+REDACTED_FIELDS = frozenset(
+    {
+        "content",
+        "edits",
+        "message",
+        "new_string",
+        "old_string",
+        "prompt",
+        "tool_response",
+    }
+)
+
+# Length of the sha256 hex prefix kept in hash mode
+_HASH_PREFIX_LENGTH = 16
+
+
+def decision_from_response(response: dict[str, Any]) -> str:
+    """Derive a normalised decision from a hook response dictionary.
+
+    Works on every event response shape produced by HookResult.to_json(),
+    so captured and replayed responses can be compared regardless of event.
+
+    Args:
+        response: Response dictionary returned by the daemon
+
+    Returns:
+        One of "allow", "deny", "ask" or "error"
+    """
+    if "error" in response:
+        return "error"
+
+    hook_output = response.get("hookSpecificOutput")
+    if isinstance(hook_output, dict):
+        permission_decision = hook_output.get("permissionDecision")
+        if isinstance(permission_decision, str):
+            return permission_decision
+        nested = hook_output.get("decision")
+        if isinstance(nested, dict) and isinstance(nested.get("behavior"), str):
+            return str(nested["behavior"])
+
+    if response.get("decision") == "block":
+        return "deny"
+
+    return "allow"
+
+
+def _redact_value(value: Any, mode: RedactMode) -> str:
+    """Replace a content value with a placeholder or hash.
+
+    Args:
+        value: Original value (string or JSON-serialisable structure)
+        mode: Redaction mode ("redact" or "hash")
+
+    Returns:
+        Redacted representation
+    """
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+    if mode == "hash":
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:_HASH_PREFIX_LENGTH]
+        return f"sha256:{digest}"
+    return f"<redacted:{len(text)} chars>"
+
+
+def redact_payload(payload: Any, mode: RedactMode) -> Any:
+    """Return a copy of payload with content-bearing fields redacted.
+
+    Args:
+        payload: Request or hook_input structure
+        mode: Redaction mode; "none" returns the payload unchanged
+
+    Returns:
+        Redacted copy (or the original payload when mode is "none")
+    """
+    if mode == "none":
+        return payload
+    if isinstance(payload, dict):
+        return {
+            key: (
+                _redact_value(value, mode)
+                if key in REDACTED_FIELDS and value is not None
+                else redact_payload(value, mode)
+            )
+            for key, value in payload.items()
+        }
+    if isinstance(payload, list):
+        return [redact_payload(item, mode) for item in payload]
+    return payload
+
+
+class TrafficCapture:
+    """Thread-safe JSONL writer for captured daemon traffic.
+
+    Records are written from executor threads, so all file access is
+    serialised with a lock. The file is rotated by size, keeping
+    ``backup_count`` older files as ``<name>.1`` .. ``<name>.N``.
+    """
+
+    __slots__ = ("_backup_count", "_lock", "_max_bytes", "_path", "_records", "_redact")
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        backup_count: int,
+        redact: RedactMode = "none",
+    ) -> None:
+        """Initialise traffic capture.
+
+        Args:
+            path: Capture file path (parent directory is created)
+            max_bytes: Rotate once the file grows beyond this size
+            backup_count: Number of rotated files to keep (0 = truncate)
+            redact: Content redaction mode
+        """
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._redact: RedactMode = redact
+        self._lock = threading.Lock()
+        self._records = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, capture_config: "TrafficCaptureConfig") -> "TrafficCapture | None":
+        """Create a capture writer from daemon.traffic_capture settings.
+
+        Args:
+            capture_config: Traffic capture configuration (path must be resolved)
+
+        Returns:
+            TrafficCapture instance, or None when capture is disabled or unusable
+        """
+        if not capture_config.enabled:
+            return None
+        if not capture_config.path:
+            logger.warning("Traffic capture enabled but no capture path set - capture disabled")
+            return None
+        try:
+            capture = cls(
+                path=Path(capture_config.path),
+                max_bytes=capture_config.max_file_bytes,
+                backup_count=capture_config.backup_count,
+                redact=capture_config.redact,
+            )
+        except OSError as e:
+            logger.warning("Cannot create traffic capture file %s: %s", capture_config.path, e)
+            return None
+        logger.info("Traffic capture enabled: %s (redact=%s)", capture.path, capture_config.redact)
+        return capture
+
+    @property
+    def path(self) -> Path:
+        """Get the active capture file path."""
+        return self._path
+
+    @property
+    def records_written(self) -> int:
+        """Get the number of records written since startup."""
+        return self._records
+
+    def record(
+        self,
+        request: dict[str, Any],
+        response: dict[str, Any],
+        elapsed_ms: float,
+        chain_result: ChainExecutionResult | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Append one request/response pair to the capture file.
+
+        Capture is best-effort: I/O failures are logged and never affect
+        the response returned to Claude Code.
+
+        Args:
+            request: Request dictionary as received on the socket
+            response: Response dictionary returned to the client
+            elapsed_ms: Processing time in milliseconds
+            chain_result: Optional chain result carrying per-handler timings
+            timestamp: Arrival time (defaults to now)
+        """
+        entry = {
+            "v": CAPTURE_FORMAT_VERSION,
+            "ts": timestamp if timestamp is not None else time.time(),
+            "request": redact_payload(request, self._redact),
+            "response": redact_payload(response, self._redact),
+            "decision": decision_from_response(response),
+            "elapsed_ms": round(elapsed_ms, 3),
+            "handlers": (
+                {name: round(ms, 3) for name, ms in chain_result.handler_timings_ms.items()}
+                if chain_result is not None
+                else {}
+            ),
+            "redact": self._redact,
+        }
+        try:
+            line = json.dumps(entry, default=str) + "\n"
+            with self._lock:
+                self._rotate_if_needed()
+                with self._path.open("a", encoding="utf-8") as f:
+                    f.write(line)
+                self._records += 1
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Traffic capture write failed: %s", e)
+
+    def _rotate_if_needed(self) -> None:
+        """Rotate the capture file when it exceeds the size limit.
+
+        Must be called with the lock held.
+        """
+        try:
+            size = self._path.stat().st_size
+        except FileNotFoundError:
+            # Nothing captured yet (or the file was removed): nothing to rotate
+            size = 0
+        if size < self._max_bytes:
+            return
+
+        if self._backup_count == 0:
+            self._path.unlink()
+            return
+
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._path.with_name(f"{self._path.name}.{index}")
+            if source.exists():
+                source.replace(self._path.with_name(f"{self._path.name}.{index + 1}"))
+        self._path.replace(self._path.with_name(f"{self._path.name}.1"))
+        logger.info("Rotated traffic capture file: %s", self._path)
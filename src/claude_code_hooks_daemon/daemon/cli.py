@@ -4,9 +4,10 @@ Provides:
 - start: Start daemon in background (daemonise)
 - stop: Send SIGTERM to daemon PID
 - status: Check if daemon is running
-- restart: Stop and start daemon
+- restart: Stop and start daemon (--handoff: replace it without downtime)
 - logs: Query in-memory logs from running daemon
 - health: Check daemon health status
+- reload-config: Apply hooks-daemon.yaml handler changes without a restart
 - handlers: List registered handlers
 - config: Show loaded configuration
 - init-config: Generate configuration template
@@ -21,10 +22,16 @@ Provides:
 - test-project-handlers: Run project handler tests
 - bug-report: Generate comprehensive bug report with diagnostics
 - format-markdown: Format markdown files via mdformat + mdformat-gfm
+- replay: Replay captured traffic and report throughput, latency and decision diffs
+- loadtest: Drive concurrent simulated sessions against the running daemon
+- benchmark-handlers: Time every handler's matches()/handle() against a baseline
+- startup-profile: Break down daemon cold-start time and check the startup budget
+- generate-handler-manifest: Regenerate (or --check) the prebuilt handler manifest
 """
 
 import argparse
 import asyncio
+import contextlib
 import datetime
 import json
 import logging
@@ -37,6 +44,7 @@ import socket
 import subprocess  # nosec B404 - subprocess used for daemon management (systemctl) only
 import sys
 import time
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -55,6 +63,8 @@ from claude_code_hooks_daemon.daemon.paths import (
     cleanup_pid_file,
     cleanup_socket,
     cleanup_stale_daemon_files,
+    get_capture_path,
+    get_history_db_path,
     get_pid_path,
     get_socket_path,
     get_venv_path,
@@ -291,12 +301,40 @@ def _resolve_socket_path(args: argparse.Namespace, project_path: Path) -> Path:
     return get_socket_path(project_path)
 
 
+def _close_fd(fd: int) -> None:
+    """Close a file descriptor if open.
+
+    Args:
+        fd: File descriptor, or -1 if none
+    """
+    if fd >= 0:
+        with contextlib.suppress(OSError):
+            os.close(fd)
+
+
 def cmd_start(args: argparse.Namespace) -> int:
     """Start daemon in background.
 
     Args:
         args: Command-line arguments
 
+    Returns:
+        0 if daemon started successfully, 1 otherwise
+    """
+    return _start_daemon(args)
+
+
+def _start_daemon(args: argparse.Namespace, handoff_from: int | None = None) -> int:
+    """Start a daemon in the background, optionally replacing a running one.
+
+    With handoff_from, the new daemon initialises fully (no progressive
+    startup) while the running daemon keeps serving, then takes over its
+    listening socket and project lock (see daemon.handoff).
+
+    Args:
+        args: Command-line arguments
+        handoff_from: PID of the running daemon to take over from
+
     Returns:
         0 if daemon started successfully, 1 otherwise
     """
@@ -314,44 +352,68 @@ def cmd_start(args: argparse.Namespace) -> int:
     # Enforce single daemon process (if enabled)
     from claude_code_hooks_daemon.daemon.enforcement import enforce_single_daemon
 
-    enforce_single_daemon(config=config, pid_path=pid_path)
+    enforce_single_daemon(config=config, pid_path=pid_path, keep_pid=handoff_from)
 
-    # Check if already running
-    pid = read_pid_file(str(pid_path))
-    if pid is not None:
-        print(f"Daemon already running (PID: {pid})")
-        return 0
+    # Project lock inherited by the daemon (a handoff receives it instead)
+    lock_fd = -1
+    if handoff_from is None:
+        # Check if already running
+        pid = read_pid_file(str(pid_path))
+        if pid is not None:
+            print(f"Daemon already running (PID: {pid})")
+            return 0
+
+        # Lock the project before forking so that, of two starts racing at cold
+        # start, only one builds a daemon. A daemon that has not written its PID
+        # file yet holds the lock too, so the loser leaves its socket alone
+        from claude_code_hooks_daemon.daemon.instances import (
+            DaemonAlreadyRunningError,
+            lock_project,
+        )
 
-    # Clean up stale socket
-    cleanup_socket(str(socket_path))
+        try:
+            lock_fd = lock_project(pid_path)
+        except DaemonAlreadyRunningError:
+            print("Daemon already running (project lock held)")
+            return 0
 
-    # Remove stale runtime files from dead containers (age-based, not hostname-based)
-    stale_days = config.daemon.stale_file_days
-    stale_daemon = cleanup_stale_daemon_files(project_path, max_age_days=stale_days)
-    write_cleanup_status(project_path, stale_daemon)
-    if stale_daemon > 0:
-        print(f"Cleaned up {stale_daemon} stale file(s) older than {stale_days} days")
+        # Clean up stale socket
+        cleanup_socket(str(socket_path))
+
+    # The daemon reports readiness (or the startup error) over this pipe
+    from claude_code_hooks_daemon.daemon.readiness import ReadinessPipe
+
+    readiness = ReadinessPipe()
 
     # Daemonise process (fork and detach from terminal)
     try:
         # First fork
         pid = os.fork()
         if pid > 0:
-            # Parent process - wait briefly then check daemon started
-            time.sleep(0.5)
-            daemon_pid = read_pid_file(str(pid_path))
-            if daemon_pid is not None:
-                print(f"Daemon started successfully (PID: {daemon_pid})")
+            # The daemon holds the lock through its inherited descriptor
+            _close_fd(lock_fd)
+            # Parent process - block until the daemon accepts requests or fails
+            outcome = readiness.wait()
+            if outcome.ready and handoff_from is not None:
+                print(f"Daemon handed over from PID {handoff_from} to PID {outcome.pid}")
+                print(f"Socket: {socket_path}")
+                return 0
+            if outcome.ready:
+                print(f"Daemon started successfully (PID: {outcome.pid})")
                 print(f"Socket: {socket_path}")
                 print("Logs: in-memory (query with 'logs' command)")
                 return 0
-            else:
-                print("ERROR: Daemon failed to start (no PID file created)", file=sys.stderr)
-                return 1
+            print(f"ERROR: Daemon failed to start: {outcome.error}", file=sys.stderr)
+            return 1
     except OSError as e:
+        readiness.close()
+        readiness.close_read()
+        _close_fd(lock_fd)
         print(f"ERROR: Fork failed: {e}", file=sys.stderr)
         return 1
 
+    readiness.close_read()
+
     # First child - decouple from parent environment
     os.chdir("/")
     os.setsid()
@@ -383,75 +445,164 @@ def cmd_start(args: argparse.Namespace) -> int:
     os.close(devnull_fd)
 
     # Now run the daemon server
-    from claude_code_hooks_daemon.daemon.controller import DaemonController
-    from claude_code_hooks_daemon.daemon.server import HooksDaemon
-
-    # Load configuration
-    config = Config.find_and_load(project_path)
-
-    # Create daemon controller
-    controller = DaemonController()
-    handler_config = {
-        "pre_tool_use": {k: v.model_dump() for k, v in config.handlers.pre_tool_use.items()},
-        "post_tool_use": {k: v.model_dump() for k, v in config.handlers.post_tool_use.items()},
-        "session_start": {k: v.model_dump() for k, v in config.handlers.session_start.items()},
-        "session_end": {k: v.model_dump() for k, v in config.handlers.session_end.items()},
-        "pre_compact": {k: v.model_dump() for k, v in config.handlers.pre_compact.items()},
-        "user_prompt_submit": {
-            k: v.model_dump() for k, v in config.handlers.user_prompt_submit.items()
-        },
-        "permission_request": {
-            k: v.model_dump() for k, v in config.handlers.permission_request.items()
-        },
-        "notification": {k: v.model_dump() for k, v in config.handlers.notification.items()},
-        "stop": {k: v.model_dump() for k, v in config.handlers.stop.items()},
-        "subagent_stop": {k: v.model_dump() for k, v in config.handlers.subagent_stop.items()},
-    }
-    controller.initialise(
-        handler_config,
-        workspace_root=project_path,
-        plugins_config=config.plugins,
-        project_handlers_config=config.project_handlers,
-        project_languages=config.daemon.languages,
-        pseudo_events_config=config.pseudo_events or None,
-        plan_workflow=config.plan_workflow,
-    )
-
-    # Get the daemon config with proper paths
-    daemon_config = config.daemon
-
-    # Ensure paths are set (use getters if not set)
-    if daemon_config.socket_path is None:
-        daemon_config.socket_path = str(daemon_config.get_socket_path(project_path))
-    if daemon_config.pid_file_path is None:
-        daemon_config.pid_file_path = str(daemon_config.get_pid_file_path(project_path))
-
-    daemon = HooksDaemon(daemon_config, controller)
-
-    # Write socket discovery file so bash hook forwarders (init.sh)
-    # can find the daemon when the socket path differs from the default
-    # (e.g., AF_UNIX path length fallback to XDG_RUNTIME_DIR)
+    from claude_code_hooks_daemon.core.data_layer import get_data_layer, get_session_registry
+    from claude_code_hooks_daemon.core.deferred import get_deferred_work
+    from claude_code_hooks_daemon.daemon.bootstrap import build_controller
+    from claude_code_hooks_daemon.daemon.capture import TrafficCapture
+    from claude_code_hooks_daemon.daemon.config_reload import ConfigReloader
+    from claude_code_hooks_daemon.daemon.handoff import request_handoff
+    from claude_code_hooks_daemon.daemon.history_store import HistoryStore
+    from claude_code_hooks_daemon.daemon.instances import DaemonInstance
+    from claude_code_hooks_daemon.daemon.maintenance import MaintenanceQueue
     from claude_code_hooks_daemon.daemon.paths import (
         cleanup_socket_discovery_file,
         write_socket_discovery_file,
     )
+    from claude_code_hooks_daemon.daemon.server import HooksDaemon
+    from claude_code_hooks_daemon.daemon.snapshot import SessionSnapshot
+    from claude_code_hooks_daemon.strategies.lint.eslint_worker import shutdown_eslint_workers
+
+    # Any failure before the server is listening goes back to the caller
+    try:
+        # Load configuration
+        config = Config.find_and_load(project_path)
+
+        # Create daemon controller. Under progressive startup only the critical
+        # handlers load here; the server finishes the rest once it is listening.
+        # A handoff loads everything first: the running daemon serves meanwhile
+        progressive = config.daemon.progressive_startup and handoff_from is None
+        controller = build_controller(
+            config, project_path, progressive=progressive, defer_maintenance=True
+        )
 
-    write_socket_discovery_file(project_path, daemon_config.socket_path)
+        # Housekeeping that hooks do not need to wait for runs once serving
+        maintenance = MaintenanceQueue()
+        maintenance.add(
+            "stale_file_cleanup",
+            partial(_cleanup_stale_files, project_path, config.daemon.stale_file_days),
+        )
+        for name, task in controller.maintenance_tasks():
+            maintenance.add(name, task)
+
+        # Watch the config file; copy before the paths below are filled in so
+        # they do not read as a config change
+        config_reloader = ConfigReloader(config_path, controller, config.model_copy(deep=True))
+
+        # Get the daemon config with proper paths
+        daemon_config = config.daemon
+
+        # Ensure paths are set (use getters if not set)
+        if daemon_config.socket_path is None:
+            daemon_config.socket_path = str(daemon_config.get_socket_path(project_path))
+        if daemon_config.pid_file_path is None:
+            daemon_config.pid_file_path = str(daemon_config.get_pid_file_path(project_path))
+        if daemon_config.traffic_capture.enabled and daemon_config.traffic_capture.path is None:
+            daemon_config.traffic_capture.path = str(get_capture_path(project_path))
+
+        # Hold the project lock taken before forking and register as a live
+        # daemon until exit, so enforcement can find us. On handoff the running
+        # daemon passes us its socket and lock instead
+        listen_socket = None
+        snapshot = SessionSnapshot.from_config(daemon_config.session_snapshot, project_path)
+        if handoff_from is None:
+            instance = DaemonInstance.adopt(lock_fd)
+            # Warm state saved at the last shutdown, read when first needed
+            if snapshot is not None:
+                controller.restore_state_on_first_request(snapshot.load)
+        else:
+            handoff = request_handoff(Path(daemon_config.socket_path), Timeout.SOCKET_CONNECT)
+            instance = DaemonInstance.adopt(handoff.lock_fd)
+            listen_socket = handoff.listen_socket
+            controller.import_state(handoff.state)
+
+        session_registry = get_session_registry()
+        session_registry.configure(
+            max_sessions=daemon_config.session_registry.max_sessions,
+            idle_timeout_seconds=daemon_config.session_registry.idle_timeout_minutes * 60,
+        )
+        shedding = daemon_config.load_shedding
+        controller.load_shedder.configure(
+            enabled=shedding.enabled,
+            min_priority=shedding.min_priority,
+            p95_threshold_ms=shedding.p95_threshold_ms,
+            queue_depth_threshold=shedding.queue_depth_threshold,
+            latency_window=shedding.latency_window,
+            sample_one_in=shedding.sample_one_in,
+        )
+        capture = TrafficCapture.from_config(daemon_config.traffic_capture)
+        history_store = HistoryStore.from_config(daemon_config.history_store, project_path)
+        if history_store is not None:
+            history_store.start()
+            get_data_layer().history.attach_store(history_store)
+            session_registry.attach_store(history_store)
+        daemon = HooksDaemon(
+            daemon_config,
+            controller,
+            capture=capture,
+            warmup=controller.complete_startup if progressive else None,
+            on_ready=readiness.notify_ready,
+            maintenance=maintenance,
+            config_reloader=config_reloader,
+            listen_socket=listen_socket,
+            lock_fd=instance.lock_fd,
+        )
 
+        # Write socket discovery file so bash hook forwarders (init.sh)
+        # can find the daemon when the socket path differs from the default
+        # (e.g., AF_UNIX path length fallback to XDG_RUNTIME_DIR)
+        write_socket_discovery_file(project_path, daemon_config.socket_path)
+    except Exception as e:
+        readiness.notify_failed(f"{type(e).__name__}: {e}")
+        raise
+
+    # Handlers' logging and archival writes run here, after each response
+    get_deferred_work().start()
     try:
         asyncio.run(daemon.start())
     except Exception as e:
+        readiness.notify_failed(f"Daemon crashed: {type(e).__name__}: {e}")
         print(f"ERROR: Daemon crashed: {e}", file=sys.stderr)
         import traceback
 
         traceback.print_exc()
         sys.exit(1)
     finally:
-        cleanup_socket_discovery_file(project_path)
+        readiness.close()
+        # After a handoff the discovery file belongs to the replacement daemon,
+        # which also received the session state directly
+        if not daemon.handed_off:
+            cleanup_socket_discovery_file(project_path)
+            # Still holding the project lock, so the next daemon reads a
+            # complete snapshot
+            if snapshot is not None:
+                snapshot.save(controller)
+        get_deferred_work().shutdown()
+        shutdown_eslint_workers()
+        if history_store is not None:
+            history_store.close()
+        instance.release()
 
     sys.exit(0)
 
 
+def _cleanup_stale_files(project_path: Path, max_age_days: int) -> str:
+    """Remove stale runtime files from dead containers (maintenance task).
+
+    Age-based, not hostname-based. Records the result for the
+    startup_cleanup status line handler.
+
+    Args:
+        project_path: Project root directory
+        max_age_days: Files older than this many days are removed
+
+    Returns:
+        One-line summary
+    """
+    removed = cleanup_stale_daemon_files(project_path, max_age_days=max_age_days)
+    write_cleanup_status(project_path, removed)
+    return f"removed {removed} file(s) older than {max_age_days} days"
+
+
 def cmd_stop(args: argparse.Namespace) -> int:
     """Stop running daemon.
 
@@ -550,9 +701,123 @@ def cmd_status(args: argparse.Namespace) -> int:
         print("\nWARNING: Daemon running but socket not found", file=sys.stderr)
         return 1
 
+    # Deferred startup maintenance (advisory - never changes the exit code)
+    response = send_daemon_request(
+        socket_path, {"event": "_system", "hook_input": {"action": "health"}}
+    )
+    if response is not None:
+        _print_maintenance(response.get("result", {}).get("maintenance"))
+
+    return 0
+
+
+def _print_maintenance(outcomes: list[dict[str, Any]] | None) -> None:
+    """Print deferred startup maintenance outcomes from a health response.
+
+    Args:
+        outcomes: The health "maintenance" list, or None if not reported
+    """
+    if not outcomes:
+        return
+    print("\nStartup maintenance:")
+    for outcome in outcomes:
+        line = f"  {outcome.get('name')}: {outcome.get('state')}"
+        if outcome.get("duration_ms") is not None:
+            line += f" ({outcome['duration_ms']:.0f}ms)"
+        if outcome.get("detail"):
+            line += f" - {outcome['detail']}"
+        print(line)
+
+
+# Seconds to wait for the daemon to accept a logs --follow connection
+_FOLLOW_CONNECT_TIMEOUT_SECONDS = 5
+
+# Seconds between get_logs polls when the daemon cannot stream
+_LOG_POLL_INTERVAL_SECONDS = 1
+
+
+def _follow_logs(socket_path: Path, request: dict[str, Any]) -> int:
+    """Print recent logs, then each new log line as the daemon streams it.
+
+    Falls back to polling get_logs for daemons without follow support.
+
+    Args:
+        socket_path: Path to Unix socket
+        request: get_logs request (count and level are reused)
+
+    Returns:
+        0 when the daemon ends the stream, 1 on error
+    """
+    from claude_code_hooks_daemon.daemon.memory_log_handler import ACTION_FOLLOW_LOGS
+
+    follow_request: dict[str, Any] = {
+        "event": "_system",
+        "hook_input": {**request["hook_input"], "action": ACTION_FOLLOW_LOGS},
+    }
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(_FOLLOW_CONNECT_TIMEOUT_SECONDS)
+        sock.connect(str(socket_path))
+        # No SHUT_WR: the daemon ends the stream when this side closes
+        sock.sendall((json.dumps(follow_request) + "\n").encode("utf-8"))
+    except OSError as e:
+        print(f"ERROR: Cannot connect to daemon: {e}", file=sys.stderr)
+        return 1
+
+    with sock, sock.makefile("r", encoding="utf-8") as stream:
+        sock.settimeout(None)
+        first_line = stream.readline()
+        if not first_line:
+            print("ERROR: Daemon closed the connection", file=sys.stderr)
+            return 1
+        response = json.loads(first_line)
+        result = response.get("result")
+        if not isinstance(result, dict) or result.get("follow") is not True:
+            # Older daemon: "Unknown system action"
+            return _poll_logs(socket_path, request)
+
+        for log_line in result.get("logs", []):
+            print(log_line, flush=True)
+        for line in stream:
+            print(json.loads(line).get("log", ""), flush=True)
+    print("Daemon stopped, log stream ended")
     return 0
 
 
+def _poll_logs(socket_path: Path, request: dict[str, Any]) -> int:
+    """Follow logs by polling get_logs once per second.
+
+    Args:
+        socket_path: Path to Unix socket
+        request: get_logs request
+
+    Returns:
+        1 on error (otherwise runs until interrupted)
+    """
+    last_count = 0
+    while True:
+        response = send_daemon_request(socket_path, request)
+        if response is None:
+            return 1
+
+        if "error" in response:
+            print(f"ERROR: {response['error']}", file=sys.stderr)
+            return 1
+
+        result = response.get("result", {})
+        logs = result.get("logs", [])
+        current_count = result.get("count", 0)
+
+        # Print new logs
+        if current_count > last_count:
+            new_logs = logs[-(current_count - last_count) :]
+            for log_line in new_logs:
+                print(log_line)
+            last_count = current_count
+
+        time.sleep(_LOG_POLL_INTERVAL_SECONDS)
+
+
 def cmd_logs(args: argparse.Namespace) -> int:
     """Query in-memory logs from running daemon.
 
@@ -584,33 +849,11 @@ def cmd_logs(args: argparse.Namespace) -> int:
     if args.level:
         request["hook_input"]["level"] = args.level.upper()
 
-    # Follow mode - poll for new logs
+    # Follow mode - stream new logs over one connection
     if args.follow:
         print("Following logs (Ctrl+C to stop)...")
-        last_count = 0
         try:
-            while True:
-                response = send_daemon_request(socket_path, request)
-                if response is None:
-                    return 1
-
-                if "error" in response:
-                    print(f"ERROR: {response['error']}", file=sys.stderr)
-                    return 1
-
-                result = response.get("result", {})
-                logs = result.get("logs", [])
-                current_count = result.get("count", 0)
-
-                # Print new logs
-                if current_count > last_count:
-                    new_logs = logs[-(current_count - last_count) :]
-                    for log_line in new_logs:
-                        print(log_line)
-                    last_count = current_count
-
-                time.sleep(1)  # Poll interval
-
+            return _follow_logs(socket_path, request)
         except KeyboardInterrupt:
             print("\nStopped following logs")
             return 0
@@ -690,6 +933,62 @@ def check_hook_registration_warnings(project_path: Path) -> list[str]:
     return warnings
 
 
+def cmd_history(args: argparse.Namespace) -> int:
+    """Summarise persisted handler decisions for this project.
+
+    Reads the SQLite decision store directly, so it works whether or not
+    the daemon is running.
+
+    Args:
+        args: Command-line arguments with by, since_hours, session, limit, db, json
+
+    Returns:
+        0 if successful, 1 otherwise
+    """
+    import sqlite3
+
+    from claude_code_hooks_daemon.daemon.history_store import summarise_history
+
+    project_path = get_project_path(getattr(args, "project_root", None))
+    if args.db:
+        db_path = Path(args.db)
+    else:
+        store_config = Config.find_and_load(project_path).daemon.history_store
+        db_path = (
+            Path(store_config.path) if store_config.path else get_history_db_path(project_path)
+        )
+
+    if not db_path.exists():
+        print(f"ERROR: History database not found: {db_path}", file=sys.stderr)
+        print(
+            "Enable it with daemon.history_store.enabled: true and restart the daemon",
+            file=sys.stderr,
+        )
+        return 1
+
+    since = time.time() - args.since_hours * 3600 if args.since_hours is not None else None
+    try:
+        rows = summarise_history(
+            db_path, group_by=args.by, since=since, session_id=args.session, limit=args.limit
+        )
+    except sqlite3.Error as e:
+        print(f"ERROR: Cannot read history database {db_path}: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    if not rows:
+        print("No handler decisions recorded")
+        return 0
+
+    print(f"{args.by.upper():<40} {'BLOCKS':>8} {'TOTAL':>8}  LAST SEEN")
+    for row in rows:
+        last_seen = datetime.datetime.fromtimestamp(row["last_seen"]).strftime("%Y-%m-%d %H:%M")
+        print(f"{row['key']!s:<40} {row['blocks']:>8} {row['total']:>8}  {last_seen}")
+    return 0
+
+
 def cmd_health(args: argparse.Namespace) -> int:
     """Check daemon health status.
 
@@ -739,6 +1038,8 @@ def cmd_health(args: argparse.Namespace) -> int:
         if count > 0:
             print(f"  {event_type}: {count}")
 
+    _print_maintenance(result.get("maintenance"))
+
     # Hook-registration drift (advisory — never changes the exit code).
     hook_warnings = check_hook_registration_warnings(project_path)
     print("\nHook registration:")
@@ -758,6 +1059,54 @@ def cmd_health(args: argparse.Namespace) -> int:
     return 0 if status == "healthy" else 1
 
 
+def cmd_reload_config(args: argparse.Namespace) -> int:
+    """Apply hooks-daemon.yaml changes to the running daemon.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 if the config was applied (or unchanged), 1 otherwise
+    """
+    project_path = get_project_path(getattr(args, "project_root", None))
+    socket_path = _resolve_socket_path(args, project_path)
+    pid_path = _resolve_pid_path(args, project_path)
+
+    pid = read_pid_file(str(pid_path))
+    if pid is None:
+        print("Daemon not running", file=sys.stderr)
+        return 1
+
+    request = {"event": "_system", "hook_input": {"action": "reload_config"}}
+    response = send_daemon_request(socket_path, request)
+
+    if response is None:
+        print("No response from daemon", file=sys.stderr)
+        return 1
+
+    if "error" in response:
+        print(f"ERROR: {response['error']}", file=sys.stderr)
+        return 1
+
+    result = response.get("result", {})
+    status = result.get("status", "unknown")
+    print(f"Config reload: {status}")
+    for changed in result.get("changed", []):
+        print(f"  changed: {changed}")
+    if status == "reloaded":
+        print(
+            f"Handlers: {result.get('unregistered', 0)} unregistered, "
+            f"{result.get('registered', 0)} registered"
+        )
+    for error in result.get("errors", []):
+        print(f"  error: {error}", file=sys.stderr)
+    restart_required = result.get("restart_required", [])
+    if restart_required:
+        print(f"Restart required to apply: {', '.join(restart_required)}")
+
+    return 0 if status in ("reloaded", "unchanged") else 1
+
+
 def cmd_get_mode(args: argparse.Namespace) -> int:
     """Get current daemon mode.
 
@@ -1039,12 +1388,25 @@ def cmd_restart(args: argparse.Namespace) -> int:
     Queries the current mode before stopping so it can print an advisory
     if a non-default mode was active (since mode resets on restart).
 
+    With --handoff the running daemon keeps serving until the new one has
+    initialised and taken over its socket, carrying over the mode and
+    handler history; if that fails it falls back to stop + start.
+
     Args:
         args: Command-line arguments
 
     Returns:
         0 if daemon restarted successfully, 1 otherwise
     """
+    # store_true gives a real bool (args stand-ins may carry other attributes)
+    if getattr(args, "handoff", False) is True:
+        project_path = get_project_path(getattr(args, "project_root", None))
+        running_pid = read_pid_file(str(_resolve_pid_path(args, project_path)))
+        if running_pid is not None:
+            if _start_daemon(args, handoff_from=running_pid) == 0:
+                return 0
+            print("Handoff failed, falling back to stop + start", file=sys.stderr)
+
     # Query current mode before stopping (best-effort, ignore failures)
     pre_mode = _get_current_mode(args)
 
@@ -2556,6 +2918,399 @@ def _bug_report_untracked_dir(project_path: Path, is_self_install: bool) -> Path
     return project_path / ".claude" / "hooks-daemon" / "untracked"
 
 
+def _print_replay_report(report: dict[str, Any], max_diffs: int) -> None:
+    """Print a human-readable replay report.
+
+    Args:
+        report: ReplayReport.to_dict() output
+        max_diffs: Maximum number of decision diffs to list
+    """
+    latency = report["latency"]
+    captured = report["captured_latency"]
+    print(f"Replay ({report['mode']}, speed={report['speed']})")
+    print(f"Requests: {report['total']}  Errors: {report['errors']}")
+    if report["redacted"]:
+        print(
+            f"Redacted: {report['redacted']} (replayed with placeholder content; "
+            "their decision diffs are marked and do not fail the replay)"
+        )
+    print(
+        f"Duration: {report['duration_seconds']:.3f}s  Throughput: {report['throughput_rps']:.1f} req/s"
+    )
+    print(
+        f"Latency (ms): p50={latency['p50_ms']:.2f} p95={latency['p95_ms']:.2f} "
+        f"p99={latency['p99_ms']:.2f} max={latency['max_ms']:.2f}"
+    )
+    print(
+        f"Captured latency (ms): p50={captured['p50_ms']:.2f} p95={captured['p95_ms']:.2f} "
+        f"p99={captured['p99_ms']:.2f} max={captured['max_ms']:.2f}"
+    )
+
+    diffs = report["decision_diffs"]
+    if not diffs:
+        print("Decision diffs: none")
+        return
+    print(f"Decision diffs: {len(diffs)}")
+    for diff in diffs[:max_diffs]:
+        tool = f" {diff['tool_name']}" if diff["tool_name"] else ""
+        marker = " [redacted]" if diff["redacted"] else ""
+        print(
+            f"  #{diff['index']} {diff['event']}{tool}: "
+            f"{diff['expected']} -> {diff['actual']}{marker}"
+        )
+    if len(diffs) > max_diffs:
+        print(f"  ... and {len(diffs) - max_diffs} more")
+
+
+def cmd_replay(args: argparse.Namespace) -> int:
+    """Replay a traffic capture through the daemon.
+
+    Feeds captured requests through an in-process controller (default) or
+    the running daemon's socket, then reports throughput, latency
+    percentiles and decisions that differ from the capture. Requests
+    captured with redaction on are replayed with placeholder content, so
+    their decision diffs are reported but marked and do not fail the run.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 if every unredacted request replayed with its captured decision, 1 otherwise
+    """
+    from claude_code_hooks_daemon.daemon.replay import (
+        load_capture,
+        replay_in_process,
+        replay_over_socket,
+    )
+
+    project_path = get_project_path(getattr(args, "project_root", None))
+    capture_path = Path(args.capture) if args.capture else get_capture_path(project_path)
+
+    try:
+        records = load_capture(capture_path)
+    except FileNotFoundError:
+        print(f"ERROR: Capture file not found: {capture_path}", file=sys.stderr)
+        print(
+            "Enable capture with daemon.traffic_capture.enabled: true and restart the daemon",
+            file=sys.stderr,
+        )
+        return 1
+
+    if args.limit is not None:
+        records = records[: args.limit]
+    if not records:
+        print(f"ERROR: No requests in capture: {capture_path}", file=sys.stderr)
+        return 1
+
+    if args.target == "socket":
+        socket_path = _resolve_socket_path(args, project_path)
+        if read_pid_file(str(_resolve_pid_path(args, project_path))) is None:
+            print("ERROR: Daemon not running (socket replay needs a live daemon)", file=sys.stderr)
+            return 1
+        report = replay_over_socket(records, socket_path, speed=args.speed)
+    else:
+        from claude_code_hooks_daemon.daemon.bootstrap import build_controller
+
+        config = Config.find_and_load(project_path)
+        controller = build_controller(config, project_path)
+        report = replay_in_process(records, controller, speed=args.speed)
+
+    report_dict = report.to_dict()
+    if args.json:
+        print(json.dumps(report_dict, indent=2))
+    else:
+        _print_replay_report(report_dict, args.max_diffs)
+
+    return 0 if report.errors == 0 and not report.reliable_diffs else 1
+
+
+def _print_loadtest_report(report: dict[str, Any]) -> None:
+    """Print a human-readable load test report.
+
+    Args:
+        report: LoadTestReport.to_dict() output
+    """
+    latency = report["latency"]
+    print(f"Load test: {report['sessions']} sessions for {report['duration_seconds']:.1f}s")
+    print(
+        f"Requests: {report['requests']}  Errors: {report['errors']}  "
+        f"Throughput: {report['throughput_rps']:.1f} req/s"
+    )
+    print(
+        f"Latency (ms): p50={latency['p50_ms']:.2f} p95={latency['p95_ms']:.2f} "
+        f"p99={latency['p99_ms']:.2f} max={latency['max_ms']:.2f}"
+    )
+    for event, summary in sorted(report["latency_by_event"].items()):
+        errors = report["errors_by_event"].get(event, 0)
+        print(
+            f"  {event}: n={summary['count']} p95={summary['p95_ms']:.2f}ms "
+            f"p99={summary['p99_ms']:.2f}ms errors={errors}"
+        )
+
+    executor = report["executor"]
+    if executor:
+        print(
+            f"Executor: {executor['max_workers']} workers, peak running={executor['peak_running']}, "
+            f"peak queued={executor['peak_queued']}, "
+            f"saturated {executor['saturated_sample_ratio']:.0%} of samples"
+        )
+    else:
+        print("Executor: no metrics samples (daemon too old or sampling failed)")
+    if report["failed_samples"]:
+        print(f"Metrics samples failed: {report['failed_samples']}")
+
+    rss = report["rss_bytes"]
+    if rss["peak"] is not None:
+        print(
+            f"RSS: start={_human_bytes(rss['start'])} peak={_human_bytes(rss['peak'])} "
+            f"end={_human_bytes(rss['end'])}"
+        )
+
+
+def cmd_loadtest(args: argparse.Namespace) -> int:
+    """Run a concurrent multi-session load test against the running daemon.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 if the load test completed without request errors, 1 otherwise
+    """
+    from claude_code_hooks_daemon.daemon.loadtest import LoadProfile, run_load_test
+
+    project_path = get_project_path(getattr(args, "project_root", None))
+    socket_path = _resolve_socket_path(args, project_path)
+    pid_path = _resolve_pid_path(args, project_path)
+
+    if read_pid_file(str(pid_path)) is None:
+        print("ERROR: Daemon not running (start it before load testing)", file=sys.stderr)
+        return 1
+
+    profile = LoadProfile(
+        sessions=args.sessions,
+        duration_seconds=args.duration,
+        think_time_ms=args.think_time_ms,
+        sample_interval_seconds=args.sample_interval,
+        seed=args.seed,
+    )
+    report = run_load_test(socket_path, profile, cwd=str(project_path)).to_dict()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_loadtest_report(report)
+
+    return 0 if report["errors"] == 0 else 1
+
+
+# Handlers listed in the human-readable benchmark report
+_BENCHMARK_REPORT_TOP = 15
+
+
+def _print_benchmark_report(run: dict[str, Any]) -> None:
+    """Print the slowest handlers from a benchmark run.
+
+    Args:
+        run: BenchmarkRun.to_dict() output
+    """
+    handlers = run["handlers"]
+
+    def worst(entry: dict[str, Any]) -> float:
+        return max(entry[metric] or 0.0 for metric in ("matches_us", "large_input_us", "handle_us"))
+
+    def fmt(value: float | None) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    print(f"Benchmarked {len(handlers)} handlers ({run['repeats']} repeats, us per call)")
+    print(f"  {'handler':<40} {'event':<18} {'matches':>9} {'large':>10} {'handle':>10}")
+    ranked = sorted(handlers.items(), key=lambda item: worst(item[1]), reverse=True)
+    for name, entry in ranked[:_BENCHMARK_REPORT_TOP]:
+        print(
+            f"  {name:<40} {entry['event']:<18} {fmt(entry['matches_us']):>9} "
+            f"{fmt(entry['large_input_us']):>10} {fmt(entry['handle_us']):>10}"
+        )
+    errors = sum(entry["errors"] for entry in handlers.values())
+    if errors:
+        print(f"  ({errors} fixtures raised and were excluded from timing)")
+
+
+def cmd_benchmark_handlers(args: argparse.Namespace) -> int:
+    """Benchmark every handler's matches() and handle().
+
+    Optionally saves the results as a JSON baseline and/or compares them
+    against an earlier baseline, failing on regressions past the tolerance.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 if no regressions were found, 1 otherwise
+    """
+    from claude_code_hooks_daemon.qa.handler_benchmark import compare_benchmarks, run_benchmarks
+
+    # Initialises ProjectContext, which several handlers need at construction
+    get_project_path(getattr(args, "project_root", None))
+
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ERROR: Cannot read benchmark baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+
+    run = run_benchmarks(repeats=args.repeats, only=args.handler).to_dict()
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(run, indent=2) + "\n")
+
+    regressions = []
+    if baseline is not None:
+        try:
+            regressions = compare_benchmarks(
+                baseline, run, tolerance=args.tolerance, min_delta_us=args.min_delta_us
+            )
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+
+    if args.json:
+        output = dict(run)
+        output["regressions"] = [
+            {
+                "handler": r.handler,
+                "metric": r.metric,
+                "baseline_us": r.baseline_us,
+                "current_us": r.current_us,
+                "ratio": round(r.ratio, 3),
+            }
+            for r in regressions
+        ]
+        print(json.dumps(output, indent=2))
+    else:
+        _print_benchmark_report(run)
+        if args.save:
+            print(f"Baseline written to {args.save}")
+        if baseline is not None:
+            if regressions:
+                print(f"REGRESSIONS ({len(regressions)}, tolerance {args.tolerance:.0%}):")
+                for r in regressions:
+                    print(
+                        f"  {r.handler}.{r.metric}: {r.baseline_us:.1f}us -> "
+                        f"{r.current_us:.1f}us ({r.ratio:.2f}x)"
+                    )
+            else:
+                print(f"No regressions against {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+def _print_startup_profile(profile: dict[str, Any], top: int, violations: list[str]) -> None:
+    """Print a human-readable startup breakdown.
+
+    Args:
+        profile: StartupProfile.to_dict() output
+        top: Number of slowest handler constructors/modules to list
+        violations: Startup budget violations
+    """
+    print(
+        f"Cold start: {profile['total_ms']:.0f}ms to initialised controller "
+        f"({profile['process_wall_ms']:.0f}ms process wall time)"
+    )
+    print(f"Imports ({profile['import_total_ms']:.0f}ms):")
+    for group, ms in sorted(profile["imports_ms"].items(), key=lambda item: -item[1]):
+        print(f"  {group:<20} {ms:>9.1f}ms")
+    print("Phases:")
+    for phase, ms in profile["phases_ms"].items():
+        print(f"  {phase:<20} {ms:>9.1f}ms")
+    print(f"Slowest handler constructors (of {len(profile['handler_init_ms'])}):")
+    for name, ms in sorted(profile["handler_init_ms"].items(), key=lambda item: -item[1])[:top]:
+        print(f"  {name:<45} {ms:>7.2f}ms")
+    print("Slowest handler module imports:")
+    for module, ms in sorted(profile["handler_modules_ms"].items(), key=lambda item: -item[1])[
+        :top
+    ]:
+        print(f"  {module.removeprefix('claude_code_hooks_daemon.handlers.'):<45} {ms:>7.2f}ms")
+    if violations:
+        print("OVER BUDGET:")
+        for violation in violations:
+            print(f"  {violation}")
+
+
+def cmd_startup_profile(args: argparse.Namespace) -> int:
+    """Profile a daemon cold start for this project.
+
+    Runs the start-up steps in a fresh interpreter with import timing enabled
+    and reports where the time goes.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 if startup is within budget, 1 if over budget or profiling failed
+    """
+    from claude_code_hooks_daemon.daemon.startup_profile import run_startup_profile
+
+    project_path = get_project_path(getattr(args, "project_root", None))
+
+    try:
+        profile = run_startup_profile(project_path)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    violations = profile.over_budget(args.budget_ms, args.handler_budget_ms)
+    if args.json:
+        output = profile.to_dict()
+        output["violations"] = violations
+        print(json.dumps(output, indent=2))
+    else:
+        _print_startup_profile(profile.to_dict(), args.top, violations)
+
+    return 1 if violations else 0
+
+
+def cmd_generate_handler_manifest(args: argparse.Namespace) -> int:
+    """Regenerate the prebuilt handler manifest shipped with the package.
+
+    With --check, compares the shipped manifest with the handler tree
+    instead of writing it (for CI).
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        0 on success or when current, 1 if the check finds a stale manifest
+    """
+    from claude_code_hooks_daemon.handlers.manifest import (
+        MANIFEST_PATH,
+        build_manifest,
+        load_manifest,
+        write_manifest,
+    )
+
+    # Handler constructors need ProjectContext
+    get_project_path(getattr(args, "project_root", None))
+
+    manifest = build_manifest()
+    if args.check:
+        shipped = load_manifest(MANIFEST_PATH)
+        if shipped is None or shipped.to_dict() != manifest.to_dict():
+            print(
+                f"Handler manifest {MANIFEST_PATH} is out of date - "
+                "run 'generate-handler-manifest'",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"Handler manifest is current: {MANIFEST_PATH}")
+        return 0
+
+    write_manifest(manifest, MANIFEST_PATH)
+    count = sum(len(entries) for entries in manifest.handlers.values())
+    print(f"Wrote {count} handlers to {MANIFEST_PATH}")
+    return 0
+
+
 def main() -> int:
     """Main CLI entry point.
 
@@ -2601,6 +3356,11 @@ def main() -> int:
 
     # restart command
     parser_restart = subparsers.add_parser("restart", help="Restart daemon")
+    parser_restart.add_argument(
+        "--handoff",
+        action="store_true",
+        help="Hand the socket to the new daemon so hooks never find it down",
+    )
     parser_restart.set_defaults(func=cmd_restart)
 
     # logs command
@@ -2626,10 +3386,39 @@ def main() -> int:
     )
     parser_logs.set_defaults(func=cmd_logs)
 
+    # history command
+    parser_history = subparsers.add_parser(
+        "history", help="Summarise persisted handler decisions (which handlers block most)"
+    )
+    parser_history.add_argument(
+        "--by",
+        choices=["handler", "tool", "decision", "event", "session"],
+        default="handler",
+        help="Group decisions by this field (default: handler)",
+    )
+    parser_history.add_argument(
+        "--since-hours", type=float, default=None, help="Only decisions from the last N hours"
+    )
+    parser_history.add_argument("--session", default=None, help="Only decisions from this session")
+    parser_history.add_argument(
+        "--limit", type=int, default=20, help="Maximum rows to show (default: 20)"
+    )
+    parser_history.add_argument(
+        "--db", default=None, help="Database path (default: daemon.history_store.path)"
+    )
+    parser_history.add_argument("--json", action="store_true", help="Output rows as JSON")
+    parser_history.set_defaults(func=cmd_history)
+
     # health command
     parser_health = subparsers.add_parser("health", help="Check daemon health")
     parser_health.set_defaults(func=cmd_health)
 
+    # reload-config command
+    parser_reload_config = subparsers.add_parser(
+        "reload-config", help="Apply hooks-daemon.yaml handler changes without a restart"
+    )
+    parser_reload_config.set_defaults(func=cmd_reload_config)
+
     # get-mode command
     parser_get_mode = subparsers.add_parser("get-mode", help="Get current daemon mode")
     parser_get_mode.add_argument(
@@ -2921,6 +3710,147 @@ def main() -> int:
     )
     parser_bug_report.set_defaults(func=cmd_bug_report)
 
+    # replay command
+    parser_replay = subparsers.add_parser(
+        "replay",
+        help="Replay captured traffic and report throughput, latency and decision diffs",
+        description=(
+            "Replay captured traffic and report throughput, latency and decision diffs. "
+            "Requests captured with traffic_capture.redact enabled are replayed with "
+            "placeholder content, so handlers may decide differently: their diffs are "
+            "marked [redacted] and do not cause a non-zero exit."
+        ),
+    )
+    parser_replay.add_argument(
+        "capture",
+        nargs="?",
+        default=None,
+        help="Capture file (default: capture-{hostname}.jsonl in untracked/)",
+    )
+    parser_replay.add_argument(
+        "--target",
+        choices=["in-process", "socket"],
+        default="in-process",
+        help="Replay through an in-process controller (default) or the running daemon",
+    )
+    parser_replay.add_argument(
+        "--speed",
+        choices=["original", "max"],
+        default="max",
+        help="Honour recorded inter-arrival gaps (original) or replay back-to-back (max)",
+    )
+    parser_replay.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Replay only the first N captured requests",
+    )
+    parser_replay.add_argument(
+        "--max-diffs",
+        type=int,
+        default=20,
+        help="Maximum decision diffs to list (default: 20)",
+    )
+    parser_replay.add_argument("--json", action="store_true", help="Output report as JSON")
+    parser_replay.set_defaults(func=cmd_replay)
+
+    # loadtest command
+    parser_loadtest = subparsers.add_parser(
+        "loadtest",
+        help="Drive concurrent simulated sessions against the running daemon",
+    )
+    parser_loadtest.add_argument(
+        "--sessions", type=int, default=8, help="Concurrent simulated sessions (default: 8)"
+    )
+    parser_loadtest.add_argument(
+        "--duration", type=float, default=30.0, help="Test duration in seconds (default: 30)"
+    )
+    parser_loadtest.add_argument(
+        "--think-time-ms",
+        type=float,
+        default=200.0,
+        help="Mean think time between a session's events, exponential (default: 200)",
+    )
+    parser_loadtest.add_argument(
+        "--sample-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between daemon metrics samples (default: 1)",
+    )
+    parser_loadtest.add_argument(
+        "--seed", type=int, default=None, help="Random seed for reproducible runs"
+    )
+    parser_loadtest.add_argument("--json", action="store_true", help="Output report as JSON")
+    parser_loadtest.set_defaults(func=cmd_loadtest)
+
+    # benchmark-handlers command
+    parser_benchmark = subparsers.add_parser(
+        "benchmark-handlers",
+        help="Time every handler's matches()/handle() and compare against a baseline",
+    )
+    parser_benchmark.add_argument(
+        "--repeats", type=int, default=5, help="Timed sweeps per metric (default: 5)"
+    )
+    parser_benchmark.add_argument(
+        "--handler",
+        action="append",
+        default=None,
+        help="Only benchmark this handler class (repeatable)",
+    )
+    parser_benchmark.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser_benchmark.add_argument(
+        "--baseline", type=Path, help="Compare against this baseline and fail on regressions"
+    )
+    parser_benchmark.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown before failing (default: 0.5 = 50%%)",
+    )
+    parser_benchmark.add_argument(
+        "--min-delta-us",
+        type=float,
+        default=20.0,
+        help="Ignore slowdowns smaller than this many microseconds (default: 20)",
+    )
+    parser_benchmark.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser_benchmark.set_defaults(func=cmd_benchmark_handlers)
+
+    # startup-profile command
+    parser_startup = subparsers.add_parser(
+        "startup-profile",
+        help="Break down daemon cold-start time (imports, config, handlers)",
+    )
+    parser_startup.add_argument(
+        "--budget-ms",
+        type=float,
+        default=2500.0,
+        help="Fail if cold start exceeds this many milliseconds (default: 2500)",
+    )
+    parser_startup.add_argument(
+        "--handler-budget-ms",
+        type=float,
+        default=50.0,
+        help="Fail if any handler constructor exceeds this many milliseconds (default: 50)",
+    )
+    parser_startup.add_argument(
+        "--top", type=int, default=10, help="Slowest handlers/modules to list (default: 10)"
+    )
+    parser_startup.add_argument("--json", action="store_true", help="Output profile as JSON")
+    parser_startup.set_defaults(func=cmd_startup_profile)
+
+    # generate-handler-manifest command
+    parser_manifest = subparsers.add_parser(
+        "generate-handler-manifest",
+        help="Regenerate the prebuilt manifest of built-in handlers",
+    )
+    parser_manifest.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit 1 if the shipped manifest is out of date instead of writing it",
+    )
+    parser_manifest.set_defaults(func=cmd_generate_handler_manifest)
+
     # Parse arguments
     args = parser.parse_args()
 
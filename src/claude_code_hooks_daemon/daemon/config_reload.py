@@ -0,0 +1,213 @@
+"""Hot reload of the daemon configuration file.
+
+The server polls the config file's stat stamp and, when it changes (or on
+an explicit ``reload_config`` system request), parses the file once and
+runs both the schema model and ConfigValidator against that single parse.
+A config that fails either check is rejected and the running handlers are
+left alone.
+
+Only the ``handlers`` section is applied live. The controller diffs it
+against the handler config it is running with and re-registers just the
+handlers whose entries (enabled, priority, options) changed, or a whole
+event section when its enable/disable tags changed. Changes to sections
+that are only read at startup (daemon, plugins, project handlers, plan
+workflow, pseudo-events) are reported as needing a restart.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claude_code_hooks_daemon.config.loader import ConfigLoader
+from claude_code_hooks_daemon.config.models import Config
+from claude_code_hooks_daemon.config.validator import ConfigValidator
+from claude_code_hooks_daemon.constants import ConfigKey
+from claude_code_hooks_daemon.daemon.bootstrap import build_handler_config
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+logger = logging.getLogger(__name__)
+
+# System action that reloads the config on demand
+ACTION_RELOAD_CONFIG = "reload_config"
+
+# Config sections that are only read at startup
+RESTART_SECTIONS: tuple[str, ...] = (
+    "daemon",
+    "plugins",
+    "project_handlers",
+    "plan_workflow",
+    "pseudo_events",
+)
+
+# Per-section keys that filter every handler in the section
+_SECTION_WIDE_KEYS = frozenset({ConfigKey.ENABLE_TAGS, ConfigKey.DISABLE_TAGS})
+
+# Event section -> changed handler config keys (None: the whole section)
+HandlerChanges = dict[str, frozenset[str] | None]
+
+
+class ReloadStatus:
+    """Outcomes of a config reload."""
+
+    RELOADED = "reloaded"
+    UNCHANGED = "unchanged"
+    REJECTED = "rejected"
+    DEFERRED = "deferred"
+
+
+@dataclass(frozen=True, slots=True)
+class ReloadResult:
+    """Outcome of a config reload.
+
+    Attributes:
+        status: One of the ReloadStatus values
+        changed: Changed handlers as "section.key" ("section.*" for a whole section)
+        registered: Handlers registered from the new config
+        unregistered: Handlers removed from the chains
+        restart_required: Startup-only sections that changed
+        errors: Why the config was rejected or the reload deferred
+    """
+
+    status: str
+    changed: tuple[str, ...] = ()
+    registered: int = 0
+    unregistered: int = 0
+    restart_required: tuple[str, ...] = ()
+    errors: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for the system response.
+
+        Returns:
+            Result dictionary
+        """
+        return {
+            "status": self.status,
+            "changed": list(self.changed),
+            "registered": self.registered,
+            "unregistered": self.unregistered,
+            "restart_required": list(self.restart_required),
+            "errors": list(self.errors),
+        }
+
+
+def diff_handler_config(
+    old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]
+) -> HandlerChanges:
+    """Find the handler entries that differ between two handler configs.
+
+    Args:
+        old: Registry-format handler config currently applied
+        new: Registry-format handler config to apply
+
+    Returns:
+        Event section -> changed config keys, or None when a section-wide
+        key (enable_tags/disable_tags) changed; unchanged sections are omitted
+    """
+    changes: HandlerChanges = {}
+    for section in old.keys() | new.keys():
+        old_section = old.get(section) or {}
+        new_section = new.get(section) or {}
+        if any(old_section.get(key) != new_section.get(key) for key in _SECTION_WIDE_KEYS):
+            changes[section] = None
+            continue
+        keys = frozenset(
+            key
+            for key in old_section.keys() | new_section.keys()
+            if key not in _SECTION_WIDE_KEYS and old_section.get(key) != new_section.get(key)
+        )
+        if keys:
+            changes[section] = keys
+    return changes
+
+
+def _stat_stamp(path: Path) -> tuple[int, int, int] | None:
+    """Identify a file version by inode, size and modification time.
+
+    Args:
+        path: File path
+
+    Returns:
+        Stamp tuple, or None if the file does not exist
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class ConfigReloader:
+    """Watches the config file and applies handler changes to the controller."""
+
+    __slots__ = ("_config", "_config_path", "_controller", "_lock", "_stamp")
+
+    def __init__(self, config_path: Path, controller: "DaemonController", config: Config) -> None:
+        """Start watching from the config the daemon was started with.
+
+        Args:
+            config_path: Config file path
+            controller: Controller to apply handler changes to
+            config: Config the controller was initialised with
+        """
+        self._config_path = config_path
+        self._controller = controller
+        self._config = config
+        self._stamp = _stat_stamp(config_path)
+        self._lock = threading.Lock()
+
+    def changed(self) -> bool:
+        """Check whether the config file changed since the last reload (one stat).
+
+        Returns:
+            True if the file's stamp differs
+        """
+        return _stat_stamp(self._config_path) != self._stamp
+
+    def reload(self) -> ReloadResult:
+        """Parse the config file once and apply handler changes.
+
+        Fail-safe: a config that cannot be parsed or fails validation is
+        rejected and the running handlers are kept.
+
+        Returns:
+            Reload outcome
+        """
+        with self._lock:
+            stamp = _stat_stamp(self._config_path)
+            try:
+                data = ConfigLoader.load(self._config_path)
+                config = Config.model_validate(data)
+                errors = ConfigValidator.validate(data)
+            except Exception as e:
+                errors = [f"{type(e).__name__}: {e}"]
+            if errors:
+                # Remember the stamp so polling does not re-parse the same broken file
+                self._stamp = stamp
+                logger.warning("Config reload rejected, keeping current handlers: %s", errors)
+                return ReloadResult(status=ReloadStatus.REJECTED, errors=tuple(errors))
+
+            try:
+                result = self._controller.apply_handler_config(build_handler_config(config))
+            except RuntimeError as e:
+                # Still warming up: leave the stamp so the next poll retries
+                return ReloadResult(status=ReloadStatus.DEFERRED, errors=(str(e),))
+
+            self._stamp = stamp
+            # Keep the startup sections as started, so a pending restart stays reported
+            self._config = self._config.model_copy(update={"handlers": config.handlers})
+            restart_required = tuple(
+                section
+                for section in RESTART_SECTIONS
+                if getattr(config, section) != getattr(self._config, section)
+            )
+            if restart_required:
+                logger.warning(
+                    "Config sections %s changed; restart the daemon to apply them",
+                    ", ".join(restart_required),
+                )
+            return replace(result, restart_required=restart_required)
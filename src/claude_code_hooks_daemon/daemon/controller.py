@@ -5,8 +5,11 @@ event router, handler registration, and request processing.
 """
 
 import logging
+import threading
 import time
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,9 +18,15 @@ from claude_code_hooks_daemon.config.validator import ConfigValidator
 from claude_code_hooks_daemon.constants.modes import DaemonMode, ModeConstant
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult
 from claude_code_hooks_daemon.core.claude_md_injector import ClaudeMdInjector
-from claude_code_hooks_daemon.core.data_layer import get_data_layer
+from claude_code_hooks_daemon.core.data_layer import (
+    DaemonDataLayer,
+    get_data_layer,
+    get_session_registry,
+    use_data_layer,
+)
 from claude_code_hooks_daemon.core.event import EventType, HookEvent
 from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.core.load_shedding import SHED_CONTEXT_PREFIX, LoadShedder
 from claude_code_hooks_daemon.core.mode import ModeManager
 from claude_code_hooks_daemon.core.mode_interceptor import get_interceptor_for_mode
 from claude_code_hooks_daemon.core.project_context import ProjectContext
@@ -27,7 +36,14 @@ from claude_code_hooks_daemon.core.pseudo_event import (
     merge_pseudo_results,
 )
 from claude_code_hooks_daemon.core.router import EventRouter
-from claude_code_hooks_daemon.handlers.registry import HandlerRegistry
+from claude_code_hooks_daemon.core.segment_cache import SegmentCache
+from claude_code_hooks_daemon.daemon.config_reload import (
+    ReloadResult,
+    ReloadStatus,
+    diff_handler_config,
+)
+from claude_code_hooks_daemon.daemon.startup_profile import StartupTimings
+from claude_code_hooks_daemon.handlers.registry import EVENT_TYPE_MAPPING, HandlerRegistry
 
 if TYPE_CHECKING:
     from claude_code_hooks_daemon.config.models import (
@@ -35,9 +51,106 @@ if TYPE_CHECKING:
         PluginsConfig,
         ProjectHandlersConfig,
     )
+    from claude_code_hooks_daemon.core.async_handler import Offload
 
 logger = logging.getLogger(__name__)
 
+# Added to every response served while progressive startup is still warming up
+WARMING_CONTEXT = (
+    "[hooks-daemon warming] Only critical safety handlers are active; "
+    "advisory and workflow handlers are still loading."
+)
+# Status line equivalent (the status line renders context as a single line)
+WARMING_STATUS = "[hooks-daemon warming]"
+
+
+# Handler config section for each event type (inverse of EVENT_TYPE_MAPPING)
+_SECTION_BY_EVENT_TYPE: dict[EventType, str] = {
+    event_type: section for section, event_type in EVENT_TYPE_MAPPING.items()
+}
+
+# Module prefix of built-in handlers (plugins and project handlers live elsewhere)
+_BUILTIN_HANDLER_PREFIX = "claude_code_hooks_daemon.handlers."
+
+# Events whose chains run their handlers concurrently when no handler can
+# stop the others (all non-terminal or parallel_safe): status segments and
+# session start checks are independent of each other
+_PARALLEL_CHAIN_EVENTS = frozenset({EventType.STATUS_LINE, EventType.SESSION_START})
+# Worker threads shared by all concurrently run handlers
+_PARALLEL_HANDLER_WORKERS = 8
+
+# Keys of the session state carried over to a replacement daemon
+_STATE_KEY_MODE = "mode"
+_STATE_KEY_HISTORY = "handler_history"
+_STATE_KEY_SESSION = "session_state"
+_STATE_KEY_PSEUDO_EVENTS = "pseudo_events"
+_STATE_KEY_SESSIONS = "sessions"
+
+
+def _is_builtin(handler: Any) -> bool:
+    """Check whether a registered handler is a built-in handler.
+
+    Args:
+        handler: Registered handler
+
+    Returns:
+        True if the handler class comes from the built-in handlers package
+    """
+    return type(handler).__module__.startswith(_BUILTIN_HANDLER_PREFIX)
+
+
+def _export_data_layer(
+    data_layer: DaemonDataLayer, since: float | None, max_history: int | None
+) -> dict[str, Any]:
+    """Serialise a data layer's history and StatusLine state.
+
+    Args:
+        data_layer: Data layer to export
+        since: Only include handler decisions made at or after this Unix timestamp
+        max_history: Only include this many of the most recent handler decisions
+
+    Returns:
+        JSON-compatible dictionary (see _import_data_layer())
+    """
+    return {
+        _STATE_KEY_HISTORY: data_layer.history.export(since=since, limit=max_history),
+        _STATE_KEY_SESSION: data_layer.session.export(),
+    }
+
+
+def _import_data_layer(data_layer: DaemonDataLayer, state: dict[str, Any]) -> None:
+    """Restore a data layer's history and StatusLine state.
+
+    Args:
+        data_layer: Data layer to restore into
+        state: Dictionary produced by _export_data_layer()
+    """
+    history_state = state.get(_STATE_KEY_HISTORY)
+    if history_state:
+        data_layer.history.restore(history_state)
+    session_state = state.get(_STATE_KEY_SESSION)
+    if session_state:
+        data_layer.session.restore(session_state)
+
+
+@dataclass(frozen=True, slots=True)
+class _RouteRequest:
+    """How an event is routed once the mode interceptor lets it through.
+
+    Attributes:
+        hook_input: Hook input dictionary passed to the handlers
+        strict_mode: Handler exceptions block the operation
+        shedder: Skips low-priority handlers under load (None for status events)
+        segment_cache: Session's status segment cache (status events only)
+        pool: Runs independent handlers concurrently (None = sequential)
+    """
+
+    hook_input: dict[str, Any]
+    strict_mode: bool
+    shedder: LoadShedder | None
+    segment_cache: SegmentCache | None
+    pool: ThreadPoolExecutor | None
+
 
 @dataclass(slots=True)
 class DaemonStats:
@@ -106,6 +219,20 @@ class DaemonStats:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class _PendingStartup:
+    """initialise() arguments kept for complete_startup() under progressive startup."""
+
+    handler_config: dict[str, dict[str, dict[str, Any]]] | None
+    workspace_root: Path
+    plugins_config: "PluginsConfig | None"
+    project_handlers_config: "ProjectHandlersConfig | None"
+    project_languages: list[str] | None
+    pseudo_events_config: dict[str, dict[str, Any]] | None
+    plan_workflow: Any
+    config_path: Path
+
+
 class DaemonController:
     """Controller for the hooks daemon.
 
@@ -116,12 +243,20 @@ class DaemonController:
     __slots__ = (
         "_config",
         "_config_errors",
+        "_defer_maintenance",
         "_degraded",
+        "_handler_pool",
         "_initialised",
         "_mode_manager",
+        "_pending_startup",
+        "_pending_state",
         "_pseudo_dispatcher",
         "_registry",
         "_router",
+        "_shedder",
+        "_startup_args",
+        "_startup_timings",
+        "_state_lock",
         "_stats",
     )
 
@@ -140,6 +275,19 @@ class DaemonController:
         self._config_errors: list[str] = []
         self._mode_manager = self._init_mode_manager(config)
         self._pseudo_dispatcher: PseudoEventDispatcher | None = None
+        self._startup_timings = StartupTimings()
+        self._pending_startup: _PendingStartup | None = None
+        self._startup_args: _PendingStartup | None = None
+        self._defer_maintenance = False
+        self._pending_state: Callable[[], dict[str, Any] | None] | None = None
+        self._state_lock = threading.Lock()
+        # Disabled until the daemon configures it (see daemon.load_shedding)
+        self._shedder = LoadShedder()
+        # Threads start when a chain first runs in parallel
+        self._handler_pool = ThreadPoolExecutor(
+            max_workers=_PARALLEL_HANDLER_WORKERS,
+            thread_name_prefix="hooks-daemon-parallel-handler",
+        )
 
     def initialise(
         self,
@@ -150,12 +298,22 @@ class DaemonController:
         project_languages: list[str] | None = None,
         pseudo_events_config: dict[str, dict[str, Any]] | None = None,
         plan_workflow: Any = None,
+        progressive: bool = False,
+        defer_maintenance: bool = False,
     ) -> None:
         """Initialise the controller with handlers.
 
         Discovers and registers all handlers with the event router,
         then loads any configured plugins and project handlers.
 
+        With progressive=True only the critical built-in handlers (priority
+        <= PriorityRange.CRITICAL_MAX) are registered here, so the daemon can
+        start serving immediately; complete_startup() loads everything else.
+
+        With defer_maintenance=True the CLAUDE.md injection and config
+        validation are left to the caller, which runs maintenance_tasks()
+        once the daemon is serving.
+
         Args:
             handler_config: Optional handler configuration from hooks-daemon.yaml
             workspace_root: Optional workspace root path (FAIL FAST if None)
@@ -164,6 +322,8 @@ class DaemonController:
             project_languages: Project-level language filter from daemon.languages config
             pseudo_events_config: Optional pseudo-event configuration from hooks-daemon.yaml
             plan_workflow: Optional PlanWorkflowConfig for plan-related handlers
+            progressive: Register critical handlers only and defer the rest
+            defer_maintenance: Skip CLAUDE.md injection and config validation
 
         Raises:
             ValueError: If workspace_root is None (FAIL FAST requirement)
@@ -190,49 +350,253 @@ class DaemonController:
         else:
             logger.info("ProjectContext already initialized")
 
-        # Discover and register built-in handlers
-        self._registry.discover()
-        count = self._registry.register_all(
-            self._router,
-            config=handler_config,
+        pending = _PendingStartup(
+            handler_config=handler_config,
             workspace_root=workspace_root,
+            plugins_config=plugins_config,
+            project_handlers_config=project_handlers_config,
             project_languages=project_languages,
+            pseudo_events_config=pseudo_events_config,
             plan_workflow=plan_workflow,
+            config_path=config_path,
         )
+        self._startup_args = pending
+        self._defer_maintenance = defer_maintenance
+        timings = self._startup_timings
+
+        # Discover and register built-in handlers. The prebuilt manifest lets
+        # register_all() import only enabled handlers; scan if it is stale
+        with timings.phase("discover"):
+            if not self._registry.load_manifest():
+                self._registry.discover()
+
+        if progressive:
+            with timings.phase("register_critical"):
+                count = self._register_builtin(self._router, pending, critical=True)
+            self._pending_startup = pending
+            self._initialised = True
+            logger.info("DaemonController serving %d critical handlers, warming up the rest", count)
+            return
 
+        with timings.phase("register_all"):
+            count = self._register_builtin(self._router, pending, critical=None)
         logger.info("Registered %d built-in handlers", count)
 
+        total_count = count + self._register_extensions(self._router, pending)
+        logger.info("DaemonController initialised with %d total handlers", total_count)
+        self._initialised = True
+
+        self._finish_startup(pending)
+
+    def complete_startup(self) -> None:
+        """Load everything progressive initialise() deferred, then swap routers.
+
+        Builds a new router holding the already-serving critical handlers plus
+        the remaining built-in, plugin and project handlers, and replaces the
+        live router in one assignment so in-flight requests keep a consistent
+        chain. Runs the CLAUDE.md injection and config validation afterwards
+        unless they were deferred. Safe to call when nothing is pending.
+
+        Fail-open: if loading fails, the critical handlers keep serving and
+        the daemon enters degraded mode so the failure is visible.
+        """
+        pending = self._pending_startup
+        if pending is None:
+            return
+
+        timings = self._startup_timings
+        try:
+            router = EventRouter()
+            for event_type, chain in self._router._chains.items():
+                for handler in chain:
+                    router.register(event_type, handler)
+            with timings.phase("register_all"):
+                self._register_builtin(router, pending, critical=False)
+            self._register_extensions(router, pending)
+        except Exception as e:
+            logger.exception("Background startup failed; serving critical handlers only")
+            self._config_errors = [f"Startup failed: {type(e).__name__}: {e}"]
+            self._degraded = True
+            self._pending_startup = None
+            return
+
+        # Swap before clearing pending: process_event() reads them in the
+        # opposite order, so a request never pairs "ready" with the old router
+        self._router = router
+        self._pending_startup = None
+        logger.info(
+            "DaemonController warm-up complete: %d total handlers",
+            sum(router.get_handler_count().values()),
+        )
+
+        self._finish_startup(pending)
+
+    def _register_builtin(
+        self, router: EventRouter, pending: _PendingStartup, *, critical: bool | None
+    ) -> int:
+        """Register built-in handlers from the registry.
+
+        Args:
+            router: Router to register with
+            pending: initialise() arguments
+            critical: Priority band passed to HandlerRegistry.register_all()
+
+        Returns:
+            Number of handlers registered
+        """
+        return self._registry.register_all(
+            router,
+            config=pending.handler_config,
+            workspace_root=pending.workspace_root,
+            project_languages=pending.project_languages,
+            plan_workflow=pending.plan_workflow,
+            handler_init_ms=self._startup_timings.handler_init_ms,
+            critical=critical,
+        )
+
+    def _register_extensions(self, router: EventRouter, pending: _PendingStartup) -> int:
+        """Register plugin and project handlers and pseudo-events.
+
+        Args:
+            router: Router to register with
+            pending: initialise() arguments
+
+        Returns:
+            Number of plugin and project handlers registered
+        """
+        timings = self._startup_timings
+
         # Load and register plugin handlers
         plugin_count = 0
-        if plugins_config is not None:
-            plugin_count = self._load_plugins(plugins_config, workspace_root)
+        if pending.plugins_config is not None:
+            with timings.phase("plugins"):
+                plugin_count = self._load_plugins(
+                    pending.plugins_config, pending.workspace_root, router=router
+                )
             logger.info("Loaded %d plugin handlers", plugin_count)
 
         # Load and register project handlers
         project_count = 0
-        if project_handlers_config is not None:
-            project_count = self._load_project_handlers(
-                project_handlers_config=project_handlers_config,
-                workspace_root=workspace_root,
-            )
+        if pending.project_handlers_config is not None:
+            with timings.phase("project_handlers"):
+                project_count = self._load_project_handlers(
+                    project_handlers_config=pending.project_handlers_config,
+                    workspace_root=pending.workspace_root,
+                    router=router,
+                )
             logger.info("Loaded %d project handlers", project_count)
 
         # Register pseudo-events (if configured)
-        if pseudo_events_config:
-            self._register_pseudo_events(pseudo_events_config)
+        if pending.pseudo_events_config:
+            with timings.phase("pseudo_events"):
+                self._register_pseudo_events(pending.pseudo_events_config)
 
-        total_count = count + plugin_count + project_count
-        logger.info("DaemonController initialised with %d total handlers", total_count)
-        self._initialised = True
+        return plugin_count + project_count
+
+    def _finish_startup(self, pending: _PendingStartup) -> None:
+        """Run the advisory startup work that needs every handler registered.
 
-        # Inject handler guidance into project CLAUDE.md (advisory, never raises)
+        Does nothing under defer_maintenance; the caller runs
+        maintenance_tasks() instead.
+
+        Args:
+            pending: initialise() arguments
+        """
+        if self._defer_maintenance:
+            return
+        self._inject_claude_md(pending)
+        self._run_config_validation(pending)
+
+    def maintenance_tasks(self) -> list[tuple[str, Callable[[], str | None]]]:
+        """Get the startup work deferred by initialise(defer_maintenance=True).
+
+        Each task is blocking and must run after complete_startup() under
+        progressive startup, so it sees every registered handler.
+
+        Returns:
+            (name, task) pairs in the order they should run
+        """
+        return [
+            ("claude_md_inject", self.inject_claude_md),
+            ("validate_config", self.validate_config),
+        ]
+
+    def inject_claude_md(self) -> str:
+        """Inject handler guidance into the project CLAUDE.md.
+
+        Returns:
+            One-line summary
+
+        Raises:
+            RuntimeError: If the controller has not been initialised
+        """
+        pending = self._require_startup_args()
+        if self._degraded:
+            # Only a partial handler set may be loaded; leave CLAUDE.md alone
+            return "skipped (daemon degraded)"
+        return f"{self._inject_claude_md(pending)} handlers"
+
+    def validate_config(self) -> str:
+        """Validate the configuration file, entering degraded mode on errors.
+
+        Returns:
+            One-line summary
+
+        Raises:
+            RuntimeError: If the controller has not been initialised
+        """
+        pending = self._require_startup_args()
+        if self._degraded:
+            # Keep the error that degraded the daemon in the first place
+            return "skipped (daemon degraded)"
+        self._run_config_validation(pending)
+        if self._degraded:
+            return f"{len(self._config_errors)} error(s), daemon degraded"
+        return "passed"
+
+    def _require_startup_args(self) -> _PendingStartup:
+        """Get the initialise() arguments.
+
+        Returns:
+            initialise() arguments
+
+        Raises:
+            RuntimeError: If the controller has not been initialised
+        """
+        if self._startup_args is None:
+            raise RuntimeError("DaemonController is not initialised")
+        return self._startup_args
+
+    def _inject_claude_md(self, pending: _PendingStartup) -> int:
+        """Inject handler guidance into project CLAUDE.md (advisory, never raises).
+
+        Args:
+            pending: initialise() arguments
+
+        Returns:
+            Number of handlers considered
+        """
         all_handlers = [h for chain in self._router._chains.values() for h in chain._handlers]
-        ClaudeMdInjector(workspace_root=workspace_root, handlers=all_handlers).inject()
+        with self._startup_timings.phase("claude_md_inject"):
+            ClaudeMdInjector(workspace_root=pending.workspace_root, handlers=all_handlers).inject()
+        return len(all_handlers)
+
+    def _run_config_validation(self, pending: _PendingStartup) -> None:
+        """Validate configuration (fail-open: degraded mode on errors).
 
-        # Validate configuration at startup (fail-open: degraded mode on errors)
-        self._validate_config(config_path)
+        Args:
+            pending: initialise() arguments
+        """
+        with self._startup_timings.phase("validate_config"):
+            self._validate_config(pending.config_path)
 
-    def _load_plugins(self, plugins_config: "PluginsConfig", workspace_root: Path) -> int:
+    def _load_plugins(
+        self,
+        plugins_config: "PluginsConfig",
+        workspace_root: Path,
+        *,
+        router: EventRouter | None = None,
+    ) -> int:
         """Load and register plugin handlers.
 
         Loads handlers from plugin configuration and registers them with
@@ -241,12 +605,15 @@ class DaemonController:
         Args:
             plugins_config: Plugin configuration from hooks-daemon.yaml
             workspace_root: Workspace root path for resolving relative paths
+            router: Router to register with (defaults to the live router)
 
         Returns:
             Number of plugin handlers loaded and registered
         """
         from claude_code_hooks_daemon.plugins.loader import PluginLoader
 
+        router = router or self._router
+
         # Load all handlers from plugins config
         handlers = PluginLoader.load_from_plugins_config(plugins_config, workspace_root)
 
@@ -311,7 +678,7 @@ class DaemonController:
                 ) from e
 
             # Register handler with the router
-            self._router.register(event_type, handler)
+            router.register(event_type, handler)
             logger.info(
                 "Registered plugin handler '%s' for %s (priority=%d, terminal=%s)",
                 handler.name,
@@ -328,6 +695,7 @@ class DaemonController:
         *,
         project_handlers_config: "ProjectHandlersConfig",
         workspace_root: Path,
+        router: EventRouter | None = None,
     ) -> int:
         """Load and register project-level handlers.
 
@@ -337,6 +705,7 @@ class DaemonController:
         Args:
             project_handlers_config: Project handlers configuration
             workspace_root: Workspace root path for resolving relative paths
+            router: Router to register with (defaults to the live router)
 
         Returns:
             Number of project handlers loaded and registered
@@ -347,6 +716,8 @@ class DaemonController:
 
         from claude_code_hooks_daemon.handlers.project_loader import ProjectHandlerLoader
 
+        router = router or self._router
+
         # Resolve path: relative paths are resolved against workspace_root
         handlers_path = Path(project_handlers_config.path)
         if not handlers_path.is_absolute():
@@ -363,7 +734,7 @@ class DaemonController:
         registered_count = 0
         for event_type, handler in discovered:
             # Check for handler_id conflict with existing handlers in the same event type
-            existing_chain = self._router.get_chain(event_type)
+            existing_chain = router.get_chain(event_type)
             existing_names = [h.name for h in existing_chain.handlers]
 
             if handler.name in existing_names:
@@ -386,7 +757,7 @@ class DaemonController:
                     event_type.value,
                 )
 
-            self._router.register(event_type, handler)
+            router.register(event_type, handler)
             logger.info(
                 "Registered project handler '%s' for %s (priority=%d, terminal=%s)",
                 handler.name,
@@ -459,6 +830,7 @@ class DaemonController:
             )
 
         if registered_count > 0:
+            dispatcher.start_background()
             self._pseudo_dispatcher = dispatcher
             logger.info("PseudoEventDispatcher active with %d pseudo-events", registered_count)
 
@@ -499,8 +871,9 @@ class DaemonController:
             config_dict = ConfigLoader.load(config_path)
             errors = ConfigValidator.validate(config_dict)
             if errors:
-                self._degraded = True
+                # Errors first: requests read them once they see degraded
                 self._config_errors = errors
+                self._degraded = True
                 logger.warning(
                     "Configuration validation failed with %d error(s). "
                     "Daemon is running in DEGRADED mode.",
@@ -513,8 +886,8 @@ class DaemonController:
         except Exception as e:
             # Validator itself crashed or config file unreadable -
             # still enter degraded mode (fail-open)
-            self._degraded = True
             self._config_errors = [f"Config validator error: {type(e).__name__}: {e}"]
+            self._degraded = True
             logger.warning(
                 "Configuration validator crashed: %s. " "Daemon is running in DEGRADED mode.",
                 e,
@@ -570,6 +943,108 @@ class DaemonController:
         """
         return self._mode_manager.set_mode(mode, custom_message)
 
+    def release_threads(self) -> None:
+        """Release the parallel handler and background pseudo-event threads.
+
+        Called on daemon stop or handoff. Work not yet started is
+        cancelled; in-flight requests have already drained.
+        """
+        self._handler_pool.shutdown(wait=False, cancel_futures=True)
+        if self._pseudo_dispatcher is not None:
+            self._pseudo_dispatcher.shutdown_background()
+
+    def export_state(
+        self,
+        *,
+        include_mode: bool = True,
+        since: float | None = None,
+        max_sessions: int | None = None,
+        max_history: int | None = None,
+    ) -> dict[str, Any]:
+        """Export session state a replacement daemon should carry on with.
+
+        Args:
+            include_mode: Include the daemon mode
+            since: Only include handler decisions made at or after this Unix timestamp
+            max_sessions: Only include per-session state for the most recent sessions
+            max_history: Only include this many of the most recent handler decisions
+
+        Returns:
+            JSON-compatible state (daemon mode, handler decision history,
+            StatusLine session state and pseudo-event state). History and
+            StatusLine state of events without a session ID are at the top
+            level; each session partition's are under "sessions".
+        """
+        state = _export_data_layer(get_data_layer(), since, max_history)
+        partitions = get_session_registry().items()
+        if max_sessions is not None:
+            partitions = partitions[-max_sessions:] if max_sessions > 0 else []
+        state[_STATE_KEY_SESSIONS] = {
+            session_id: _export_data_layer(data_layer, since, max_history)
+            for session_id, data_layer in partitions
+        }
+        if include_mode:
+            state[_STATE_KEY_MODE] = self._mode_manager.to_dict()
+        if self._pseudo_dispatcher is not None:
+            state[_STATE_KEY_PSEUDO_EVENTS] = self._pseudo_dispatcher.export(max_sessions)
+        return state
+
+    def import_state(self, state: dict[str, Any]) -> None:
+        """Restore session state exported by a previous daemon (fail-open).
+
+        Args:
+            state: Dictionary produced by export_state()
+        """
+        try:
+            mode_state = state.get(_STATE_KEY_MODE)
+            if mode_state:
+                self._mode_manager.set_mode(
+                    DaemonMode(mode_state[ModeConstant.KEY_MODE]),
+                    mode_state.get(ModeConstant.KEY_CUSTOM_MESSAGE),
+                )
+            _import_data_layer(get_data_layer(), state)
+            registry = get_session_registry()
+            # Least recently used first, so the registry keeps that order
+            for session_id, session_data in state.get(_STATE_KEY_SESSIONS, {}).items():
+                _import_data_layer(registry.acquire(session_id), session_data)
+            pseudo_state = state.get(_STATE_KEY_PSEUDO_EVENTS)
+            if pseudo_state and self._pseudo_dispatcher is not None:
+                self._pseudo_dispatcher.restore(pseudo_state)
+            self._forget_sessions(registry.pop_evicted())
+        except Exception:
+            logger.exception("Failed to restore session state from previous daemon")
+
+    def restore_state_on_first_request(self, loader: Callable[[], dict[str, Any] | None]) -> None:
+        """Restore session state lazily, when the first event is processed.
+
+        Keeps reading the snapshot off the startup path. While a progressive
+        startup is still warming, the restore waits for the full handler
+        set (and pseudo-event dispatcher) to be in place.
+
+        Args:
+            loader: Returns state produced by export_state(), or None
+        """
+        self._pending_state = loader
+
+    def _restore_pending_state(self) -> None:
+        """Run the pending state loader once (fail-open).
+
+        Concurrent first requests wait for the restore rather than racing it.
+        """
+        with self._state_lock:
+            loader = self._pending_state
+            if loader is None:
+                return
+            self._pending_state = None
+            try:
+                state = loader()
+            except Exception:
+                logger.exception("Failed to load session state snapshot")
+                return
+            if state:
+                self.import_state(state)
+                logger.info("Restored session state from snapshot")
+
     def process_event(self, event: HookEvent) -> ChainExecutionResult:
         """Process a hook event.
 
@@ -593,87 +1068,326 @@ class DaemonController:
                 execution_time_ms=0.0,
             )
 
+        # Read in this order: complete_startup() swaps the router before it
+        # clears the pending state
+        warming = self._pending_startup is not None
+        router = self._router
+
+        if self._pending_state is not None and not warming:
+            self._restore_pending_state()
+
+        session_id = event.hook_input.session_id
+        with use_data_layer(self._session_data_layer(session_id)):
+            result = self._process_in_session(event, router, warming)
+        if event.event_type == EventType.SESSION_END and session_id:
+            # After the chain, so SessionEnd handlers still see the session
+            self._end_session(session_id)
+        return result
+
+    async def process_event_async(
+        self, event: HookEvent, offload: "Offload"
+    ) -> ChainExecutionResult:
+        """Process a hook event from the event loop.
+
+        Same result as process_event(), but async handlers are awaited on
+        the loop and every synchronous step (handlers, history, pseudo-events)
+        is offloaded, so no worker thread waits on an async handler.
+
+        Args:
+            event: Hook event to process
+            offload: Runs synchronous steps on a worker thread
+
+        Returns:
+            Chain execution result
+        """
+        if not self._initialised or self._degraded:
+            return await offload(self.process_event, event)
+
+        # Read in this order: complete_startup() swaps the router before it
+        # clears the pending state
+        warming = self._pending_startup is not None
+        router = self._router
+
+        if self._pending_state is not None and not warming:
+            await offload(self._restore_pending_state)
+
+        session_id = event.hook_input.session_id
+        data_layer = await offload(self._session_data_layer, session_id)
+        with use_data_layer(data_layer):
+            result = await self._process_in_session_async(event, router, warming, offload)
+        if event.event_type == EventType.SESSION_END and session_id:
+            await offload(self._end_session, session_id)
+        return result
+
+    def uses_async_handlers(self, event_type: str) -> bool:
+        """Check whether an event's chain awaits handlers on the event loop.
+
+        Args:
+            event_type: Hook event type (e.g. "Status")
+
+        Returns:
+            True if the chain contains async handlers, so the event should
+            be processed with process_request_traced_async()
+        """
+        if not self._initialised or self._degraded:
+            return False
+        try:
+            chain = self._router.get_chain(EventType.from_string(event_type))
+        except ValueError:
+            # Unknown event: process_request() reports it
+            logger.debug("No chain for event type %r", event_type)
+            return False
+        return chain.has_async_handlers()
+
+    def _end_session(self, session_id: str) -> None:
+        """Release a session's data layer partition after SessionEnd.
+
+        Args:
+            session_id: Session that ended
+        """
+        if get_session_registry().end_session(session_id):
+            self._forget_sessions(get_session_registry().pop_evicted())
+
+    def _session_data_layer(self, session_id: str | None) -> DaemonDataLayer:
+        """Get the data layer partition for an event's session.
+
+        Args:
+            session_id: Event's session ID (None = the global data layer)
+
+        Returns:
+            Data layer to bind while the event is processed
+        """
+        if not session_id:
+            return get_data_layer()
+        registry = get_session_registry()
+        data_layer = registry.acquire(session_id)
+        self._forget_sessions(registry.pop_evicted())
+        return data_layer
+
+    def _forget_sessions(self, session_ids: list[str]) -> None:
+        """Drop per-session state held outside the data layer.
+
+        Args:
+            session_ids: Sessions whose data layer partition was evicted
+        """
+        if self._pseudo_dispatcher is None:
+            return
+        for session_id in session_ids:
+            self._pseudo_dispatcher.forget_session(session_id)
+
+    def _process_in_session(
+        self, event: HookEvent, router: EventRouter, warming: bool
+    ) -> ChainExecutionResult:
+        """Run an event through the mode interceptor, handlers and pseudo-events.
+
+        Called with the session's data layer bound.
+
+        Args:
+            event: Hook event to process
+            router: Router to dispatch with
+            warming: Progressive startup is still loading handlers
+
+        Returns:
+            Chain execution result
+        """
         start_time = time.perf_counter()
         try:
-            # Convert HookInput to dict for handlers (use Python field names, not camelCase aliases)
-            hook_input_dict = event.hook_input.model_dump(by_alias=False)
+            route = self._prepare_route(event, start_time)
+            if isinstance(route, ChainExecutionResult):
+                return route
+            result = router.route(
+                event.event_type,
+                route.hook_input,
+                strict_mode=route.strict_mode,
+                shedder=route.shedder,
+                segment_cache=route.segment_cache,
+                pool=route.pool,
+            )
+            return self._finish_route(event, route, result, start_time, warming)
+        except Exception as e:
+            return self._internal_error(event, e, start_time)
+
+    async def _process_in_session_async(
+        self, event: HookEvent, router: EventRouter, warming: bool, offload: "Offload"
+    ) -> ChainExecutionResult:
+        """Run an event like _process_in_session(), awaiting async handlers.
+
+        Called with the session's data layer bound.
+
+        Args:
+            event: Hook event to process
+            router: Router to dispatch with
+            warming: Progressive startup is still loading handlers
+            offload: Runs synchronous steps on a worker thread
 
-            # Mode interceptor: short-circuit before handler chain
-            interceptor = get_interceptor_for_mode(
-                self._mode_manager.current_mode,
-                self._mode_manager.custom_message,
+        Returns:
+            Chain execution result
+        """
+        start_time = time.perf_counter()
+        try:
+            route = await offload(self._prepare_route, event, start_time)
+            if isinstance(route, ChainExecutionResult):
+                return route
+            result = await router.route_async(
+                event.event_type,
+                route.hook_input,
+                offload,
+                strict_mode=route.strict_mode,
+                shedder=route.shedder,
+                segment_cache=route.segment_cache,
+                pool=route.pool,
             )
-            if interceptor is not None:
-                intercept_result = interceptor.intercept(event.event_type, hook_input_dict)
-                if intercept_result is not None:
-                    processing_time = (time.perf_counter() - start_time) * 1000
-                    self._stats.record_request(event.event_type.value, processing_time)
-                    logger.info(
-                        "Mode interceptor short-circuited %s event (mode=%s)",
-                        event.event_type.value,
-                        self._mode_manager.current_mode.value,
-                    )
-                    return ChainExecutionResult(
-                        result=intercept_result,
-                        execution_time_ms=processing_time,
-                    )
-
-            # Update data layer SessionState on StatusLine events
-            if event.event_type == EventType.STATUS_LINE:
-                logger.debug("StatusLine raw hook_input: %s", hook_input_dict)
-                get_data_layer().session.update_from_status_event(hook_input_dict)
+            return await offload(self._finish_route, event, route, result, start_time, warming)
+        except Exception as e:
+            return self._internal_error(event, e, start_time)
 
-            # Get strict_mode from config (default to False if no config)
-            strict_mode = self._config.strict_mode if self._config else False
-
-            result = self._router.route(event.event_type, hook_input_dict, strict_mode=strict_mode)
-            processing_time = (time.perf_counter() - start_time) * 1000
-            self._stats.record_request(event.event_type.value, processing_time)
-
-            # Record handler decisions in data layer history
-            data_layer = get_data_layer()
-            for handler_name in result.handlers_matched:
-                tool_name = event.hook_input.tool_name or ""
-                data_layer.history.record(
-                    handler_id=handler_name,
-                    event_type=event.event_type.value,
-                    decision=result.result.decision.value,
-                    tool_name=tool_name,
-                    reason=result.result.reason,
-                )
+    def _prepare_route(
+        self, event: HookEvent, start_time: float
+    ) -> _RouteRequest | ChainExecutionResult:
+        """Apply the mode interceptor and work out how to route an event.
+
+        Args:
+            event: Hook event to process
+            start_time: perf_counter() reading when processing started
+
+        Returns:
+            Routing options, or the interceptor's result when it
+            short-circuits the chain
+        """
+        # Convert HookInput to dict for handlers (use Python field names, not camelCase aliases)
+        hook_input_dict = event.hook_input.model_dump(by_alias=False)
 
-            # Dispatch pseudo-events (if configured)
-            if self._pseudo_dispatcher is not None:
-                session_id = event.hook_input.session_id or "default"
-                pseudo_results = self._pseudo_dispatcher.check_and_fire(
-                    event.event_type,
-                    hook_input_dict,
-                    session_id,
+        # Mode interceptor: short-circuit before handler chain
+        interceptor = get_interceptor_for_mode(
+            self._mode_manager.current_mode,
+            self._mode_manager.custom_message,
+        )
+        if interceptor is not None:
+            intercept_result = interceptor.intercept(event.event_type, hook_input_dict)
+            if intercept_result is not None:
+                processing_time = (time.perf_counter() - start_time) * 1000
+                self._stats.record_request(event.event_type.value, processing_time)
+                logger.info(
+                    "Mode interceptor short-circuited %s event (mode=%s)",
+                    event.event_type.value,
+                    self._mode_manager.current_mode.value,
+                )
+                return ChainExecutionResult(
+                    result=intercept_result,
+                    execution_time_ms=processing_time,
                 )
-                if pseudo_results:
-                    result = merge_pseudo_results(result, pseudo_results)
 
-            # Check if a handler crashed (strict mode creates error result with context)
-            if any("Handler exception:" in ctx for ctx in result.result.context):
-                self._stats.record_error()
+        # Update data layer SessionState on StatusLine events. Status
+        # segments are cached per session and never shed (the line
+        # would lose parts)
+        shedder: LoadShedder | None = self._shedder
+        segment_cache: SegmentCache | None = None
+        if event.event_type == EventType.STATUS_LINE:
+            logger.debug("StatusLine raw hook_input: %s", hook_input_dict)
+            get_data_layer().session.update_from_status_event(hook_input_dict)
+            shedder = None
+            segment_cache = get_data_layer().status_segments
+
+        return _RouteRequest(
+            hook_input=hook_input_dict,
+            # Get strict_mode from config (default to False if no config)
+            strict_mode=self._config.strict_mode if self._config else False,
+            shedder=shedder,
+            segment_cache=segment_cache,
+            pool=(self._handler_pool if event.event_type in _PARALLEL_CHAIN_EVENTS else None),
+        )
 
-            return result
-        except Exception as e:
-            processing_time = (time.perf_counter() - start_time) * 1000
-            self._stats.record_request(event.event_type.value, processing_time)
-            self._stats.record_error()
-            logger.exception("Error processing event")
+    def _finish_route(
+        self,
+        event: HookEvent,
+        route: _RouteRequest,
+        result: ChainExecutionResult,
+        start_time: float,
+        warming: bool,
+    ) -> ChainExecutionResult:
+        """Record a chain's result and add pseudo-event and warming output.
 
-            # Return error result
-            error_result = HookResult.error(
-                error_type="internal_error",
-                error_details=f"{type(e).__name__}: {e}",
+        Args:
+            event: Hook event being processed
+            route: Routing options the chain ran with
+            result: Chain execution result
+            start_time: perf_counter() reading when processing started
+            warming: Progressive startup is still loading handlers
+
+        Returns:
+            Chain execution result to respond with
+        """
+        processing_time = (time.perf_counter() - start_time) * 1000
+        self._stats.record_request(event.event_type.value, processing_time)
+        self._shedder.record_latency(processing_time)
+        if result.handlers_shed:
+            result.result.add_context(
+                f"{SHED_CONTEXT_PREFIX} Skipped under load: {', '.join(result.handlers_shed)}"
             )
-            return ChainExecutionResult(
-                result=error_result,
-                execution_time_ms=processing_time,
+
+        # Record handler decisions in data layer history
+        data_layer = get_data_layer()
+        for handler_name in result.handlers_matched:
+            tool_name = event.hook_input.tool_name or ""
+            data_layer.history.record(
+                handler_id=handler_name,
+                event_type=event.event_type.value,
+                decision=result.result.decision.value,
+                tool_name=tool_name,
+                reason=result.result.reason,
+                session_id=event.hook_input.session_id,
             )
 
+        # Dispatch pseudo-events (if configured)
+        if self._pseudo_dispatcher is not None:
+            session_id = event.hook_input.session_id or "default"
+            pseudo_results = self._pseudo_dispatcher.check_and_fire(
+                event.event_type,
+                route.hook_input,
+                session_id,
+            )
+            if pseudo_results:
+                result = merge_pseudo_results(result, pseudo_results)
+
+        if warming:
+            result.result.add_context(
+                WARMING_STATUS if event.event_type == EventType.STATUS_LINE else WARMING_CONTEXT
+            )
+
+        # Check if a handler crashed (strict mode creates error result with context)
+        if any("Handler exception:" in ctx for ctx in result.result.context):
+            self._stats.record_error()
+
+        return result
+
+    def _internal_error(
+        self, event: HookEvent, error: Exception, start_time: float
+    ) -> ChainExecutionResult:
+        """Build the result for an event whose processing raised.
+
+        Args:
+            event: Hook event being processed
+            error: Exception raised outside the handlers
+            start_time: perf_counter() reading when processing started
+
+        Returns:
+            Chain execution result carrying an internal_error result
+        """
+        processing_time = (time.perf_counter() - start_time) * 1000
+        self._stats.record_request(event.event_type.value, processing_time)
+        self._stats.record_error()
+        logger.exception("Error processing event")
+
+        # Return error result
+        error_result = HookResult.error(
+            error_type="internal_error",
+            error_details=f"{type(error).__name__}: {error}",
+        )
+        return ChainExecutionResult(
+            result=error_result,
+            execution_time_ms=processing_time,
+        )
+
     def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
         """Process a raw request from the socket server.
 
@@ -685,8 +1399,63 @@ class DaemonController:
         Returns:
             Response dictionary per PRD 3.2.2 format
         """
+        response, _ = self.process_request_traced(request_data)
+        return response
+
+    def process_request_traced(
+        self, request_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None]:
+        """Process a raw request and also return the chain execution result.
+
+        Used by traffic capture and replay, which need per-handler timings
+        alongside the formatted response.
+
+        Args:
+            request_data: Raw request dictionary
+
+        Returns:
+            Tuple of (response dictionary, chain result or None for invalid requests)
+        """
+        event = self._parse_request(request_data)
+        if not isinstance(event, HookEvent):
+            return event, None
+
+        result = self.process_event(event)
+
+        # Use to_json() for Claude Code hook format, not to_response_dict()
+        return result.result.to_json(event.event_type.value), result
+
+    async def process_request_traced_async(
+        self, request_data: dict[str, Any], offload: "Offload"
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None]:
+        """Process a raw request from the event loop (see process_event_async()).
+
+        Args:
+            request_data: Raw request dictionary
+            offload: Runs synchronous steps on a worker thread
+
+        Returns:
+            Tuple of (response dictionary, chain result or None for invalid requests)
+        """
+        event = self._parse_request(request_data)
+        if not isinstance(event, HookEvent):
+            return event, None
+
+        result = await self.process_event_async(event, offload)
+        return result.result.to_json(event.event_type.value), result
+
+    @staticmethod
+    def _parse_request(request_data: dict[str, Any]) -> HookEvent | dict[str, Any]:
+        """Validate a raw request.
+
+        Args:
+            request_data: Raw request dictionary
+
+        Returns:
+            The hook event, or the error response for an invalid request
+        """
         try:
-            event = HookEvent.model_validate(request_data)
+            return HookEvent.model_validate(request_data)
         except Exception as e:
             logger.warning("Invalid request data: %s", e)
             error_result = HookResult.error(
@@ -695,10 +1464,31 @@ class DaemonController:
             )
             return error_result.to_response_dict("Unknown", 0.0)
 
-        result = self.process_event(event)
+    @property
+    def startup_timings(self) -> StartupTimings:
+        """Get the phase and handler constructor timings from initialise()."""
+        return self._startup_timings
 
-        # Use to_json() for Claude Code hook format, not to_response_dict()
-        return result.result.to_json(event.event_type.value)
+    @property
+    def load_shedder(self) -> LoadShedder:
+        """Get the shedder that skips low-priority handlers under load."""
+        return self._shedder
+
+    def attach_queue_depth(self, provider: Callable[[], int]) -> None:
+        """Let load shedding see how many requests wait for a worker.
+
+        Args:
+            provider: Returns the server's current queue depth
+        """
+        self._shedder.attach_queue_depth(provider)
+
+    def get_load_shedding(self) -> dict[str, Any]:
+        """Get load shedding state and counters.
+
+        Returns:
+            Shedder snapshot (see LoadShedder.snapshot())
+        """
+        return self._shedder.snapshot()
 
     def get_stats(self) -> DaemonStats:
         """Get daemon statistics.
@@ -717,9 +1507,12 @@ class DaemonController:
         health: dict[str, Any] = {
             "status": "degraded" if self._degraded else "healthy",
             "initialised": self._initialised,
+            "warming": self.is_warming,
             "stats": self._stats.to_dict(),
             "handlers": self._router.get_handler_count(),
             ModeConstant.KEY_MODE: self._mode_manager.current_mode.value,
+            "sessions": get_session_registry().stats(),
+            "load_shedding": self._shedder.snapshot(),
         }
 
         if self._degraded:
@@ -746,6 +1539,88 @@ class DaemonController:
             ]
         return result
 
+    def apply_handler_config(
+        self, handler_config: dict[str, dict[str, dict[str, Any]]]
+    ) -> ReloadResult:
+        """Apply a changed handlers config without restarting.
+
+        Re-registers only the built-in handlers whose config entries changed
+        (plus handlers sharing options with them), on a copy of the live
+        router that then replaces it in one assignment, like
+        complete_startup(). Plugin and project handlers are kept as-is.
+
+        Args:
+            handler_config: New registry-format handler config
+
+        Returns:
+            Reload outcome (status reloaded or unchanged)
+
+        Raises:
+            RuntimeError: If not initialised or progressive startup is still warming up
+        """
+        pending = self._require_startup_args()
+        if self.is_warming:
+            raise RuntimeError("daemon is still warming up")
+
+        changes = diff_handler_config(pending.handler_config or {}, handler_config)
+        if not changes:
+            return ReloadResult(status=ReloadStatus.UNCHANGED)
+
+        # Handlers that inherit options from a changed handler change with it
+        for event_type, chain in self._router._chains.items():
+            section = _SECTION_BY_EVENT_TYPE.get(event_type)
+            keys = changes.get(section) if section else None
+            if section is None or keys is None:
+                continue
+            inheriting = {
+                h.config_key for h in chain if h.shares_options_with in keys and h.config_key
+            }
+            changes[section] = keys | inheriting
+
+        router = EventRouter()
+        unregistered = 0
+        for event_type, chain in self._router._chains.items():
+            section = _SECTION_BY_EVENT_TYPE.get(event_type)
+            for handler in chain:
+                if section in changes and _is_builtin(handler):
+                    keys = changes[section]
+                    if keys is None or handler.config_key in keys:
+                        unregistered += 1
+                        continue
+                router.register(event_type, handler)
+
+        updated = replace(pending, handler_config=handler_config)
+        registered = self._registry.register_all(
+            router,
+            config=handler_config,
+            workspace_root=updated.workspace_root,
+            project_languages=updated.project_languages,
+            plan_workflow=updated.plan_workflow,
+            only=changes,
+        )
+
+        self._router = router
+        self._startup_args = updated
+        changed = tuple(
+            sorted(
+                f"{section}.*" if keys is None else f"{section}.{key}"
+                for section, keys in changes.items()
+                for key in (keys or (None,))
+            )
+        )
+        logger.info(
+            "Applied handler config changes %s: %d unregistered, %d registered",
+            ", ".join(changed),
+            unregistered,
+            registered,
+        )
+        return ReloadResult(
+            status=ReloadStatus.RELOADED,
+            changed=changed,
+            registered=registered,
+            unregistered=unregistered,
+        )
+
     def get_router(self) -> EventRouter:
         """Get the event router.
 
@@ -767,6 +1642,11 @@ class DaemonController:
         """Check if controller is initialised."""
         return self._initialised
 
+    @property
+    def is_warming(self) -> bool:
+        """Check if progressive startup is still loading non-critical handlers."""
+        return self._pending_startup is not None
+
     @property
     def is_degraded(self) -> bool:
         """Check if controller is in degraded mode due to config errors."""
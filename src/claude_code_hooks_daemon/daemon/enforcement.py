@@ -2,6 +2,11 @@
 
 Provides enforcement logic to prevent multiple daemon instances from running
 simultaneously, particularly useful in container environments.
+
+Other daemons are found through the live daemon registry (see
+daemon.instances), which costs O(number of daemons). The system-wide process
+scan is kept as an explicit fallback (daemon.enforcement_discovery: scan) for
+daemons started by versions that did not register themselves.
 """
 
 import logging
@@ -9,6 +14,7 @@ import os
 from pathlib import Path
 
 from claude_code_hooks_daemon.config.models import Config
+from claude_code_hooks_daemon.daemon.instances import find_registered_daemons
 from claude_code_hooks_daemon.daemon.paths import cleanup_pid_file, read_pid_file
 from claude_code_hooks_daemon.daemon.process_verification import (
     find_all_daemon_processes,
@@ -19,8 +25,11 @@ from claude_code_hooks_daemon.utils.container_detection import is_container_envi
 
 logger = logging.getLogger(__name__)
 
+# daemon.enforcement_discovery value selecting the system-wide process scan
+ENFORCEMENT_DISCOVERY_SCAN = "scan"
+
 
-def enforce_single_daemon(config: Config, pid_path: Path) -> None:
+def enforce_single_daemon(config: Config, pid_path: Path, keep_pid: int | None = None) -> None:
     """Enforce single daemon process constraint.
 
     In containers: Kills all daemon processes except current process (system-wide).
@@ -29,6 +38,7 @@ def enforce_single_daemon(config: Config, pid_path: Path) -> None:
     Args:
         config: Daemon configuration
         pid_path: Path to PID file
+        keep_pid: Daemon to leave running (the one handing over its socket)
     """
     # Check if enforcement is enabled
     if not config.daemon.enforce_single_daemon_process:
@@ -41,16 +51,10 @@ def enforce_single_daemon(config: Config, pid_path: Path) -> None:
     in_container = is_container_environment()
     logger.debug(f"Container environment: {in_container}")
 
-    # Find all daemon processes
-    daemon_pids = find_all_daemon_processes()
-    current_pid = os.getpid()
-
-    # Remove current process from list
-    other_daemons = [pid for pid in daemon_pids if pid != current_pid]
-
-    logger.debug(f"Found {len(other_daemons)} other daemon process(es)")
-
     # In container: Kill all other daemons (system-wide enforcement)
+    other_daemons = (
+        [pid for pid in _find_other_daemons(config) if pid != keep_pid] if in_container else []
+    )
     if in_container and other_daemons:
         logger.warning(
             f"Container environment: Killing {len(other_daemons)} other daemon process(es)"
@@ -71,3 +75,23 @@ def enforce_single_daemon(config: Config, pid_path: Path) -> None:
         if pid_from_file is not None and not is_process_running(pid_from_file):
             logger.info(f"Cleaning up stale PID file: {pid_path} (PID {pid_from_file})")
             cleanup_pid_file(str(pid_path))
+
+
+def _find_other_daemons(config: Config) -> list[int]:
+    """Find daemon processes other than the current one.
+
+    Args:
+        config: Daemon configuration (selects registry or full scan)
+
+    Returns:
+        PIDs of other daemon processes
+    """
+    if config.daemon.enforcement_discovery == ENFORCEMENT_DISCOVERY_SCAN:
+        daemon_pids = find_all_daemon_processes()
+    else:
+        daemon_pids = find_registered_daemons()
+
+    current_pid = os.getpid()
+    other_daemons = [pid for pid in daemon_pids if pid != current_pid]
+    logger.debug(f"Found {len(other_daemons)} other daemon process(es)")
+    return other_daemons
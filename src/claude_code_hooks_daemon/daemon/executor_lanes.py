@@ -0,0 +1,277 @@
+"""Executor lanes: a thread pool per class of hook event.
+
+With one shared pool, a burst of slow PostToolUse linting or Stop
+transcript parsing occupies every worker and a status line refresh queues
+behind it. Each lane owns its own pool and queue limit, so events in the
+interactive lane (status line, PreToolUse) always find a free worker.
+
+Per-session serialisation (see session_lanes) is shared by every lane: a
+session's requests run one at a time in arrival order whichever lane
+serves them, so its PreToolUse never overlaps its own PostToolUse or Stop.
+Status requests bypass it (the server passes no session): they only read
+session state, so a status refresh never waits for its own session's
+lint run. Lanes keep threads apart across sessions - one session's slow
+PostToolUse cannot take the worker another session's status refresh needs.
+
+Requests whose chain has async handlers run with run_async(): the request
+is a coroutine on the event loop that offloads its synchronous steps to
+the lane's pool, so the lane's threads are free while its handlers wait
+on subprocesses.
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from claude_code_hooks_daemon.config.models import ExecutorLaneConfig
+from claude_code_hooks_daemon.daemon.metrics import LaneMetrics
+from claude_code_hooks_daemon.daemon.session_lanes import SessionLanes
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Lane used when the configuration defines none
+DEFAULT_LANE_NAME = "default"
+
+
+class LaneFullError(Exception):
+    """Raised when a request arrives at a lane whose queue is full."""
+
+
+class ExecutorLane:
+    """A named thread pool with its own metrics and session serialisation."""
+
+    __slots__ = ("_executor", "events", "max_workers", "metrics", "name", "sessions")
+
+    def __init__(
+        self,
+        name: str,
+        events: frozenset[str],
+        max_workers: int,
+        max_queue: int | None = None,
+        sessions: SessionLanes | None = None,
+    ) -> None:
+        """Create a lane (its threads start on first use).
+
+        Args:
+            name: Lane name from configuration
+            events: Event types routed here (empty = catch-all)
+            max_workers: Worker threads in the lane's pool
+            max_queue: Most requests allowed to wait (None = no limit)
+            sessions: Session serialisation shared with the other lanes
+                (None = this lane's own)
+        """
+        self.name = name
+        self.events = events
+        self.max_workers = max_workers
+        self.metrics = LaneMetrics(max_queue)
+        self.sessions = sessions if sessions is not None else SessionLanes()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the lane's thread pool, creating it on first use.
+
+        Returns:
+            Thread pool that runs this lane's handler chains
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"hooks-daemon-{self.name}"
+            )
+        return self._executor
+
+    async def run(self, session_id: str | None, func: Callable[..., T], *args: Any) -> T:
+        """Run a job in this lane after the session's earlier requests.
+
+        The job runs in a copy of the caller's context, so request-scoped
+        state (e.g. the request's deferred tasks) reaches the worker thread.
+
+        Args:
+            session_id: Session the request belongs to (None = not serialised)
+            func: Function to run on a worker thread
+            *args: Positional arguments for func
+
+        Returns:
+            The job's result
+
+        Raises:
+            LaneFullError: If the lane's queue is full
+        """
+        job = self.metrics.track(func, *args)
+        if job is None:
+            raise LaneFullError(self.name)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        started = False
+
+        def submit() -> "asyncio.Future[T]":
+            nonlocal started
+            started = True
+            return loop.run_in_executor(self.executor(), context.run, job)
+
+        try:
+            return await self.sessions.run(session_id, submit)
+        finally:
+            if not started:
+                # Cancelled while waiting behind its session: never ran
+                self.metrics.cancel()
+
+    async def run_async(
+        self, session_id: str | None, func: Callable[..., Awaitable[T]], *args: Any
+    ) -> T:
+        """Run a coroutine job in this lane after the session's earlier requests.
+
+        The job runs on the event loop; it should hand its synchronous
+        work to offload(), which uses this lane's threads.
+
+        Args:
+            session_id: Session the request belongs to (None = not serialised)
+            func: Coroutine function to run
+            *args: Positional arguments for func
+
+        Returns:
+            The job's result
+
+        Raises:
+            LaneFullError: If the lane's queue is full
+        """
+        job = self.metrics.track_async(func, *args)
+        if job is None:
+            raise LaneFullError(self.name)
+        started = False
+
+        def submit() -> Awaitable[T]:
+            nonlocal started
+            started = True
+            return job()
+
+        try:
+            return await self.sessions.run(session_id, submit)
+        finally:
+            if not started:
+                # Cancelled while waiting behind its session: never ran
+                self.metrics.cancel()
+
+    def offload(self, func: Callable[..., T], /, *args: Any) -> "asyncio.Future[T]":
+        """Run a synchronous step of a run_async() job on the lane's threads.
+
+        The step runs in a copy of the caller's context (the session's
+        data layer, the request's deferred tasks).
+
+        Args:
+            func: Function to run on a worker thread
+            *args: Positional arguments for func
+
+        Returns:
+            Future resolving to func's result
+        """
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(self.executor(), context.run, func, *args)
+
+    def shutdown(self) -> None:
+        """Release worker threads, cancelling jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the lane's metrics.
+
+        Returns:
+            Routed events, worker count, queue counters and queue wait
+            percentiles
+        """
+        return {
+            "events": sorted(self.events),
+            "max_workers": self.max_workers,
+            **self.metrics.snapshot(),
+        }
+
+
+class ExecutorLanes:
+    """Routes each hook event to the lane configured for it."""
+
+    __slots__ = ("_by_event", "_fallback", "lanes", "sessions")
+
+    def __init__(self, lanes: list[ExecutorLane]) -> None:
+        """Create the router.
+
+        Events no lane lists go to the first lane with no events, or to
+        the last lane when every lane lists its events.
+
+        Args:
+            lanes: Lanes in configuration order (at least one), sharing
+                one SessionLanes
+        """
+        self.lanes = lanes
+        self.sessions = lanes[0].sessions
+        self._by_event = {event: lane for lane in lanes for event in lane.events}
+        self._fallback = next((lane for lane in lanes if not lane.events), lanes[-1])
+
+    @classmethod
+    def from_config(
+        cls, configs: Mapping[str, ExecutorLaneConfig], default_workers: int
+    ) -> "ExecutorLanes":
+        """Build lanes from daemon.executor_lanes.
+
+        Args:
+            configs: Lane configurations keyed by lane name
+            default_workers: Worker count for lanes that do not set one
+
+        Returns:
+            Router over the configured lanes (one catch-all lane if none)
+        """
+        sessions = SessionLanes()
+        lanes = [
+            ExecutorLane(
+                name,
+                frozenset(config.events),
+                config.max_workers or default_workers,
+                config.max_queue,
+                sessions,
+            )
+            for name, config in configs.items()
+        ]
+        if not lanes:
+            lanes = [ExecutorLane(DEFAULT_LANE_NAME, frozenset(), default_workers, None, sessions)]
+        return cls(lanes)
+
+    def for_event(self, event: str) -> ExecutorLane:
+        """Get the lane serving an event type.
+
+        Args:
+            event: Hook event type (e.g. "PreToolUse")
+
+        Returns:
+            The lane listing the event, or the catch-all lane
+        """
+        return self._by_event.get(event, self._fallback)
+
+    @property
+    def max_workers(self) -> int:
+        """Total worker threads across all lanes."""
+        return sum(lane.max_workers for lane in self.lanes)
+
+    def queued(self) -> int:
+        """Get the number of requests waiting in any lane.
+
+        Returns:
+            Requests admitted to a lane that have not started yet
+        """
+        return sum(lane.metrics.queued for lane in self.lanes)
+
+    def shutdown(self) -> None:
+        """Release every lane's worker threads."""
+        for lane in self.lanes:
+            lane.shutdown()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get metrics for every lane.
+
+        Returns:
+            Lane snapshots keyed by lane name
+        """
+        return {lane.name: lane.snapshot() for lane in self.lanes}
@@ -0,0 +1,135 @@
+"""Listening-socket handoff from a running daemon to its replacement.
+
+``restart --handoff`` replaces a daemon without a window in which hooks
+find no daemon. The incoming daemon initialises fully while the outgoing
+one keeps serving, then sends it a ``handoff`` system request over the
+normal socket. The outgoing daemon answers on that connection with one
+byte carrying two file descriptors as SCM_RIGHTS ancillary data:
+
+- the listening socket, so the incoming daemon accepts from the same
+  kernel queue and the socket path never stops accepting connections
+- the project lock file (see daemon.instances), so the lock is never free
+
+followed by the usual JSON response line holding its PID and serialisable
+session state. The outgoing daemon then stops accepting, drains its
+in-flight requests and exits without removing the socket, PID or socket
+discovery files, which now belong to the incoming daemon.
+"""
+
+import contextlib
+import json
+import os
+import socket
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# System action that asks the running daemon to hand over its socket
+ACTION_HANDOFF = "handoff"
+
+# Single byte that carries the descriptors ahead of the JSON response
+_FD_MARKER = b"\0"
+
+# Descriptors passed, in order: listening socket, project lock file
+_HANDOFF_FD_COUNT = 2
+
+_RECV_CHUNK_BYTES = 65536
+
+
+class HandoffError(RuntimeError):
+    """The running daemon did not hand over its socket."""
+
+
+@dataclass(slots=True)
+class Handoff:
+    """What the incoming daemon receives from the outgoing one.
+
+    Attributes:
+        listen_socket: Listening socket to serve on
+        lock_fd: Descriptor of the (still locked) project lock file
+        pid: PID of the outgoing daemon
+        state: Session state exported by the outgoing controller
+    """
+
+    listen_socket: socket.socket
+    lock_fd: int
+    pid: int
+    state: dict[str, Any] = field(default_factory=dict)
+
+
+def send_handoff_fds(conn_fd: int, listen_fd: int, lock_fd: int) -> None:
+    """Send the listening socket and lock descriptors on a client connection.
+
+    Must run before anything else is written to the connection, so the
+    marker byte is the first byte the client reads.
+
+    Args:
+        conn_fd: Descriptor of the connected client socket
+        listen_fd: Listening socket descriptor
+        lock_fd: Project lock file descriptor
+
+    Raises:
+        OSError: If the descriptors cannot be sent
+    """
+    # A duplicate so closing our socket object leaves the connection open
+    with socket.socket(fileno=os.dup(conn_fd)) as conn:
+        socket.send_fds(conn, [_FD_MARKER], [listen_fd, lock_fd])
+
+
+def request_handoff(socket_path: Path, timeout: float) -> Handoff:
+    """Ask the daemon listening on socket_path to hand over its socket.
+
+    Args:
+        socket_path: Socket of the running daemon
+        timeout: Seconds to wait for the connection and the response
+
+    Returns:
+        Received socket, lock descriptor and session state
+
+    Raises:
+        HandoffError: If the daemon refused, is too old to support handoff,
+            or sent something unexpected
+        OSError: If the daemon cannot be reached
+    """
+    request = {"event": "_system", "hook_input": {"action": ACTION_HANDOFF}}
+    fds: list[int] = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk, chunk_fds, _flags, _addr = socket.recv_fds(
+                    sock, _RECV_CHUNK_BYTES, _HANDOFF_FD_COUNT
+                )
+                fds.extend(chunk_fds)
+                if not chunk:
+                    break
+                data += chunk
+
+        if data.startswith(_FD_MARKER):
+            data = data[len(_FD_MARKER) :]
+        try:
+            response = json.loads(data)
+        except ValueError as e:
+            raise HandoffError(f"malformed handoff response: {e}") from None
+        if "error" in response:
+            raise HandoffError(str(response["error"]))
+        if len(fds) != _HANDOFF_FD_COUNT:
+            raise HandoffError(f"expected {_HANDOFF_FD_COUNT} descriptors, got {len(fds)}")
+
+        result = response.get("result") or {}
+        pid = int(result.get("pid", 0))
+        state = result.get("state") or {}
+        listen_fd, lock_fd = fds
+        handoff = Handoff(
+            listen_socket=socket.socket(fileno=listen_fd), lock_fd=lock_fd, pid=pid, state=state
+        )
+    except BaseException:
+        for fd in fds:
+            with contextlib.suppress(OSError):
+                os.close(fd)
+        raise
+    return handoff
@@ -0,0 +1,394 @@
+"""Persistent SQLite store for handler decisions.
+
+HandlerHistory keeps a bounded in-memory window for handlers to query.
+When ``daemon.history_store.enabled`` is set, each decision is also queued
+here and written to a SQLite database (WAL mode) by a background thread,
+in batches, so the request path never waits on disk. The database keeps
+decisions for ``retention_days`` and backs the ``history`` CLI command's
+per-project analytics (which handlers block most, per tool, per session).
+
+Usage:
+    store = HistoryStore(path, retention_days=30)
+    store.start()
+    get_data_layer().history.attach_store(store)
+    ...
+    store.close()
+
+    rows = summarise_history(path, group_by="handler", since=time.time() - 86400)
+"""
+
+import contextlib
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claude_code_hooks_daemon.daemon.paths import get_history_db_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from claude_code_hooks_daemon.config.models import HistoryStoreConfig
+    from claude_code_hooks_daemon.core.handler_history import HandlerDecisionRecord
+
+logger = logging.getLogger(__name__)
+
+# Bump with a migration when the schema changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS decisions (
+        id INTEGER PRIMARY KEY,
+        timestamp REAL NOT NULL,
+        session_id TEXT,
+        handler_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        decision TEXT NOT NULL,
+        tool_name TEXT NOT NULL,
+        reason TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_session ON decisions (session_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_handler"
+    " ON decisions (handler_id, decision, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_tool ON decisions (tool_name, decision)",
+)
+
+_INSERT = (
+    "INSERT INTO decisions"
+    " (timestamp, session_id, handler_id, event_type, decision, tool_name, reason)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# history CLI --by choices -> column (never interpolate user input into SQL)
+GROUP_BY_COLUMNS = {
+    "handler": "handler_id",
+    "tool": "tool_name",
+    "decision": "decision",
+    "event": "event_type",
+    "session": "session_id",
+}
+
+_SECONDS_PER_DAY = 86400
+
+# Seconds to wait on a database locked by another daemon (e.g. during handoff)
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+# Records written per transaction
+_BATCH_SIZE = 500
+
+# Records queued before new ones are dropped (the writer has fallen behind)
+_MAX_QUEUED = 10000
+
+# Seconds between retention sweeps while running
+_PRUNE_INTERVAL_SECONDS = 3600
+
+# Seconds close() waits for queued records to be written
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+_STOP = object()
+
+
+class HistoryStore:
+    """Batched background writer of handler decisions to SQLite."""
+
+    __slots__ = (
+        "_dropped",
+        "_flush_interval",
+        "_path",
+        "_queue",
+        "_retention_seconds",
+        "_thread",
+        "_written",
+    )
+
+    def __init__(
+        self, path: Path, *, retention_days: float, flush_interval_seconds: float = 1.0
+    ) -> None:
+        """Configure the store (call start() to begin writing).
+
+        Args:
+            path: SQLite database path
+            retention_days: Delete decisions older than this
+            flush_interval_seconds: Longest a queued decision waits before being written
+        """
+        self._path = path
+        self._retention_seconds = retention_days * _SECONDS_PER_DAY
+        self._flush_interval = flush_interval_seconds
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=_MAX_QUEUED)
+        self._thread: threading.Thread | None = None
+        self._written = 0
+        self._dropped = 0
+
+    @classmethod
+    def from_config(
+        cls, store_config: "HistoryStoreConfig", project_path: Path
+    ) -> "HistoryStore | None":
+        """Create from configuration.
+
+        Args:
+            store_config: History store configuration
+            project_path: Project root (for the default path)
+
+        Returns:
+            HistoryStore, or None when disabled
+        """
+        if not store_config.enabled:
+            return None
+        path = Path(store_config.path) if store_config.path else get_history_db_path(project_path)
+        return cls(
+            path,
+            retention_days=store_config.retention_days,
+            flush_interval_seconds=store_config.flush_interval_seconds,
+        )
+
+    @property
+    def path(self) -> Path:
+        """Database path."""
+        return self._path
+
+    @property
+    def written(self) -> int:
+        """Decisions written to the database so far."""
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Decisions dropped because the writer fell behind or failed."""
+        return self._dropped
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="history-store-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, record: "HandlerDecisionRecord") -> None:
+        """Queue a decision for writing (never blocks).
+
+        Args:
+            record: Decision to persist
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+    def close(self, timeout: float = _CLOSE_TIMEOUT_SECONDS) -> None:
+        """Write queued decisions and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the writer to finish
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        # Blocking put: the sentinel must not be dropped when the queue is full
+        with contextlib.suppress(queue.Full):
+            self._queue.put(_STOP, timeout=timeout)
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Writer thread: batch queued decisions into transactions."""
+        try:
+            conn = connect(self._path)
+            ensure_schema(conn)
+        except (sqlite3.Error, OSError):
+            logger.exception("History store unavailable at %s; decisions not persisted", self._path)
+            self._drain_and_drop()
+            return
+
+        next_prune = 0.0
+        with contextlib.closing(conn):
+            while True:
+                if time.monotonic() >= next_prune:
+                    self._prune(conn)
+                    next_prune = time.monotonic() + _PRUNE_INTERVAL_SECONDS
+                try:
+                    item = self._queue.get(timeout=self._flush_interval)
+                except queue.Empty:
+                    continue
+                batch: list[HandlerDecisionRecord] = []
+                stop = False
+                while True:
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)  # type: ignore[arg-type]
+                    if len(batch) >= _BATCH_SIZE:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._write(conn, batch)
+                if stop:
+                    return
+
+    def _write(self, conn: sqlite3.Connection, batch: "list[HandlerDecisionRecord]") -> None:
+        """Insert a batch in one transaction (fail-open).
+
+        Args:
+            conn: Database connection
+            batch: Decisions to insert
+        """
+        if not batch:
+            return
+        try:
+            with conn:
+                conn.executemany(_INSERT, _rows(batch))
+            self._written += len(batch)
+        except sqlite3.Error as e:
+            self._dropped += len(batch)
+            logger.warning("Failed to write %d decisions to history store: %s", len(batch), e)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete decisions older than the retention period (fail-open).
+
+        Args:
+            conn: Database connection
+        """
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM decisions WHERE timestamp < ?",
+                    (time.time() - self._retention_seconds,),
+                )
+            if cursor.rowcount:
+                logger.info("History store: deleted %d expired decisions", cursor.rowcount)
+        except sqlite3.Error as e:
+            logger.warning("History store retention sweep failed: %s", e)
+
+    def _drain_and_drop(self) -> None:
+        """Discard queued decisions once the database is unusable."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._dropped += 1
+
+
+def _rows(
+    records: "Iterable[HandlerDecisionRecord]",
+) -> "Iterable[tuple[float, str | None, str, str, str, str, str | None]]":
+    """Convert records to INSERT parameter tuples.
+
+    Args:
+        records: Decisions to convert
+
+    Returns:
+        Parameter tuples in _INSERT column order
+    """
+    return (
+        (
+            r.timestamp,
+            r.session_id,
+            r.handler_id,
+            r.event_type,
+            r.decision,
+            r.tool_name,
+            r.reason,
+        )
+        for r in records
+    )
+
+
+def connect(path: Path, *, read_only: bool = False) -> sqlite3.Connection:
+    """Open the history database.
+
+    Args:
+        path: Database path
+        read_only: Open read-only (for queries from the CLI)
+
+    Returns:
+        Connection (WAL mode unless read-only)
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened
+    """
+    if read_only:
+        return sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=_BUSY_TIMEOUT_SECONDS
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_SECONDS)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create the decisions table and indexes if missing.
+
+    Args:
+        conn: Database connection
+
+    Raises:
+        sqlite3.Error: If the schema cannot be created
+    """
+    with conn:
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+
+def summarise_history(
+    path: Path,
+    *,
+    group_by: str = "handler",
+    since: float | None = None,
+    session_id: str | None = None,
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    """Count decisions in the history database, grouped by one column.
+
+    Args:
+        path: Database path
+        group_by: One of GROUP_BY_COLUMNS
+        since: Only count decisions at or after this Unix timestamp
+        session_id: Only count decisions from this session
+        limit: Maximum groups to return (most blocks first)
+
+    Returns:
+        One dict per group: key, blocks (deny + ask), total and last_seen
+
+    Raises:
+        ValueError: If group_by is not a known grouping
+        sqlite3.Error: If the database cannot be read
+    """
+    column = GROUP_BY_COLUMNS.get(group_by)
+    if column is None:
+        raise ValueError(f"Cannot group history by {group_by!r}")
+
+    conditions: list[str] = []
+    params: list[Any] = []
+    if since is not None:
+        conditions.append("timestamp >= ?")
+        params.append(since)
+    if session_id is not None:
+        conditions.append("session_id = ?")
+        params.append(session_id)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    sql = (
+        f"SELECT {column},"
+        " SUM(decision IN ('deny', 'ask')) AS blocks,"
+        " COUNT(*) AS total,"
+        " MAX(timestamp) AS last_seen"
+        f" FROM decisions {where}"
+        f" GROUP BY {column} ORDER BY blocks DESC, total DESC LIMIT ?"
+    )
+    params.append(limit)
+
+    with contextlib.closing(connect(path, read_only=True)) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return [
+        {"key": key, "blocks": blocks, "total": total, "last_seen": last_seen}
+        for key, blocks, total, last_seen in rows
+    ]
@@ -0,0 +1,266 @@
+"""Registry of live daemon processes.
+
+Finding daemons by walking the process table (``find_all_daemon_processes``)
+costs time proportional to every process on the host, which is noticeable
+on shared CI machines. Instead, each running daemon holds two advisory
+``flock`` locks for its lifetime:
+
+- the project lock file beside its PID file (``get_lock_path``), so a
+  second daemon for the same project refuses to start
+- a record file named after its PID in the per-user registry directory
+  (``get_instance_registry_dir``), so enforcement can list every daemon
+
+The kernel drops both locks when the process exits, however it exits, so
+an unlocked record always belongs to a dead daemon and is removed on
+sight. Listing daemons therefore costs O(number of daemons): one lock
+probe and one ``/proc/<pid>/cmdline`` read per record.
+"""
+
+import contextlib
+import fcntl
+import logging
+import os
+from pathlib import Path
+
+from claude_code_hooks_daemon.daemon.paths import (
+    get_instance_registry_dir,
+    get_lock_path,
+    read_pid_file,
+)
+from claude_code_hooks_daemon.daemon.process_verification import is_daemon_pid
+
+logger = logging.getLogger(__name__)
+
+# Record files are named "<pid>.daemon"; in-progress ones carry a temp suffix
+_RECORD_SUFFIX = ".daemon"
+_PENDING_SUFFIX = ".pending"
+
+
+class DaemonAlreadyRunningError(RuntimeError):
+    """Another daemon holds the project lock."""
+
+
+class DaemonInstance:
+    """Locks held by a running daemon; released explicitly or on exit."""
+
+    __slots__ = ("_lock_fd", "_record_fd", "_record_path")
+
+    def __init__(self, lock_fd: int, record_fd: int, record_path: Path | None) -> None:
+        """Wrap already-acquired locks (use acquire()).
+
+        Args:
+            lock_fd: Locked project lock file descriptor
+            record_fd: Locked registry record descriptor, or -1 if unregistered
+            record_path: Registry record path, or None if unregistered
+        """
+        self._lock_fd = lock_fd
+        self._record_fd = record_fd
+        self._record_path = record_path
+
+    @classmethod
+    def acquire(cls, pid_path: Path, registry_dir: Path | None = None) -> "DaemonInstance":
+        """Take the project lock and register this process.
+
+        Registration is best effort: if the registry directory is unusable
+        the daemon still runs, enforcement just cannot see it.
+
+        Args:
+            pid_path: Daemon PID file path (the lock file lives beside it)
+            registry_dir: Registry directory (defaults to get_instance_registry_dir())
+
+        Returns:
+            DaemonInstance holding the locks
+
+        Raises:
+            DaemonAlreadyRunningError: If another daemon holds the project lock
+            OSError: If the project lock file cannot be opened
+        """
+        return cls._registered(lock_project(pid_path), registry_dir)
+
+    @classmethod
+    def adopt(cls, lock_fd: int, registry_dir: Path | None = None) -> "DaemonInstance":
+        """Register this process as the holder of an already-held project lock.
+
+        The descriptor is either inherited from ``start``, which locks the
+        project before forking, or handed over by the daemon being replaced
+        (see daemon.handoff). Either way it shares the open file description
+        that holds the lock, so the lock stays held when the other process
+        exits.
+
+        Args:
+            lock_fd: Received project lock file descriptor
+            registry_dir: Registry directory (defaults to get_instance_registry_dir())
+
+        Returns:
+            DaemonInstance holding the lock
+        """
+        return cls._registered(lock_fd, registry_dir)
+
+    @classmethod
+    def _registered(cls, lock_fd: int, registry_dir: Path | None) -> "DaemonInstance":
+        """Register this process (best effort) alongside a held project lock.
+
+        Args:
+            lock_fd: Locked project lock file descriptor
+            registry_dir: Registry directory (defaults to get_instance_registry_dir())
+
+        Returns:
+            DaemonInstance holding the locks
+        """
+        try:
+            record_fd, record_path = _register(registry_dir or get_instance_registry_dir())
+        except OSError as e:
+            logger.warning("Daemon not registered for single-daemon enforcement: %s", e)
+            record_fd, record_path = -1, None
+        return cls(lock_fd, record_fd, record_path)
+
+    @property
+    def lock_fd(self) -> int:
+        """Project lock file descriptor (-1 once released)."""
+        return self._lock_fd
+
+    def release(self) -> None:
+        """Remove the registry record and drop both locks."""
+        if self._record_path is not None:
+            with contextlib.suppress(OSError):
+                self._record_path.unlink()
+            self._record_path = None
+        for fd in (self._record_fd, self._lock_fd):
+            if fd >= 0:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+        self._record_fd = self._lock_fd = -1
+
+
+def _register(registry_dir: Path) -> tuple[int, Path]:
+    """Create and lock this process's record.
+
+    The record is locked under a temporary name and then renamed, so a
+    concurrent find_registered_daemons() never sees it unlocked.
+
+    Args:
+        registry_dir: Registry directory
+
+    Returns:
+        (locked record descriptor, record path)
+
+    Raises:
+        OSError: If the directory is unusable or not owned by this user
+    """
+    registry_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if registry_dir.stat().st_uid != os.getuid():
+        raise PermissionError(f"{registry_dir} is not owned by this user")
+
+    pid = os.getpid()
+    record_path = registry_dir / f"{pid}{_RECORD_SUFFIX}"
+    pending_path = registry_dir / f"{pid}{_RECORD_SUFFIX}{_PENDING_SUFFIX}"
+    fd = os.open(pending_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.write(fd, f"{pid}\n".encode())
+        pending_path.rename(record_path)
+    except OSError:
+        os.close(fd)
+        with contextlib.suppress(OSError):
+            pending_path.unlink()
+        raise
+    return fd, record_path
+
+
+def lock_project(pid_path: Path) -> int:
+    """Take the project lock without registering this process.
+
+    Args:
+        pid_path: Daemon PID file path (the lock file lives beside it)
+
+    Returns:
+        Locked project lock file descriptor
+
+    Raises:
+        DaemonAlreadyRunningError: If another daemon holds the project lock
+        OSError: If the project lock file cannot be opened
+    """
+    lock_path = get_lock_path(pid_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(lock_fd)
+        holder = read_pid_file(pid_path)
+        raise DaemonAlreadyRunningError(
+            f"another daemon (PID {holder if holder is not None else 'unknown'}) "
+            f"holds {lock_path}"
+        ) from None
+    return lock_fd
+
+
+def is_project_locked(pid_path: Path) -> bool:
+    """Check whether a live daemon holds the project lock.
+
+    Args:
+        pid_path: Daemon PID file path
+
+    Returns:
+        True if another process holds the lock
+    """
+    return _is_locked(get_lock_path(pid_path))
+
+
+def find_registered_daemons(registry_dir: Path | None = None) -> list[int]:
+    """List the PIDs of live registered daemons, pruning dead records.
+
+    A record is live when its lock is held and /proc/<pid>/cmdline still
+    names the daemon (guards against a recycled PID inheriting the lock).
+
+    Args:
+        registry_dir: Registry directory (defaults to get_instance_registry_dir())
+
+    Returns:
+        PIDs of live daemons, excluding the current process
+    """
+    registry_dir = registry_dir or get_instance_registry_dir()
+    try:
+        records = list(registry_dir.glob(f"*{_RECORD_SUFFIX}"))
+    except OSError as e:
+        logger.debug("Cannot read daemon registry %s: %s", registry_dir, e)
+        return []
+
+    current_pid = os.getpid()
+    live: list[int] = []
+    for record in records:
+        try:
+            pid = int(record.name.removesuffix(_RECORD_SUFFIX))
+        except ValueError:
+            continue
+        if pid == current_pid:
+            continue
+        if _is_locked(record) and is_daemon_pid(pid):
+            live.append(pid)
+        else:
+            logger.info("Removing stale daemon record %s", record)
+            with contextlib.suppress(OSError):
+                record.unlink()
+    return live
+
+
+def _is_locked(path: Path) -> bool:
+    """Check whether another process holds a lock on a file.
+
+    Args:
+        path: Lock or record file path
+
+    Returns:
+        True if the lock is held (False if free or the file is missing)
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
@@ -0,0 +1,370 @@
+"""Concurrent multi-session load generator for a running daemon.
+
+Simulates N agent sessions (including subagent-style bursts) hitting one
+project daemon at the same time. Each session loops until the test
+deadline: it picks an event from a weighted PreToolUse/PostToolUse/
+Status/Stop mix, sends it over a fresh socket connection (exactly as the
+bash hook forwarders do), then sleeps for an exponentially distributed
+think time.
+
+A sampler polls the daemon's ``_system`` ``metrics`` action while the test
+runs, so the report shows executor saturation and RSS over time alongside
+client-side throughput, tail latency and errors.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from claude_code_hooks_daemon.constants import HookInputField, Timeout, ToolName
+from claude_code_hooks_daemon.utils.latency import summarise_latencies
+
+logger = logging.getLogger(__name__)
+
+# Default event mix, roughly matching observed agent traffic: every tool
+# call produces a Pre/Post pair, the status line refreshes continuously
+# and a session stops rarely
+DEFAULT_EVENT_MIX: dict[str, float] = {
+    "PreToolUse": 0.40,
+    "PostToolUse": 0.35,
+    "Status": 0.20,
+    "Stop": 0.05,
+}
+
+# Realistic, harmless tool calls replayed by simulated sessions
+_BASH_COMMANDS = (
+    "ls -la",
+    "git status",
+    "git diff --stat",
+    "python -m pytest -q tests/unit",
+    "grep -rn TODO src",
+    "cat pyproject.toml",
+)
+_SOURCE_SNIPPET = 'def add(a: int, b: int) -> int:\n    """Add two numbers."""\n    return a + b\n'
+
+# Response stream read limit for the load generator's socket clients
+_STREAM_LIMIT_BYTES = 1024 * 1024
+
+
+@dataclass(slots=True)
+class LoadProfile:
+    """Parameters of a load test run.
+
+    Attributes:
+        sessions: Number of concurrent simulated sessions
+        duration_seconds: How long each session keeps sending events
+        think_time_ms: Mean think time between a session's events (exponential)
+        sample_interval_seconds: How often daemon metrics are sampled
+        event_mix: Event name -> relative weight
+        seed: Random seed for reproducible runs
+    """
+
+    sessions: int = 8
+    duration_seconds: float = 30.0
+    think_time_ms: float = 200.0
+    sample_interval_seconds: float = 1.0
+    event_mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_EVENT_MIX))
+    seed: int | None = None
+
+
+@dataclass(slots=True)
+class LoadTestReport:
+    """Results of a load test run.
+
+    Attributes:
+        profile: Profile the test ran with
+        duration_seconds: Actual wall-clock duration
+        latencies_ms: Event name -> latency samples
+        errors: Event name -> error count
+        samples: Daemon metrics snapshots with elapsed time ("t") added
+        failed_samples: Metrics polls that got no usable response
+    """
+
+    profile: LoadProfile
+    duration_seconds: float = 0.0
+    latencies_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    samples: list[dict[str, Any]] = field(default_factory=list)
+    failed_samples: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        """Get the number of requests that received a response."""
+        return sum(len(values) for values in self.latencies_ms.values())
+
+    @property
+    def total_errors(self) -> int:
+        """Get the number of failed requests."""
+        return sum(self.errors.values())
+
+    def _saturation(self) -> dict[str, Any]:
+        """Summarise executor saturation from the metrics samples.
+
+        Returns:
+            Saturation summary (empty when no samples were collected)
+        """
+        executor_samples = [s["executor"] for s in self.samples if "executor" in s]
+        if not executor_samples:
+            return {}
+        max_workers = executor_samples[-1]["max_workers"]
+        saturated = sum(1 for e in executor_samples if e["running"] >= max_workers)
+        queued = sum(1 for e in executor_samples if e["queued"] > 0)
+        return {
+            "max_workers": max_workers,
+            "peak_running": max(e["peak_running"] for e in executor_samples),
+            "peak_queued": max(e["peak_queued"] for e in executor_samples),
+            "saturated_sample_ratio": saturated / len(executor_samples),
+            "queued_sample_ratio": queued / len(executor_samples),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to a JSON-serialisable dictionary.
+
+        Returns:
+            Report dictionary
+        """
+        all_latencies = [v for values in self.latencies_ms.values() for v in values]
+        rss_series = [s["rss_bytes"] for s in self.samples if "rss_bytes" in s]
+        throughput = (
+            self.total_requests / self.duration_seconds if self.duration_seconds > 0 else 0.0
+        )
+        return {
+            "sessions": self.profile.sessions,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "requests": self.total_requests,
+            "errors": self.total_errors,
+            "errors_by_event": dict(self.errors),
+            "throughput_rps": round(throughput, 2),
+            "latency": summarise_latencies(all_latencies),
+            "latency_by_event": {
+                event: summarise_latencies(values) for event, values in self.latencies_ms.items()
+            },
+            "executor": self._saturation(),
+            "rss_bytes": {
+                "start": rss_series[0] if rss_series else None,
+                "peak": max(rss_series) if rss_series else None,
+                "end": rss_series[-1] if rss_series else None,
+            },
+            "samples": self.samples,
+            "failed_samples": self.failed_samples,
+        }
+
+
+def build_hook_input(
+    event: str, session_id: str, rng: random.Random, cwd: str = "/tmp"  # nosec B108
+) -> dict[str, Any]:
+    """Build a realistic hook_input payload for a simulated session.
+
+    Args:
+        event: Hook event name (PreToolUse, PostToolUse, Status, Stop)
+        session_id: Simulated session identifier
+        rng: Random source
+        cwd: Working directory reported to handlers
+
+    Returns:
+        hook_input dictionary
+    """
+    hook_input: dict[str, Any] = {
+        HookInputField.HOOK_EVENT_NAME: event,
+        HookInputField.SESSION_ID: session_id,
+        HookInputField.TRANSCRIPT_PATH: f"/tmp/loadtest/{session_id}.jsonl",  # nosec B108
+        HookInputField.CWD: cwd,
+    }
+
+    if event in ("PreToolUse", "PostToolUse"):
+        tool = rng.choice((ToolName.BASH, ToolName.READ, ToolName.WRITE, ToolName.EDIT))
+        file_path = f"{cwd}/src/module_{rng.randint(1, 50)}.py"
+        tool_input: dict[str, Any]
+        if tool == ToolName.BASH:
+            tool_input = {"command": rng.choice(_BASH_COMMANDS)}
+        elif tool == ToolName.READ:
+            tool_input = {"file_path": file_path}
+        elif tool == ToolName.WRITE:
+            tool_input = {"file_path": file_path, "content": _SOURCE_SNIPPET}
+        else:
+            tool_input = {"file_path": file_path, "old_string": "a + b", "new_string": "b + a"}
+        hook_input[HookInputField.TOOL_NAME] = tool
+        hook_input[HookInputField.TOOL_INPUT] = tool_input
+        if event == "PostToolUse":
+            hook_input["tool_response"] = {"success": True}
+    elif event == "Status":
+        hook_input["model"] = {"id": "claude-sonnet", "display_name": "Sonnet"}
+        hook_input["workspace"] = {"current_dir": cwd, "project_dir": cwd}
+        hook_input["context_window"] = {
+            "context_window_size": 200_000,
+            "used_percentage": rng.randint(1, 90),
+        }
+    elif event == "Stop":
+        hook_input["stop_hook_active"] = False
+
+    return hook_input
+
+
+async def _send(socket_path: Path, request: dict[str, Any], timeout: float) -> dict[str, Any]:
+    """Send one request over a fresh connection and decode the response.
+
+    Args:
+        socket_path: Daemon Unix socket path
+        request: Request dictionary
+        timeout: Overall timeout in seconds
+
+    Returns:
+        Decoded response dictionary
+    """
+
+    async def roundtrip() -> dict[str, Any]:
+        reader, writer = await asyncio.open_unix_connection(
+            str(socket_path), limit=_STREAM_LIMIT_BYTES
+        )
+        try:
+            writer.write((json.dumps(request) + "\n").encode("utf-8"))
+            await writer.drain()
+            line = await reader.readline()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        response = json.loads(line)
+        if not isinstance(response, dict):
+            raise ValueError("non-object response")
+        return response
+
+    return await asyncio.wait_for(roundtrip(), timeout)
+
+
+async def _run_session(
+    index: int,
+    socket_path: Path,
+    profile: LoadProfile,
+    deadline: float,
+    report: LoadTestReport,
+    rng: random.Random,
+    cwd: str,
+) -> None:
+    """Drive one simulated session until the deadline.
+
+    Args:
+        index: Session number (used in the session id)
+        socket_path: Daemon Unix socket path
+        profile: Load profile
+        deadline: perf_counter() value at which to stop
+        report: Report to record results into
+        rng: Random source for this session
+        cwd: Working directory reported to handlers
+    """
+    session_id = f"loadtest-{index:03d}"
+    events = list(profile.event_mix)
+    weights = list(profile.event_mix.values())
+    request_number = 0
+
+    while time.perf_counter() < deadline:
+        event = rng.choices(events, weights)[0]
+        request_number += 1
+        request = {
+            "event": event,
+            "hook_input": build_hook_input(event, session_id, rng, cwd),
+            "request_id": f"{session_id}-{request_number}",
+        }
+        start = time.perf_counter()
+        try:
+            response = await _send(socket_path, request, Timeout.REQUEST_DEFAULT)
+        except (OSError, TimeoutError, ValueError) as e:
+            logger.debug("Load test request failed (%s): %s", event, e)
+            report.errors[event] += 1
+        else:
+            report.latencies_ms[event].append((time.perf_counter() - start) * 1000)
+            if "error" in response:
+                report.errors[event] += 1
+
+        if profile.think_time_ms > 0:
+            await asyncio.sleep(rng.expovariate(1000 / profile.think_time_ms))
+
+
+async def _sample_metrics(
+    socket_path: Path, profile: LoadProfile, started: float, report: LoadTestReport
+) -> None:
+    """Poll daemon metrics until cancelled.
+
+    Args:
+        socket_path: Daemon Unix socket path
+        profile: Load profile (sample interval)
+        started: perf_counter() value at test start
+        report: Report to append samples to
+    """
+    request = {"event": "_system", "hook_input": {"action": "metrics"}}
+    while True:
+        try:
+            response = await _send(socket_path, request, Timeout.SOCKET_CONNECT)
+            result = response.get("result")
+            if isinstance(result, dict):
+                report.samples.append({"t": round(time.perf_counter() - started, 3), **result})
+        except (OSError, TimeoutError, ValueError) as e:
+            # Counted in the report: a daemon that stops answering leaves a gap
+            report.failed_samples += 1
+            logger.debug("Metrics sample failed: %s", e)
+        await asyncio.sleep(profile.sample_interval_seconds)
+
+
+async def run_load_test_async(
+    socket_path: Path, profile: LoadProfile, cwd: str = "/tmp"  # nosec B108
+) -> LoadTestReport:
+    """Run a load test against a daemon socket.
+
+    Args:
+        socket_path: Daemon Unix socket path
+        profile: Load profile
+        cwd: Working directory reported to handlers (usually the project root)
+
+    Returns:
+        Load test report
+    """
+    report = LoadTestReport(profile=profile)
+    master_rng = random.Random(profile.seed)  # nosec B311 - load simulation, not crypto
+    started = time.perf_counter()
+    deadline = started + profile.duration_seconds
+
+    sampler = asyncio.create_task(_sample_metrics(socket_path, profile, started, report))
+    try:
+        await asyncio.gather(
+            *(
+                _run_session(
+                    index,
+                    socket_path,
+                    profile,
+                    deadline,
+                    report,
+                    random.Random(master_rng.random()),  # nosec B311
+                    cwd,
+                )
+                for index in range(profile.sessions)
+            )
+        )
+    finally:
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+
+    report.duration_seconds = time.perf_counter() - started
+    return report
+
+
+def run_load_test(
+    socket_path: Path, profile: LoadProfile, cwd: str = "/tmp"  # nosec B108
+) -> LoadTestReport:
+    """Run a load test from synchronous code.
+
+    Args:
+        socket_path: Daemon Unix socket path
+        profile: Load profile
+        cwd: Working directory reported to handlers
+
+    Returns:
+        Load test report
+    """
+    return asyncio.run(run_load_test_async(socket_path, profile, cwd))
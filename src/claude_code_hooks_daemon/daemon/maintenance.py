@@ -0,0 +1,127 @@
+"""Post-ready maintenance queue.
+
+Some startup work does not need to finish before the daemon serves hooks:
+stale runtime file cleanup, CLAUDE.md guidance injection (which may run
+git) and config re-validation. ``start`` queues these and the server runs
+them in a background thread once the socket is listening, so they no
+longer add to the time hooks wait for a daemon.
+
+Tasks run one at a time, in the order they were added. Each is fail-open:
+an exception is logged and recorded against the task, and the next task
+still runs. Outcomes are reported in the ``health`` system action.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A maintenance task returns an optional one-line summary of what it did
+MaintenanceTask = Callable[[], str | None]
+
+
+class TaskState:
+    """Lifecycle states of a maintenance task."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    OK = "ok"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class MaintenanceOutcome:
+    """Progress and result of one maintenance task.
+
+    Attributes:
+        name: Task name
+        state: One of the TaskState values
+        duration_ms: Run time once finished, else None
+        detail: Summary returned by the task, or the error if it failed
+    """
+
+    name: str
+    state: str = TaskState.PENDING
+    duration_ms: float | None = None
+    detail: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for the health response.
+
+        Returns:
+            Outcome dictionary
+        """
+        return {
+            "name": self.name,
+            "state": self.state,
+            "duration_ms": None if self.duration_ms is None else round(self.duration_ms, 1),
+            "detail": self.detail,
+        }
+
+
+class MaintenanceQueue:
+    """Ordered list of deferred startup tasks with observable outcomes.
+
+    add() is called while setting up the daemon; run_all() runs on a
+    worker thread while snapshot() may be called from the event loop.
+    """
+
+    __slots__ = ("_lock", "_outcomes", "_tasks")
+
+    def __init__(self) -> None:
+        """Create an empty queue."""
+        self._tasks: list[tuple[str, MaintenanceTask]] = []
+        self._outcomes: list[MaintenanceOutcome] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, task: MaintenanceTask) -> None:
+        """Queue a task.
+
+        Args:
+            name: Task name reported in health
+            task: Blocking callable returning an optional summary
+        """
+        with self._lock:
+            self._tasks.append((name, task))
+            self._outcomes.append(MaintenanceOutcome(name=name))
+
+    def run_all(self) -> None:
+        """Run every queued task in order, recording each outcome (fail-open)."""
+        with self._lock:
+            queued = list(zip(self._tasks, self._outcomes, strict=True))
+        for (name, task), outcome in queued:
+            with self._lock:
+                outcome.state = TaskState.RUNNING
+            start = time.perf_counter()
+            try:
+                detail = task()
+            except Exception as e:
+                logger.exception("Maintenance task %s failed", name)
+                state, detail = TaskState.FAILED, f"{type(e).__name__}: {e}"
+            else:
+                state = TaskState.OK
+            duration_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                outcome.state = state
+                outcome.detail = detail
+                outcome.duration_ms = duration_ms
+            logger.info("Maintenance task %s %s in %.0fms", name, state, duration_ms)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Report the current state of every task.
+
+        Returns:
+            Outcome dictionaries in queue order
+        """
+        with self._lock:
+            return [outcome.to_dict() for outcome in self._outcomes]
+
+    @property
+    def done(self) -> bool:
+        """Check whether every queued task has finished."""
+        with self._lock:
+            return all(o.state in (TaskState.OK, TaskState.FAILED) for o in self._outcomes)
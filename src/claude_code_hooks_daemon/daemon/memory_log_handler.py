@@ -2,13 +2,72 @@
 
 Stores logs in memory to avoid I/O overhead during request processing.
 Log cleanup happens asynchronously after responses are sent.
+
+Each record is reduced on emit to a compact LogEntry (sequence number,
+timestamp, level, interned logger id and rendered message), so the buffer
+does not keep LogRecords, or the objects their args reference, alive. The
+formatter's layout is only applied when logs are queried. Entries are also
+indexed by level, so a minimum-level query walks only matching entries,
+and subscribers (``logs --follow``) are called with each new entry.
 """
 
+import bisect
+import heapq
+import itertools
 import logging
 from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
+# System action that streams new log entries over the client connection
+ACTION_FOLLOW_LOGS = "follow_logs"
+
+# Default number of entries kept (DaemonConfig.log_buffer_size overrides)
+DEFAULT_MAX_RECORDS = 1000
+
+# Level index buckets: an entry goes in the bucket of the highest standard
+# level at or below its own
+_LEVEL_BUCKETS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+
+_MSECS_PER_SECOND = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class LogEntry:
+    """One buffered log record, reduced to what the log queries need.
+
+    Attributes:
+        seq: Position in the stream of all entries ever emitted
+        created: Unix timestamp of the record
+        levelno: Numeric log level
+        logger_id: Index into the handler's interned logger names
+        message: Rendered message, with any traceback appended
+    """
+
+    seq: int
+    created: float
+    levelno: int
+    logger_id: int
+    message: str
+
+
+LogSubscriber = Callable[[LogEntry], None]
+
+
+def _bucket(levelno: int) -> int:
+    """Index of the level bucket holding entries of a level.
+
+    Args:
+        levelno: Numeric log level
+
+    Returns:
+        Bucket index (levels below DEBUG share the DEBUG bucket)
+    """
+    return max(bisect.bisect_right(_LEVEL_BUCKETS, levelno) - 1, 0)
+
 
 class MemoryLogHandler(logging.Handler):
     """Logging handler that stores records in a circular in-memory buffer.
@@ -17,7 +76,7 @@ class MemoryLogHandler(logging.Handler):
     a viewable log history.
     """
 
-    def __init__(self, max_records: int = 1000) -> None:
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS) -> None:
         """Initialize memory log handler.
 
         Args:
@@ -25,7 +84,14 @@ class MemoryLogHandler(logging.Handler):
         """
         super().__init__()
         self.max_records = max_records
-        self.records: deque[logging.LogRecord] = deque(maxlen=max_records)
+        self.records: deque[LogEntry] = deque(maxlen=max_records)
+        # Same entries as records, split by level bucket (each oldest first)
+        self._by_level: tuple[deque[LogEntry], ...] = tuple(deque() for _ in _LEVEL_BUCKETS)
+        self._logger_ids: dict[str, int] = {}
+        self._logger_names: list[str] = []
+        self._next_seq = 0
+        self._subscribers: list[LogSubscriber] = []
+        self._exception_formatter = logging.Formatter()
 
     def emit(self, record: logging.LogRecord) -> None:
         """Store log record in memory buffer.
@@ -34,35 +100,153 @@ class MemoryLogHandler(logging.Handler):
             record: Log record to store
         """
         try:
-            # Store the record in circular buffer
-            # deque with maxlen automatically drops oldest when full
-            self.records.append(record)
+            entry = self._compact(record)
+            # deque with maxlen drops the oldest entry when full; drop it
+            # from the level index too (it is the oldest in its bucket)
+            if len(self.records) == self.max_records:
+                self._by_level[_bucket(self.records[0].levelno)].popleft()
+            self.records.append(entry)
+            self._by_level[_bucket(entry.levelno)].append(entry)
         except (MemoryError, AttributeError, TypeError):
             # Expected errors in append/access
             self.handleError(record)
+            return
         except Exception as e:
             # Unexpected errors - log and handle
             logger.error("Unexpected error in memory log handler: %s", e, exc_info=True)
             self.handleError(record)
+            return
+
+        for subscriber in tuple(self._subscribers):
+            try:
+                subscriber(entry)
+            except Exception:
+                # Never log from here: it would re-enter this handler
+                self.unsubscribe(subscriber)
+
+    def _compact(self, record: logging.LogRecord) -> LogEntry:
+        """Reduce a record to a LogEntry.
+
+        Args:
+            record: Record being emitted
+
+        Returns:
+            Entry with the message rendered and the logger name interned
+        """
+        message = record.getMessage()
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self._exception_formatter.formatStack(record.stack_info)}"
 
-    def get_logs(self, count: int | None = None) -> list[str]:
+        logger_id = self._logger_ids.get(record.name)
+        if logger_id is None:
+            logger_id = len(self._logger_names)
+            self._logger_names.append(record.name)
+            self._logger_ids[record.name] = logger_id
+
+        self._next_seq += 1
+        return LogEntry(
+            seq=self._next_seq,
+            created=record.created,
+            levelno=record.levelno,
+            logger_id=logger_id,
+            message=message,
+        )
+
+    def format_entry(self, entry: LogEntry) -> str:
+        """Format an entry with the handler's formatter.
+
+        Args:
+            entry: Buffered entry
+
+        Returns:
+            Formatted log line
+        """
+        record = logging.makeLogRecord(
+            {
+                "name": self._logger_names[entry.logger_id],
+                "levelno": entry.levelno,
+                "levelname": logging.getLevelName(entry.levelno),
+                "msg": entry.message,
+                "created": entry.created,
+                "msecs": int((entry.created - int(entry.created)) * _MSECS_PER_SECOND) + 0.0,
+            }
+        )
+        return self.format(record)
+
+    def get_logs(self, count: int | None = None, min_level: int | None = None) -> list[str]:
         """Get formatted log messages from buffer.
 
         Args:
             count: Number of recent logs to return (None = all)
+            min_level: Only logs at or above this numeric level (None = all)
 
         Returns:
-            List of formatted log strings
+            List of formatted log strings, oldest first
         """
-        records = list(self.records)
-        if count is not None:
-            records = records[-count:]
+        return [self.format_entry(entry) for entry in self.get_entries(count, min_level)]
+
+    def get_entries(self, count: int | None = None, min_level: int | None = None) -> list[LogEntry]:
+        """Get buffered entries, reading only the matching level buckets.
 
-        return [self.format(record) for record in records]
+        Args:
+            count: Number of recent entries to return (None = all)
+            min_level: Only entries at or above this numeric level (None = all)
+
+        Returns:
+            Entries, oldest first
+        """
+        if count is not None and count <= 0:
+            return []
+        with self.lock:  # type: ignore[union-attr]
+            if min_level is None or min_level <= logging.NOTSET:
+                entries = list(self.records)
+                return entries[-count:] if count is not None else entries
+
+            # Newest first from each bucket at or above min_level, merged by
+            # sequence; the lowest bucket may also hold lower levels
+            first = _bucket(min_level)
+            lowest: Iterator[LogEntry] = (
+                e for e in reversed(self._by_level[first]) if e.levelno >= min_level
+            )
+            sources = [lowest, *(reversed(bucket) for bucket in self._by_level[first + 1 :])]
+            newest_first = heapq.merge(*sources, key=attrgetter("seq"), reverse=True)
+            selected = list(itertools.islice(newest_first, count))
+        selected.reverse()
+        return selected
+
+    def subscribe(self, subscriber: LogSubscriber) -> None:
+        """Call subscriber with every entry emitted from now on.
+
+        Runs on whichever thread logged the record, inside the handler lock:
+        it must be quick, must not log and must not block. A subscriber that
+        raises is removed.
+
+        Args:
+            subscriber: Callable taking a LogEntry
+        """
+        with self.lock:  # type: ignore[union-attr]
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: LogSubscriber) -> None:
+        """Stop calling a subscriber (no-op if not subscribed).
+
+        Args:
+            subscriber: Callable passed to subscribe()
+        """
+        with self.lock:  # type: ignore[union-attr]
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
 
     def clear(self) -> None:
         """Clear all logs from memory buffer."""
-        self.records.clear()
+        with self.lock:  # type: ignore[union-attr]
+            self.records.clear()
+            for bucket in self._by_level:
+                bucket.clear()
 
     def get_record_count(self) -> int:
         """Get number of records currently in buffer.
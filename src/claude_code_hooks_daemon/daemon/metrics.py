@@ -0,0 +1,324 @@
+"""Runtime concurrency metrics for the daemon server.
+
+Tracks how requests flow through the socket server and the thread pool
+that runs handler chains, so saturation can be observed from outside via
+the ``_system`` ``metrics`` action (used by the ``loadtest`` command).
+
+A request is *active* from the moment its connection is accepted until
+the response is written. Inside that window it is *queued* once submitted
+to the executor and *running* once a worker thread picks it up.
+
+Each executor lane (see executor_lanes) also keeps LaneMetrics: how many
+of its requests wait and run, how many were rejected because its queue
+was full, and how long recent requests waited before a worker ran them.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import psutil
+
+from claude_code_hooks_daemon.utils.latency import summarise_latencies
+
+T = TypeVar("T")
+
+# Python's ThreadPoolExecutor default when max_workers is None
+_DEFAULT_EXECUTOR_CEILING = 32
+_DEFAULT_EXECUTOR_EXTRA = 4
+
+# Recent queue waits kept per lane for the wait-time percentiles
+_QUEUE_WAIT_SAMPLES = 1024
+
+_MS_PER_SECOND = 1000
+
+
+def default_executor_workers() -> int:
+    """Get the worker count ThreadPoolExecutor uses when none is configured.
+
+    Returns:
+        min(32, cpu_count + 4), matching the standard library default
+    """
+    return min(_DEFAULT_EXECUTOR_CEILING, (os.cpu_count() or 1) + _DEFAULT_EXECUTOR_EXTRA)
+
+
+class ServerMetrics:
+    """Thread-safe counters for active, queued and running requests.
+
+    Counters are updated from both the event loop and executor threads,
+    so every mutation takes the lock. Peaks are kept since startup.
+    """
+
+    __slots__ = (
+        "_active",
+        "_lock",
+        "_peak_active",
+        "_peak_queued",
+        "_peak_running",
+        "_queued",
+        "_requests_total",
+        "_running",
+    )
+
+    def __init__(self) -> None:
+        """Initialise server metrics with all counters at zero."""
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._running = 0
+        self._peak_active = 0
+        self._peak_queued = 0
+        self._peak_running = 0
+        self._requests_total = 0
+
+    def request_started(self) -> None:
+        """Record a newly accepted client connection."""
+        with self._lock:
+            self._active += 1
+            self._requests_total += 1
+            self._peak_active = max(self._peak_active, self._active)
+
+    def request_finished(self) -> None:
+        """Record a client connection that has been answered."""
+        with self._lock:
+            self._active -= 1
+
+    def track(self, func: Callable[..., T], *args: Any) -> Callable[[], T]:
+        """Wrap an executor job so queue and run time are tracked.
+
+        Marks the job as queued immediately; the returned callable moves it
+        to running when a worker thread starts it and clears it on exit.
+
+        Args:
+            func: Function to run in the executor
+            *args: Positional arguments for func
+
+        Returns:
+            Zero-argument callable suitable for run_in_executor
+        """
+        self._job_queued()
+
+        def run() -> T:
+            self._job_started()
+            try:
+                return func(*args)
+            finally:
+                self._job_finished()
+
+        return run
+
+    def track_async(
+        self, func: Callable[..., Awaitable[T]], *args: Any
+    ) -> Callable[[], Awaitable[T]]:
+        """Wrap a job that runs as a coroutine, tracking it like track().
+
+        Args:
+            func: Coroutine function to run on the event loop
+            *args: Positional arguments for func
+
+        Returns:
+            Zero-argument coroutine function
+        """
+        self._job_queued()
+
+        async def run() -> T:
+            self._job_started()
+            try:
+                return await func(*args)
+            finally:
+                self._job_finished()
+
+        return run
+
+    def _job_queued(self) -> None:
+        """Count a job waiting to start."""
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+    def _job_started(self) -> None:
+        """Move a job from queued to running."""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._peak_running = max(self._peak_running, self._running)
+
+    def _job_finished(self) -> None:
+        """Count a running job as done."""
+        with self._lock:
+            self._running -= 1
+
+    def snapshot(self, executor_workers: int) -> dict[str, Any]:
+        """Get a point-in-time view of all counters.
+
+        Args:
+            executor_workers: Maximum worker threads in the request executor
+
+        Returns:
+            Metrics dictionary including current process RSS in bytes
+        """
+        with self._lock:
+            metrics: dict[str, Any] = {
+                "requests_total": self._requests_total,
+                "active_requests": self._active,
+                "peak_active_requests": self._peak_active,
+                "executor": {
+                    "max_workers": executor_workers,
+                    "running": self._running,
+                    "queued": self._queued,
+                    "peak_running": self._peak_running,
+                    "peak_queued": self._peak_queued,
+                },
+            }
+        metrics["rss_bytes"] = psutil.Process().memory_info().rss
+        return metrics
+
+
+class LaneMetrics:
+    """Thread-safe queue, run and wait-time counters for one executor lane.
+
+    A request is queued from the moment the lane accepts it until a worker
+    thread starts it, so its queue wait includes any time spent behind an
+    earlier request from the same session.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_max_queue",
+        "_peak_queued",
+        "_peak_running",
+        "_queued",
+        "_rejected",
+        "_running",
+        "_waits_ms",
+    )
+
+    def __init__(self, max_queue: int | None = None) -> None:
+        """Initialise with all counters at zero.
+
+        Args:
+            max_queue: Most requests allowed to be queued (None = no limit)
+        """
+        self._lock = threading.Lock()
+        self._max_queue = max_queue
+        self._queued = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._peak_running = 0
+        self._rejected = 0
+        self._waits_ms: deque[float] = deque(maxlen=_QUEUE_WAIT_SAMPLES)
+
+    def track(self, func: Callable[..., T], *args: Any) -> Callable[[], T] | None:
+        """Admit a job to the lane, tracking its queue wait and run time.
+
+        Args:
+            func: Function to run in the lane's executor
+            *args: Positional arguments for func
+
+        Returns:
+            Zero-argument callable for run_in_executor, or None if the
+            lane's queue is full (the job is counted as rejected)
+        """
+        if not self._admit():
+            return None
+        enqueued = time.perf_counter()
+
+        def run() -> T:
+            self._job_started(enqueued)
+            try:
+                return func(*args)
+            finally:
+                self._job_finished()
+
+        return run
+
+    def track_async(
+        self, func: Callable[..., Awaitable[T]], *args: Any
+    ) -> Callable[[], Awaitable[T]] | None:
+        """Admit a job that runs as a coroutine, tracking it like track().
+
+        Args:
+            func: Coroutine function to run on the event loop
+            *args: Positional arguments for func
+
+        Returns:
+            Zero-argument coroutine function, or None if the lane's queue
+            is full (the job is counted as rejected)
+        """
+        if not self._admit():
+            return None
+        enqueued = time.perf_counter()
+
+        async def run() -> T:
+            self._job_started(enqueued)
+            try:
+                return await func(*args)
+            finally:
+                self._job_finished()
+
+        return run
+
+    def _admit(self) -> bool:
+        """Queue a job unless the lane's queue is full.
+
+        Returns:
+            False if the job was rejected
+        """
+        with self._lock:
+            if self._max_queue is not None and self._queued >= self._max_queue:
+                self._rejected += 1
+                return False
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        return True
+
+    def _job_started(self, enqueued: float) -> None:
+        """Move a job from queued to running, recording its queue wait.
+
+        Args:
+            enqueued: perf_counter() reading when the job was admitted
+        """
+        waited_ms = (time.perf_counter() - enqueued) * _MS_PER_SECOND
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._peak_running = max(self._peak_running, self._running)
+            self._waits_ms.append(waited_ms)
+
+    def _job_finished(self) -> None:
+        """Count a running job as done."""
+        with self._lock:
+            self._running -= 1
+
+    @property
+    def queued(self) -> int:
+        """Requests admitted to the lane that have not started yet."""
+        with self._lock:
+            return self._queued
+
+    def cancel(self) -> None:
+        """Release the queue slot of an admitted job that will never run."""
+        with self._lock:
+            self._queued -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a point-in-time view of the lane's counters.
+
+        Returns:
+            Metrics dictionary with queue wait percentiles over recent requests
+        """
+        with self._lock:
+            waits = list(self._waits_ms)
+            metrics: dict[str, Any] = {
+                "max_queue": self._max_queue,
+                "running": self._running,
+                "queued": self._queued,
+                "peak_running": self._peak_running,
+                "peak_queued": self._peak_queued,
+                "rejected": self._rejected,
+            }
+        metrics["queue_wait_ms"] = summarise_latencies(waits)
+        return metrics
@@ -380,6 +380,79 @@ def get_log_path(project_dir: Path | str) -> Path:
     return path
 
 
+def get_capture_path(project_dir: Path | str) -> Path:
+    """
+    Generate traffic capture file path for project-specific daemon.
+
+    Pattern: {project}/.claude/hooks-daemon/untracked/capture-{hostname}.jsonl
+    Self-install: {project}/untracked/capture-{hostname}.jsonl
+
+    Deliberately not prefixed with ``daemon`` so that stale-file cleanup
+    never removes a capture the user is about to replay.
+
+    Args:
+        project_dir: Path to project directory (Path object or string)
+
+    Returns:
+        Path object for capture file
+    """
+    project_path = Path(project_dir).resolve()
+    untracked_dir = _get_untracked_dir(project_path)
+    untracked_dir.mkdir(parents=True, exist_ok=True)
+
+    suffix = _get_hostname_suffix()
+    return untracked_dir / f"capture{suffix}.jsonl"
+
+
+def get_snapshot_path(project_dir: Path | str) -> Path:
+    """
+    Generate session snapshot file path for project-specific daemon.
+
+    Pattern: {project}/.claude/hooks-daemon/untracked/session-snapshot-{hostname}.json
+    Self-install: {project}/untracked/session-snapshot-{hostname}.json
+
+    Not prefixed with ``daemon`` so that stale-file cleanup leaves it to
+    the snapshot's own age limit. Without HOSTNAME there is no suffix: the
+    time-hash fallback would give every daemon a different file.
+
+    Args:
+        project_dir: Path to project directory (Path object or string)
+
+    Returns:
+        Path object for snapshot file
+    """
+    project_path = Path(project_dir).resolve()
+    untracked_dir = _get_untracked_dir(project_path)
+    untracked_dir.mkdir(parents=True, exist_ok=True)
+
+    suffix = _get_hostname_suffix() if os.environ.get("HOSTNAME") else ""
+    return untracked_dir / f"session-snapshot{suffix}.json"
+
+
+def get_history_db_path(project_dir: Path | str) -> Path:
+    """
+    Generate handler decision database path for project-specific daemon.
+
+    Pattern: {project}/.claude/hooks-daemon/untracked/handler-history-{hostname}.db
+    Self-install: {project}/untracked/handler-history-{hostname}.db
+
+    Like the session snapshot, the suffix is omitted without HOSTNAME so
+    every daemon (and the history command) uses the same database.
+
+    Args:
+        project_dir: Path to project directory (Path object or string)
+
+    Returns:
+        Path object for database file
+    """
+    project_path = Path(project_dir).resolve()
+    untracked_dir = _get_untracked_dir(project_path)
+    untracked_dir.mkdir(parents=True, exist_ok=True)
+
+    suffix = _get_hostname_suffix() if os.environ.get("HOSTNAME") else ""
+    return untracked_dir / f"handler-history{suffix}.db"
+
+
 def write_socket_discovery_file(project_dir: Path | str, socket_path: Path | str) -> None:
     """Write the actual socket path to a discovery file.
 
@@ -499,6 +572,52 @@ def write_pid_file(pid_path: Path | str, pid: int) -> None:
         f.write(str(pid))
 
 
+def get_lock_path(pid_path: Path | str) -> Path:
+    """
+    Get the project lock file held by the running daemon.
+
+    Lives beside the PID file and is never removed, so every daemon for the
+    project locks the same inode (the PID file itself is rewritten and
+    unlinked during stale-file cleanup).
+
+    Args:
+        pid_path: Path to PID file (Path object or string)
+
+    Returns:
+        Path object for the lock file
+    """
+    pid_path = Path(pid_path)
+    return pid_path.with_name(f"{pid_path.name}.lock")
+
+
+def get_instance_registry_dir() -> Path:
+    """
+    Get the per-user directory of live daemon records.
+
+    Each running daemon keeps one locked record here, so single-daemon
+    enforcement can find daemons without scanning every process.
+
+    Can be overridden via CLAUDE_HOOKS_REGISTRY_DIR environment variable
+    (useful for testing to avoid collision with production daemons).
+
+    Returns:
+        Path object for the registry directory (may not exist yet)
+    """
+    if env_path := os.environ.get("CLAUDE_HOOKS_REGISTRY_DIR"):
+        return Path(env_path)
+
+    xdg_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_dir and Path(xdg_dir).is_dir():
+        return Path(xdg_dir) / "hooks-daemon" / "instances"
+
+    run_user = Path(f"/run/user/{os.getuid()}")
+    if run_user.is_dir():
+        return run_user / "hooks-daemon" / "instances"
+
+    # nosec B108 - per-user directory, created 0700 and ownership-checked on use
+    return Path("/tmp") / f"hooks-daemon-{os.getuid()}" / "instances"  # nosec B108
+
+
 def cleanup_socket(socket_path: Path | str) -> None:
     """
     Remove Unix socket file if it exists.
@@ -6,6 +6,7 @@ particularly useful in container environments for single-process enforcement.
 
 import logging
 import os
+from pathlib import Path
 
 import psutil
 
@@ -127,6 +128,33 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
+def is_daemon_pid(pid: int) -> bool:
+    """Check whether a single PID is a daemon process.
+
+    Reads /proc/<pid>/cmdline where available (no process table walk) and
+    falls back to psutil on platforms without /proc.
+
+    Args:
+        pid: Process ID to check
+
+    Returns:
+        True if the process exists and its command line names the daemon.
+    """
+    proc_cmdline = Path(f"/proc/{pid}/cmdline")
+    if Path("/proc/self").is_dir():
+        try:
+            cmdline = proc_cmdline.read_bytes().decode(errors="replace").split("\0")
+        except OSError:
+            return False
+        return _is_daemon_process(None, cmdline)
+
+    try:
+        process = psutil.Process(pid)
+        return _is_daemon_process(process.name(), process.cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
 def _is_daemon_process(name: str | None, cmdline: list[str] | None) -> bool:
     """Check if process name or cmdline indicates a daemon process.
 
@@ -0,0 +1,158 @@
+"""Readiness notification from the daemonised process to ``start``.
+
+``start`` double-forks, so the process that runs the server is not a
+child the caller can wait on. Instead the caller creates a pipe before
+forking and the daemon writes one line to it:
+
+- ``READY <pid>`` once the socket is listening and accepting requests
+- ``ERROR <message>`` if startup fails before that point
+
+and closes its end. The caller blocks on the read end, so ``start``
+returns the moment the daemon can serve hooks (no fixed sleep, no socket
+polling) and reports startup failures with the exception text. If the
+daemon dies without writing, the caller sees end-of-file immediately.
+"""
+
+import contextlib
+import os
+import select
+import time
+from dataclasses import dataclass
+
+# Upper bound on how long start waits for the daemon to become ready
+READINESS_TIMEOUT_SECONDS = 10.0
+
+_READY = "READY"
+_ERROR = "ERROR"
+_ENCODING = "utf-8"
+_READ_CHUNK_BYTES = 4096
+# Keep error lines well under PIPE_BUF so the write is atomic
+_MAX_ERROR_CHARS = 2000
+
+
+@dataclass(frozen=True, slots=True)
+class Readiness:
+    """Outcome of waiting for the daemon.
+
+    Attributes:
+        pid: Daemon PID when it signalled readiness, else None
+        error: Why the daemon is not ready, else None
+    """
+
+    pid: int | None = None
+    error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Check whether the daemon signalled readiness."""
+        return self.pid is not None
+
+
+class ReadinessPipe:
+    """One-shot pipe carrying the daemon's readiness line to the caller.
+
+    Create it before forking. The caller uses wait(); the daemon calls
+    close_read() after forking and then notify_ready() or notify_failed().
+    Every method is safe to call more than once.
+    """
+
+    __slots__ = ("_read_fd", "_write_fd")
+
+    def __init__(self) -> None:
+        """Create the pipe (file descriptors are inherited across fork)."""
+        self._read_fd, self._write_fd = os.pipe()
+
+    def close_read(self) -> None:
+        """Close the caller's end (daemon side, after forking)."""
+        self._read_fd = _close(self._read_fd)
+
+    def close(self) -> None:
+        """Close the daemon's end without a message (caller sees end-of-file)."""
+        self._write_fd = _close(self._write_fd)
+
+    def notify_ready(self) -> None:
+        """Tell the caller the daemon is accepting requests."""
+        self._send(f"{_READY} {os.getpid()}")
+
+    def notify_failed(self, message: str) -> None:
+        """Tell the caller startup failed.
+
+        Args:
+            message: Failure description (newlines are flattened)
+        """
+        flat = " ".join(message.split())[:_MAX_ERROR_CHARS]
+        self._send(f"{_ERROR} {flat}")
+
+    def _send(self, line: str) -> None:
+        """Write the readiness line once and close the daemon's end.
+
+        Args:
+            line: Line to send (without newline)
+        """
+        if self._write_fd < 0:
+            return
+        # Caller may have gone away (e.g. killed); the daemon carries on regardless
+        with contextlib.suppress(OSError):
+            os.write(self._write_fd, f"{line}\n".encode(_ENCODING))
+        self.close()
+
+    def wait(self, timeout: float = READINESS_TIMEOUT_SECONDS) -> Readiness:
+        """Block until the daemon reports readiness or failure (caller side).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Readiness outcome
+        """
+        # Drop our copy of the write end so a dead daemon produces end-of-file
+        self.close()
+        deadline = time.monotonic() + timeout
+        data = b""
+        try:
+            while b"\n" not in data:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return Readiness(error=f"daemon did not become ready within {timeout:g}s")
+                readable, _, _ = select.select([self._read_fd], [], [], remaining)
+                if not readable:
+                    continue
+                chunk = os.read(self._read_fd, _READ_CHUNK_BYTES)
+                if not chunk:
+                    return Readiness(error="daemon exited before it was ready")
+                data += chunk
+        finally:
+            self.close_read()
+        return _parse(data.decode(_ENCODING, errors="replace").splitlines()[0])
+
+
+def _close(fd: int) -> int:
+    """Close a file descriptor if open.
+
+    Args:
+        fd: File descriptor, or -1 if already closed
+
+    Returns:
+        -1
+    """
+    if fd >= 0:
+        with contextlib.suppress(OSError):
+            os.close(fd)
+    return -1
+
+
+def _parse(line: str) -> Readiness:
+    """Parse a readiness line.
+
+    Args:
+        line: Line written by the daemon
+
+    Returns:
+        Readiness outcome
+    """
+    kind, _, detail = line.partition(" ")
+    if kind == _READY and detail.isdigit():
+        return Readiness(pid=int(detail))
+    if kind == _ERROR:
+        return Readiness(error=detail or "unknown error")
+    return Readiness(error=f"unexpected readiness message: {line!r}")
@@ -0,0 +1,329 @@
+"""Deterministic replay of captured daemon traffic.
+
+Feeds a traffic capture (see daemon/capture.py) back through either an
+in-process DaemonController or a running daemon's Unix socket, at the
+original inter-arrival timing or as fast as possible. Produces a report
+with throughput, latency percentiles and any decisions that differ from
+the ones recorded at capture time.
+
+In-process replay measures handler cost without socket and process-spawn
+overhead; socket replay measures the full daemon path. Handlers run for
+real in both modes, so replay against the project the capture came from.
+
+Records captured with redaction on are replayed with their placeholder
+content, so a handler that inspects a redacted field can legitimately
+decide differently. Those requests still count towards throughput and
+latency, but the report marks them and their decision diffs separately.
+"""
+
+import json
+import logging
+import socket
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from claude_code_hooks_daemon.constants import HookInputField, Timeout
+from claude_code_hooks_daemon.daemon.capture import decision_from_response
+from claude_code_hooks_daemon.utils.latency import summarise_latencies
+
+logger = logging.getLogger(__name__)
+
+ReplaySpeed = Literal["original", "max"]
+
+# Maximum recorded gap honoured in "original" speed mode; longer idle
+# periods in a capture (user away from keyboard) are compressed to this
+_MAX_REPLAY_GAP_SECONDS = 5.0
+
+# Socket buffer size for reading daemon responses
+_RECV_BUFFER_SIZE = 65536
+
+
+@dataclass(slots=True)
+class CapturedRequest:
+    """A single request loaded from a capture file.
+
+    Attributes:
+        timestamp: Wall-clock arrival time at capture
+        request: Request dictionary (event + hook_input)
+        decision: Normalised decision recorded at capture time
+        elapsed_ms: Processing time recorded at capture time
+        redacted: Whether content fields were redacted at capture time
+    """
+
+    timestamp: float
+    request: dict[str, Any]
+    decision: str
+    elapsed_ms: float
+    redacted: bool = False
+
+    @property
+    def event(self) -> str:
+        """Get the hook event name."""
+        return str(self.request.get("event", ""))
+
+    @property
+    def tool_name(self) -> str | None:
+        """Get the tool name, if the event carries one."""
+        hook_input = self.request.get("hook_input") or {}
+        tool_name = hook_input.get(HookInputField.TOOL_NAME)
+        return str(tool_name) if tool_name is not None else None
+
+
+@dataclass(slots=True)
+class DecisionDiff:
+    """A replayed request whose decision differs from the captured one.
+
+    Attributes:
+        index: Position of the request in the capture
+        event: Hook event name
+        tool_name: Tool name (if any)
+        expected: Decision recorded at capture time
+        actual: Decision produced during replay
+        redacted: Whether the request was replayed with redacted content
+    """
+
+    index: int
+    event: str
+    tool_name: str | None
+    expected: str
+    actual: str
+    redacted: bool = False
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    """Results of replaying a capture.
+
+    Attributes:
+        mode: "in-process" or "socket"
+        speed: Replay pacing used
+        total: Number of requests replayed
+        errors: Requests that failed (transport error or error response)
+        redacted: Requests replayed with redacted content
+        duration_seconds: Wall-clock replay duration
+        latencies_ms: Per-request latency samples
+        captured_latencies_ms: Latencies recorded at capture time
+        diffs: Requests whose decision changed
+    """
+
+    mode: str
+    speed: ReplaySpeed
+    total: int = 0
+    errors: int = 0
+    redacted: int = 0
+    duration_seconds: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+    captured_latencies_ms: list[float] = field(default_factory=list)
+    diffs: list[DecisionDiff] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Get requests per second over the replay duration."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.total / self.duration_seconds
+
+    @property
+    def reliable_diffs(self) -> list[DecisionDiff]:
+        """Get decision diffs for requests replayed with their original content."""
+        return [d for d in self.diffs if not d.redacted]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to a JSON-serialisable dictionary.
+
+        Returns:
+            Report dictionary
+        """
+        return {
+            "mode": self.mode,
+            "speed": self.speed,
+            "total": self.total,
+            "errors": self.errors,
+            "redacted": self.redacted,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "throughput_rps": round(self.throughput, 2),
+            "latency": summarise_latencies(self.latencies_ms),
+            "captured_latency": summarise_latencies(self.captured_latencies_ms),
+            "decision_diffs": [
+                {
+                    "index": d.index,
+                    "event": d.event,
+                    "tool_name": d.tool_name,
+                    "expected": d.expected,
+                    "actual": d.actual,
+                    "redacted": d.redacted,
+                }
+                for d in self.diffs
+            ],
+        }
+
+
+def load_capture(path: Path) -> list[CapturedRequest]:
+    """Load captured requests from a JSONL capture file.
+
+    Malformed lines are skipped with a warning so that a capture truncated
+    by a crash can still be replayed.
+
+    Args:
+        path: Capture file path
+
+    Returns:
+        Captured requests in file order
+
+    Raises:
+        FileNotFoundError: If the capture file does not exist
+    """
+    records: list[CapturedRequest] = []
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                request = entry["request"]
+                if not isinstance(request, dict):
+                    raise ValueError("request is not an object")
+                records.append(
+                    CapturedRequest(
+                        timestamp=float(entry.get("ts", 0.0)),
+                        request=request,
+                        decision=str(entry.get("decision", "allow")),
+                        elapsed_ms=float(entry.get("elapsed_ms", 0.0)),
+                        redacted=entry.get("redact", "none") != "none",
+                    )
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping malformed capture line %d in %s: %s", line_number, path, e)
+    return records
+
+
+def _send_socket_request(socket_path: Path, request: dict[str, Any], timeout: float) -> Any:
+    """Send one request over the daemon socket and return the decoded response.
+
+    Args:
+        socket_path: Daemon Unix socket path
+        request: Request dictionary
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Decoded JSON response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        chunks: list[bytes] = []
+        while chunk := sock.recv(_RECV_BUFFER_SIZE):
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _replay(
+    records: Iterable[CapturedRequest],
+    send: Callable[[dict[str, Any]], dict[str, Any]],
+    report: ReplayReport,
+    sleep: Callable[[float], None],
+) -> ReplayReport:
+    """Replay records through a send function, filling in the report.
+
+    Args:
+        records: Captured requests to replay
+        send: Function that processes one request and returns its response
+        report: Report to populate
+        sleep: Sleep function used for original-speed pacing
+
+    Returns:
+        The populated report
+    """
+    replay_start = time.perf_counter()
+    previous_ts: float | None = None
+
+    for index, record in enumerate(records):
+        if report.speed == "original" and previous_ts is not None:
+            gap = min(max(record.timestamp - previous_ts, 0.0), _MAX_REPLAY_GAP_SECONDS)
+            if gap > 0:
+                sleep(gap)
+        previous_ts = record.timestamp
+
+        start = time.perf_counter()
+        try:
+            response = send(record.request)
+        except (OSError, ValueError) as e:
+            logger.warning("Replay request %d failed: %s", index, e)
+            response = {"error": str(e)}
+        report.latencies_ms.append((time.perf_counter() - start) * 1000)
+        report.captured_latencies_ms.append(record.elapsed_ms)
+        report.total += 1
+        if record.redacted:
+            report.redacted += 1
+
+        actual = decision_from_response(response)
+        if actual == "error":
+            report.errors += 1
+        if actual != record.decision:
+            report.diffs.append(
+                DecisionDiff(
+                    index=index,
+                    event=record.event,
+                    tool_name=record.tool_name,
+                    expected=record.decision,
+                    actual=actual,
+                    redacted=record.redacted,
+                )
+            )
+
+    report.duration_seconds = time.perf_counter() - replay_start
+    return report
+
+
+def replay_in_process(
+    records: Iterable[CapturedRequest],
+    controller: Any,
+    speed: ReplaySpeed = "max",
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayReport:
+    """Replay captured requests through an in-process controller.
+
+    Args:
+        records: Captured requests to replay
+        controller: Initialised controller exposing process_request()
+        speed: "original" to honour recorded gaps, "max" for back-to-back
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Replay report
+    """
+    report = ReplayReport(mode="in-process", speed=speed)
+    return _replay(records, controller.process_request, report, sleep)
+
+
+def replay_over_socket(
+    records: Iterable[CapturedRequest],
+    socket_path: Path,
+    speed: ReplaySpeed = "max",
+    timeout: float = Timeout.SOCKET_CONNECT,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayReport:
+    """Replay captured requests against a running daemon's socket.
+
+    Args:
+        records: Captured requests to replay
+        socket_path: Daemon Unix socket path
+        speed: "original" to honour recorded gaps, "max" for back-to-back
+        timeout: Per-request socket timeout in seconds
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Replay report
+    """
+    report = ReplayReport(mode="socket", speed=speed)
+
+    def send(request: dict[str, Any]) -> dict[str, Any]:
+        response = _send_socket_request(socket_path, request, timeout)
+        return response if isinstance(response, dict) else {"error": "non-object response"}
+
+    return _replay(records, send, report, sleep)
@@ -4,9 +4,10 @@ This module provides the core daemon server that eliminates process spawn overhe
 by maintaining a long-lived Python process with handlers loaded in memory.
 
 Logging:
-- All logs stored in memory via MemoryLogHandler (circular buffer, 1000 records)
+- All logs stored in memory via MemoryLogHandler (circular buffer, log_buffer_size entries)
 - ERROR level and above also output to stderr for critical visibility
-- No file logging - query logs via CLI or socket API
+- No file logging - query logs via CLI or socket API; ``logs --follow``
+  streams new entries over the socket (follow_logs system action)
 """
 
 import asyncio
@@ -15,16 +16,48 @@ import json
 import logging
 import os
 import signal
+import socket
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any, Protocol, runtime_checkable
 
 from claude_code_hooks_daemon.constants.modes import DaemonMode, ModeConstant
+from claude_code_hooks_daemon.core.async_handler import (
+    Offload,
+    attach_event_loop,
+    detach_event_loop,
+)
+from claude_code_hooks_daemon.core.chain import ChainExecutionResult
+from claude_code_hooks_daemon.core.deferred import (
+    DeferredTask,
+    collect_deferred,
+    get_deferred_work,
+    release_deferred,
+)
+from claude_code_hooks_daemon.core.event import EventType
 from claude_code_hooks_daemon.core.hook_result import HookResult
 from claude_code_hooks_daemon.core.input_schemas import get_input_schema
+from claude_code_hooks_daemon.daemon.capture import TrafficCapture
 from claude_code_hooks_daemon.daemon.config import DaemonConfig
-from claude_code_hooks_daemon.daemon.memory_log_handler import MemoryLogHandler
+from claude_code_hooks_daemon.daemon.config_reload import ACTION_RELOAD_CONFIG, ConfigReloader
+from claude_code_hooks_daemon.daemon.executor_lanes import (
+    ExecutorLane,
+    ExecutorLanes,
+    LaneFullError,
+)
+from claude_code_hooks_daemon.daemon.handoff import ACTION_HANDOFF, send_handoff_fds
+from claude_code_hooks_daemon.daemon.maintenance import MaintenanceQueue
+from claude_code_hooks_daemon.daemon.memory_log_handler import (
+    ACTION_FOLLOW_LOGS,
+    DEFAULT_MAX_RECORDS,
+    LogEntry,
+    MemoryLogHandler,
+)
+from claude_code_hooks_daemon.daemon.metrics import ServerMetrics, default_executor_workers
+from claude_code_hooks_daemon.daemon.single_flight import SingleFlight
 from claude_code_hooks_daemon.utils.strict_mode import handle_tier2_error
 
 # Global memory log handler - accessible for log queries
@@ -32,6 +65,15 @@ _memory_log_handler: MemoryLogHandler | None = None
 
 logger = logging.getLogger(__name__)
 
+# Entries buffered per log follower before new ones are dropped (slow client)
+_FOLLOW_QUEUE_SIZE = 1000
+
+# Python 3.13+ unlinks a Unix server's socket path on close; after a handoff
+# that path belongs to the replacement daemon, so shutdown() removes it instead
+_UNIX_SERVER_OPTIONS: dict[str, Any] = (
+    {"cleanup_socket": False} if sys.version_info >= (3, 13) else {}
+)
+
 
 @runtime_checkable
 class Controller(Protocol):
@@ -58,6 +100,63 @@ class Controller(Protocol):
         ...
 
 
+@runtime_checkable
+class TracingController(Protocol):
+    """Protocol for controllers that expose chain results for traffic capture."""
+
+    def process_request_traced(
+        self, request_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None]:
+        """Process a request and return (response, chain result)."""
+        ...
+
+
+@runtime_checkable
+class AsyncController(Protocol):
+    """Protocol for controllers that await async handlers on the event loop."""
+
+    def uses_async_handlers(self, event_type: str) -> bool:
+        """Check whether an event's chain has async handlers."""
+        ...
+
+    async def process_request_traced_async(
+        self, request_data: dict[str, Any], offload: Offload
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None]:
+        """Process a request on the event loop and return (response, chain result)."""
+        ...
+
+
+@runtime_checkable
+class StatefulController(Protocol):
+    """Protocol for controllers whose session state survives a socket handoff."""
+
+    def export_state(self) -> dict[str, Any]:
+        """Export JSON-compatible session state."""
+        ...
+
+
+@runtime_checkable
+class LoadSheddingController(Protocol):
+    """Protocol for controllers that shed low-priority handlers under load."""
+
+    def attach_queue_depth(self, provider: Callable[[], int]) -> None:
+        """Report the server's queue depth to load shedding."""
+        ...
+
+    def get_load_shedding(self) -> dict[str, Any]:
+        """Get load shedding state and counters."""
+        ...
+
+
+@runtime_checkable
+class ThreadedController(Protocol):
+    """Protocol for controllers that own worker threads of their own."""
+
+    def release_threads(self) -> None:
+        """Release the controller's worker threads."""
+        ...
+
+
 @runtime_checkable
 class LegacyController(Protocol):
     """Protocol for legacy FrontController."""
@@ -80,15 +179,38 @@ def get_memory_logs(count: int | None = None, level: str | None = None) -> list[
     if _memory_log_handler is None:
         return ["No logs available - daemon not initialised"]
 
-    logs = _memory_log_handler.get_logs(count)
+    return _memory_log_handler.get_logs(count, _level_number(level))
 
-    # Filter by level if specified
-    if level:
-        level_names = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        allowed_levels = level_names[level_names.index(level.upper()) :]
-        logs = [log for log in logs if any(f"[{lvl}]" in log for lvl in allowed_levels)]
 
-    return logs
+def _end_log_follow(follower: "asyncio.Queue[LogEntry | None]") -> None:
+    """Queue the end-of-stream marker for a log follower.
+
+    Args:
+        follower: Follower's entry queue (oldest entry dropped if full)
+    """
+    if follower.full():
+        follower.get_nowait()
+    follower.put_nowait(None)
+
+
+def _level_number(level: str | None) -> int | None:
+    """Convert a level name to its number.
+
+    Args:
+        level: Level name such as "ERROR" (None = no filter)
+
+    Returns:
+        Numeric level, or None
+
+    Raises:
+        ValueError: If the name is not a known level
+    """
+    if not level:
+        return None
+    levelno = logging.getLevelNamesMapping().get(level.upper())
+    if levelno is None:
+        raise ValueError(f"Unknown log level: {level}")
+    return levelno
 
 
 def get_log_count() -> int:
@@ -111,17 +233,30 @@ class HooksDaemon:
     - Graceful shutdown handling (SIGTERM, SIGINT)
     - PID file management with stale PID detection
     - Request timing metrics
-    - Concurrent request handling
+    - Concurrent request handling on a dedicated, observable handler thread pool
     - In-memory logging with stderr output for errors
     """
 
     __slots__ = (
         "_active_requests",
+        "_background_task",
+        "_capture",
+        "_config_reloader",
+        "_executor_lanes",
+        "_handed_off",
         "_idle_check_interval",
         "_input_validators",
         "_is_new_controller",
+        "_listen_socket",
+        "_lock_fd",
+        "_log_followers",
+        "_maintenance",
+        "_metrics",
+        "_on_ready",
         "_shutdown_requested",
         "_shutdown_task",
+        "_status_flights",
+        "_warmup",
         "config",
         "controller",
         "last_activity",
@@ -134,6 +269,13 @@ class HooksDaemon:
         config: DaemonConfig,
         controller: Controller | LegacyController,
         idle_check_interval: int = 60,
+        capture: TrafficCapture | None = None,
+        warmup: Callable[[], None] | None = None,
+        on_ready: Callable[[], None] | None = None,
+        maintenance: MaintenanceQueue | None = None,
+        config_reloader: ConfigReloader | None = None,
+        listen_socket: socket.socket | None = None,
+        lock_fd: int | None = None,
     ) -> None:
         """Initialise hooks daemon.
 
@@ -141,6 +283,18 @@ class HooksDaemon:
             config: Daemon configuration
             controller: Controller for request dispatch (new or legacy)
             idle_check_interval: Seconds between idle timeout checks (default 60)
+            capture: Optional traffic capture writer (see daemon.traffic_capture)
+            warmup: Optional blocking callable run in a background thread once
+                the socket is listening (progressive startup)
+            on_ready: Optional callable invoked once the socket accepts requests
+                (readiness notification to the start command)
+            maintenance: Optional deferred startup tasks, run in the background
+                after the warm-up; outcomes are reported in health
+            config_reloader: Optional config hot reload; polled every
+                config.config_reload_interval_seconds and run on reload_config
+            listen_socket: Optional already-listening socket handed over by the
+                daemon this one replaces; served instead of binding socket_path
+            lock_fd: Optional project lock descriptor; enables the handoff action
         """
         self.config = config
         self.controller = controller
@@ -153,17 +307,60 @@ class HooksDaemon:
         self._idle_check_interval = idle_check_interval
         self._is_new_controller = isinstance(controller, Controller)
         self._input_validators: dict[str, Any] = {}  # Cached validators per event type
+        self._log_followers: set[asyncio.Queue[LogEntry | None]] = set()
 
         # Configure logging with memory handler and stderr for errors
-        self._setup_logging(config.log_level)
+        self._setup_logging(config.log_level, config.log_buffer_size)
+
+        self._capture = capture
+        self._warmup = warmup
+        self._on_ready = on_ready
+        self._maintenance = maintenance
+        self._config_reloader = config_reloader
+        self._background_task: asyncio.Future[None] | None = None
+        self._listen_socket = listen_socket
+        self._lock_fd = lock_fd
+        self._handed_off = False
+
+        # Dedicated pools for handler chains, one per executor lane, so slow
+        # events never hold up latency-sensitive ones. Pools are created on
+        # first dispatch; same-session requests in a lane run in order.
+        self._executor_lanes = ExecutorLanes.from_config(
+            config.executor_lanes, self._executor_workers()
+        )
+        self._metrics = ServerMetrics()
+        # Identical Status requests in flight for a session share one run
+        self._status_flights = SingleFlight()
+        if isinstance(controller, LoadSheddingController):
+            controller.attach_queue_depth(self._executor_lanes.queued)
+
+    def _executor_workers(self) -> int:
+        """Get the configured handler thread pool size.
+
+        Returns:
+            daemon.executor_max_workers, or the ThreadPoolExecutor default
+        """
+        return self.config.executor_max_workers or default_executor_workers()
+
+    def _get_executor(self, event: str) -> ThreadPoolExecutor:
+        """Get the thread pool serving an event, creating it on first use.
+
+        Args:
+            event: Hook event type
+
+        Returns:
+            Thread pool of the event's executor lane
+        """
+        return self._executor_lanes.for_event(event).executor()
 
-    def _setup_logging(self, log_level: str) -> None:
+    def _setup_logging(self, log_level: str, buffer_size: int = DEFAULT_MAX_RECORDS) -> None:
         """Configure logging with memory handler and stderr error output.
 
         Checks HOOKS_DAEMON_LOG_LEVEL environment variable first, falls back to config.
 
         Args:
             log_level: Log level string from config (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            buffer_size: Log entries kept in memory
         """
         global _memory_log_handler
 
@@ -189,7 +386,7 @@ class HooksDaemon:
                 )
 
         # Create memory handler
-        _memory_log_handler = MemoryLogHandler(max_records=1000)
+        _memory_log_handler = MemoryLogHandler(max_records=buffer_size)
         _memory_log_handler.setLevel(logging.DEBUG)  # Capture all levels in memory
 
         # Create formatter
@@ -328,7 +525,7 @@ class HooksDaemon:
         """Start the daemon server.
 
         - Writes PID file
-        - Creates Unix socket server
+        - Creates Unix socket server (or serves a handed-over socket)
         - Starts idle timeout monitor
         - Handles graceful shutdown signals
         """
@@ -339,6 +536,58 @@ class HooksDaemon:
         if self.config.pid_file_path_obj:
             self._write_pid_file()
 
+        if self._listen_socket is not None:
+            # Handed over by the daemon we replace: same socket, same path
+            self.server = await asyncio.start_unix_server(
+                self._handle_client, sock=self._listen_socket, **_UNIX_SERVER_OPTIONS
+            )
+            logger.info("Serving on socket handed over by the previous daemon")
+        else:
+            await self._bind_socket()
+
+        logger.info("Daemon listening on %s", socket_path)
+
+        # Setup signal handlers for graceful shutdown
+        loop = asyncio.get_running_loop()
+        # Async handlers run their coroutines here, not on worker threads
+        attach_event_loop(loop)
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, partial(self._signal_handler, sig))
+
+        # Tell the start command we are serving (readiness pipe)
+        if self._on_ready is not None:
+            self._on_ready()
+
+        # Finish progressive startup and deferred maintenance off the event
+        # loop, now that hooks can connect
+        if self._warmup is not None or self._maintenance is not None:
+            self._background_task = loop.run_in_executor(None, self._run_background)
+
+        # Start idle timeout monitor
+        idle_monitor_task = asyncio.create_task(self._monitor_idle_timeout())
+
+        # Start periodic file touch (keeps runtime files fresh so stale cleanup
+        # can distinguish live containers from dead ones by mtime)
+        touch_task = asyncio.create_task(self._touch_daemon_files_periodically())
+
+        # Apply config file edits without a restart
+        watch_task = asyncio.create_task(self._watch_config_periodically())
+
+        # Wait for shutdown event
+        await self.shutdown_event.wait()
+
+        # Cancel background tasks
+        for task in (idle_monitor_task, touch_task, watch_task):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        logger.info("Daemon shutdown complete")
+
+    async def _bind_socket(self) -> None:
+        """Create the Unix socket server on config.socket_path."""
+        socket_path = self.config.socket_path_obj
+
         # Remove stale socket if exists
         if socket_path and socket_path.exists():
             logger.warning("Removing stale socket: %s", socket_path)
@@ -347,7 +596,7 @@ class HooksDaemon:
         # Start Unix socket server
         try:
             self.server = await asyncio.start_unix_server(
-                self._handle_client, path=str(socket_path)
+                self._handle_client, path=str(socket_path), **_UNIX_SERVER_OPTIONS
             )
         except OSError as e:
             # AF_UNIX socket path too long or other socket creation failure
@@ -363,32 +612,70 @@ class HooksDaemon:
         if socket_path:
             socket_path.chmod(0o660)
 
-        logger.info("Daemon listening on %s", socket_path)
+    @property
+    def handed_off(self) -> bool:
+        """Check whether this daemon handed its socket to a replacement."""
+        return self._handed_off
 
-        # Setup signal handlers for graceful shutdown
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, partial(self._signal_handler, sig))
+    def _hand_off(self, writer: asyncio.StreamWriter | None) -> dict[str, Any]:
+        """Send the listening socket and project lock to a replacement daemon.
 
-        # Start idle timeout monitor
-        idle_monitor_task = asyncio.create_task(self._monitor_idle_timeout())
+        On success this daemon stops accepting, drains in-flight requests
+        and shuts down, leaving the socket, PID and discovery files in place.
 
-        # Start periodic file touch (keeps runtime files fresh so stale cleanup
-        # can distinguish live containers from dead ones by mtime)
-        touch_task = asyncio.create_task(self._touch_daemon_files_periodically())
+        Args:
+            writer: Connection the handoff request arrived on
 
-        # Wait for shutdown event
-        await self.shutdown_event.wait()
+        Returns:
+            Response with this daemon's PID and session state, or an error
+        """
+        listeners = self.server.sockets if self.server is not None else ()
+        conn = writer.get_extra_info("socket") if writer is not None else None
+        if self._lock_fd is None or not listeners or conn is None:
+            return {"error": "Socket handoff is not available"}
+        if self._shutdown_requested:
+            return {"error": "Daemon is already shutting down"}
 
-        # Cancel background tasks
-        idle_monitor_task.cancel()
-        touch_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await idle_monitor_task
-        with contextlib.suppress(asyncio.CancelledError):
-            await touch_task
+        state: dict[str, Any] = {}
+        if isinstance(self.controller, StatefulController):
+            try:
+                state = self.controller.export_state()
+            except Exception:
+                logger.exception("Failed to export session state for handoff")
 
-        logger.info("Daemon shutdown complete")
+        try:
+            send_handoff_fds(conn.fileno(), listeners[0].fileno(), self._lock_fd)
+        except OSError as e:
+            logger.error("Socket handoff failed: %s", e)
+            return {"error": f"Socket handoff failed: {e}"}
+
+        logger.info("Handed socket to replacement daemon, draining and exiting")
+        self._handed_off = True
+        # shutdown() waits for this request to finish writing its response
+        self._shutdown_task = asyncio.create_task(self.shutdown())
+        return {"result": {"pid": os.getpid(), "state": state}}
+
+    def _run_background(self) -> None:
+        """Run the warm-up, then the maintenance queue (background thread)."""
+        if self._warmup is not None:
+            self._run_warmup(self._warmup)
+        if self._maintenance is not None:
+            self._maintenance.run_all()
+
+    @staticmethod
+    def _run_warmup(warmup: Callable[[], None]) -> None:
+        """Run the background warm-up, logging instead of raising (fail-open).
+
+        Args:
+            warmup: Blocking warm-up callable
+        """
+        start = time.perf_counter()
+        try:
+            warmup()
+        except Exception:
+            logger.exception("Background warm-up failed")
+            return
+        logger.info("Background warm-up finished in %.0fms", (time.perf_counter() - start) * 1000)
 
     def _signal_handler(self, sig: signal.Signals) -> None:
         """Handle shutdown signals.
@@ -422,6 +709,41 @@ class HooksDaemon:
             logger.debug("Daemon file touch task cancelled")
             raise
 
+    async def _watch_config_periodically(self) -> None:
+        """Poll the config file stamp and hot-reload it when it changes.
+
+        A stat per interval on the event loop; parsing and handler
+        re-registration run in the default executor.
+        """
+        interval = self.config.config_reload_interval_seconds
+        if self._config_reloader is None or interval <= 0:
+            return
+        try:
+            while not self._shutdown_requested:
+                await asyncio.sleep(interval)
+                if self._config_reloader.changed():
+                    logger.info("Config file changed, reloading")
+                    await self._reload_config()
+        except asyncio.CancelledError:
+            logger.debug("Config watch task cancelled")
+            raise
+
+    async def _reload_config(self) -> dict[str, Any]:
+        """Reload the config file off the event loop (fail-open).
+
+        Returns:
+            Reload result dictionary
+        """
+        if self._config_reloader is None:
+            return {"error": "Config reload is not available"}
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, self._config_reloader.reload)
+        except Exception as e:
+            logger.exception("Config reload failed")
+            return {"error": f"Config reload failed: {type(e).__name__}: {e}"}
+        return {"result": result.to_dict()}
+
     async def _monitor_idle_timeout(self) -> None:
         """Monitor idle timeout and shutdown if exceeded.
 
@@ -451,7 +773,7 @@ class HooksDaemon:
         - Sets shutdown flag
         - Waits for active requests to complete
         - Closes server
-        - Removes socket and PID files
+        - Removes socket and PID files (unless handed off to a replacement)
         - Sets shutdown event
         """
         if self._shutdown_requested:
@@ -460,6 +782,12 @@ class HooksDaemon:
         self._shutdown_requested = True
         logger.info("Shutting down daemon...")
 
+        # End log follow streams, or wait_closed() below would wait for them.
+        # Scheduled, so entries already handed to the loop are sent first
+        loop = asyncio.get_running_loop()
+        for follower in self._log_followers:
+            loop.call_soon(_end_log_follow, follower)
+
         # Wait for active requests to complete (with timeout)
         if self._active_requests > 0:
             logger.info("Waiting for %d active requests...", self._active_requests)
@@ -473,6 +801,19 @@ class HooksDaemon:
             self.server.close()
             await self.server.wait_closed()
 
+        # Cancel async handlers still running on the loop so no worker waits
+        # for them forever, then release handler worker threads (in-flight
+        # jobs already drained above)
+        detach_event_loop()
+        self._executor_lanes.shutdown()
+        if isinstance(self.controller, ThreadedController):
+            self.controller.release_threads()
+
+        # After a handoff the socket and PID file belong to the replacement
+        if self._handed_off:
+            self.shutdown_event.set()
+            return
+
         # Cleanup socket file
         socket_path = self.config.socket_path_obj
         if socket_path and socket_path.exists():
@@ -498,7 +839,10 @@ class HooksDaemon:
             writer: Stream writer for outgoing data
         """
         self._active_requests += 1
+        self._metrics.request_started()
         self.last_activity = time.time()
+        counted = True
+        deferred: list[DeferredTask] = []
 
         try:
             # Read request (newline-delimited JSON)
@@ -510,7 +854,8 @@ class HooksDaemon:
 
             # Parse and process request
             start_time = time.time()
-            response = await self._process_request(request_data.decode())
+            with collect_deferred() as deferred:
+                response = await self._process_request(request_data.decode(), writer)
             elapsed_ms = (time.time() - start_time) * 1000
 
             # Note: timing_ms removed - Claude Code schema doesn't accept it as top-level field
@@ -532,6 +877,15 @@ class HooksDaemon:
 
             logger.debug("Request processed in %.2fms", elapsed_ms)
 
+            result = response.get("result")
+            if isinstance(result, dict) and result.get("follow") is True:
+                # A log follower is not an in-flight request: it must not hold
+                # up shutdown's drain or show as active in metrics
+                self._active_requests -= 1
+                self._metrics.request_finished()
+                counted = False
+                await self._stream_logs(reader, writer, result.get("min_level"))
+
         except Exception as e:
             logger.exception("Error handling client: %s", e)
             error_response = {"error": str(e)}
@@ -539,15 +893,104 @@ class HooksDaemon:
             await writer.drain()
 
         finally:
-            self._active_requests -= 1
+            # Side effects deferred by handlers run once the response is out
+            release_deferred(deferred)
+            if counted:
+                self._active_requests -= 1
+                self._metrics.request_finished()
             writer.close()
-            await writer.wait_closed()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _follow_logs(self, hook_input: dict[str, Any]) -> dict[str, Any]:
+        """Start a log follow: recent entries now, new ones streamed after.
+
+        Args:
+            hook_input: Request data with optional count (backlog) and level
+
+        Returns:
+            Response with the backlog and follow=True, or an error
+        """
+        if _memory_log_handler is None:
+            return {"error": "No logs available - daemon not initialised"}
+        min_level = _level_number(hook_input.get("level"))
+        backlog = _memory_log_handler.get_logs(hook_input.get("count"), min_level)
+        return {
+            "result": {
+                "logs": backlog,
+                "count": get_log_count(),
+                "follow": True,
+                "min_level": min_level,
+            }
+        }
+
+    async def _stream_logs(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, min_level: int | None
+    ) -> None:
+        """Write each new log entry as a JSON line until the client leaves.
+
+        Ends when the client closes its end of the connection (so followers
+        must not half-close after sending the request), when a write fails,
+        or when the daemon shuts down.
+
+        Args:
+            reader: Client stream (watched for EOF)
+            writer: Client stream to write entries to
+            min_level: Only stream entries at or above this level (None = all)
+        """
+        handler = _memory_log_handler
+        if handler is None:
+            return
+        loop = asyncio.get_running_loop()
+        entries: asyncio.Queue[LogEntry | None] = asyncio.Queue(maxsize=_FOLLOW_QUEUE_SIZE)
+
+        def offer(entry: LogEntry) -> None:
+            # Slow client: drop rather than grow without bound
+            with contextlib.suppress(asyncio.QueueFull):
+                entries.put_nowait(entry)
+
+        def on_entry(entry: LogEntry) -> None:
+            # Called on the logging thread: hand over to the event loop
+            if min_level is None or entry.levelno >= min_level:
+                loop.call_soon_threadsafe(offer, entry)
+
+        self._log_followers.add(entries)
+        handler.subscribe(on_entry)
+        client_closed = asyncio.ensure_future(reader.read(1))
+        try:
+            while True:
+                next_entry = asyncio.ensure_future(entries.get())
+                await asyncio.wait({next_entry, client_closed}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_entry.done():
+                    next_entry.cancel()
+                    return
+                batch: list[LogEntry | None] = [next_entry.result()]
+                while not entries.empty() and batch[-1] is not None:
+                    batch.append(entries.get_nowait())
+                lines = [
+                    json.dumps({"log": handler.format_entry(entry)}) + "\n"
+                    for entry in batch
+                    if entry is not None
+                ]
+                writer.write("".join(lines).encode())
+                await writer.drain()
+                if batch[-1] is None:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            handler.unsubscribe(on_entry)
+            client_closed.cancel()
+            self._log_followers.discard(entries)
 
-    async def _process_request(self, request_data: str) -> dict[str, Any]:
+    async def _process_request(
+        self, request_data: str, writer: asyncio.StreamWriter | None = None
+    ) -> dict[str, Any]:
         """Process incoming hook request.
 
         Args:
             request_data: JSON-encoded request string
+            writer: Client connection (needed only by the handoff action)
 
         Returns:
             Response dictionary with result or error
@@ -582,6 +1025,20 @@ class HooksDaemon:
 
         # Handle system events (logs, status, health, handlers)
         if event == "_system":
+            action = hook_input.get("action")
+            if action == ACTION_FOLLOW_LOGS:
+                response = self._follow_logs(hook_input)
+                if request_id:
+                    response["request_id"] = request_id
+                return response
+            if action in (ACTION_RELOAD_CONFIG, ACTION_HANDOFF):
+                if action == ACTION_RELOAD_CONFIG:
+                    response = await self._reload_config()
+                else:
+                    response = self._hand_off(writer)
+                if request_id:
+                    response["request_id"] = request_id
+                return response
             return self._handle_system_request(hook_input, request_id)
 
         # INPUT VALIDATION - Validate hook_input structure before dispatch
@@ -606,20 +1063,45 @@ class HooksDaemon:
                             validation_errors,
                         )
 
-        # Process with appropriate controller
-        loop = asyncio.get_running_loop()
+        # Process with appropriate controller, in the event's executor lane
+        # and behind the session's earlier requests
+        lane = self._executor_lanes.for_event(event)
+        session_id = hook_input.get("session_id")
+        session = session_id if isinstance(session_id, str) else None
 
         if self._is_new_controller and isinstance(self.controller, Controller):
             # New DaemonController - use process_request directly
-            result: dict[str, Any] = await loop.run_in_executor(
-                None, self.controller.process_request, request
+            result: dict[str, Any]
+            process = (
+                self._process_and_capture
+                if self._capture is not None
+                else self.controller.process_request
             )
+            try:
+                if event == EventType.STATUS_LINE.value and session is not None:
+                    # Status only reads session state (bar its own model and
+                    # context fields) and is already coalesced, so it skips the
+                    # session's queue rather than wait out a lint run or Stop
+                    key = (session, json.dumps(hook_input, sort_keys=True, default=str))
+                    shared = await self._status_flights.run(
+                        key, lambda: self._run_in_lane(lane, None, event, request, process)
+                    )
+                    # Each coalesced caller gets its own copy to add its request_id
+                    result = dict(shared)
+                else:
+                    result = await self._run_in_lane(lane, session, event, request, process)
+            except LaneFullError:
+                return self._lane_full_response(lane, event, request_id)
             if request_id:
                 result["request_id"] = request_id
             return result
         elif isinstance(self.controller, LegacyController):
             # Legacy FrontController - dispatch and convert result
-            hook_result = await loop.run_in_executor(None, self.controller.dispatch, hook_input)
+            dispatch = self.controller.dispatch
+            try:
+                hook_result = await lane.run(session, self._metrics.track(dispatch, hook_input))
+            except LaneFullError:
+                return self._lane_full_response(lane, event, request_id)
 
             # Build response (don't wrap in "result" - to_json already returns correct format)
             response_dict: dict[str, Any] = hook_result.to_json(event)
@@ -629,6 +1111,118 @@ class HooksDaemon:
         else:
             return {"error": "Unknown controller type"}
 
+    async def _run_in_lane(
+        self,
+        lane: ExecutorLane,
+        session: str | None,
+        event: str,
+        request: dict[str, Any],
+        process: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Process a request in its executor lane.
+
+        A chain with async handlers runs as a coroutine on the event loop,
+        offloading its synchronous steps to the lane, so no lane thread
+        waits while those handlers run subprocesses. Other chains run
+        whole on a lane thread.
+
+        Args:
+            lane: Lane serving the event
+            session: Session to serialise behind (None = not serialised)
+            event: Hook event type
+            request: Parsed request dictionary
+            process: Synchronous processing function for the request
+
+        Returns:
+            Response dictionary
+
+        Raises:
+            LaneFullError: If the lane's queue is full
+        """
+        controller = self.controller
+        if isinstance(controller, AsyncController) and controller.uses_async_handlers(event):
+            job = partial(self._process_async, controller, lane.offload)
+            return await lane.run_async(session, self._metrics.track_async(job, request))
+        return await lane.run(session, self._metrics.track(process, request))
+
+    async def _process_async(
+        self, controller: AsyncController, offload: Offload, request: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Process a request on the event loop, appending it to any traffic capture.
+
+        Args:
+            controller: Controller that awaits async handlers
+            offload: Runs synchronous steps on the lane's threads
+            request: Parsed request dictionary
+
+        Returns:
+            Response dictionary from the controller
+        """
+        arrived = time.time()
+        start = time.perf_counter()
+        result, chain_result = await controller.process_request_traced_async(request, offload)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        capture = self._capture
+        if capture is not None:
+            await offload(
+                partial(capture.record, timestamp=arrived),
+                request,
+                result,
+                elapsed_ms,
+                chain_result,
+            )
+        return result
+
+    @staticmethod
+    def _lane_full_response(
+        lane: ExecutorLane, event: str, request_id: str | None
+    ) -> dict[str, Any]:
+        """Build the response for a request rejected by a full lane queue.
+
+        Args:
+            lane: Lane whose queue was full
+            event: Event type of the rejected request
+            request_id: Request ID to echo (if any)
+
+        Returns:
+            Error response naming the lane
+        """
+        logger.warning("Executor lane %r queue full, rejecting %s", lane.name, event)
+        response: dict[str, Any] = {
+            "error": "executor_lane_full",
+            "lane": lane.name,
+            "event_type": event,
+        }
+        if request_id:
+            response["request_id"] = request_id
+        return response
+
+    def _process_and_capture(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Process a request and append it to the traffic capture.
+
+        Runs in the executor thread so capture I/O never blocks the event loop.
+
+        Args:
+            request: Parsed request dictionary
+
+        Returns:
+            Response dictionary from the controller
+        """
+        arrived = time.time()
+        start = time.perf_counter()
+        chain_result: ChainExecutionResult | None = None
+        result: dict[str, Any]
+        if isinstance(self.controller, TracingController):
+            result, chain_result = self.controller.process_request_traced(request)
+        elif isinstance(self.controller, Controller):
+            result = self.controller.process_request(request)
+        else:
+            return {"error": "Unknown controller type"}
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if self._capture is not None:
+            self._capture.record(request, result, elapsed_ms, chain_result, timestamp=arrived)
+        return result
+
     def _handle_system_request(
         self, hook_input: dict[str, Any], request_id: str | None
     ) -> dict[str, Any]:
@@ -661,6 +1255,8 @@ class HooksDaemon:
                     "stats": {"uptime_seconds": 0, "requests_processed": 0},
                     "handlers": {},
                 }
+            if self._maintenance is not None:
+                health_result["maintenance"] = self._maintenance.snapshot()
             response = {"result": health_result}
 
         elif action == "handlers":
@@ -714,6 +1310,16 @@ class HooksDaemon:
                         }
                     }
 
+        elif action == "metrics":
+            metrics = self._metrics.snapshot(self._executor_lanes.max_workers)
+            metrics["lanes"] = self._executor_lanes.snapshot()
+            metrics["session_lanes"] = self._executor_lanes.sessions.snapshot()
+            metrics["status_coalescing"] = self._status_flights.snapshot()
+            metrics["deferred_work"] = get_deferred_work().snapshot()
+            if isinstance(self.controller, LoadSheddingController):
+                metrics["load_shedding"] = self.controller.get_load_shedding()
+            response = {"result": metrics}
+
         elif action == "log_marker":
             # Log a boundary marker message
             message = hook_input.get("message", "MARKER")
@@ -0,0 +1,111 @@
+"""Per-session serial lanes for hook requests.
+
+Handler state is largely per session: pseudo-event trigger counters,
+progressive-verbosity block counts and transcript offsets are keyed by
+``session_id``. When two requests from the same session run on different
+executor threads at once, their read-modify-write updates interleave and
+the session sees nondeterministic behaviour.
+
+Each session therefore gets a lane: its requests wait in arrival order and
+at most one of them is in the executor at a time. Different sessions'
+lanes run in parallel, bounded only by the executor's worker count.
+Requests without a session ID are not serialised.
+
+Lanes live only while a request for the session is queued or running, and
+all bookkeeping happens on the event loop thread, so no locking is needed.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Deepest lanes listed in the metrics snapshot
+_TOP_LANES = 5
+
+
+class _Lane:
+    """FIFO gate for one session's requests."""
+
+    __slots__ = ("depth", "lock")
+
+    def __init__(self) -> None:
+        """Create an empty lane."""
+        # asyncio.Lock wakes waiters in the order they started waiting
+        self.lock = asyncio.Lock()
+        self.depth = 0
+
+
+class SessionLanes:
+    """Runs each session's requests one at a time, in arrival order."""
+
+    __slots__ = ("_lanes", "_peak_depth", "_serialised_total")
+
+    def __init__(self) -> None:
+        """Create with no lanes."""
+        self._lanes: dict[str, _Lane] = {}
+        self._peak_depth = 0
+        self._serialised_total = 0
+
+    async def run(self, session_id: str | None, submit: Callable[[], Awaitable[T]]) -> T:
+        """Run a job after the session's earlier requests have finished.
+
+        Must be called on the event loop thread.
+
+        Args:
+            session_id: Session the request belongs to (None = not serialised)
+            submit: Starts the job (e.g. hands it to the executor)
+
+        Returns:
+            The job's result
+        """
+        if not session_id:
+            return await submit()
+
+        lane = self._lanes.get(session_id)
+        if lane is None:
+            lane = self._lanes[session_id] = _Lane()
+        lane.depth += 1
+        self._peak_depth = max(self._peak_depth, lane.depth)
+        if lane.depth > 1:
+            self._serialised_total += 1
+        try:
+            async with lane.lock:
+                return await submit()
+        finally:
+            lane.depth -= 1
+            if lane.depth == 0:
+                del self._lanes[session_id]
+
+    def depth(self, session_id: str) -> int:
+        """Get the number of queued and running requests for a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Requests in the session's lane (0 if it has none)
+        """
+        lane = self._lanes.get(session_id)
+        return lane.depth if lane is not None else 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get lane metrics.
+
+        Returns:
+            Active lane count, requests waiting behind their session's
+            running request, peak lane depth, requests that had to wait
+            since startup, and the deepest lanes
+        """
+        deepest = sorted(self._lanes.items(), key=lambda item: item[1].depth, reverse=True)
+        return {
+            "active": len(self._lanes),
+            "waiting": sum(lane.depth - 1 for lane in self._lanes.values()),
+            "peak_depth": self._peak_depth,
+            "serialised_total": self._serialised_total,
+            "deepest": [
+                {"session_id": session_id, "depth": lane.depth}
+                for session_id, lane in deepest[:_TOP_LANES]
+            ],
+        }
@@ -0,0 +1,59 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+Claude Code can send several identical Status events for one session
+within a few hundred milliseconds. While one is being processed, later
+identical requests wait for its result instead of running the status line
+chain again.
+
+Only use this for requests without side effects beyond their response:
+coalesced requests are never processed themselves. All bookkeeping
+happens on the event loop thread.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one job per key at a time, sharing its result."""
+
+    __slots__ = ("_calls", "_coalesced_total")
+
+    def __init__(self) -> None:
+        """Create with nothing in flight."""
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self._coalesced_total = 0
+
+    async def run(self, key: Hashable, submit: Callable[[], Awaitable[T]]) -> T:
+        """Run a job, or wait for the identical job already in flight.
+
+        A caller that is cancelled stops waiting without cancelling the
+        shared job, so other waiters still get its result.
+
+        Args:
+            key: Identity of the request (equal keys share one execution)
+            submit: Starts the job
+
+        Returns:
+            The job's result (shared by every caller with the same key)
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self._coalesced_total += 1
+        else:
+            call = asyncio.ensure_future(submit())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        result: T = await asyncio.shield(call)
+        return result
+
+    def snapshot(self) -> dict[str, int]:
+        """Get coalescing counters.
+
+        Returns:
+            Jobs in flight and requests served from another's job since startup
+        """
+        return {"in_flight": len(self._calls), "coalesced_total": self._coalesced_total}
@@ -0,0 +1,217 @@
+"""Session state snapshot carried across idle shutdown and restart.
+
+Handler decision history (which drives progressive-verbosity escalation
+such as DestructiveGitHandler's block count), StatusLine session state,
+pseudo-event trigger counters and nitpick transcript offsets live in
+memory. Without a snapshot they reset whenever the daemon idles out or
+restarts.
+
+On shutdown the daemon writes ``DaemonController.export_state()`` to a
+JSON file in its untracked directory::
+
+    {"version": 1, "saved_at": <unix time>, "state": {...}}
+
+The file is written under a temporary name and renamed into place, so a
+reader never sees a partial snapshot. Only history from the last
+``max_age_hours`` and per-session state for the ``max_sessions`` most
+recent sessions are written, and the oldest history is dropped until the
+snapshot fits in ``max_bytes`` (each session's data layer is limited to
+the same number of records, halved until it fits).
+
+The next daemon consumes the file (reads, then deletes it) when it serves
+its first request, and ignores it if it is older than ``max_age_hours`` or
+from a different snapshot version.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claude_code_hooks_daemon.daemon.paths import get_snapshot_path
+
+if TYPE_CHECKING:
+    from claude_code_hooks_daemon.config.models import SessionSnapshotConfig
+    from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+logger = logging.getLogger(__name__)
+
+# Bump when the state layout changes incompatibly; older snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+_SECONDS_PER_HOUR = 3600
+
+
+class SessionSnapshot:
+    """Writes and consumes the session state snapshot file."""
+
+    __slots__ = ("_max_age_seconds", "_max_bytes", "_max_sessions", "_path")
+
+    def __init__(
+        self, path: Path, *, max_age_seconds: float, max_sessions: int, max_bytes: int
+    ) -> None:
+        """Configure the snapshot file and its bounds.
+
+        Args:
+            path: Snapshot file path
+            max_age_seconds: Discard snapshots and history records older than this
+            max_sessions: Keep per-session state for this many most recent sessions
+            max_bytes: Maximum snapshot size
+        """
+        self._path = path
+        self._max_age_seconds = max_age_seconds
+        self._max_sessions = max_sessions
+        self._max_bytes = max_bytes
+
+    @classmethod
+    def from_config(
+        cls, snapshot_config: "SessionSnapshotConfig", project_path: Path
+    ) -> "SessionSnapshot | None":
+        """Create from configuration.
+
+        Args:
+            snapshot_config: Session snapshot configuration
+            project_path: Project root (for the default path)
+
+        Returns:
+            SessionSnapshot, or None when disabled
+        """
+        if not snapshot_config.enabled:
+            return None
+        path = (
+            Path(snapshot_config.path) if snapshot_config.path else get_snapshot_path(project_path)
+        )
+        return cls(
+            path,
+            max_age_seconds=snapshot_config.max_age_hours * _SECONDS_PER_HOUR,
+            max_sessions=snapshot_config.max_sessions,
+            max_bytes=snapshot_config.max_bytes,
+        )
+
+    @property
+    def path(self) -> Path:
+        """Snapshot file path."""
+        return self._path
+
+    def save(self, controller: "DaemonController") -> int:
+        """Write the controller's session state atomically (fail-open).
+
+        Args:
+            controller: Controller whose state to save
+
+        Returns:
+            Bytes written (0 if nothing could be written)
+        """
+        now = time.time()
+        since = now - self._max_age_seconds
+        max_history: int | None = None
+        try:
+            while True:
+                # The mode is left out: a fresh start uses the configured default
+                state = controller.export_state(
+                    include_mode=False,
+                    since=since,
+                    max_sessions=self._max_sessions,
+                    max_history=max_history,
+                )
+                data = _encode({"version": SNAPSHOT_VERSION, "saved_at": now, "state": state})
+                if len(data) <= self._max_bytes:
+                    break
+                # Halve the largest history until the snapshot fits
+                kept = _largest_history(state)
+                if kept == 0:
+                    logger.warning(
+                        "Session snapshot exceeds %d bytes without history, not saved",
+                        self._max_bytes,
+                    )
+                    return 0
+                max_history = kept // 2
+            _write_atomic(self._path, data)
+        except Exception:
+            logger.exception("Failed to save session snapshot to %s", self._path)
+            return 0
+        logger.info("Saved session snapshot (%d bytes) to %s", len(data), self._path)
+        return len(data)
+
+    def load(self) -> dict[str, Any] | None:
+        """Read and delete the snapshot (fail-open).
+
+        Returns:
+            Saved controller state, or None if there is no usable snapshot
+        """
+        try:
+            raw = self._path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Cannot read session snapshot %s: %s", self._path, e)
+            return None
+        # Consumed: a later start must not restore the same state again
+        with contextlib.suppress(OSError):
+            self._path.unlink()
+
+        try:
+            snapshot = json.loads(raw)
+        except ValueError as e:
+            logger.warning("Ignoring corrupt session snapshot %s: %s", self._path, e)
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.info("Ignoring session snapshot from another snapshot version")
+            return None
+        age = time.time() - float(snapshot.get("saved_at", 0))
+        if age > self._max_age_seconds:
+            logger.info("Ignoring session snapshot saved %.0fs ago", age)
+            return None
+        state = snapshot.get("state")
+        return state if isinstance(state, dict) else None
+
+
+def _largest_history(state: dict[str, Any]) -> int:
+    """Most history records in any one data layer of an exported state.
+
+    Args:
+        state: Output of DaemonController.export_state()
+
+    Returns:
+        Record count of the largest history (global or per session)
+    """
+    layers = [state, *state.get("sessions", {}).values()]
+    return max(len(layer["handler_history"]["records"]) for layer in layers)
+
+
+def _encode(snapshot: dict[str, Any]) -> bytes:
+    """Serialise a snapshot compactly.
+
+    Args:
+        snapshot: Snapshot envelope
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return json.dumps(snapshot, separators=(",", ":")).encode()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file under a temporary name, then rename it into place.
+
+    Args:
+        path: Destination path
+        data: File contents
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        tmp_path.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
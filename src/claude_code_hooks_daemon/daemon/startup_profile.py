@@ -0,0 +1,347 @@
+"""Daemon cold-start breakdown.
+
+The first hook after an idle timeout waits for the daemon to cold start:
+``ensure_daemon`` blocks while the new process imports its dependencies,
+loads config and builds every handler. This module measures where that
+time goes.
+
+``run_startup_profile()`` starts a fresh interpreter with ``-X importtime``
+which performs the same steps as ``start`` (package import, config load,
+``build_controller``) and prints phase timings as JSON. The parent
+merges those with the import-time tree from stderr:
+
+- **imports**: grouped into pydantic, yaml, jsonschema, psutil, handler
+  modules and the rest of the daemon, plus a per-handler-module breakdown
+- **phases**: config load, ``HandlerRegistry.discover``/``register_all``,
+  plugin and project-handler loading, pseudo-events,
+  ``ClaudeMdInjector.inject`` and ``_validate_config``
+- **handler constructors**: time spent in each handler's ``__init__``
+
+DaemonController imports StartupTimings from here, so this module must
+stay stdlib-only at import time.
+"""
+
+import json
+import subprocess  # nosec B404 - runs the current interpreter on this module only
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Startup budget enforced by tests and startup-profile: cold start (first
+# daemon import to initialised controller) and any single handler constructor
+STARTUP_BUDGET_MS = 2500.0
+HANDLER_INIT_BUDGET_MS = 50.0
+
+# Child process timeout
+_PROFILE_TIMEOUT_SECONDS = 120
+
+# Child entry point; the clock starts before the daemon package is imported
+_CHILD_SCRIPT = (
+    "import sys, time; started = time.perf_counter(); "
+    "from pathlib import Path; "
+    "from claude_code_hooks_daemon.daemon.startup_profile import _child_main; "
+    "sys.exit(_child_main(Path(sys.argv[1]), started))"
+)
+
+# Import groups, matched by module-name prefix in order; a module without
+# a matching prefix inherits the group of the module that imported it
+IMPORT_GROUPS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("pydantic", ("pydantic", "pydantic_core", "annotated_types", "typing_inspection")),
+    ("yaml", ("yaml", "_yaml")),
+    (
+        "jsonschema",
+        ("jsonschema", "jsonschema_specifications", "referencing", "rpds", "attrs", "attr"),
+    ),
+    ("psutil", ("psutil",)),
+    ("handlers", ("claude_code_hooks_daemon.handlers",)),
+    ("daemon", ("claude_code_hooks_daemon",)),
+)
+OTHER_IMPORT_GROUP = "other"
+
+_HANDLER_MODULE_PREFIX = "claude_code_hooks_daemon.handlers."
+_IMPORTTIME_PREFIX = "import time:"
+
+
+class StartupTimings:
+    """Ordered phase and handler-constructor timings for one startup.
+
+    DaemonController records into an instance of this class on every
+    initialise(), so the numbers are available to the profiler and to any
+    other caller that wants to inspect how startup was spent.
+    """
+
+    __slots__ = ("handler_init_ms", "phases_ms")
+
+    def __init__(self) -> None:
+        """Initialise empty timings."""
+        self.phases_ms: dict[str, float] = {}
+        self.handler_init_ms: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase.
+
+        Args:
+            name: Phase name (repeated names accumulate)
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.phases_ms[name] = self.phases_ms.get(name, 0.0) + elapsed_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary.
+
+        Returns:
+            Phase and handler constructor timings in milliseconds
+        """
+        return {
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases_ms.items()},
+            "handler_init_ms": {name: round(ms, 3) for name, ms in self.handler_init_ms.items()},
+        }
+
+
+@dataclass(slots=True)
+class _ImportNode:
+    """One line of ``-X importtime`` output with its children."""
+
+    name: str
+    level: int
+    self_us: int
+    cumulative_us: int
+    children: list["_ImportNode"] = field(default_factory=list)
+
+
+def _import_group(module: str) -> str | None:
+    """Get the import group a module name belongs to.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Group name, or None when no prefix matches
+    """
+    for group, prefixes in IMPORT_GROUPS:
+        for prefix in prefixes:
+            if module == prefix or module.startswith(f"{prefix}."):
+                return group
+    return None
+
+
+def _parse_import_tree(stderr: str) -> list[_ImportNode]:
+    """Parse ``-X importtime`` output into a forest of import nodes.
+
+    importtime prints a module after all of its children, indenting names
+    by two spaces per nesting level.
+
+    Args:
+        stderr: Child process stderr
+
+    Returns:
+        Top-level import nodes in import order
+    """
+    pending: list[_ImportNode] = []
+    for line in stderr.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(_IMPORTTIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        raw_name = fields[2].rstrip()
+        name = raw_name.lstrip()
+        level = (len(raw_name) - len(name) - 1) // 2
+        node = _ImportNode(name, level, int(fields[0]), int(fields[1]))
+        while pending and pending[-1].level > level:
+            node.children.insert(0, pending.pop())
+        pending.append(node)
+    return pending
+
+
+def parse_importtime(stderr: str) -> tuple[dict[str, float], dict[str, float]]:
+    """Summarise ``-X importtime`` output.
+
+    Each module's own (self) time is attributed to its group, or to the
+    group of its nearest grouped ancestor, so e.g. stdlib modules pulled in
+    by pydantic count towards pydantic.
+
+    Args:
+        stderr: Child process stderr
+
+    Returns:
+        Tuple of (group -> milliseconds, handler module -> cumulative milliseconds)
+    """
+    groups: dict[str, float] = {}
+    handler_modules: dict[str, float] = {}
+
+    def visit(node: _ImportNode, inherited: str) -> None:
+        group = _import_group(node.name) or inherited
+        groups[group] = groups.get(group, 0.0) + node.self_us / 1000
+        if node.name.startswith(_HANDLER_MODULE_PREFIX) and node.name.count(".") >= 3:
+            handler_modules[node.name] = node.cumulative_us / 1000
+        for child in node.children:
+            visit(child, group)
+
+    for root in _parse_import_tree(stderr):
+        visit(root, OTHER_IMPORT_GROUP)
+
+    return (
+        {group: round(ms, 3) for group, ms in groups.items()},
+        {module: round(ms, 3) for module, ms in handler_modules.items()},
+    )
+
+
+@dataclass(slots=True)
+class StartupProfile:
+    """Cold-start breakdown for one project.
+
+    Attributes:
+        process_wall_ms: Wall time of the whole child process, interpreter included
+        total_ms: Time from the first daemon import to an initialised controller
+        phases_ms: Startup phase -> milliseconds, in execution order
+        handler_init_ms: Handler class -> constructor milliseconds
+        imports_ms: Import group -> milliseconds
+        handler_modules_ms: Handler module -> cumulative import milliseconds
+    """
+
+    process_wall_ms: float
+    total_ms: float
+    phases_ms: dict[str, float]
+    handler_init_ms: dict[str, float]
+    imports_ms: dict[str, float]
+    handler_modules_ms: dict[str, float]
+
+    @property
+    def import_total_ms(self) -> float:
+        """Get total import time across all groups."""
+        return sum(self.imports_ms.values())
+
+    def over_budget(
+        self,
+        budget_ms: float = STARTUP_BUDGET_MS,
+        handler_budget_ms: float = HANDLER_INIT_BUDGET_MS,
+    ) -> list[str]:
+        """List startup budget violations.
+
+        Args:
+            budget_ms: Maximum total startup time
+            handler_budget_ms: Maximum time for any single handler constructor
+
+        Returns:
+            Human-readable violations (empty when within budget)
+        """
+        violations = []
+        if self.total_ms > budget_ms:
+            violations.append(f"startup took {self.total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+        for name, ms in sorted(self.handler_init_ms.items()):
+            if ms > handler_budget_ms:
+                violations.append(
+                    f"{name}.__init__ took {ms:.1f}ms (budget {handler_budget_ms:.0f}ms)"
+                )
+        return violations
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary.
+
+        Returns:
+            Profile dictionary
+        """
+        return {
+            "process_wall_ms": round(self.process_wall_ms, 3),
+            "total_ms": round(self.total_ms, 3),
+            "import_total_ms": round(self.import_total_ms, 3),
+            "imports_ms": self.imports_ms,
+            "phases_ms": self.phases_ms,
+            "handler_init_ms": self.handler_init_ms,
+            "handler_modules_ms": self.handler_modules_ms,
+        }
+
+
+def run_startup_profile(project_path: Path, python: str = sys.executable) -> StartupProfile:
+    """Profile a cold daemon start for a project in a fresh interpreter.
+
+    The child performs the same steps as ``start`` does before serving,
+    including the CLAUDE.md guidance injection.
+
+    Args:
+        project_path: Project root containing .claude/hooks-daemon.yaml
+        python: Interpreter to profile with
+
+    Returns:
+        Startup profile
+
+    Raises:
+        RuntimeError: If the child process fails
+    """
+    command = [python, "-X", "importtime", "-c", _CHILD_SCRIPT, str(project_path)]
+    start = time.perf_counter()
+    result = subprocess.run(  # nosec B603 - fixed interpreter and module
+        command,
+        capture_output=True,
+        text=True,
+        timeout=_PROFILE_TIMEOUT_SECONDS,
+        check=False,
+    )
+    process_wall_ms = (time.perf_counter() - start) * 1000
+
+    if result.returncode != 0 or not result.stdout.strip():
+        error_lines = [
+            line for line in result.stderr.splitlines() if not line.startswith(_IMPORTTIME_PREFIX)
+        ]
+        raise RuntimeError(
+            f"Startup profile failed (exit {result.returncode}): "
+            + ("\n".join(error_lines[-10:]) or "no output")
+        )
+
+    child = json.loads(result.stdout.strip().splitlines()[-1])
+    imports_ms, handler_modules_ms = parse_importtime(result.stderr)
+    return StartupProfile(
+        process_wall_ms=process_wall_ms,
+        total_ms=child["total_ms"],
+        phases_ms=child["phases_ms"],
+        handler_init_ms=child["handler_init_ms"],
+        imports_ms=imports_ms,
+        handler_modules_ms=handler_modules_ms,
+    )
+
+
+def _child_main(project_path: Path, started: float) -> int:
+    """Run the startup steps and print timings as JSON (child process).
+
+    Args:
+        project_path: Project root
+        started: perf_counter() value taken before the daemon package was imported
+
+    Returns:
+        Exit code
+    """
+    timings = StartupTimings()
+    timings.phases_ms["import_package"] = (time.perf_counter() - started) * 1000
+
+    with timings.phase("import_config"):
+        from claude_code_hooks_daemon.config.models import Config
+    with timings.phase("config_load"):
+        config = Config.find_and_load(project_path)
+    with timings.phase("import_controller"):
+        from claude_code_hooks_daemon.daemon.bootstrap import build_controller
+        from claude_code_hooks_daemon.daemon.controller import DaemonController  # noqa: F401
+
+    controller = build_controller(config, project_path)
+    total_ms = (time.perf_counter() - started) * 1000
+
+    controller_timings = controller.startup_timings.to_dict()
+    output = {
+        "total_ms": round(total_ms, 3),
+        "phases_ms": {**timings.to_dict()["phases_ms"], **controller_timings["phases_ms"]},
+        "handler_init_ms": controller_timings["handler_init_ms"],
+    }
+    print(json.dumps(output))
+    return 0
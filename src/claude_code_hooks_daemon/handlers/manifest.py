@@ -0,0 +1,293 @@
+"""Prebuilt manifest of built-in handlers.
+
+Scanning the handler tree means importing every handler module (and each
+one's strategy registries) just to find out which classes exist, even for
+handlers the project has disabled. The manifest records, per event
+section and config key, the module, class, event type, default tags and
+default priority of every built-in handler, so registration can apply
+config and tag filtering first and import only the handlers it keeps.
+
+The manifest is generated (``generate-handler-manifest``), shipped in the
+package as ``manifest.json`` and verified against the source tree by the
+test suite. At load time it is also checked against the event directory
+listings; if a handler module was added or removed without regenerating,
+the registry logs a warning and falls back to a full scan.
+
+Manifest format (version 1)::
+
+    {
+        "version": 1,
+        "modules": {"pre_tool_use": ["absolute_path", ...], ...},
+        "handlers": {
+            "pre_tool_use": {
+                "destructive_git": {
+                    "module": "claude_code_hooks_daemon.handlers.pre_tool_use.destructive_git",
+                    "class": "DestructiveGitHandler",
+                    "event_type": "PreToolUse",
+                    "tags": ["safety", "git", ...],
+                    "priority": 10
+                }
+            }
+        }
+    }
+"""
+
+import importlib
+import inspect
+import json
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from claude_code_hooks_daemon.core.handler import Handler
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+_HANDLERS_PACKAGE = "claude_code_hooks_daemon.handlers"
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """One built-in handler recorded in the manifest.
+
+    Attributes:
+        config_key: Handler config key within its event section
+        module: Dotted module path defining the handler
+        class_name: Handler class name
+        event_type: Hook event name (EventType value)
+        tags: Default tags set by the handler constructor
+        priority: Default priority set by the handler constructor
+    """
+
+    config_key: str
+    module: str
+    class_name: str
+    event_type: str
+    tags: tuple[str, ...]
+    priority: int
+
+    def load_class(self) -> type[Handler]:
+        """Import the module and return the handler class.
+
+        Returns:
+            Handler class
+
+        Raises:
+            ImportError: If the module cannot be imported
+            TypeError: If the attribute is not a Handler subclass
+        """
+        attr = getattr(importlib.import_module(self.module), self.class_name, None)
+        if not (isinstance(attr, type) and issubclass(attr, Handler)):
+            raise TypeError(f"{self.module}.{self.class_name} is not a Handler subclass")
+        return attr
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerManifest:
+    """All built-in handlers, grouped by event section.
+
+    Attributes:
+        handlers: Event section (e.g. "pre_tool_use") -> config key -> entry
+        modules: Event section -> module stems present when generated
+    """
+
+    handlers: dict[str, dict[str, ManifestEntry]]
+    modules: dict[str, tuple[str, ...]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the versioned JSON format.
+
+        Returns:
+            JSON-serialisable manifest dictionary
+        """
+        return {
+            "version": MANIFEST_VERSION,
+            "modules": {section: list(stems) for section, stems in self.modules.items()},
+            "handlers": {
+                section: {
+                    key: {
+                        "module": entry.module,
+                        "class": entry.class_name,
+                        "event_type": entry.event_type,
+                        "tags": list(entry.tags),
+                        "priority": entry.priority,
+                    }
+                    for key, entry in entries.items()
+                }
+                for section, entries in self.handlers.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HandlerManifest":
+        """Build a manifest from its JSON form.
+
+        Args:
+            data: Parsed manifest JSON
+
+        Returns:
+            HandlerManifest
+
+        Raises:
+            ValueError: If the version is unsupported or the structure is invalid
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Invalid handler manifest: expected a JSON object")
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported handler manifest version: {data.get('version')!r}")
+        try:
+            handlers = {
+                section: {
+                    key: ManifestEntry(
+                        config_key=key,
+                        module=raw["module"],
+                        class_name=raw["class"],
+                        event_type=raw["event_type"],
+                        tags=tuple(raw["tags"]),
+                        priority=int(raw["priority"]),
+                    )
+                    for key, raw in entries.items()
+                }
+                for section, entries in data["handlers"].items()
+            }
+            modules = {section: tuple(stems) for section, stems in data["modules"].items()}
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid handler manifest: {e}") from e
+        return cls(handlers=handlers, modules=modules)
+
+    def is_current(self, handlers_dir: Path) -> bool:
+        """Check that the event directories still contain the recorded modules.
+
+        Args:
+            handlers_dir: Directory of the handlers package
+
+        Returns:
+            True if every event section lists exactly the modules on disk
+        """
+        return all(
+            _module_stems(handlers_dir / section) == stems
+            for section, stems in self.modules.items()
+        )
+
+
+def _module_stems(event_dir: Path) -> tuple[str, ...]:
+    """List the handler module stems in an event directory.
+
+    Args:
+        event_dir: Event handler directory
+
+    Returns:
+        Sorted module stems, skipping private modules
+    """
+    if not event_dir.is_dir():
+        return ()
+    return tuple(sorted(p.stem for p in event_dir.glob("*.py") if not p.name.startswith("_")))
+
+
+def handler_classes(module: ModuleType) -> Iterator[type[Handler]]:
+    """Yield the concrete public Handler subclasses found in a module.
+
+    Args:
+        module: Imported handler module
+
+    Yields:
+        Handler classes
+    """
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (
+            isinstance(attr, type)
+            and issubclass(attr, Handler)
+            and attr is not Handler
+            and not attr.__name__.startswith("_")
+            and not inspect.isabstract(attr)
+        ):
+            yield attr
+
+
+def build_manifest(handlers_dir: Path | None = None) -> HandlerManifest:
+    """Scan the handler tree and build a manifest.
+
+    Imports and instantiates every built-in handler to read its default
+    tags and priority, so ProjectContext must be initialised.
+
+    Args:
+        handlers_dir: Directory of the handlers package (defaults to this package)
+
+    Returns:
+        HandlerManifest
+    """
+    # Imported lazily: registry imports this module for load_manifest()
+    from claude_code_hooks_daemon.handlers.registry import EVENT_TYPE_MAPPING, _get_config_key
+
+    handlers_dir = handlers_dir or Path(__file__).parent
+    handlers: dict[str, dict[str, ManifestEntry]] = {}
+    modules: dict[str, tuple[str, ...]] = {}
+
+    for section, event_type in EVENT_TYPE_MAPPING.items():
+        stems = _module_stems(handlers_dir / section)
+        if not stems:
+            continue
+        modules[section] = stems
+        entries: dict[str, ManifestEntry] = {}
+        for stem in stems:
+            module_name = f"{_HANDLERS_PACKAGE}.{section}.{stem}"
+            for handler_class in handler_classes(importlib.import_module(module_name)):
+                # Handler subclasses override __init__ with no args
+                instance = handler_class()
+                config_key = _get_config_key(handler_class.__name__)
+                entries[config_key] = ManifestEntry(
+                    config_key=config_key,
+                    module=module_name,
+                    class_name=handler_class.__name__,
+                    event_type=event_type.value,
+                    tags=tuple(instance.tags),
+                    priority=instance.priority,
+                )
+        handlers[section] = dict(sorted(entries.items()))
+
+    return HandlerManifest(handlers=handlers, modules=modules)
+
+
+def write_manifest(manifest: HandlerManifest, path: Path = MANIFEST_PATH) -> None:
+    """Write a manifest as formatted JSON.
+
+    Args:
+        manifest: Manifest to write
+        path: Destination path
+    """
+    path.write_text(json.dumps(manifest.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> HandlerManifest | None:
+    """Load the shipped manifest if it is present, valid and current.
+
+    Args:
+        path: Manifest path
+
+    Returns:
+        HandlerManifest, or None when the caller should fall back to scanning
+    """
+    try:
+        manifest = HandlerManifest.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        logger.debug("No handler manifest at %s", path)
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring handler manifest %s: %s", path, e)
+        return None
+
+    if not manifest.is_current(path.parent):
+        logger.warning(
+            "Handler manifest %s is out of date with the handler tree - scanning instead. "
+            "Run 'generate-handler-manifest' to refresh it.",
+            path,
+        )
+        return None
+    return manifest
@@ -9,7 +9,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, Handler, HookResult, append_line, defer
 
 
 class NotificationLoggerHandler(Handler):
@@ -40,7 +40,7 @@ class NotificationLoggerHandler(Handler):
         return True
 
     def handle(self, hook_input: dict[str, Any]) -> HookResult:
-        """Log notification to file.
+        """Log notification to file, after the response is sent.
 
         Args:
             hook_input: Hook input dictionary from Claude Code
@@ -48,25 +48,19 @@ class NotificationLoggerHandler(Handler):
         Returns:
             HookResult with allow decision (silent logging)
         """
-        try:
-            # Create log directory
-            log_dir = Path("untracked/logs/hooks")
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            # Build log entry
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                **hook_input,  # Include all notification fields
-            }
-
-            # Write to JSONL file (one JSON object per line)
-            log_file = log_dir / "notifications.jsonl"
-            with log_file.open("a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-
-        except OSError as e:
-            logger.warning("Failed to write notification log: %s", e)
-
+        # Build log entry
+        log_entry = {
+            "timestamp": datetime.now().isoformat(),
+            **hook_input,  # Include all notification fields
+        }
+        log_line = json.dumps(log_entry)
+
+        def write_log() -> None:
+            # Append to JSONL file (one JSON object per line); a write error
+            # is logged and counted by the deferred worker
+            append_line(Path("untracked/logs/hooks/notifications.jsonl"), log_line)
+
+        defer(write_log)
         return HookResult(decision=Decision.ALLOW)
 
     def get_claude_md(self) -> str | None:
@@ -1,10 +1,14 @@
 """LintOnEditHandler - runs language-aware lint validation after Write/Edit.
 
 Uses Strategy Pattern: all language-specific logic is delegated to LintStrategy
-implementations. The handler itself has ZERO language awareness.
+implementations. The handler itself has ZERO language awareness. Lint tools
+run as async subprocesses on the daemon's event loop, the default and
+extended commands concurrently. Verdicts are cached by content (see
+strategies.lint.service), so re-saving unchanged content never re-lints.
 """
 
-import subprocess  # nosec B404 - subprocess used for lint validation only (trusted tools)
+import asyncio
+import subprocess  # nosec B404 - only for TimeoutExpired
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -16,17 +20,24 @@ from claude_code_hooks_daemon.constants import (
     Timeout,
     ToolName,
 )
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, HookResult
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, run_process
 from claude_code_hooks_daemon.core.utils import get_file_path
 from claude_code_hooks_daemon.strategies.lint.common import matches_skip_path
 from claude_code_hooks_daemon.strategies.lint.protocol import LintStrategy
 from claude_code_hooks_daemon.strategies.lint.registry import LintStrategyRegistry
+from claude_code_hooks_daemon.strategies.lint.service import (
+    LintService,
+    compile_python,
+    is_py_compile,
+    lint_cache_key,
+)
 
 # Placeholder for file path in lint commands
 _FILE_PLACEHOLDER = "{file}"
 
 
-class LintOnEditHandler(Handler):
+class LintOnEditHandler(AsyncHandler):
     """Run language-aware lint validation on files after Write/Edit.
 
     Uses Strategy Pattern: delegates ALL language-specific decisions to LintStrategy
@@ -57,6 +68,7 @@ class LintOnEditHandler(Handler):
             ],
         )
         self._registry = LintStrategyRegistry.create_default()
+        self._lint_service = LintService()
         # Config options: set via setattr AFTER __init__
         self._languages: list[str] | None = None
         self._command_overrides: dict[str, dict[str, str | None]] | None = None
@@ -96,7 +108,7 @@ class LintOnEditHandler(Handler):
         # File must exist (PostToolUse runs after write)
         return Path(file_path).exists()
 
-    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
         """Run lint commands and deny if errors found."""
         file_path = get_file_path(hook_input)
         if not file_path:
@@ -108,19 +120,20 @@ class LintOnEditHandler(Handler):
 
         # Get lint commands (config overrides take priority)
         default_cmd, extended_cmd = self._get_lint_commands(strategy)
+        commands = [default_cmd] if not extended_cmd else [default_cmd, extended_cmd]
 
-        # Run default lint command
-        default_result = self._run_lint_command(default_cmd, file_path, strategy.language_name)
-        if default_result is not None:
-            return default_result
+        # Run default and extended lint commands concurrently
+        results = await asyncio.gather(
+            *(self._run_lint_command(cmd, file_path, strategy.language_name) for cmd in commands)
+        )
 
-        # Run extended lint command if configured and default passed
-        if extended_cmd:
-            extended_result = self._run_lint_command(
-                extended_cmd, file_path, strategy.language_name
-            )
-            if extended_result is not None:
-                return extended_result
+        # Lint errors first (default before extended), then advisories
+        for result in results:
+            if result is not None and result.decision == Decision.DENY:
+                return result
+        for result in results:
+            if result is not None:
+                return result
 
         return HookResult(decision=Decision.ALLOW)
 
@@ -159,11 +172,14 @@ class LintOnEditHandler(Handler):
         "Go": "go.mod",
     }
 
-    def _run_lint_command(
+    async def _run_lint_command(
         self, command_template: str, file_path: str, language_name: str
     ) -> HookResult | None:
         """Run a lint command and return HookResult if it fails, None if it passes.
 
+        Verdicts come from the lint service's cache when the linted content
+        and lint config are unchanged since an earlier run.
+
         Returns:
             HookResult with DENY if lint fails, None if lint passes.
             HookResult with ALLOW if linter not found or times out (graceful degradation).
@@ -188,10 +204,46 @@ class LintOnEditHandler(Handler):
         # SECURITY: These are trusted lint tools defined in strategy constants
         command_parts = command.split()
 
+        target = Path(file_path) if effective_path == file_path else Path(file_path).parent
+        key = lint_cache_key(command, target, suffix=Path(file_path).suffix)
+        return await self._lint_service.run(
+            key,
+            lambda: self._execute_lint(
+                command, command_parts, file_path, language_name, working_dir
+            ),
+        )
+
+    async def _execute_lint(
+        self,
+        command: str,
+        command_parts: list[str],
+        file_path: str,
+        language_name: str,
+        working_dir: str | None,
+    ) -> HookResult | None:
+        """Run one lint command (no caching).
+
+        Returns:
+            HookResult with DENY if lint fails, None if lint passes.
+            HookResult with ALLOW if linter not found or times out (graceful degradation).
+        """
+        if is_py_compile(command_parts):
+            # Syntax check in-process instead of starting an interpreter. A
+            # file removed since the edit has nothing left to check; any other
+            # read error fails the check with the message py_compile prints
+            try:
+                compile_error = await asyncio.to_thread(compile_python, file_path)
+            except FileNotFoundError:
+                compile_error = None
+            except OSError as e:
+                compile_error = str(e)
+            if compile_error is None:
+                return None
+            return self._lint_failed(language_name, file_path, compile_error, command)
+
         try:
-            result = subprocess.run(  # nosec B603 - lint tools are trusted, file path from hook
+            result = await run_process(
                 command_parts,
-                capture_output=True,
                 text=True,
                 timeout=Timeout.LINT_CHECK,
                 cwd=working_dir,
@@ -204,15 +256,7 @@ class LintOnEditHandler(Handler):
                         error_output + "\n" + result.stderr if error_output else result.stderr
                     )
 
-                return HookResult(
-                    decision=Decision.DENY,
-                    reason=(
-                        f"{language_name} lint FAILED for {Path(file_path).name}\n\n"
-                        f"{error_output}\n\n"
-                        f"Fix the lint errors before continuing.\n"
-                        f"Command: {command}"
-                    ),
-                )
+                return self._lint_failed(language_name, file_path, error_output, command)
 
         except FileNotFoundError:
             # Linter not installed - advisory allow (visible in system-reminders)
@@ -231,6 +275,21 @@ class LintOnEditHandler(Handler):
 
         return None
 
+    @staticmethod
+    def _lint_failed(
+        language_name: str, file_path: str, error_output: str, command: str
+    ) -> HookResult:
+        """Build the DENY result for a failed lint command."""
+        return HookResult(
+            decision=Decision.DENY,
+            reason=(
+                f"{language_name} lint FAILED for {Path(file_path).name}\n\n"
+                f"{error_output}\n\n"
+                f"Fix the lint errors before continuing.\n"
+                f"Command: {command}"
+            ),
+        )
+
     def get_claude_md(self) -> str | None:
         return None
 
@@ -2,10 +2,16 @@
 
 When llm: commands exist in package.json, runs ESLint validation (enforcement mode).
 When llm: commands do NOT exist, skips validation and advises about creating llm:lint.
+ESLint runs as an async subprocess on the daemon's event loop, or - with the
+persistent_worker option - in a long-lived ESLint process shared by every write,
+with verdicts cached by file content.
 """
 
+import asyncio
+import logging
 import os
-import subprocess  # nosec B404 - subprocess used for eslint validation only (trusted tool)
+import subprocess  # nosec B404 - only for TimeoutExpired
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -18,13 +24,26 @@ from claude_code_hooks_daemon.constants import (
     ToolName,
 )
 from claude_code_hooks_daemon.constants.paths import ProjectPath
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult, ProjectContext
+from claude_code_hooks_daemon.core import Decision, HookResult, ProjectContext
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, run_process
 from claude_code_hooks_daemon.core.utils import get_file_path
+from claude_code_hooks_daemon.strategies.lint.eslint_worker import (
+    DEFAULT_DEBOUNCE_SECONDS,
+    ESLINT_CONFIG_FILES,
+    EslintWorkerError,
+    get_eslint_worker,
+)
+from claude_code_hooks_daemon.strategies.lint.service import LintService, lint_cache_key
 from claude_code_hooks_daemon.utils.guides import get_llm_command_guide_path
 from claude_code_hooks_daemon.utils.npm import has_llm_commands_in_package_json
 
+logger = logging.getLogger(__name__)
+
+# Cache key command for verdicts from the persistent worker ({file} = resolved path)
+_WORKER_CACHE_COMMAND = "eslint-worker --max-warnings 0 {file}"
 
-class ValidateEslintOnWriteHandler(Handler):
+
+class ValidateEslintOnWriteHandler(AsyncHandler):
     """Run ESLint validation on TypeScript/TSX files after write."""
 
     VALIDATE_EXTENSIONS: ClassVar[list[str]] = [".ts", ".tsx"]
@@ -55,6 +74,10 @@ class ValidateEslintOnWriteHandler(Handler):
             Path(workspace_root) if workspace_root else ProjectContext.project_root()
         )
         self.has_llm_commands: bool = has_llm_commands_in_package_json()
+        # Options (set by the registry from config)
+        self._persistent_worker: bool = False
+        self._debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS
+        self._lint_service = LintService()
 
     def matches(self, hook_input: dict[str, Any]) -> bool:
         """Check if writing TypeScript/TSX file that needs validation."""
@@ -78,7 +101,7 @@ class ValidateEslintOnWriteHandler(Handler):
         file_path_obj = Path(file_path)
         return file_path_obj.exists()
 
-    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
         """Run ESLint on the file and block if errors found."""
         file_path = get_file_path(hook_input)
         if not file_path:
@@ -111,7 +134,10 @@ class ValidateEslintOnWriteHandler(Handler):
                 ),
             )
 
-        print(f"\n🔍 Running ESLint validation on {file_path_obj.name}...")
+        logger.debug("Running ESLint validation on %s", file_path_obj.name)
+
+        if self._persistent_worker:
+            return await self._validate_with_worker(file_path)
 
         # Check if this is a worktree file (either manually managed or Claude Code managed)
         is_worktree = any(
@@ -139,42 +165,20 @@ class ValidateEslintOnWriteHandler(Handler):
                 env["PATH"] = str(bin_path) + os.pathsep + env.get("PATH", "")
 
             if is_worktree:
-                print("  [Detected worktree file - using ESLint wrapper for consistent config]")
-
-            result = (
-                subprocess.run(  # nosec B603 - eslint/npx are trusted tools, file path validated
-                    command,
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=Timeout.ESLINT_CHECK,
-                    env=env,
-                )
+                logger.debug("Worktree file - using ESLint wrapper for consistent config")
+
+            result = await run_process(
+                command,
+                cwd=cwd,
+                text=True,
+                timeout=Timeout.ESLINT_CHECK,
+                env=env,
             )
 
             if result.returncode != 0:
-                error_message = (
-                    f"ESLint validation FAILED for {file_path}\n\n"
-                    + "=" * 80
-                    + "\n"
-                    + result.stdout
-                    + "\n"
-                )
-
-                if result.stderr:
-                    error_message += result.stderr + "\n"
-
-                error_message += (
-                    "=" * 80 + "\n\n"
-                    "🚫 FILE WAS WRITTEN BUT HAS ESLINT ERRORS!\n"
-                    "   You MUST fix these errors before continuing.\n\n"
-                    f"   Run: npx eslint {file_path} --fix\n"
-                    "   Or:  npm run lint -- --fix\n"
-                )
-
-                return HookResult(decision=Decision.DENY, reason=error_message)
-
-            print(f"✅ ESLint validation passed for {file_path_obj.name}\n")
+                return self._eslint_failed(file_path, result.stdout, result.stderr)
+
+            logger.debug("ESLint validation passed for %s", file_path_obj.name)
             return HookResult(decision=Decision.ALLOW)
 
         except subprocess.TimeoutExpired:
@@ -185,6 +189,70 @@ class ValidateEslintOnWriteHandler(Handler):
         except Exception as e:
             return HookResult(decision=Decision.DENY, reason=f"Failed to run ESLint: {e!s}")
 
+    async def _validate_with_worker(self, file_path: str) -> HookResult:
+        """Lint a file with the workspace's persistent ESLint worker.
+
+        Verdicts are cached by file content and ESLint config mtimes, so
+        rewriting a file with already-checked content does not lint again.
+
+        Args:
+            file_path: File to lint
+
+        Returns:
+            DENY with ESLint's report if the file fails, else ALLOW
+        """
+        target = Path(file_path)
+        worker = get_eslint_worker(self.workspace_root, debounce_seconds=self._debounce_seconds)
+        # The path is part of the key: ESLint overrides and ignores are path-based,
+        # and the verdict names the file
+        command = _WORKER_CACHE_COMMAND.format(file=target.resolve())
+
+        def cache_key() -> Hashable | None:
+            return lint_cache_key(command, target, config_names=ESLINT_CONFIG_FILES)
+
+        async def lint() -> HookResult | None:
+            # Shielded: the pending result may be shared with other writes of this file
+            result = await asyncio.shield(asyncio.wrap_future(worker.lint(file_path)))
+            if result.passed:
+                return None
+            return self._eslint_failed(file_path, result.output, "")
+
+        try:
+            verdict = await self._lint_service.run(cache_key(), lint, revalidate=cache_key)
+        except TimeoutError:
+            return HookResult(
+                decision=Decision.DENY,
+                reason=f"ESLint timed out after {Timeout.ESLINT_CHECK} seconds",
+            )
+        except EslintWorkerError as e:
+            return HookResult(decision=Decision.DENY, reason=f"Failed to run ESLint: {e!s}")
+        return verdict or HookResult(decision=Decision.ALLOW)
+
+    @staticmethod
+    def _eslint_failed(file_path: str, report: str, stderr: str) -> HookResult:
+        """Build the DENY result for a file with ESLint errors.
+
+        Args:
+            file_path: File that failed
+            report: ESLint's report
+            stderr: Extra diagnostics (may be empty)
+
+        Returns:
+            DENY with the report and fix instructions
+        """
+        error_message = f"ESLint validation FAILED for {file_path}\n\n" + "=" * 80 + "\n"
+        error_message += report + "\n"
+        if stderr:
+            error_message += stderr + "\n"
+        error_message += (
+            "=" * 80 + "\n\n"
+            "🚫 FILE WAS WRITTEN BUT HAS ESLINT ERRORS!\n"
+            "   You MUST fix these errors before continuing.\n\n"
+            f"   Run: npx eslint {file_path} --fix\n"
+            "   Or:  npm run lint -- --fix\n"
+        )
+        return HookResult(decision=Decision.DENY, reason=error_message)
+
     def get_claude_md(self) -> str | None:
         return None
 
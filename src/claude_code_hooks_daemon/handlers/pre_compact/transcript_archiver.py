@@ -9,7 +9,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 from claude_code_hooks_daemon.constants import DaemonPath, HandlerID, HandlerTag, Priority
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, Handler, HookResult, defer
 
 
 class TranscriptArchiverHandler(Handler):
@@ -40,7 +40,7 @@ class TranscriptArchiverHandler(Handler):
         return True
 
     def handle(self, hook_input: dict[str, Any]) -> HookResult:
-        """Archive transcript to file.
+        """Archive transcript to file, after the response is sent.
 
         Args:
             hook_input: Hook input dictionary from Claude Code
@@ -48,28 +48,26 @@ class TranscriptArchiverHandler(Handler):
         Returns:
             HookResult with allow decision (silent archiving)
         """
-        try:
-            # Create archive directory
-            archive_dir = Path(DaemonPath.UNTRACKED_DIR) / "transcripts"
-            archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_dir = Path(DaemonPath.UNTRACKED_DIR) / "transcripts"
 
-            # Generate timestamp filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            archive_file = archive_dir / f"transcript_{timestamp}.json"
+        # Generate timestamp filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        archive_file = archive_dir / f"transcript_{timestamp}.json"
 
-            # Build archive data
-            archive_data = {
-                "archived_at": datetime.now().isoformat(),
-                "transcript": hook_input.get("transcript", []),
-            }
+        # Build archive data
+        archive_data = {
+            "archived_at": datetime.now().isoformat(),
+            "transcript": hook_input.get("transcript", []),
+        }
 
+        def write_archive() -> None:
+            # A write error is logged and counted by the deferred worker
+            archive_dir.mkdir(parents=True, exist_ok=True)
             # Write to JSON file with pretty formatting
             with archive_file.open("w") as f:
                 json.dump(archive_data, f, indent=2)
 
-        except OSError as e:
-            logger.warning("Failed to archive transcript: %s", e)
-
+        defer(write_archive)
         return HookResult(decision=Decision.ALLOW)
 
     def get_claude_md(self) -> str | None:
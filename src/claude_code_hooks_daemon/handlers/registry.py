@@ -8,13 +8,24 @@ import importlib
 import inspect
 import logging
 import pkgutil
+import time
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from claude_code_hooks_daemon.constants import ConfigKey
 from claude_code_hooks_daemon.constants.handlers import HandlerID
+from claude_code_hooks_daemon.constants.priority import PriorityRange
 from claude_code_hooks_daemon.core.event import EventType
 from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.handlers.manifest import (
+    MANIFEST_PATH,
+    HandlerManifest,
+    handler_classes,
+    load_manifest,
+)
 
 if TYPE_CHECKING:
     from claude_code_hooks_daemon.core.router import EventRouter
@@ -37,6 +48,88 @@ EVENT_TYPE_MAPPING: dict[str, EventType] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _Candidate:
+    """A built-in handler that register_all() may register.
+
+    Attributes:
+        section: Event config section (e.g. "pre_tool_use")
+        event_type: Event the handler registers for
+        config_key: Handler config key within the section
+        class_name: Handler class name
+        tags: Default tags when known without importing (manifest), else None
+        priority: Default priority when known without importing (manifest), else None
+        load: Returns the handler class, importing its module if needed
+    """
+
+    section: str
+    event_type: EventType
+    config_key: str
+    class_name: str
+    tags: tuple[str, ...] | None
+    priority: int | None
+    load: Callable[[], type[Handler]]
+
+
+def _loaded_class(handler_class: type[Handler]) -> type[Handler]:
+    """Return an already imported handler class (scan-path candidate loader)."""
+    return handler_class
+
+
+def _tags_allowed(
+    tags: tuple[str, ...], enable_tags: list[str] | None, disable_tags: list[str]
+) -> bool:
+    """Check a handler's tags against an event section's tag filters.
+
+    Args:
+        tags: Handler tags
+        enable_tags: If set, at least one tag must be listed
+        disable_tags: No tag may be listed
+
+    Returns:
+        True if the handler passes both filters
+    """
+    if enable_tags and not any(tag in tags for tag in enable_tags):
+        return False
+    return not (disable_tags and any(tag in tags for tag in disable_tags))
+
+
+def _in_band(priority: int, critical: bool | None) -> bool:
+    """Check a handler priority against a progressive-startup band.
+
+    Args:
+        priority: Effective handler priority
+        critical: True for the critical band (<= PriorityRange.CRITICAL_MAX),
+            False for everything above it, None for all priorities
+
+    Returns:
+        True if the priority falls in the requested band
+    """
+    return critical is None or (priority <= PriorityRange.CRITICAL_MAX) == critical
+
+
+def _selected(
+    only: Mapping[str, Collection[str] | None] | None, section: str, config_key: str
+) -> bool:
+    """Check a handler against a config-reload selection.
+
+    Args:
+        only: Section -> config keys to register (None for the whole
+            section), or None to select every handler
+        section: Handler event section (e.g. "pre_tool_use")
+        config_key: Handler config key
+
+    Returns:
+        True if the handler is selected
+    """
+    if only is None:
+        return True
+    if section not in only:
+        return False
+    keys = only[section]
+    return keys is None or config_key in keys
+
+
 class HandlerRegistry:
     """Registry for discovering and managing handlers.
 
@@ -44,13 +137,14 @@ class HandlerRegistry:
     registers them with the event router.
     """
 
-    __slots__ = ("_disabled_handlers", "_handlers", "_workspace_root")
+    __slots__ = ("_disabled_handlers", "_handlers", "_manifest", "_workspace_root")
 
     def __init__(self) -> None:
         """Initialise empty registry."""
         self._handlers: dict[str, type[Handler]] = {}
         self._disabled_handlers: set[str] = set()
         self._workspace_root: Path | None = None
+        self._manifest: HandlerManifest | None = None
 
     def discover(self, package_path: str = "claude_code_hooks_daemon.handlers") -> int:
         """Discover all handler classes in the handlers package.
@@ -154,6 +248,74 @@ class HandlerRegistry:
         """
         return list(self._handlers.keys())
 
+    def load_manifest(self, path: Path = MANIFEST_PATH) -> bool:
+        """Use the prebuilt handler manifest for subsequent registration.
+
+        With a manifest loaded, register_all() applies config and tag
+        filtering before importing anything and imports only the handler
+        modules it keeps.
+
+        Args:
+            path: Manifest path (defaults to the shipped manifest)
+
+        Returns:
+            True if a current manifest was loaded, False to keep scanning
+        """
+        self._manifest = load_manifest(path)
+        return self._manifest is not None
+
+    def _collect_candidates(self) -> list["_Candidate"]:
+        """List registration candidates for every built-in handler.
+
+        Returns:
+            Candidates from the manifest when loaded, otherwise from a scan
+        """
+        if self._manifest is not None:
+            return [
+                _Candidate(
+                    section=section,
+                    event_type=event_type,
+                    config_key=config_key,
+                    class_name=entry.class_name,
+                    tags=entry.tags,
+                    priority=entry.priority,
+                    load=entry.load_class,
+                )
+                for section, event_type in EVENT_TYPE_MAPPING.items()
+                for config_key, entry in self._manifest.handlers.get(section, {}).items()
+            ]
+
+        candidates = []
+        handlers_dir = Path(__file__).parent
+        for section, event_type in EVENT_TYPE_MAPPING.items():
+            event_dir = handlers_dir / section
+            if not event_dir.is_dir():
+                continue
+
+            for py_file in event_dir.glob("*.py"):
+                if py_file.name.startswith("_"):
+                    continue
+
+                module_name = f"claude_code_hooks_daemon.handlers.{section}.{py_file.stem}"
+
+                # FAIL FAST: If a production handler fails to import, that's a critical error
+                # Test fixtures are loaded separately via plugins, not through this path
+                module = importlib.import_module(module_name)
+
+                for handler_class in handler_classes(module):
+                    candidates.append(
+                        _Candidate(
+                            section=section,
+                            event_type=event_type,
+                            config_key=_get_config_key(handler_class.__name__),
+                            class_name=handler_class.__name__,
+                            tags=None,
+                            priority=None,
+                            load=partial(_loaded_class, handler_class),
+                        )
+                    )
+        return candidates
+
     def register_all(
         self,
         router: "EventRouter",
@@ -162,6 +324,9 @@ class HandlerRegistry:
         workspace_root: Path | None = None,
         project_languages: list[str] | None = None,
         plan_workflow: Any = None,
+        handler_init_ms: dict[str, float] | None = None,
+        critical: bool | None = None,
+        only: Mapping[str, Collection[str] | None] | None = None,
     ) -> int:
         """Register all discovered handlers with the router.
 
@@ -169,12 +334,24 @@ class HandlerRegistry:
         1. First pass: collect all handler options into options_registry
         2. Second pass: instantiate handlers and apply inherited options
 
+        When a manifest is loaded (see load_manifest()), disabled and
+        tag-filtered handlers are skipped without importing their modules.
+
         Args:
             router: Event router to register handlers with
             config: Optional handler configuration from hooks-daemon.yaml
             workspace_root: Optional workspace root path for handlers
             project_languages: Project-level language filter from daemon.languages config
             plan_workflow: Optional PlanWorkflowConfig for plan-related handlers
+            handler_init_ms: Optional dict to record each handler constructor's
+                duration in milliseconds, keyed by class name
+            critical: Register only critical handlers (priority <=
+                PriorityRange.CRITICAL_MAX) when True, only the rest when
+                False, or all when None (used by progressive startup)
+            only: Register only these handlers: event section -> config keys,
+                with None meaning the whole section (used by config reload).
+                Options are still collected from every handler so shared
+                options resolve as in a full registration.
 
         Returns:
             Number of handlers registered
@@ -183,187 +360,170 @@ class HandlerRegistry:
         if workspace_root:
             self._workspace_root = workspace_root
 
+        # Candidates come from the prebuilt manifest (no imports yet) or from
+        # scanning the event directories (imports every module, once)
+        candidates = self._collect_candidates()
+
         # PASS 1: Collect all handler options
         options_registry: dict[str, dict[str, Any]] = {}
-        handlers_dir = Path(__file__).parent
 
-        for dir_name, event_type in EVENT_TYPE_MAPPING.items():
-            event_dir = handlers_dir / dir_name
-            if not event_dir.is_dir():
-                continue
-
-            event_config = (config or {}).get(dir_name) or {}
-
-            for py_file in event_dir.glob("*.py"):
-                if py_file.name.startswith("_"):
-                    continue
-
-                module_name = f"claude_code_hooks_daemon.handlers.{dir_name}.{py_file.stem}"
-
-                # FAIL FAST: If a production handler fails to import, that's a critical error
-                # Test fixtures are loaded separately via plugins, not through this path
-                module = importlib.import_module(module_name)
-
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, Handler)
-                        and attr is not Handler
-                        and not attr.__name__.startswith("_")
-                        and not inspect.isabstract(attr)
-                    ):
-                        config_key = _get_config_key(attr.__name__)
-                        handler_config = event_config.get(config_key, {})
-                        if handler_config.get(ConfigKey.ENABLED, True):
-                            # Use config key from HandlerID constant
-                            try:
-                                registry_key = f"{event_type.value}.{config_key}"
-                                options = handler_config.get(ConfigKey.OPTIONS, {})
-                                # Include workspace_root in options if available
-                                if self._workspace_root:
-                                    options["workspace_root"] = self._workspace_root
-                                options_registry[registry_key] = options
-                            except Exception:
-                                logger.debug(
-                                    "Failed to collect options for handler '%s': %s",
-                                    config_key,
-                                    exc_info=True,
-                                )
+        for candidate in candidates:
+            event_config = (config or {}).get(candidate.section) or {}
+            handler_config = event_config.get(candidate.config_key, {})
+            if handler_config.get(ConfigKey.ENABLED, True):
+                # Use config key from HandlerID constant
+                try:
+                    registry_key = f"{candidate.event_type.value}.{candidate.config_key}"
+                    # Copy: the caller's config is kept and diffed on hot reload
+                    options = dict(handler_config.get(ConfigKey.OPTIONS, {}))
+                    # Include workspace_root in options if available
+                    if self._workspace_root:
+                        options["workspace_root"] = self._workspace_root
+                    options_registry[registry_key] = options
+                except Exception:
+                    logger.debug(
+                        "Failed to collect options for handler '%s': %s",
+                        candidate.config_key,
+                        exc_info=True,
+                    )
 
         # PASS 2: Register handlers with inherited options
         count = 0
 
-        for dir_name, event_type in EVENT_TYPE_MAPPING.items():
-            event_dir = handlers_dir / dir_name
-            if not event_dir.is_dir():
-                continue
+        for candidate in candidates:
+            event_type = candidate.event_type
 
             # Get configuration for this event type
-            event_config = (config or {}).get(dir_name) or {}
+            event_config = (config or {}).get(candidate.section) or {}
 
             # Extract tag filters from event config
-            enable_tags = event_config.get(ConfigKey.ENABLE_TAGS)
+            enable_tags_raw: Any = event_config.get(ConfigKey.ENABLE_TAGS)
+            enable_tags: list[str] | None = (
+                enable_tags_raw if isinstance(enable_tags_raw, list) else None
+            )
             disable_tags_raw: Any = event_config.get(ConfigKey.DISABLE_TAGS, [])
             disable_tags: list[str] = disable_tags_raw if isinstance(disable_tags_raw, list) else []
 
-            # Find all Python files in the directory
-            for py_file in event_dir.glob("*.py"):
-                if py_file.name.startswith("_"):
+            # Check handler-specific config (use config key from HandlerID constant)
+            config_key = candidate.config_key
+            handler_config = event_config.get(config_key, {})
+
+            if not _selected(only, candidate.section, config_key):
+                continue
+
+            # Skip disabled handlers
+            if not handler_config.get(ConfigKey.ENABLED, True):
+                logger.debug("Handler %s is disabled", candidate.class_name)
+                continue
+
+            if self.is_disabled(candidate.class_name):
+                logger.debug("Handler %s is disabled in registry", candidate.class_name)
+                continue
+
+            # Manifest entries carry default tags, so tag filtering happens
+            # before the handler module is ever imported
+            if candidate.tags is not None and not _tags_allowed(
+                candidate.tags, enable_tags, disable_tags
+            ):
+                logger.debug("Handler %s skipped by tag filters", candidate.class_name)
+                continue
+
+            # Likewise the priority band, honouring any config override
+            config_priority = handler_config.get(ConfigKey.PRIORITY)
+            known_priority = config_priority if config_priority is not None else candidate.priority
+            if known_priority is not None and not _in_band(known_priority, critical):
+                continue
+
+            try:
+                attr = candidate.load()
+            except Exception as e:
+                logger.warning("Failed to import %s: %s", candidate.class_name, e)
+                continue
+
+            try:
+                # Instantiate and register
+                # Handler subclasses override __init__ with no args
+                init_start = time.perf_counter()
+                instance = attr()
+                if handler_init_ms is not None:
+                    handler_init_ms[attr.__name__] = (time.perf_counter() - init_start) * 1000
+
+                # Tag-based filtering
+                if enable_tags and not any(tag in instance.tags for tag in enable_tags):
+                    logger.debug(
+                        "Handler %s skipped - no matching tags in enable_tags %s",
+                        attr.__name__,
+                        enable_tags,
+                    )
                     continue
 
-                module_name = f"claude_code_hooks_daemon.handlers.{dir_name}.{py_file.stem}"
+                if disable_tags and any(tag in instance.tags for tag in disable_tags):
+                    logger.debug(
+                        "Handler %s skipped - has tag in disable_tags %s",
+                        attr.__name__,
+                        disable_tags,
+                    )
+                    continue
 
-                try:
-                    module = importlib.import_module(module_name)
-                except Exception as e:
-                    logger.warning("Failed to import %s: %s", module_name, e)
+                # Override priority from config if specified and not None
+                # (PyYAML parses 'priority:' with no value as None — Plan 00070)
+                if config_priority is not None:
+                    instance.priority = config_priority
+
+                if not _in_band(instance.priority, critical):
                     continue
 
-                # Find Handler subclasses in the module
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, Handler)
-                        and attr is not Handler
-                        and not attr.__name__.startswith("_")
-                        and not inspect.isabstract(attr)
-                    ):
-                        # Check handler-specific config (use config key from HandlerID constant)
-                        config_key = _get_config_key(attr.__name__)
-                        handler_config = event_config.get(config_key, {})
-
-                        # Skip disabled handlers
-                        if not handler_config.get(ConfigKey.ENABLED, True):
-                            logger.debug("Handler %s is disabled", attr.__name__)
-                            continue
-
-                        if self.is_disabled(attr.__name__):
-                            logger.debug("Handler %s is disabled in registry", attr.__name__)
-                            continue
-
-                        try:
-                            # Instantiate and register
-                            # Handler subclasses override __init__ with no args
-                            instance = attr()
-
-                            # Tag-based filtering
-                            if enable_tags and not any(tag in instance.tags for tag in enable_tags):
-                                logger.debug(
-                                    "Handler %s skipped - no matching tags in enable_tags %s",
-                                    attr.__name__,
-                                    enable_tags,
-                                )
-                                continue
-
-                            if disable_tags and any(tag in instance.tags for tag in disable_tags):
-                                logger.debug(
-                                    "Handler %s skipped - has tag in disable_tags %s",
-                                    attr.__name__,
-                                    disable_tags,
-                                )
-                                continue
-
-                            # Override priority from config if specified and not None
-                            # (PyYAML parses 'priority:' with no value as None — Plan 00070)
-                            config_priority = handler_config.get(ConfigKey.PRIORITY)
-                            if config_priority is not None:
-                                instance.priority = config_priority
-
-                            # Apply options inheritance if handler shares options with parent
-                            registry_key = f"{event_type.value}.{config_key}"
-                            handler_options = options_registry.get(registry_key, {})
-
-                            if instance.shares_options_with:
-                                # Get parent options
-                                parent_key = f"{event_type.value}.{instance.shares_options_with}"
-                                parent_options = options_registry.get(parent_key, {})
-                                # Merge: parent options + child overrides
-                                merged_options = {**parent_options, **handler_options}
-                            else:
-                                merged_options = handler_options
-
-                            # Apply all options as private attributes (generic for all handlers)
-                            for option_key, option_value in merged_options.items():
-                                setattr(instance, f"_{option_key}", option_value)
-
-                            # Inject project-level language filter (via setattr like other options)
-                            instance._project_languages = project_languages
-
-                            # Inject plan_workflow config for planning-tagged handlers
-                            # This overrides any handler-level options (top-level is source of truth)
-                            # Uses dynamic setattr pattern (same as handler options) for type safety
-                            if plan_workflow is not None and "planning" in instance.tags:
-                                plan_attrs: dict[str, str | bool | None] = {
-                                    "track_plans_in_project": (
-                                        plan_workflow.directory if plan_workflow.enabled else None
-                                    ),
-                                    "plan_workflow_docs": (
-                                        plan_workflow.workflow_docs
-                                        if plan_workflow.enabled
-                                        else None
-                                    ),
-                                    "enforce_claude_code_sync": (
-                                        plan_workflow.enforce_claude_code_sync
-                                        if plan_workflow.enabled
-                                        else False
-                                    ),
-                                }
-                                for attr_key, attr_val in plan_attrs.items():
-                                    setattr(instance, f"_{attr_key}", attr_val)
-
-                            router.register(event_type, instance)
-                            count += 1
-                            logger.debug(
-                                "Registered %s for %s (priority=%d, tags=%s)",
-                                attr.__name__,
-                                event_type.value,
-                                instance.priority,
-                                instance.tags,
-                            )
-                        except Exception as e:
-                            logger.warning("Failed to instantiate %s: %s", attr.__name__, e)
+                # Apply options inheritance if handler shares options with parent
+                registry_key = f"{event_type.value}.{config_key}"
+                handler_options = options_registry.get(registry_key, {})
+
+                if instance.shares_options_with:
+                    # Get parent options
+                    parent_key = f"{event_type.value}.{instance.shares_options_with}"
+                    parent_options = options_registry.get(parent_key, {})
+                    # Merge: parent options + child overrides
+                    merged_options = {**parent_options, **handler_options}
+                else:
+                    merged_options = handler_options
+
+                # Apply all options as private attributes (generic for all handlers)
+                for option_key, option_value in merged_options.items():
+                    setattr(instance, f"_{option_key}", option_value)
+
+                # Inject project-level language filter (via setattr like other options)
+                instance._project_languages = project_languages
+
+                # Inject plan_workflow config for planning-tagged handlers
+                # This overrides any handler-level options (top-level is source of truth)
+                # Uses dynamic setattr pattern (same as handler options) for type safety
+                if plan_workflow is not None and "planning" in instance.tags:
+                    plan_attrs: dict[str, str | bool | None] = {
+                        "track_plans_in_project": (
+                            plan_workflow.directory if plan_workflow.enabled else None
+                        ),
+                        "plan_workflow_docs": (
+                            plan_workflow.workflow_docs if plan_workflow.enabled else None
+                        ),
+                        "enforce_claude_code_sync": (
+                            plan_workflow.enforce_claude_code_sync
+                            if plan_workflow.enabled
+                            else False
+                        ),
+                    }
+                    for attr_key, attr_val in plan_attrs.items():
+                        setattr(instance, f"_{attr_key}", attr_val)
+
+                router.register(event_type, instance)
+                count += 1
+                logger.debug(
+                    "Registered %s for %s (priority=%d, tags=%s)",
+                    attr.__name__,
+                    event_type.value,
+                    instance.priority,
+                    instance.tags,
+                )
+            except Exception as e:
+                logger.warning("Failed to instantiate %s: %s", attr.__name__, e)
 
         logger.info("Registered %d handlers with router", count)
         return count
@@ -1,12 +1,13 @@
 """Version check handler for SessionStart events.
 
 Checks if the daemon is up-to-date with the latest GitHub release on new sessions only.
-Uses 1-day cache to avoid excessive git operations.
+Uses 1-day cache to avoid excessive git operations. git ls-remote runs as
+an async subprocess on the daemon's event loop.
 """
 
 import json
 import logging
-import subprocess  # nosec B404 - subprocess used for git commands only (trusted system tool)
+import subprocess  # nosec B404 - only for TimeoutExpired
 import time
 from pathlib import Path
 from typing import Any
@@ -18,14 +19,15 @@ from claude_code_hooks_daemon.constants import (
     Priority,
     Timeout,
 )
-from claude_code_hooks_daemon.core import Handler, HookResult, ProjectContext
+from claude_code_hooks_daemon.core import HookResult, ProjectContext
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, run_process
 from claude_code_hooks_daemon.core.hook_result import Decision
 from claude_code_hooks_daemon.version import __version__
 
 logger = logging.getLogger(__name__)
 
 
-class VersionCheckHandler(Handler):
+class VersionCheckHandler(AsyncHandler):
     """Check daemon version against latest GitHub release on new sessions.
 
     Only runs on new sessions (not resume) to avoid annoying users.
@@ -101,7 +103,7 @@ class VersionCheckHandler(Handler):
         except (OSError, TypeError) as e:
             logger.debug("Failed to write version cache: %s", e)
 
-    def _get_latest_version(self) -> str | None:
+    async def _get_latest_version(self) -> str | None:
         """Get latest version tag from GitHub (git ls-remote).
 
         Returns:
@@ -114,7 +116,7 @@ class VersionCheckHandler(Handler):
             # - URL is trusted: our own GitHub repository
             # - No shell=True (prevents command injection)
             # - Timeout prevents hanging
-            result = subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
+            result = await run_process(
                 [
                     "git",
                     "ls-remote",
@@ -123,7 +125,6 @@ class VersionCheckHandler(Handler):
                     "--sort=-v:refname",
                     "https://github.com/Edmonds-Commerce-Limited/claude-code-hooks-daemon.git",
                 ],
-                capture_output=True,
                 text=True,
                 timeout=Timeout.VERSION_CHECK,
                 check=False,
@@ -193,7 +194,7 @@ class VersionCheckHandler(Handler):
         # Only run on new sessions (not resume)
         return not self._is_resume_session(hook_input)
 
-    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
         """Check daemon version and advise upgrade if outdated.
 
         Returns:
@@ -210,7 +211,7 @@ class VersionCheckHandler(Handler):
                     return HookResult(decision=Decision.ALLOW, reason=None, context=[])
 
             # Fetch latest version
-            latest_version = self._get_latest_version()
+            latest_version = await self._get_latest_version()
 
             if latest_version is None:
                 # Failed to check - fail silently
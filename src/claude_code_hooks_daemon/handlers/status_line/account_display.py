@@ -5,16 +5,23 @@ and displays it in the status line.
 """
 
 import re
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority
 from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core.segment_cache import file_mtime_ns
+
+# Reuse the segment this long while the launch config is unchanged
+_SEGMENT_TTL_SECONDS = 300.0
 
 
 class AccountDisplayHandler(Handler):
     """Display Claude account username in status line."""
 
+    segment_ttl_seconds = _SEGMENT_TTL_SECONDS
+
     def __init__(self) -> None:
         super().__init__(
             handler_id=HandlerID.ACCOUNT_DISPLAY,
@@ -27,6 +34,10 @@ class AccountDisplayHandler(Handler):
         """Always run for status events."""
         return True
 
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        """The launch config file's mtime."""
+        return file_mtime_ns(Path.home() / ".claude" / ".last-launch.conf")
+
     def handle(self, hook_input: dict[str, Any]) -> HookResult:
         """Extract and format account username.
 
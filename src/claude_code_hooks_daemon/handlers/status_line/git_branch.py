@@ -2,22 +2,60 @@
 
 Shows current git branch if the workspace is in a git repository.
 Fails silently if not in a git repo or if git commands error.
+Git runs as async subprocesses on the daemon's event loop.
 """
 
 import logging
-import subprocess  # nosec B404 - subprocess used for git commands only (trusted system tool)
+import subprocess  # nosec B404 - only for CalledProcessError and TimeoutExpired
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority, Timeout
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, HookResult
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, run_process
+from claude_code_hooks_daemon.core.segment_cache import file_mtime_ns
 
 logger = logging.getLogger(__name__)
 
+# Reuse the branch segment this long unless HEAD changes (checkout, switch)
+_SEGMENT_TTL_SECONDS = 30.0
 
-class GitBranchHandler(Handler):
+_GITDIR_PREFIX = "gitdir:"
+
+
+def _head_path(cwd: str) -> Path | None:
+    """Find the HEAD file of the repository containing a directory.
+
+    Args:
+        cwd: Directory inside the working tree
+
+    Returns:
+        Path to HEAD (following a worktree's .git file), or None outside a repo
+    """
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git / "HEAD"
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text().strip()
+            except OSError:
+                # Unreadable .git file: no HEAD to watch, like a non-gitdir file
+                content = ""
+            if content.startswith(_GITDIR_PREFIX):
+                return (directory / content[len(_GITDIR_PREFIX) :].strip()) / "HEAD"
+            return None
+    return None
+
+
+class GitBranchHandler(AsyncHandler):
     """Show current git branch if in a git repo."""
 
+    segment_ttl_seconds = _SEGMENT_TTL_SECONDS
+    handle_deadline_seconds = Timeout.GIT_BRANCH_DEADLINE
+
     def __init__(self) -> None:
         super().__init__(
             handler_id=HandlerID.GIT_BRANCH,
@@ -32,7 +70,22 @@ class GitBranchHandler(Handler):
         """Always run for status events."""
         return True
 
-    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+    async def handle_in_time(self, hook_input: dict[str, Any]) -> HookResult:
+        """Run handle_async(), showing nothing if git misses the deadline.
+
+        Args:
+            hook_input: Status event input with workspace data
+
+        Returns:
+            HookResult from handle_async(), or empty on a slow repo
+        """
+        try:
+            return await super().handle_in_time(hook_input)
+        except TimeoutError:
+            logger.debug("Git branch lookup missed its %ss deadline", self.handle_deadline_seconds)
+            return HookResult(context=[])
+
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
         """Get current git branch and format for status line.
 
         Args:
@@ -49,10 +102,9 @@ class GitBranchHandler(Handler):
 
         try:
             # Check if in git repo
-            result = subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
+            result = await run_process(
                 ["git", "rev-parse", "--show-toplevel"],
                 cwd=cwd,
-                capture_output=True,
                 timeout=Timeout.GIT_STATUS_SHORT,
                 check=False,
             )
@@ -61,10 +113,9 @@ class GitBranchHandler(Handler):
                 return HookResult(context=[])  # Not a git repo
 
             # Get current branch
-            result = subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
+            result = await run_process(
                 ["git", "branch", "--show-current"],
                 cwd=cwd,
-                capture_output=True,
                 timeout=Timeout.GIT_STATUS_SHORT,
                 check=True,
             )
@@ -72,7 +123,7 @@ class GitBranchHandler(Handler):
             branch = result.stdout.decode().strip()
             if branch:
                 if not self._default_branch_detected:
-                    self._default_branch = self._get_default_branch(cwd)
+                    self._default_branch = await self._get_default_branch(cwd)
                     self._default_branch_detected = True
                 green = "\033[32m"
                 orange = "\033[38;5;208m"
@@ -93,7 +144,16 @@ class GitBranchHandler(Handler):
 
         return HookResult(context=[])
 
-    def _get_default_branch(self, cwd: str) -> str | None:
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        """Working directory and the mtime of its repository's HEAD file."""
+        workspace = hook_input.get("workspace", {})
+        cwd = workspace.get("current_dir") or workspace.get("project_dir")
+        if not cwd:
+            return None
+        head = _head_path(cwd)
+        return (cwd, file_mtime_ns(head) if head is not None else None)
+
+    async def _get_default_branch(self, cwd: str) -> str | None:
         """Detect the default branch for the repo.
 
         Strategy:
@@ -102,10 +162,9 @@ class GitBranchHandler(Handler):
         3. Return None if undetermined (branch will be shown orange)
         """
         try:
-            result = subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
+            result = await run_process(
                 ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
                 cwd=cwd,
-                capture_output=True,
                 timeout=Timeout.GIT_STATUS_SHORT,
                 check=False,
             )
@@ -115,14 +174,11 @@ class GitBranchHandler(Handler):
 
             # Fallback: check common default branch names locally
             for candidate in ("main", "master"):
-                result = (
-                    subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
-                        ["git", "show-ref", "--verify", f"refs/heads/{candidate}"],
-                        cwd=cwd,
-                        capture_output=True,
-                        timeout=Timeout.GIT_STATUS_SHORT,
-                        check=False,
-                    )
+                result = await run_process(
+                    ["git", "show-ref", "--verify", f"refs/heads/{candidate}"],
+                    cwd=cwd,
+                    timeout=Timeout.GIT_STATUS_SHORT,
+                    check=False,
                 )
                 if result.returncode == 0:
                     return candidate
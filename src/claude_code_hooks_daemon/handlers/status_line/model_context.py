@@ -55,11 +55,13 @@ context_window_size exceeds all configured tiers use the largest tier.
 import json
 import logging
 import re
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority
 from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core.segment_cache import file_mtime_ns
 
 logger = logging.getLogger(__name__)
 
@@ -103,10 +105,16 @@ _CONTEXT_TIER_1000K_RED_PCT = 40
 # Does NOT match Claude 3.x format: claude-3-5-sonnet-20241022
 _MODEL_VERSION_PATTERN = re.compile(r"claude-(?:opus|sonnet|haiku)-(\d+)-")
 
+# Reuse the segment this long while the model, context usage and settings
+# file are unchanged
+_SEGMENT_TTL_SECONDS = 60.0
+
 
 class ModelContextHandler(Handler):
     """Format model name with effort level and color-coded context percentage."""
 
+    segment_ttl_seconds = _SEGMENT_TTL_SECONDS
+
     def __init__(self) -> None:
         super().__init__(
             handler_id=HandlerID.MODEL_CONTEXT,
@@ -170,6 +178,18 @@ class ModelContextHandler(Handler):
 
         return HookResult(context=[status])
 
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        """Model, context usage and the settings file's mtime (effort level)."""
+        model_data = hook_input.get("model", {})
+        ctx_data = hook_input.get("context_window", {})
+        return (
+            model_data.get("id"),
+            model_data.get("display_name"),
+            ctx_data.get("used_percentage"),
+            ctx_data.get("context_window_size"),
+            file_mtime_ns(self._get_settings_path()),
+        )
+
     def _get_effort_suffix(self, model_id: str, reset: str) -> str:
         """Get effort level signal bars for Claude 4+ models.
 
@@ -9,18 +9,25 @@ Effort level display is handled by ModelContextHandler (shown next to model name
 
 import json
 import logging
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority
 from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core.segment_cache import file_mtime_ns
 
 logger = logging.getLogger(__name__)
 
+# Reuse the segment this long while the settings file is unchanged
+_SEGMENT_TTL_SECONDS = 60.0
+
 
 class ThinkingModeHandler(Handler):
     """Display thinking mode and effort level in status line."""
 
+    segment_ttl_seconds = _SEGMENT_TTL_SECONDS
+
     def __init__(self) -> None:
         super().__init__(
             handler_id=HandlerID.THINKING_MODE,
@@ -64,6 +71,10 @@ class ThinkingModeHandler(Handler):
             logger.info("Error reading thinking mode settings")
             return HookResult(context=[])
 
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        """The settings file's mtime."""
+        return file_mtime_ns(self._get_settings_path())
+
     def _read_settings(self) -> dict[str, Any]:
         """Read Claude settings file.
 
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority, ToolName
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, Handler, HookResult, append_line, defer
 from claude_code_hooks_daemon.core.project_context import ProjectContext
 from claude_code_hooks_daemon.core.transcript_reader import (
     ContentBlock,
@@ -380,8 +380,9 @@ class AutoContinueStopHandler(Handler):
     def _log_stop_event(self, hook_input: dict[str, Any], decision: Decision, reason: str) -> None:
         """Log stop event to JSONL file for debugging.
 
-        Appends one JSON line to {project_root}/untracked/stop-events.jsonl.
-        Silently ignores write errors — this is non-critical logging.
+        Appends one JSON line to {project_root}/untracked/stop-events.jsonl
+        once the response is sent. Write errors are logged and counted by
+        the deferred worker; this is non-critical logging.
 
         Args:
             hook_input: Original hook input
@@ -390,18 +391,18 @@ class AutoContinueStopHandler(Handler):
         """
         try:
             untracked_dir: Path = ProjectContext.daemon_untracked_dir()
-            log_path = untracked_dir / "stop-events.jsonl"
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            entry = {
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-                "decision": decision.value,
-                "reason_prefix": reason[:80],
-                "stop_hook_active": bool(hook_input.get("stop_hook_active", False)),
-            }
-            with log_path.open("a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except (RuntimeError, OSError) as e:
+        except RuntimeError as e:
             logger.debug("_log_stop_event: non-critical write failure: %s", e)
+            return
+        log_path = untracked_dir / "stop-events.jsonl"
+        entry = {
+            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "decision": decision.value,
+            "reason_prefix": reason[:80],
+            "stop_hook_active": bool(hook_input.get("stop_hook_active", False)),
+        }
+        log_line = json.dumps(entry)
+        defer(lambda: append_line(log_path, log_line))
 
     def _contains_confirmation_pattern(self, text: str) -> bool:
         """Check if text contains a confirmation pattern.
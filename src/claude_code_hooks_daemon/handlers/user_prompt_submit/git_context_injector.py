@@ -1,14 +1,15 @@
 """GitContextInjectorHandler - injects git status context into user prompts."""
 
-import subprocess  # nosec B404 - subprocess used for git commands only (trusted system tool)
+import subprocess  # nosec B404 - only for TimeoutExpired
 from typing import Any
 
 from claude_code_hooks_daemon.constants import HandlerID, HandlerTag, Priority, Timeout
-from claude_code_hooks_daemon.core import Decision, Handler, HookResult
+from claude_code_hooks_daemon.core import Decision, HookResult
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler, run_process
 from claude_code_hooks_daemon.core.project_context import ProjectContext
 
 
-class GitContextInjectorHandler(Handler):
+class GitContextInjectorHandler(AsyncHandler):
     """Inject current git status as context when user submits a prompt.
 
     Provides awareness of repository state (branch, uncommitted changes) to help
@@ -40,7 +41,7 @@ class GitContextInjectorHandler(Handler):
         """
         return True
 
-    def handle(self, _hook_input: dict[str, Any]) -> HookResult:
+    async def handle_async(self, _hook_input: dict[str, Any]) -> HookResult:
         """Inject git status as context.
 
         Args:
@@ -58,9 +59,8 @@ class GitContextInjectorHandler(Handler):
         try:
             # Run git status with short timeout
             # cwd from ProjectContext (authoritative project root), or cwd fallback
-            result = subprocess.run(  # nosec B603 B607 - git is trusted system tool, no user input
+            result = await run_process(
                 ["git", "status"],
-                capture_output=True,
                 text=True,
                 timeout=Timeout.GIT_CONTEXT,
                 cwd=project_root,
@@ -11,6 +11,8 @@ when a nitpick trigger fires.
 from __future__ import annotations
 
 import logging
+import threading
+from dataclasses import asdict
 from typing import Any
 
 from claude_code_hooks_daemon.constants.protocol import HookInputField
@@ -29,14 +31,19 @@ class NitpickSetup:
     Maintains per-session NitpickState and uses TranscriptReader for
     incremental transcript reading. Returns enriched hook_input with
     assistant_messages, or None if no new messages to audit.
+
+    The dispatcher runs one call per session at a time; the state map is
+    locked because export() and forget_session() may run alongside a
+    background call for another session.
     """
 
-    __slots__ = ("_reader", "_states")
+    __slots__ = ("_lock", "_reader", "_states")
 
     def __init__(self) -> None:
         """Initialise with shared transcript reader and empty state map."""
         self._reader = TranscriptReader()
         self._states: dict[str, NitpickState] = {}
+        self._lock = threading.Lock()
 
     def __call__(self, hook_input: dict[str, Any], session_id: str) -> dict[str, Any] | None:
         """Read transcript and return enriched hook_input.
@@ -60,20 +67,20 @@ class NitpickSetup:
             transcript_path, state.last_byte_offset
         )
 
-        # Update byte offset
-        state.last_byte_offset = new_offset
-
         # Filter to assistant messages only
         assistant_messages = TranscriptReader.filter_assistant_messages(new_messages)
 
+        with self._lock:
+            # Update byte offset
+            state.last_byte_offset = new_offset
+
+            # Update last audited UUID
+            if assistant_messages and assistant_messages[-1].uuid:
+                state.last_audited_uuid = assistant_messages[-1].uuid
+
         if not assistant_messages:
             return None
 
-        # Update last audited UUID
-        last_msg = assistant_messages[-1]
-        if last_msg.uuid:
-            state.last_audited_uuid = last_msg.uuid
-
         # Build enriched hook_input
         enriched: dict[str, Any] = {
             **hook_input,
@@ -94,7 +101,44 @@ class NitpickSetup:
         Returns:
             NitpickState if exists, None otherwise
         """
-        return self._states.get(session_id)
+        with self._lock:
+            return self._states.get(session_id)
+
+    def export(self, max_sessions: int | None = None) -> dict[str, Any]:
+        """Serialise per-session audit positions for another daemon process.
+
+        Args:
+            max_sessions: Keep only the most recently started sessions
+
+        Returns:
+            JSON-compatible dictionary of session_id -> state fields
+        """
+        with self._lock:
+            session_ids = list(self._states)
+            if max_sessions is not None:
+                session_ids = session_ids[-max_sessions:] if max_sessions > 0 else []
+            return {session_id: asdict(self._states[session_id]) for session_id in session_ids}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load audit positions exported by another daemon process.
+
+        Sessions this process has already started auditing keep their state.
+
+        Args:
+            data: Dictionary produced by export()
+        """
+        with self._lock:
+            for session_id, fields in data.items():
+                self._states.setdefault(session_id, NitpickState(**fields))
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop a session's audit position.
+
+        Args:
+            session_id: Session that ended or was evicted
+        """
+        with self._lock:
+            self._states.pop(session_id, None)
 
     def _get_or_create_state(self, session_id: str) -> NitpickState:
         """Get or create NitpickState for a session.
@@ -105,6 +149,7 @@ class NitpickSetup:
         Returns:
             NitpickState for the session
         """
-        if session_id not in self._states:
-            self._states[session_id] = NitpickState()
-        return self._states[session_id]
+        with self._lock:
+            if session_id not in self._states:
+                self._states[session_id] = NitpickState()
+            return self._states[session_id]
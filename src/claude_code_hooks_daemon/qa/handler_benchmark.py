@@ -0,0 +1,514 @@
+"""Microbenchmarks for every built-in handler's matches() and handle().
+
+Walks ``HandlerRegistry.discover()`` and times each handler against two
+fixture sets:
+
+- **Acceptance fixtures**: hook inputs derived from the handler's own
+  ``get_acceptance_tests()`` (Bash commands, or Write/Edit calls described
+  as "Use the Write tool to write to <path> with content '...'").
+- **Large inputs**: generated worst-case payloads for the handler's event
+  (a 500-stage Bash pipeline, a 1 MB Write, a 256 KB Edit, a 1 MB prompt).
+
+Results are saved as a JSON baseline and later runs are compared against
+it, so a new regex or strategy that slows down the PreToolUse path fails
+the comparison instead of shipping silently.
+
+Baseline format (version 1)::
+
+    {
+        "version": 1,
+        "repeats": 5,
+        "handlers": {
+            "DestructiveGitHandler": {
+                "event": "PreToolUse",
+                "fixtures": 4, "matched": 3, "errors": 0,
+                "matches_us": 2.1,       # mean per call, acceptance fixtures
+                "large_input_us": 40.3,  # mean per call, generated inputs
+                "handle_us": 11.8        # mean per call, matching fixtures
+            }
+        }
+    }
+
+Each timing is the median of ``repeats`` timed sweeps, reported in
+microseconds per call.
+"""
+
+import inspect
+import logging
+import re
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from claude_code_hooks_daemon.constants import HookInputField, ToolName
+from claude_code_hooks_daemon.core.event import EventType
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.handlers.registry import EVENT_TYPE_MAPPING, HandlerRegistry
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_FORMAT_VERSION = 1
+
+# Default comparison thresholds: a metric regresses when it is more than
+# DEFAULT_TOLERANCE slower (relative) AND at least DEFAULT_MIN_DELTA_US slower
+# (absolute), so sub-microsecond jitter on trivial handlers never fails a run
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_MIN_DELTA_US = 20.0
+DEFAULT_REPEATS = 5
+
+TIMED_METRICS = ("matches_us", "large_input_us", "handle_us")
+
+# Generated large-input sizes
+_PIPELINE_STAGES = 500
+_LARGE_WRITE_BYTES = 1024 * 1024
+_LARGE_EDIT_BYTES = 256 * 1024
+_LARGE_PROMPT_BYTES = 1024 * 1024
+
+_BENCH_CWD = "/workspace"
+_BENCH_SESSION_ID = "handler-benchmark"
+
+_TOOL_EVENTS = frozenset(
+    {EventType.PRE_TOOL_USE, EventType.POST_TOOL_USE, EventType.PERMISSION_REQUEST}
+)
+
+# "Use the Write tool to write to /path/file.md with content '...'"
+_TOOL_INSTRUCTION_RE = re.compile(r"^Use the (Write|Edit|Read) tool\b", re.IGNORECASE)
+_INSTRUCTION_PATH_RE = re.compile(r"(?:file_path\s+)?'?(/[\w.@+-]+(?:/[\w.@+-]+)*)'?")
+_INSTRUCTION_CONTENT_RE = re.compile(r"with content '(.*)'", re.DOTALL)
+
+
+@dataclass(slots=True)
+class HandlerBenchmark:
+    """Benchmark result for one handler.
+
+    Attributes:
+        name: Handler class name
+        event: Hook event the handler is registered for
+        fixtures: Number of acceptance and generated fixtures
+        matched: Number of fixtures for which matches() returned True
+        errors: Number of fixtures where matches() or handle() raised
+        matches_us: Mean matches() time per call over acceptance fixtures
+        large_input_us: Mean matches() time per call over generated inputs
+        handle_us: Mean handle() time per call over matching fixtures
+    """
+
+    name: str
+    event: str
+    fixtures: int = 0
+    matched: int = 0
+    errors: int = 0
+    matches_us: float | None = None
+    large_input_us: float | None = None
+    handle_us: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a baseline entry.
+
+        Returns:
+            Dictionary without the handler name (used as the key)
+        """
+        return {
+            "event": self.event,
+            "fixtures": self.fixtures,
+            "matched": self.matched,
+            "errors": self.errors,
+            "matches_us": self.matches_us,
+            "large_input_us": self.large_input_us,
+            "handle_us": self.handle_us,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """A handler metric that got slower than the baseline allows.
+
+    Attributes:
+        handler: Handler class name
+        metric: Metric name (one of TIMED_METRICS)
+        baseline_us: Baseline time per call in microseconds
+        current_us: Current time per call in microseconds
+    """
+
+    handler: str
+    metric: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        """Get current / baseline time."""
+        return self.current_us / self.baseline_us if self.baseline_us > 0 else float("inf")
+
+
+@dataclass(slots=True)
+class BenchmarkRun:
+    """Results for a whole benchmark run.
+
+    Attributes:
+        repeats: Timed sweeps per metric
+        handlers: Handler name -> benchmark result
+    """
+
+    repeats: int
+    handlers: dict[str, HandlerBenchmark] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the versioned baseline format.
+
+        Returns:
+            JSON-serialisable baseline dictionary
+        """
+        return {
+            "version": BENCHMARK_FORMAT_VERSION,
+            "repeats": self.repeats,
+            "handlers": {name: result.to_dict() for name, result in sorted(self.handlers.items())},
+        }
+
+
+def _base_input(event: EventType) -> dict[str, Any]:
+    """Build the fields every hook input carries.
+
+    Args:
+        event: Hook event type
+
+    Returns:
+        Base hook_input dictionary
+    """
+    return {
+        HookInputField.HOOK_EVENT_NAME: event.value,
+        HookInputField.SESSION_ID: _BENCH_SESSION_ID,
+        HookInputField.TRANSCRIPT_PATH: f"/tmp/{_BENCH_SESSION_ID}/transcript.jsonl",  # nosec B108
+        HookInputField.CWD: _BENCH_CWD,
+    }
+
+
+def _tool_input(event: EventType, tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any]:
+    """Build a tool event hook input.
+
+    Args:
+        event: PreToolUse, PostToolUse or PermissionRequest
+        tool_name: Tool name
+        tool_input: Tool input dictionary
+
+    Returns:
+        hook_input dictionary
+    """
+    hook_input = _base_input(event)
+    hook_input[HookInputField.TOOL_NAME] = tool_name
+    hook_input[HookInputField.TOOL_INPUT] = tool_input
+    if event == EventType.POST_TOOL_USE:
+        hook_input["tool_response"] = {"stdout": "", "stderr": "", "interrupted": False}
+    return hook_input
+
+
+def _tool_call_from_command(command: str) -> tuple[str, dict[str, Any]]:
+    """Interpret an acceptance test command as a tool call.
+
+    Acceptance tests describe Write/Edit/Read calls in prose ("Use the
+    Write tool to write to /path with content '...'"); everything else is
+    a Bash command.
+
+    Args:
+        command: AcceptanceTest.command
+
+    Returns:
+        Tuple of (tool_name, tool_input)
+    """
+    instruction = _TOOL_INSTRUCTION_RE.match(command)
+    if instruction is None:
+        return ToolName.BASH, {"command": command}
+
+    tool = instruction.group(1).capitalize()
+    path_match = _INSTRUCTION_PATH_RE.search(command, instruction.end())
+    file_path = path_match.group(1) if path_match else f"{_BENCH_CWD}/benchmark.txt"
+    content_match = _INSTRUCTION_CONTENT_RE.search(command)
+    content = content_match.group(1) if content_match else ""
+
+    if tool == ToolName.WRITE:
+        return ToolName.WRITE, {"file_path": file_path, "content": content}
+    if tool == ToolName.EDIT:
+        return ToolName.EDIT, {"file_path": file_path, "old_string": content, "new_string": content}
+    return ToolName.READ, {"file_path": file_path}
+
+
+def _event_input(event: EventType, text: str) -> dict[str, Any]:
+    """Build a non-tool event hook input carrying free text.
+
+    Args:
+        event: Hook event type
+        text: Prompt, message or command text for the event
+
+    Returns:
+        hook_input dictionary
+    """
+    hook_input = _base_input(event)
+    if event == EventType.USER_PROMPT_SUBMIT:
+        hook_input["prompt"] = text
+    elif event == EventType.NOTIFICATION:
+        hook_input["message"] = text
+    elif event in (EventType.STOP, EventType.SUBAGENT_STOP):
+        hook_input["stop_hook_active"] = False
+    elif event == EventType.SESSION_START:
+        hook_input["source"] = "startup"
+    elif event == EventType.PRE_COMPACT:
+        hook_input["trigger"] = "auto"
+    elif event == EventType.STATUS_LINE:
+        hook_input["model"] = {"id": "claude-sonnet", "display_name": "Sonnet"}
+        hook_input["workspace"] = {"current_dir": _BENCH_CWD, "project_dir": _BENCH_CWD}
+        hook_input["context_window"] = {"context_window_size": 200_000, "used_percentage": 42}
+    return hook_input
+
+
+def acceptance_fixtures(handler: Handler, event: EventType) -> list[dict[str, Any]]:
+    """Derive hook inputs from a handler's acceptance tests.
+
+    Args:
+        handler: Handler instance
+        event: Event the handler is registered for
+
+    Returns:
+        One hook_input per acceptance test (empty if none are defined)
+    """
+    try:
+        tests = handler.get_acceptance_tests()
+    except Exception as e:
+        logger.warning("get_acceptance_tests() failed for %s: %s", type(handler).__name__, e)
+        return []
+
+    fixtures = []
+    for test in tests:
+        command = getattr(test, "command", "")
+        if event in _TOOL_EVENTS:
+            tool_name, tool_input = _tool_call_from_command(command)
+            fixtures.append(_tool_input(event, tool_name, tool_input))
+        else:
+            fixtures.append(_event_input(event, command))
+    return fixtures
+
+
+def large_input_fixtures(event: EventType) -> list[dict[str, Any]]:
+    """Generate worst-case payloads for an event.
+
+    Args:
+        event: Hook event type
+
+    Returns:
+        Generated hook inputs (empty for events without free-form payloads)
+    """
+    if event in _TOOL_EVENTS:
+        pipeline = " | ".join(
+            f"grep -v 'pattern_{i}' --color=never" for i in range(_PIPELINE_STAGES)
+        )
+        source_line = "def handler_{0}(value: int) -> int:\n    return value * {0}\n\n"
+        content = "".join(source_line.format(i) for i in range(_LARGE_WRITE_BYTES // 48))
+        content = content[:_LARGE_WRITE_BYTES]
+        edit_text = content[:_LARGE_EDIT_BYTES]
+        return [
+            _tool_input(event, ToolName.BASH, {"command": f"cat src/app.py | {pipeline} | wc -l"}),
+            _tool_input(
+                event, ToolName.WRITE, {"file_path": f"{_BENCH_CWD}/src/big.py", "content": content}
+            ),
+            _tool_input(
+                event,
+                ToolName.EDIT,
+                {
+                    "file_path": f"{_BENCH_CWD}/src/big.py",
+                    "old_string": edit_text,
+                    "new_string": edit_text.replace("value", "number"),
+                },
+            ),
+        ]
+    if event in (EventType.USER_PROMPT_SUBMIT, EventType.NOTIFICATION):
+        sentence = "Please refactor the parser and keep the tests green. "
+        text = (sentence * (_LARGE_PROMPT_BYTES // len(sentence) + 1))[:_LARGE_PROMPT_BYTES]
+        return [_event_input(event, text)]
+    return []
+
+
+def _probe(
+    call: Callable[[dict[str, Any]], Any], fixtures: Iterable[dict[str, Any]]
+) -> tuple[list[tuple[dict[str, Any], Any]], int]:
+    """Call a handler method once per fixture, dropping fixtures that raise.
+
+    Args:
+        call: Bound handler method
+        fixtures: Hook inputs
+
+    Returns:
+        Tuple of ([(fixture, return value)], error count)
+    """
+    results = []
+    errors = 0
+    for fixture in fixtures:
+        try:
+            results.append((fixture, call(fixture)))
+        except Exception as e:
+            logger.debug("Benchmark fixture raised in %s: %s", call, e)
+            errors += 1
+    return results, errors
+
+
+def _time_per_call(
+    call: Callable[[dict[str, Any]], Any], fixtures: list[dict[str, Any]], repeats: int
+) -> float | None:
+    """Time a handler method over fixtures.
+
+    Args:
+        call: Bound handler method
+        fixtures: Hook inputs known not to raise
+        repeats: Number of timed sweeps
+
+    Returns:
+        Median of per-sweep mean microseconds per call, or None without fixtures
+    """
+    if not fixtures:
+        return None
+    sweeps = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for fixture in fixtures:
+            call(fixture)
+        sweeps.append((time.perf_counter() - start) * 1_000_000 / len(fixtures))
+    return round(statistics.median(sweeps), 3)
+
+
+def benchmark_handler(
+    handler: Handler, event: EventType, repeats: int = DEFAULT_REPEATS
+) -> HandlerBenchmark:
+    """Benchmark one handler instance.
+
+    handle() is only timed on fixtures for which matches() returned True,
+    mirroring how the chain dispatches.
+
+    Args:
+        handler: Handler instance
+        event: Event the handler is registered for
+        repeats: Number of timed sweeps per metric
+
+    Returns:
+        Benchmark result
+    """
+    acceptance = acceptance_fixtures(handler, event)
+    large = large_input_fixtures(event)
+    result = HandlerBenchmark(
+        name=type(handler).__name__, event=event.value, fixtures=len(acceptance) + len(large)
+    )
+
+    acceptance_probe, acceptance_errors = _probe(handler.matches, acceptance)
+    large_probe, large_errors = _probe(handler.matches, large)
+    matching = [fixture for fixture, matched in acceptance_probe + large_probe if matched]
+    handle_probe, handle_errors = _probe(handler.handle, matching)
+
+    result.matched = len(matching)
+    result.errors = acceptance_errors + large_errors + handle_errors
+    result.matches_us = _time_per_call(
+        handler.matches, [fixture for fixture, _ in acceptance_probe], repeats
+    )
+    result.large_input_us = _time_per_call(
+        handler.matches, [fixture for fixture, _ in large_probe], repeats
+    )
+    result.handle_us = _time_per_call(
+        handler.handle, [fixture for fixture, _ in handle_probe], repeats
+    )
+    return result
+
+
+def _event_for_handler(handler_class: type[Handler]) -> EventType | None:
+    """Get the event a built-in handler is registered for from its package.
+
+    Args:
+        handler_class: Handler class discovered by the registry
+
+    Returns:
+        Event type, or None for classes outside an event package
+    """
+    parts = handler_class.__module__.split(".")
+    for part in parts:
+        if part in EVENT_TYPE_MAPPING:
+            return EVENT_TYPE_MAPPING[part]
+    return None
+
+
+def run_benchmarks(
+    repeats: int = DEFAULT_REPEATS, only: Iterable[str] | None = None
+) -> BenchmarkRun:
+    """Benchmark every discovered handler.
+
+    Args:
+        repeats: Number of timed sweeps per metric
+        only: Optional handler class names to restrict the run to
+
+    Returns:
+        Benchmark run results
+    """
+    registry = HandlerRegistry()
+    registry.discover()
+    selected = set(only) if only else None
+    run = BenchmarkRun(repeats=repeats)
+
+    for name in sorted(registry.list_handlers()):
+        if selected is not None and name not in selected:
+            continue
+        handler_class = registry.get_handler_class(name)
+        if handler_class is None or inspect.isabstract(handler_class):
+            continue
+        event = _event_for_handler(handler_class)
+        if event is None:
+            continue
+        try:
+            # Handler subclasses override __init__ with no args
+            handler = handler_class()
+        except Exception as e:
+            logger.warning("Cannot instantiate %s for benchmarking: %s", name, e)
+            continue
+        run.handlers[name] = benchmark_handler(handler, event, repeats)
+
+    return run
+
+
+def compare_benchmarks(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_us: float = DEFAULT_MIN_DELTA_US,
+) -> list[Regression]:
+    """Find handler metrics that regressed past the tolerance.
+
+    Handlers or metrics missing from either side are ignored, so adding a
+    handler never fails a comparison against an older baseline.
+
+    Args:
+        baseline: Baseline dictionary (BenchmarkRun.to_dict() format)
+        current: Current run dictionary (same format)
+        tolerance: Allowed relative slowdown (0.5 = 50% slower)
+        min_delta_us: Absolute slowdown below which changes are ignored
+
+    Returns:
+        Regressions sorted by handler then metric
+
+    Raises:
+        ValueError: If the baseline format version is unsupported
+    """
+    version = baseline.get("version")
+    if version != BENCHMARK_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark baseline version {version!r} "
+            f"(expected {BENCHMARK_FORMAT_VERSION})"
+        )
+
+    regressions = []
+    baseline_handlers: dict[str, Any] = baseline.get("handlers", {})
+    for name, entry in sorted(current.get("handlers", {}).items()):
+        base_entry = baseline_handlers.get(name)
+        if base_entry is None:
+            continue
+        for metric in TIMED_METRICS:
+            base_value = base_entry.get(metric)
+            value = entry.get(metric)
+            if base_value is None or value is None:
+                continue
+            if value > base_value * (1 + tolerance) and value - base_value >= min_delta_us:
+                regressions.append(Regression(name, metric, float(base_value), float(value)))
+    return regressions
@@ -0,0 +1,450 @@
+"""Persistent ESLint worker - one long-lived Node process per project.
+
+Running ESLint through ``tsx scripts/eslint-wrapper.ts`` per write pays
+for Node startup, TypeScript transpilation of the wrapper, and ESLint
+loading its config and plugins every time. EslintWorker keeps one Node
+process per workspace with ESLint loaded, and talks to it with
+line-delimited JSON over stdin/stdout:
+
+    request:  {"id": 1, "files": ["/abs/a.ts", "/abs/b.ts"]}
+    response: {"id": 1, "files": {"/abs/a.ts": {"errors": 0, "warnings": 1,
+               "output": "<stylish report>"}}}
+    failure:  {"id": 1, "error": "<message>"}
+
+The worker is started on first use, restarted when an ESLint config file
+changes (by mtime) or the process dies, and stopped with the daemon via
+shutdown_eslint_workers(). Files submitted within a short debounce window
+are linted in a single request, and a file submitted again before its
+batch is sent shares the pending result.
+
+The Node program ships inline (run with ``node -e``) and loads ESLint
+from the project's own node_modules.
+
+Usage:
+    worker = get_eslint_worker(workspace_root, debounce_seconds=0.1)
+    result = await asyncio.wrap_future(worker.lint(file_path))
+"""
+
+import contextlib
+import json
+import logging
+import os
+import select
+import subprocess  # nosec B404 - runs the project's Node/ESLint
+import tempfile
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from claude_code_hooks_daemon.constants import Timeout
+from claude_code_hooks_daemon.strategies.lint.service import config_stamp
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for more files before sending a batch
+DEFAULT_DEBOUNCE_SECONDS = 0.1
+
+# Seconds a stopping worker gets to exit after stdin closes
+_STOP_TIMEOUT_SECONDS = 2.0
+
+# Warnings allowed before a file fails (matches --max-warnings 0)
+_MAX_WARNINGS = 0
+
+# Files whose changes restart the worker (ESLint config is loaded once)
+ESLINT_CONFIG_FILES = frozenset(
+    {
+        ".eslintignore",
+        ".eslintrc",
+        ".eslintrc.cjs",
+        ".eslintrc.js",
+        ".eslintrc.json",
+        ".eslintrc.yaml",
+        ".eslintrc.yml",
+        "eslint.config.cjs",
+        "eslint.config.cts",
+        "eslint.config.js",
+        "eslint.config.mjs",
+        "eslint.config.mts",
+        "eslint.config.ts",
+        "package.json",
+        "tsconfig.json",
+    }
+)
+
+_WORKER_SCRIPT = r"""
+const path = require("path");
+const readline = require("readline");
+const { createRequire } = require("module");
+const { ESLint } = createRequire(path.join(process.cwd(), "package.json"))("eslint");
+const eslint = new ESLint({ cwd: process.cwd() });
+const formatter = eslint.loadFormatter("stylish");
+const reply = (message) => process.stdout.write(JSON.stringify(message) + "\n");
+let queue = Promise.resolve();
+readline.createInterface({ input: process.stdin })
+  .on("line", (line) => {
+    queue = queue.then(async () => {
+      let id = null;
+      try {
+        const request = JSON.parse(line);
+        id = request.id;
+        const files = {};
+        const targets = [];
+        for (const file of request.files) {
+          if (await eslint.isPathIgnored(file)) {
+            files[file] = { errors: 0, warnings: 0, output: "" };
+          } else {
+            targets.push(file);
+          }
+        }
+        const results = targets.length ? await eslint.lintFiles(targets) : [];
+        for (const result of results) {
+          files[result.filePath] = {
+            errors: result.errorCount,
+            warnings: result.warningCount,
+            output: await (await formatter).format([result]),
+          };
+        }
+        reply({ id, files });
+      } catch (error) {
+        reply({ id, error: String((error && error.stack) || error) });
+      }
+    });
+  })
+  .on("close", () => queue.then(() => process.exit(0)));
+"""
+
+
+class EslintWorkerError(Exception):
+    """The worker could not lint the files (failed to start, crashed, or replied with an error)."""
+
+
+@dataclass(frozen=True, slots=True)
+class EslintFileResult:
+    """ESLint outcome for one file."""
+
+    errors: int
+    warnings: int
+    output: str
+
+    @property
+    def passed(self) -> bool:
+        """Whether the file has no errors and no more warnings than allowed."""
+        return self.errors == 0 and self.warnings <= _MAX_WARNINGS
+
+
+class EslintWorker:
+    """Long-lived ESLint process for one workspace, with batched requests."""
+
+    __slots__ = (
+        "_command",
+        "_config_stamp",
+        "_cwd",
+        "_debounce_seconds",
+        "_env",
+        "_io_lock",
+        "_lock",
+        "_next_id",
+        "_pending",
+        "_process",
+        "_stderr",
+        "_timeout",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        *,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        timeout: float = Timeout.ESLINT_CHECK,
+        command: list[str] | None = None,
+    ) -> None:
+        """Configure the worker (the process starts on the first batch).
+
+        Args:
+            workspace_root: Project root (worker cwd, where ESLint is installed)
+            debounce_seconds: Seconds to collect files before sending a batch
+            timeout: Seconds to wait for a batch's response
+            command: Worker command (default: the inline Node program)
+        """
+        self._cwd = workspace_root
+        self._debounce_seconds = debounce_seconds
+        self._timeout = timeout
+        self._command = command or ["node", "-e", _WORKER_SCRIPT]
+        # Built once: node_modules/.bin first so node/tsx resolve under a bare PATH
+        self._env = dict(os.environ)
+        bin_path = workspace_root / "node_modules" / ".bin"
+        if bin_path.exists():
+            self._env["PATH"] = str(bin_path) + os.pathsep + self._env.get("PATH", "")
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._pending: dict[str, Future[EslintFileResult]] = {}
+        self._timer: threading.Timer | None = None
+        self._process: subprocess.Popen[bytes] | None = None
+        self._stderr: IO[bytes] | None = None
+        self._config_stamp: tuple[tuple[str, int], ...] = ()
+        self._next_id = 0
+
+    def lint(self, file_path: str) -> "Future[EslintFileResult]":
+        """Queue a file for the next batch.
+
+        Args:
+            file_path: File to lint
+
+        Returns:
+            Future resolved with the file's result, or failed with
+            EslintWorkerError / TimeoutError
+        """
+        key = _path_key(file_path)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+            if self._timer is None:
+                self._timer = threading.Timer(self._debounce_seconds, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return future
+
+    def close(self) -> None:
+        """Fail queued files and stop the process."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            pending, self._pending = self._pending, {}
+        if timer is not None:
+            timer.cancel()
+        _fail(pending, EslintWorkerError("ESLint worker shut down"))
+        with self._io_lock:
+            self._stop()
+
+    def _flush(self) -> None:
+        """Timer thread: send every queued file as one request."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._timer = None
+        if not batch:
+            return
+        try:
+            with self._io_lock:
+                results = self._request(list(batch))
+        except Exception as e:
+            _fail(batch, e)
+            return
+        for file_path, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(file_path)
+            if result is None:
+                # Fail closed: a file ESLint did not report on was not checked
+                future.set_exception(
+                    EslintWorkerError(f"ESLint worker returned no result for {file_path}")
+                )
+            else:
+                future.set_result(result)
+
+    def _request(self, files: list[str]) -> dict[str, EslintFileResult]:
+        """Lint files, restarting the process for config changes or a crash.
+
+        Args:
+            files: Absolute file paths
+
+        Returns:
+            Result per file path
+
+        Raises:
+            EslintWorkerError: If the worker fails to start, crashes twice or reports an error
+            TimeoutError: If the worker does not answer in time
+        """
+        stamp = config_stamp(self._cwd, ESLINT_CONFIG_FILES)
+        if self._process is not None and stamp != self._config_stamp:
+            logger.info("ESLint config changed, restarting worker")
+            self._stop()
+        try:
+            return self._exchange(files, stamp)
+        except (BrokenPipeError, EOFError):
+            logger.warning("ESLint worker exited, restarting: %s", self._stderr_text())
+            self._stop()
+        try:
+            return self._exchange(files, stamp)
+        except (BrokenPipeError, EOFError) as e:
+            detail = self._stderr_text()
+            self._stop()
+            raise EslintWorkerError(f"ESLint worker exited: {detail or e}") from e
+
+    def _exchange(
+        self, files: list[str], stamp: tuple[tuple[str, int], ...]
+    ) -> dict[str, EslintFileResult]:
+        """Send one request and read its response.
+
+        Args:
+            files: Absolute file paths
+            stamp: Config stamp recorded if the process is started
+
+        Returns:
+            Result per file path
+
+        Raises:
+            BrokenPipeError: If the process is gone when writing
+            EOFError: If the process exits before answering
+            EslintWorkerError: If the worker reports an error or its reply is malformed
+            TimeoutError: If no answer arrives in time (the process is killed)
+        """
+        process = self._ensure_started(stamp)
+        assert process.stdin is not None and process.stdout is not None  # nosec B101
+        self._next_id += 1
+        request_id = self._next_id
+        process.stdin.write(json.dumps({"id": request_id, "files": files}).encode() + b"\n")
+        process.stdin.flush()
+
+        ready, _, _ = select.select([process.stdout], [], [], self._timeout)
+        if not ready:
+            process.kill()
+            self._stop()
+            raise TimeoutError(f"ESLint timed out after {self._timeout} seconds")
+        line = process.stdout.readline()
+        if not line:
+            raise EOFError("no response")
+
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            self._stop()
+            raise EslintWorkerError(f"Malformed ESLint worker response: {e}") from e
+        if response.get("id") != request_id:
+            self._stop()
+            raise EslintWorkerError("ESLint worker response out of sequence")
+        if "error" in response:
+            raise EslintWorkerError(str(response["error"]))
+        # ESLint reports paths unresolved (symlinks kept); key them like requests
+        return {
+            _path_key(file_path): EslintFileResult(
+                errors=int(result["errors"]),
+                warnings=int(result["warnings"]),
+                output=str(result["output"]),
+            )
+            for file_path, result in response["files"].items()
+        }
+
+    def _ensure_started(self, stamp: tuple[tuple[str, int], ...]) -> "subprocess.Popen[bytes]":
+        """Start the process unless it is running.
+
+        Args:
+            stamp: Config stamp the new process is loaded with
+
+        Returns:
+            The running process
+
+        Raises:
+            EslintWorkerError: If the command cannot be started
+        """
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        self._stop()
+        self._stderr = tempfile.TemporaryFile()  # noqa: SIM115 - closed by _stop()
+        try:
+            self._process = subprocess.Popen(  # nosec B603 - fixed command, no shell
+                self._command,
+                cwd=str(self._cwd),
+                env=self._env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+            )
+        except OSError as e:
+            self._stop()
+            raise EslintWorkerError(f"Failed to start ESLint worker: {e}") from e
+        self._config_stamp = stamp
+        logger.debug("Started ESLint worker (pid %s) in %s", self._process.pid, self._cwd)
+        return self._process
+
+    def _stop(self) -> None:
+        """Stop the process if any (caller holds the I/O lock)."""
+        process, self._process = self._process, None
+        if process is not None:
+            with contextlib.suppress(OSError):
+                if process.stdin is not None:
+                    process.stdin.close()
+            try:
+                process.wait(timeout=_STOP_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+        stderr, self._stderr = self._stderr, None
+        if stderr is not None:
+            stderr.close()
+
+    def _stderr_text(self) -> str:
+        """Read what the process wrote to stderr (for crash reports).
+
+        Returns:
+            Trimmed stderr, or "" if unavailable
+        """
+        if self._stderr is None:
+            return ""
+        try:
+            self._stderr.seek(0)
+            return self._stderr.read().decode(errors="replace").strip()
+        except OSError:
+            return ""
+
+
+def _path_key(file_path: str) -> str:
+    """Normalise a path the same way for requests and ESLint's replies.
+
+    Args:
+        file_path: Path as submitted or as reported by ESLint
+
+    Returns:
+        Absolute path with symlinks resolved
+    """
+    return str(Path(file_path).resolve())
+
+
+def _fail(futures: dict[str, "Future[EslintFileResult]"], error: BaseException) -> None:
+    """Fail every future not already done.
+
+    Args:
+        futures: Futures by file path
+        error: Exception to set
+    """
+    for future in futures.values():
+        if not future.done():
+            future.set_exception(error)
+
+
+_workers: dict[Path, EslintWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_eslint_worker(
+    workspace_root: Path, *, debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS
+) -> EslintWorker:
+    """Get the shared worker for a workspace, creating it on first use.
+
+    Args:
+        workspace_root: Project root
+        debounce_seconds: Batch window for a newly created worker
+
+    Returns:
+        The workspace's EslintWorker
+    """
+    with _workers_lock:
+        worker = _workers.get(workspace_root)
+        if worker is None:
+            worker = EslintWorker(workspace_root, debounce_seconds=debounce_seconds)
+            _workers[workspace_root] = worker
+        return worker
+
+
+def shutdown_eslint_workers() -> None:
+    """Stop every worker process (called when the daemon stops)."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
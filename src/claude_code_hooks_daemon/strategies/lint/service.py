@@ -0,0 +1,311 @@
+"""Lint service - cached, coalesced lint runs shared by lint handlers.
+
+Every Write/Edit used to start the linters again, even when the file was
+saved with content that had already been checked. LintService remembers
+each run's verdict under a key made from the command, a hash of the
+content being linted and the modification times of lint config files
+around it, so unchanged content is never linted twice. A run for a key
+that is already in flight (rapid repeated saves of the same content) is
+shared instead of started again.
+
+Only definitive verdicts are cached (passed, or failed with errors);
+advisory results such as "linter not installed" or "timed out" are not.
+
+Python's default syntax check (``python -m py_compile``) is answered
+in-process with compile() instead of starting an interpreter.
+
+Usage:
+    service = LintService()
+    key = lint_cache_key(command, Path(file_path))
+    result = await service.run(key, lambda: run_linter(command))
+"""
+
+import asyncio
+import hashlib
+import sys
+import threading
+import traceback
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+
+from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
+
+# Verdicts kept (least recently used are evicted first)
+_MAX_CACHED = 512
+
+# Lint tool configuration files whose changes invalidate cached verdicts
+LINT_CONFIG_FILES = frozenset(
+    {
+        ".editorconfig",
+        ".flake8",
+        ".golangci.yaml",
+        ".golangci.yml",
+        ".rubocop.yml",
+        ".ruff.toml",
+        ".shellcheckrc",
+        ".swiftlint.yml",
+        "Cargo.toml",
+        "analysis_options.yaml",
+        "clippy.toml",
+        "composer.json",
+        "detekt.yml",
+        "go.mod",
+        "go.sum",
+        "mypy.ini",
+        "phpcs.xml",
+        "phpstan.neon",
+        "pyproject.toml",
+        "ruff.toml",
+        "setup.cfg",
+        "tox.ini",
+    }
+)
+
+# Directory marking the top of a project (config above it is not consulted)
+_PROJECT_ROOT_MARKER = ".git"
+
+# Interpreters whose "-m py_compile {file}" is answered in-process
+_PYTHON_INTERPRETERS = frozenset({sys.executable, "python", "python3"})
+_PY_COMPILE_ARGS = ("-m", "py_compile")
+
+LintJob = Callable[[], Awaitable[HookResult | None]]
+
+
+def content_digest(target: Path, suffix: str | None = None) -> str | None:
+    """Hash the content a lint command reads.
+
+    Args:
+        target: File, or directory for package-level commands (e.g. go vet)
+        suffix: For a directory, hash the files with this suffix in it
+
+    Returns:
+        Hex digest, or None if the content cannot be read
+    """
+    digest = hashlib.sha256()
+    try:
+        if target.is_dir():
+            for path in sorted(target.iterdir()):
+                if suffix is None or path.suffix == suffix:
+                    digest.update(path.name.encode())
+                    digest.update(path.read_bytes())
+        else:
+            digest.update(target.read_bytes())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def config_stamp(
+    target: Path, names: frozenset[str] = LINT_CONFIG_FILES
+) -> tuple[tuple[str, int], ...]:
+    """Get modification times of lint config files that apply to a target.
+
+    Looks in the target's directory and each parent up to the project root
+    (the first directory containing .git).
+
+    Args:
+        target: File or directory being linted
+        names: Config file names to look for
+
+    Returns:
+        (path, mtime_ns) for each config file found, nearest first
+    """
+    stamp: list[tuple[str, int]] = []
+    directory = target if target.is_dir() else target.parent
+    while True:
+        try:
+            entries = {entry.name for entry in directory.iterdir()}
+        except OSError:
+            entries = set()
+        for name in sorted(entries & names):
+            path = directory / name
+            try:
+                stamp.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                continue
+        if _PROJECT_ROOT_MARKER in entries or directory == directory.parent:
+            return tuple(stamp)
+        directory = directory.parent
+
+
+def lint_cache_key(
+    command: str,
+    target: Path,
+    *,
+    suffix: str | None = None,
+    config_names: frozenset[str] = LINT_CONFIG_FILES,
+) -> Hashable | None:
+    """Build the cache key for one lint command.
+
+    Args:
+        command: Command line with the file path filled in
+        target: File (or package directory) the command lints
+        suffix: For a directory target, suffix of the files it reads
+        config_names: Config file names that affect the command
+
+    Returns:
+        (command, content hash, config stamp), or None if the content
+        cannot be read (the run is then neither cached nor shared)
+    """
+    digest = content_digest(target, suffix)
+    if digest is None:
+        return None
+    return (command, digest, config_stamp(target, config_names))
+
+
+def is_py_compile(command_parts: list[str]) -> bool:
+    """Check whether a command is the stock Python syntax check.
+
+    Args:
+        command_parts: Command split into arguments
+
+    Returns:
+        True for "<python> -m py_compile <file>"
+    """
+    return (
+        len(command_parts) == len(_PY_COMPILE_ARGS) + 2
+        and command_parts[0] in _PYTHON_INTERPRETERS
+        and tuple(command_parts[1:-1]) == _PY_COMPILE_ARGS
+    )
+
+
+def compile_python(file_path: str) -> str | None:
+    """Syntax-check a Python file in-process, like python -m py_compile.
+
+    Args:
+        file_path: Python source file
+
+    Returns:
+        py_compile-style error text, or None if the file compiles
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    source = Path(file_path).read_bytes()
+    try:
+        compile(source, file_path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        return "".join(traceback.format_exception_only(type(e), e)).rstrip()
+    return None
+
+
+class LintService:
+    """Caches lint verdicts by content and shares identical in-flight runs."""
+
+    __slots__ = ("_cache", "_coalesced", "_hits", "_in_flight", "_lock", "_misses")
+
+    def __init__(self) -> None:
+        """Create with an empty cache."""
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[Hashable, HookResult | None] = OrderedDict()
+        self._in_flight: dict[
+            Hashable, tuple[asyncio.AbstractEventLoop, asyncio.Future[HookResult | None]]
+        ] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def run(
+        self,
+        key: Hashable | None,
+        job: LintJob,
+        revalidate: Callable[[], Hashable | None] | None = None,
+    ) -> HookResult | None:
+        """Get a lint verdict from cache, from an identical run, or by running.
+
+        Args:
+            key: From lint_cache_key() (None = always run, never cache)
+            job: Runs the linter: None if it passed, else a HookResult
+            revalidate: Rebuilds the key after the run; the verdict is not
+                cached if it differs (the content changed while linting)
+
+        Returns:
+            The job's result (a copy when served from cache)
+        """
+        if key is None:
+            return await job()
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return _copy(self._cache[key])
+            flight = self._in_flight.get(key)
+            # A run on another event loop (CLI threads) cannot be awaited here
+            if flight is not None and flight[0] is loop:
+                self._coalesced += 1
+                shared = flight[1]
+            else:
+                self._misses += 1
+                shared = None
+                owned: asyncio.Future[HookResult | None] = loop.create_future()
+                self._in_flight[key] = (loop, owned)
+
+        if shared is not None:
+            return _copy(await asyncio.shield(shared))
+
+        try:
+            result = await job()
+        except BaseException as e:
+            self._finish(key, owned)
+            if isinstance(e, asyncio.CancelledError):
+                owned.cancel()
+            else:
+                owned.set_exception(e)
+                # Sharers see the error; nobody may be waiting to retrieve it
+                owned.exception()
+            raise
+        self._finish(key, owned)
+        cacheable = result is None or result.decision == Decision.DENY
+        if cacheable and (revalidate is None or revalidate() == key):
+            with self._lock:
+                self._cache[key] = _copy(result)
+                while len(self._cache) > _MAX_CACHED:
+                    self._cache.popitem(last=False)
+        owned.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached verdict."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Cached verdicts, cache hits, runs, and runs shared with one in flight
+        """
+        with self._lock:
+            return {
+                "cached": len(self._cache),
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+            }
+
+    def _finish(self, key: Hashable, owned: "asyncio.Future[HookResult | None]") -> None:
+        """Stop sharing a finished run.
+
+        Args:
+            key: Run's cache key
+            owned: Future other callers waited on
+        """
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is not None and flight[1] is owned:
+                del self._in_flight[key]
+
+
+def _copy(result: HookResult | None) -> HookResult | None:
+    """Copy a result so callers cannot change the cached one.
+
+    Args:
+        result: Cached or shared result
+
+    Returns:
+        Deep copy (None stays None)
+    """
+    return None if result is None else result.model_copy(deep=True)
@@ -5,6 +5,7 @@ All utilities follow DRY principles - no duplication allowed.
 """
 
 from claude_code_hooks_daemon.utils.guides import get_llm_command_guide_path
+from claude_code_hooks_daemon.utils.latency import percentile, summarise_latencies
 from claude_code_hooks_daemon.utils.naming import (
     class_name_to_config_key,
     config_key_to_display_name,
@@ -24,4 +25,6 @@ __all__ = [
     "get_transcript_reader",
     "has_llm_commands_in_package_json",
     "is_stop_hook_active",
+    "percentile",
+    "summarise_latencies",
 ]
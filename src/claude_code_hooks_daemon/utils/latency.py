@@ -0,0 +1,69 @@
+"""Latency statistics utilities.
+
+Single source of truth for percentile maths used by the replay, load-test
+and benchmark tooling, so every report computes p50/p95/p99 the same way.
+
+Usage:
+    from claude_code_hooks_daemon.utils.latency import summarise_latencies
+
+    summary = summarise_latencies([1.2, 0.8, 3.4])
+    # {"count": 3, "min_ms": 0.8, "mean_ms": 1.8, "p50_ms": 1.2, ...}
+"""
+
+from collections.abc import Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Compute a percentile using linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Interpolated percentile value (0.0 for an empty sample)
+
+    Raises:
+        ValueError: If pct is outside 0-100
+    """
+    if not 0 <= pct <= 100:
+        raise ValueError(f"Percentile must be between 0 and 100, got {pct}")
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = rank - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+def summarise_latencies(values: Sequence[float]) -> dict[str, float]:
+    """Summarise latency samples in milliseconds.
+
+    Args:
+        values: Latency samples in milliseconds
+
+    Returns:
+        Dictionary with count, min_ms, mean_ms, p50_ms, p95_ms, p99_ms and max_ms
+    """
+    if not values:
+        return {
+            "count": 0,
+            "min_ms": 0.0,
+            "mean_ms": 0.0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+    return {
+        "count": len(values),
+        "min_ms": min(values),
+        "mean_ms": sum(values) / len(values),
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "p99_ms": percentile(values, 99),
+        "max_ms": max(values),
+    }
@@ -1,6 +1,7 @@
 """Tests for config initialization command."""
 
 import importlib
+import inspect
 import pkgutil
 import re
 import tempfile
@@ -71,6 +72,7 @@ def _discover_all_handlers() -> dict[str, list[str]]:
                         and issubclass(attr, Handler)
                         and attr is not Handler
                         and not attr.__name__.startswith("_")
+                        and not inspect.isabstract(attr)
                         and "HelloWorld" not in attr.__name__
                     ):
                         config_key = _to_snake_case(attr.__name__)
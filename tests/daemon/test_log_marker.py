@@ -16,6 +16,7 @@ class TestLogMarker:
         config.pid_file_path = None
         config.idle_timeout_seconds = 600
         config.log_level = "INFO"
+        config.log_buffer_size = 1000
 
         daemon = HooksDaemon(controller=MagicMock(), config=config)
 
@@ -41,6 +42,7 @@ class TestLogMarker:
         config.pid_file_path = None
         config.idle_timeout_seconds = 600
         config.log_level = "INFO"
+        config.log_buffer_size = 1000
 
         daemon = HooksDaemon(controller=MagicMock(), config=config)
 
@@ -58,6 +60,7 @@ class TestLogMarker:
         config.pid_file_path = None
         config.idle_timeout_seconds = 600
         config.log_level = "INFO"
+        config.log_buffer_size = 1000
 
         daemon = HooksDaemon(controller=MagicMock(), config=config)
 
@@ -76,6 +79,7 @@ class TestLogMarker:
         config.pid_file_path = None
         config.idle_timeout_seconds = 600
         config.log_level = "INFO"
+        config.log_buffer_size = 1000
 
         daemon = HooksDaemon(controller=MagicMock(), config=config)
 
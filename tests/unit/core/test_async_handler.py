@@ -0,0 +1,339 @@
+"""Tests for async handlers and run_process()."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import pytest
+
+from claude_code_hooks_daemon.core.async_handler import (
+    AsyncHandler,
+    attach_event_loop,
+    detach_event_loop,
+    run_process,
+)
+from claude_code_hooks_daemon.core.chain import HandlerChain
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.core.segment_cache import SegmentCache
+
+T = TypeVar("T")
+
+
+class _SyncHandler(Handler):
+    """Non-terminal synchronous handler."""
+
+    def __init__(self, name: str, priority: int, terminal: bool = False) -> None:
+        super().__init__(name=name, priority=priority, terminal=terminal)
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        return HookResult(context=[self.name])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+class _AsyncHandler(AsyncHandler):
+    """Async handler that records the thread its coroutine ran on."""
+
+    def __init__(self, name: str, priority: int, delay: float = 0.0) -> None:
+        super().__init__(name=name, priority=priority, terminal=False)
+        self.delay = delay
+        self.thread_id: int | None = None
+        self.calls = 0
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
+        self.thread_id = threading.get_ident()
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return HookResult(context=[self.name])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+@pytest.fixture
+def daemon_loop() -> Iterator[tuple[asyncio.AbstractEventLoop, threading.Thread]]:
+    """An event loop running on its own thread, attached for async handlers."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    attach_event_loop(loop)
+    yield loop, thread
+    detach_event_loop()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+class TestRunProcess:
+    """Tests for run_process()."""
+
+    def test_captures_text_output(self) -> None:
+        result = asyncio.run(run_process([sys.executable, "-c", "print('hi')"], text=True))
+
+        assert result.returncode == 0
+        assert result.stdout == "hi\n"
+
+    def test_timeout_kills_process(self) -> None:
+        command = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(run_process(command, timeout=0.2))
+
+    def test_check_raises_on_failure(self) -> None:
+        command = [sys.executable, "-c", "raise SystemExit(3)"]
+
+        with pytest.raises(subprocess.CalledProcessError):
+            asyncio.run(run_process(command, check=True))
+
+    def test_missing_command(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(run_process(["no-such-command-for-hooks-daemon-tests"]))
+
+
+class TestAsyncHandler:
+    """Tests for AsyncHandler.handle()."""
+
+    def test_runs_without_daemon_loop(self) -> None:
+        handler = _AsyncHandler("async", 10)
+
+        assert handler.handle({}).context == ["async"]
+
+    def test_runs_on_attached_loop(
+        self, daemon_loop: tuple[asyncio.AbstractEventLoop, threading.Thread]
+    ) -> None:
+        _, loop_thread = daemon_loop
+        handler = _AsyncHandler("async", 10)
+
+        result = handler.handle({})
+
+        assert result.context == ["async"]
+        assert handler.thread_id == loop_thread.ident
+
+    def test_deadline_cancels_handler(self) -> None:
+        handler = _AsyncHandler("slow", 10, delay=5.0)
+        handler.handle_deadline_seconds = 0.05  # type: ignore[misc]
+
+        with pytest.raises(TimeoutError):
+            handler.handle({})
+
+    def test_detach_cancels_waiting_handlers(
+        self, daemon_loop: tuple[asyncio.AbstractEventLoop, threading.Thread]
+    ) -> None:
+        handler = _AsyncHandler("stuck", 10, delay=30.0)
+        errors: list[BaseException] = []
+
+        def call() -> None:
+            try:
+                handler.handle({})
+            except BaseException as e:
+                errors.append(e)
+
+        caller = threading.Thread(target=call)
+        caller.start()
+        while handler.thread_id is None:
+            threading.Event().wait(0.01)
+        detach_event_loop()
+        caller.join(timeout=5)
+
+        assert not caller.is_alive()
+        assert isinstance(errors[0], CancelledError)
+
+    def test_chain_mixes_sync_and_async_handlers(
+        self, daemon_loop: tuple[asyncio.AbstractEventLoop, threading.Thread]
+    ) -> None:
+        chain = HandlerChain()
+        chain.add(_SyncHandler("sync-late", 30))
+        chain.add(_AsyncHandler("async", 20, delay=0.01))
+        chain.add(_SyncHandler("sync-early", 10))
+
+        result = chain.execute({})
+
+        assert result.result.context == ["sync-early", "async", "sync-late"]
+
+
+class _GatedHandler(AsyncHandler):
+    """Async handler that waits until the test releases it."""
+
+    def __init__(self, name: str, priority: int) -> None:
+        super().__init__(name=name, priority=priority, terminal=False)
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
+        self.started.set()
+        await self.release.wait()
+        return HookResult(context=[self.name])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+class _Offload:
+    """Offloads to a single worker thread, counting calls."""
+
+    def __init__(self) -> None:
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.calls = 0
+
+    def __call__(self, func: Callable[..., T], /, *args: Any) -> "asyncio.Future[T]":
+        self.calls += 1
+        return asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+
+class TestExecuteAsync:
+    """Tests for HandlerChain.execute_async()."""
+
+    def test_worker_thread_is_free_while_async_handler_waits(self) -> None:
+        chain = HandlerChain()
+        gated = _GatedHandler("async", 20)
+        chain.add(_SyncHandler("sync-early", 10))
+        chain.add(gated)
+        chain.add(_SyncHandler("sync-late", 30))
+        offload = _Offload()
+
+        async def scenario() -> list[str]:
+            run = asyncio.ensure_future(chain.execute_async({}, offload))
+            await asyncio.wait_for(gated.started.wait(), 5)
+            # The only worker thread takes other work while the handler waits
+            await asyncio.wait_for(offload(lambda: None), 5)
+            gated.release.set()
+            result = await asyncio.wait_for(run, 5)
+            return result.result.context
+
+        try:
+            assert asyncio.run(scenario()) == ["sync-early", "async", "sync-late"]
+        finally:
+            offload.pool.shutdown()
+
+    def test_async_handler_runs_on_the_loop(self) -> None:
+        chain = HandlerChain()
+        handler = _AsyncHandler("async", 10)
+        chain.add(handler)
+        offload = _Offload()
+
+        async def scenario() -> int:
+            await chain.execute_async({}, offload)
+            return threading.get_ident()
+
+        try:
+            loop_thread = asyncio.run(scenario())
+        finally:
+            offload.pool.shutdown()
+
+        assert handler.thread_id == loop_thread
+
+    def test_sync_runs_are_offloaded_once(self) -> None:
+        chain = HandlerChain()
+        for name, priority in (("a", 10), ("b", 20), ("c", 40), ("d", 50)):
+            chain.add(_SyncHandler(name, priority))
+        chain.add(_AsyncHandler("async", 30))
+        offload = _Offload()
+
+        try:
+            result = asyncio.run(chain.execute_async({}, offload))
+        finally:
+            offload.pool.shutdown()
+
+        assert result.result.context == ["a", "b", "async", "c", "d"]
+        # a+b, async's matches(), c+d
+        assert offload.calls == 3
+
+    def test_terminal_sync_handler_skips_later_async_handler(self) -> None:
+        chain = HandlerChain()
+        handler = _AsyncHandler("async", 20)
+        chain.add(_SyncHandler("gate", 10, terminal=True))
+        chain.add(handler)
+        offload = _Offload()
+
+        try:
+            result = asyncio.run(chain.execute_async({}, offload))
+        finally:
+            offload.pool.shutdown()
+
+        assert result.terminated_by == "gate"
+        assert handler.calls == 0
+
+    def test_missed_deadline_is_a_handler_error(self) -> None:
+        chain = HandlerChain()
+        handler = _AsyncHandler("slow", 10, delay=5.0)
+        handler.handle_deadline_seconds = 0.05  # type: ignore[misc]
+        chain.add(handler)
+        offload = _Offload()
+
+        try:
+            result = asyncio.run(chain.execute_async({}, offload))
+        finally:
+            offload.pool.shutdown()
+
+        assert result.result.context == ["Handler exception: TimeoutError: "]
+
+    def test_segment_cache_reuses_async_result(self) -> None:
+        chain = HandlerChain()
+        handler = _AsyncHandler("async", 10)
+        handler.segment_ttl_seconds = 60.0  # type: ignore[misc]
+        chain.add(handler)
+        cache = SegmentCache()
+        offload = _Offload()
+
+        async def scenario() -> list[str]:
+            await chain.execute_async({}, offload, segment_cache=cache)
+            result = await chain.execute_async({}, offload, segment_cache=cache)
+            return result.result.context
+
+        try:
+            assert asyncio.run(scenario()) == ["async"]
+        finally:
+            offload.pool.shutdown()
+
+        assert handler.calls == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_parallel_chain_runs_sync_handlers_on_pool(self) -> None:
+        chain = HandlerChain()
+        chain.add(_SyncHandler("sync", 10))
+        chain.add(_AsyncHandler("async", 20, delay=0.01))
+        offload = _Offload()
+        pool = ThreadPoolExecutor(max_workers=2)
+
+        try:
+            result = asyncio.run(chain.execute_async({}, offload, pool=pool))
+        finally:
+            offload.pool.shutdown()
+            pool.shutdown()
+
+        assert result.parallel
+        assert result.result.context == ["sync", "async"]
+        # Only the async handler's matches() used offload
+        assert offload.calls == 1
+
+    def test_has_async_handlers(self) -> None:
+        chain = HandlerChain()
+        chain.add(_SyncHandler("sync", 10))
+
+        assert not chain.has_async_handlers()
+        chain.add(_AsyncHandler("async", 20))
+        assert chain.has_async_handlers()
@@ -4,9 +4,15 @@ Tests HandlerChain execution, priority ordering, terminal/non-terminal behavior,
 error handling, and ChainExecutionResult.
 """
 
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import pytest
+
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult, HandlerChain
+from claude_code_hooks_daemon.core.data_layer import DaemonDataLayer, get_data_layer, use_data_layer
 from claude_code_hooks_daemon.core.handler import Handler
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
 
@@ -465,6 +471,18 @@ class TestHandlerChain:
         assert result.execution_time_ms > 0.0
         assert result.execution_time_ms < 100.0  # Should be very fast
 
+    def test_execute_records_per_handler_timings(self) -> None:
+        """execute records time for every evaluated handler, matched or not."""
+        chain = HandlerChain()
+        chain.add(MockHandler("h1", priority=10, should_match=False))
+        chain.add(MockHandler("h2", priority=20, terminal=True, result=HookResult.deny("no")))
+        chain.add(MockHandler("h3", priority=30))
+
+        result = chain.execute({"tool_name": "Bash"})
+
+        assert set(result.handler_timings_ms) == {"h1", "h2"}
+        assert all(ms >= 0.0 for ms in result.handler_timings_ms.values())
+
     def test_execute_handles_handler_exception(self) -> None:
         """execute handles exceptions raised by handlers with FAIL FAST (strict mode)."""
         chain = HandlerChain()
@@ -736,3 +754,110 @@ class TestHandlerChain:
         assert h3.handle_called == 1
         assert h4.handle_called == 0
         assert h5.handle_called == 1
+
+
+class _BarrierHandler(MockHandler):
+    """Handler that only finishes once its peers are running too."""
+
+    def __init__(self, name: str, priority: int, barrier: threading.Barrier, **kwargs: Any) -> None:
+        super().__init__(name, priority=priority, **kwargs)
+        self._barrier = barrier
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        self._barrier.wait(timeout=5)
+        return HookResult(context=[self.name])
+
+
+class TestParallelExecution:
+    """Tests for HandlerChain.execute() with a thread pool."""
+
+    @pytest.fixture
+    def pool(self) -> Iterator[ThreadPoolExecutor]:
+        pool = ThreadPoolExecutor(max_workers=4)
+        yield pool
+        pool.shutdown(wait=True)
+
+    def test_non_terminal_handlers_run_concurrently(self, pool: ThreadPoolExecutor) -> None:
+        barrier = threading.Barrier(3)
+        chain = HandlerChain()
+        for name, priority in (("late", 30), ("early", 10), ("middle", 20)):
+            chain.add(_BarrierHandler(name, priority, barrier))
+
+        result = chain.execute({}, pool=pool)
+
+        assert result.parallel
+        assert result.result.context == ["early", "middle", "late"]
+        assert result.handlers_executed == ["early", "middle", "late"]
+        assert set(result.handler_timings_ms) == {"early", "middle", "late"}
+
+    def test_terminal_handler_keeps_chain_sequential(self, pool: ThreadPoolExecutor) -> None:
+        chain = HandlerChain()
+        blocker = MockHandler("blocker", priority=10, terminal=True, result=HookResult.deny("no"))
+        later = MockHandler("later", priority=20)
+        chain.add(blocker)
+        chain.add(later)
+
+        result = chain.execute({}, pool=pool)
+
+        assert not result.parallel
+        assert later.matches_called == 0
+        assert result.terminated_by == "blocker"
+
+    def test_parallel_safe_terminal_stops_merge(self, pool: ThreadPoolExecutor) -> None:
+        chain = HandlerChain()
+        advice = MockHandler("advice", priority=5, result=HookResult(context=["advice"]))
+        blocker = MockHandler("blocker", priority=10, terminal=True, result=HookResult.deny("no"))
+        blocker.parallel_safe = True  # type: ignore[misc]
+        later = MockHandler("later", priority=20, result=HookResult(context=["later"]))
+        for handler in (advice, blocker, later):
+            chain.add(handler)
+
+        result = chain.execute({}, pool=pool)
+
+        assert result.parallel
+        assert result.terminated_by == "blocker"
+        assert result.result.decision == Decision.DENY
+        assert result.result.context == ["advice"]
+        assert result.handlers_executed == ["advice", "blocker"]
+
+    def test_strict_mode_error_is_merged_in_priority_order(self, pool: ThreadPoolExecutor) -> None:
+        chain = HandlerChain()
+        chain.add(MockHandler("first", priority=10, result=HookResult(context=["first"])))
+        chain.add(MockHandler("broken", priority=20, raise_exception=ValueError("boom")))
+        chain.add(MockHandler("last", priority=30, result=HookResult(context=["last"])))
+
+        result = chain.execute({}, strict_mode=True, pool=pool)
+
+        assert result.terminated_by == "broken"
+        assert result.result.decision == Decision.DENY
+        assert result.result.context[0] == "first"
+        assert "last" not in result.result.context
+
+    def test_handlers_see_bound_data_layer(self, pool: ThreadPoolExecutor) -> None:
+        seen: list[DaemonDataLayer] = []
+
+        class _Recorder(MockHandler):
+            def handle(self, hook_input: dict[str, Any]) -> HookResult:
+                seen.append(get_data_layer())
+                return HookResult()
+
+        chain = HandlerChain()
+        chain.add(_Recorder("a", priority=10))
+        chain.add(_Recorder("b", priority=20))
+        session_layer = DaemonDataLayer()
+
+        with use_data_layer(session_layer):
+            chain.execute({}, pool=pool)
+
+        assert seen == [session_layer, session_layer]
+
+    def test_runs_inline_when_pool_is_shut_down(self) -> None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown()
+        chain = HandlerChain()
+        chain.add(MockHandler("a", priority=10, result=HookResult(context=["a"])))
+        chain.add(MockHandler("b", priority=20, result=HookResult(context=["b"])))
+
+        result = chain.execute({}, pool=pool)
+
+        assert result.result.context == ["a", "b"]
@@ -3,11 +3,18 @@
 TDD RED phase: These tests define the expected API for DaemonDataLayer.
 """
 
+from typing import Any
+from unittest.mock import MagicMock
+
 from claude_code_hooks_daemon.constants import ToolName
+from claude_code_hooks_daemon.core import data_layer as data_layer_module
 from claude_code_hooks_daemon.core.data_layer import (
     DaemonDataLayer,
+    SessionRegistry,
     get_data_layer,
+    get_session_registry,
     reset_data_layer,
+    use_data_layer,
 )
 from claude_code_hooks_daemon.core.handler_history import HandlerHistory
 from claude_code_hooks_daemon.core.session_state import SessionState
@@ -134,3 +141,90 @@ class TestDaemonDataLayerIntegration:
         )
         assert dl.history.was_blocked(ToolName.BASH) is True
         assert dl.history.count_blocks() == 1
+
+
+class TestSessionRegistry:
+    """Test per-session data layer partitions."""
+
+    def test_same_session_gets_same_partition(self) -> None:
+        registry = SessionRegistry()
+        assert registry.acquire("s1") is registry.acquire("s1")
+        assert registry.acquire("s1") is not registry.acquire("s2")
+
+    def test_lru_cap_evicts_least_recently_used(self) -> None:
+        registry = SessionRegistry(max_sessions=2)
+        registry.acquire("s1")
+        registry.acquire("s2")
+        registry.acquire("s1")
+        registry.acquire("s3")
+
+        assert [sid for sid, _ in registry.items()] == ["s1", "s3"]
+        assert registry.pop_evicted() == ["s2"]
+        assert registry.pop_evicted() == []
+
+    def test_idle_partitions_are_evicted(self, monkeypatch: Any) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(data_layer_module.time, "monotonic", lambda: clock[0])
+        registry = SessionRegistry(idle_timeout_seconds=600)
+        registry.acquire("old")
+        clock[0] += 500
+        registry.acquire("recent")
+        clock[0] += 200
+
+        registry.acquire("new")
+
+        assert [sid for sid, _ in registry.items()] == ["recent", "new"]
+        assert registry.pop_evicted() == ["old"]
+
+    def test_end_session(self) -> None:
+        registry = SessionRegistry()
+        registry.acquire("s1")
+
+        assert registry.end_session("s1") is True
+        assert registry.end_session("s1") is False
+        assert len(registry) == 0
+        assert registry.stats()["evicted_total"] == 1
+
+    def test_store_is_attached_to_new_and_existing_partitions(self) -> None:
+        registry = SessionRegistry()
+        store = MagicMock()
+        registry.acquire("s1")
+        registry.attach_store(store)
+
+        for session_id in ("s1", "s2"):
+            registry.acquire(session_id).history.record(
+                handler_id="h", event_type="PreToolUse", decision="deny", tool_name="Bash"
+            )
+
+        assert store.add.call_count == 2
+
+    def test_stats_report_largest_partitions(self) -> None:
+        registry = SessionRegistry()
+        registry.acquire("quiet")
+        registry.acquire("busy").history.record(
+            handler_id="h", event_type="PreToolUse", decision="deny", tool_name="Bash", reason="x"
+        )
+
+        stats = registry.stats()
+
+        assert stats["live"] == 2
+        assert stats["largest"][0]["session_id"] == "busy"
+        assert stats["largest"][0]["history_records"] == 1
+        assert stats["approx_bytes"] > 0
+
+
+class TestUseDataLayer:
+    """Test binding a partition for get_data_layer()."""
+
+    def test_bound_partition_is_returned_then_released(self) -> None:
+        reset_data_layer()
+        partition = DaemonDataLayer()
+
+        with use_data_layer(partition):
+            assert get_data_layer() is partition
+        assert get_data_layer() is not partition
+
+    def test_reset_clears_registry(self) -> None:
+        get_session_registry().acquire("s1")
+        reset_data_layer()
+        assert len(get_session_registry()) == 0
@@ -0,0 +1,176 @@
+"""Tests for deferred side-effect work."""
+
+import contextvars
+import threading
+from pathlib import Path
+
+import pytest
+
+from claude_code_hooks_daemon.core import deferred
+from claude_code_hooks_daemon.core.deferred import (
+    BufferedAppender,
+    DeferredWork,
+    append_line,
+    collect_deferred,
+    defer,
+    release_deferred,
+)
+
+
+def _raise_os_error(_self: BufferedAppender) -> None:
+    raise OSError("disk full")
+
+
+class TestDefer:
+    """Tests for defer() with the process-wide queue (no worker in tests)."""
+
+    def test_runs_inline_outside_a_request(self) -> None:
+        ran: list[str] = []
+
+        defer(lambda: ran.append("task"))
+
+        assert ran == ["task"]
+
+    def test_collected_until_released(self) -> None:
+        ran: list[str] = []
+
+        with collect_deferred() as tasks:
+            defer(lambda: ran.append("task"))
+            assert ran == []
+        release_deferred(tasks)
+        release_deferred(tasks)
+
+        assert ran == ["task"]
+
+    def test_collection_reaches_copied_contexts(self) -> None:
+        with collect_deferred() as tasks:
+            contextvars.copy_context().run(defer, lambda: None)
+
+        assert len(tasks) == 1
+
+    def test_append_line_writes_and_closes_inline(self, tmp_path: Path) -> None:
+        path = tmp_path / "logs" / "events.jsonl"
+
+        defer(lambda: append_line(path, '{"n": 1}'))
+        defer(lambda: append_line(path, '{"n": 2}'))
+
+        assert path.read_text() == '{"n": 1}\n{"n": 2}\n'
+
+
+class TestDeferredWork:
+    """Tests for the background worker."""
+
+    def test_shutdown_runs_queued_tasks_and_flushes(self, tmp_path: Path) -> None:
+        work = DeferredWork()
+        path = tmp_path / "events.jsonl"
+        work.start()
+
+        for n in range(250):
+            work.submit(lambda n=n: work.appender(path).write_line(str(n)))
+        work.shutdown()
+
+        assert path.read_text().splitlines() == [str(n) for n in range(250)]
+        assert work.snapshot() == {
+            "running": False,
+            "queued": 0,
+            "completed": 250,
+            "failed": 0,
+            "dropped": 0,
+            "write_errors": 0,
+        }
+
+    def test_failing_task_is_counted(self) -> None:
+        work = DeferredWork()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        work.submit(fail)
+
+        assert work.snapshot()["failed"] == 1
+
+    def test_failed_write_is_counted(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        work = DeferredWork()
+
+        work.submit(lambda: work.appender(blocker / "events.jsonl").write_line("x"))
+
+        assert work.snapshot()["failed"] == 1
+
+    def test_failed_flush_is_counted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(BufferedAppender, "flush", _raise_os_error)
+        work = DeferredWork()
+        work.start()
+
+        work.submit(lambda: work.appender(tmp_path / "events.jsonl").write_line("x"))
+        work.shutdown()
+
+        assert work.snapshot()["write_errors"] == 1
+
+    def test_full_queue_drops(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(deferred, "_MAX_QUEUED", 1)
+        work = DeferredWork()
+        release = threading.Event()
+        started = threading.Event()
+
+        def block() -> None:
+            started.set()
+            release.wait(5)
+
+        work.start()
+        work.submit(block)
+        started.wait(5)
+        work.submit(lambda: None)
+        work.submit(lambda: None)
+        release.set()
+        work.shutdown()
+
+        assert work.snapshot()["dropped"] == 1
+        assert work.snapshot()["completed"] == 2
+
+    def test_appender_shared_per_file(self, tmp_path: Path) -> None:
+        work = DeferredWork()
+
+        assert work.appender(tmp_path / "a") is work.appender(tmp_path / "a")
+        assert work.appender(tmp_path / "a") is not work.appender(tmp_path / "b")
+
+
+class TestBufferedAppender:
+    """Tests for BufferedAppender."""
+
+    def test_buffered_until_flush(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        appender = BufferedAppender(path)
+
+        appender.write_line("one")
+        before = path.read_text()
+        appender.flush()
+
+        assert before == ""
+        assert path.read_text() == "one\n"
+        appender.close()
+
+    def test_rotates_by_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        appender = BufferedAppender(path, max_bytes=8, backups=2)
+
+        for line in ("aaaa", "bbbb", "cccc", "dddd", "eeee"):
+            appender.write_line(line)
+        appender.close()
+
+        assert path.read_text() == "eeee\n"
+        assert (tmp_path / "events.jsonl.1").read_text() == "cccc\ndddd\n"
+        assert (tmp_path / "events.jsonl.2").read_text() == "aaaa\nbbbb\n"
+        assert not (tmp_path / "events.jsonl.3").exists()
+
+    def test_counts_existing_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        path.write_text("1234567\n")
+        appender = BufferedAppender(path, max_bytes=10, backups=1)
+
+        appender.write_line("x")
+        appender.close()
+
+        assert (tmp_path / "events.jsonl.1").read_text() == "1234567\nx\n"
+        assert not path.exists()
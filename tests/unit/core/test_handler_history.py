@@ -271,6 +271,43 @@ class TestHandlerHistoryMaxSize:
             )
         assert history.total_count == 5
 
+    def test_evicted_blocks_are_no_longer_counted(self) -> None:
+        """Block counters follow the retained window, not all records ever made."""
+        history = HandlerHistory(max_size=2)
+        history.record(handler_id="h1", event_type="PreToolUse", decision="deny", tool_name="Bash")
+        history.record(handler_id="h2", event_type="PreToolUse", decision="allow", tool_name="Read")
+        history.record(handler_id="h2", event_type="PreToolUse", decision="ask", tool_name="Read")
+
+        assert history.count_blocks() == 1
+        assert history.count_blocks_by_handler("h1") == 0
+        assert history.count_blocks_by_handler("h2") == 1
+        assert not history.was_blocked("Bash")
+        assert history.was_blocked("Read")
+
+
+class TestHandlerHistoryStore:
+    """Test HandlerHistory.attach_store()."""
+
+    def test_records_are_sent_to_the_store(self) -> None:
+        """Each decision, with its session, reaches the attached store."""
+        stored: list[HandlerDecisionRecord] = []
+
+        class _Store:
+            def add(self, record: HandlerDecisionRecord) -> None:
+                stored.append(record)
+
+        history = HandlerHistory()
+        history.attach_store(_Store())
+        history.record(
+            handler_id="h1",
+            event_type="PreToolUse",
+            decision="deny",
+            tool_name=ToolName.BASH,
+            session_id="s1",
+        )
+
+        assert [(r.handler_id, r.session_id) for r in stored] == [("h1", "s1")]
+
 
 class TestHandlerHistoryReset:
     """Test HandlerHistory.reset()."""
@@ -385,6 +422,43 @@ class TestHandlerHistoryCountBlocksByHandler:
         assert history.count_blocks_by_handler("block-sed-command") == 1
 
 
+class TestHandlerHistoryExportRestore:
+    """Test HandlerHistory.export() and restore()."""
+
+    def test_restored_history_answers_the_same_queries(self) -> None:
+        """Restoring an export keeps block counts and total_count."""
+        source = HandlerHistory()
+        source.record(
+            handler_id="destructive-git",
+            event_type="PreToolUse",
+            decision="deny",
+            tool_name=ToolName.BASH,
+            reason="force push",
+        )
+        source.record(
+            handler_id="tdd", event_type="PreToolUse", decision="allow", tool_name=ToolName.WRITE
+        )
+
+        target = HandlerHistory()
+        target.restore(source.export())
+
+        assert target.get_recent(2) == source.get_recent(2)
+        assert target.count_blocks_by_handler("destructive-git") == 1
+        assert target.total_count == 2
+
+    def test_restored_records_go_before_new_ones(self) -> None:
+        """Records made before restore() stay the most recent."""
+        source = HandlerHistory()
+        source.record(handler_id="old", event_type="Stop", decision="deny", tool_name="")
+        target = HandlerHistory()
+        target.record(handler_id="new", event_type="Stop", decision="deny", tool_name="")
+
+        target.restore(source.export())
+
+        assert [r.handler_id for r in target.get_recent(2)] == ["new", "old"]
+        assert target.total_count == 2
+
+
 class TestHandlerDecisionRecord:
     """Test the HandlerDecisionRecord dataclass."""
 
@@ -0,0 +1,158 @@
+"""Tests for priority-aware load shedding."""
+
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.core.chain import HandlerChain
+from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.core.load_shedding import SHED_CONTEXT_PREFIX, LoadShedder
+from claude_code_hooks_daemon.core.router import EventRouter
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+_SLOW_MS = 500.0
+
+
+class _ContextHandler(Handler):
+    """Non-terminal handler that adds its name as context."""
+
+    def __init__(self, name: str, priority: int, terminal: bool = False) -> None:
+        super().__init__(name=name, priority=priority, terminal=terminal)
+        self.calls = 0
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        self.calls += 1
+        return HookResult(context=[self.name])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+def _pressured(**options: Any) -> LoadShedder:
+    shedder = LoadShedder()
+    shedder.configure(enabled=True, p95_threshold_ms=100.0, **options)
+    for _ in range(20):
+        shedder.record_latency(_SLOW_MS)
+    return shedder
+
+
+class TestLoadShedder:
+    """Tests for LoadShedder.should_shed()."""
+
+    def test_disabled_by_default(self) -> None:
+        shedder = LoadShedder()
+        for _ in range(20):
+            shedder.record_latency(_SLOW_MS)
+
+        assert not shedder.should_shed(_ContextHandler("advice", 60))
+
+    def test_no_shedding_without_pressure(self) -> None:
+        shedder = LoadShedder()
+        shedder.configure(enabled=True, p95_threshold_ms=100.0)
+        shedder.record_latency(1.0)
+
+        assert not shedder.should_shed(_ContextHandler("advice", 60))
+        assert not shedder.snapshot()["active"]
+
+    def test_sheds_low_priority_under_latency_pressure(self) -> None:
+        shedder = _pressured()
+
+        assert shedder.should_shed(_ContextHandler("advice", 60))
+        snapshot = shedder.snapshot()
+        assert snapshot["active"]
+        assert snapshot["activations"] == 1
+        assert snapshot["shed_by_handler"] == {"advice": 1}
+
+    def test_queue_depth_alone_triggers_shedding(self) -> None:
+        shedder = LoadShedder()
+        shedder.configure(enabled=True, queue_depth_threshold=3)
+        shedder.attach_queue_depth(lambda: 5)
+
+        assert shedder.should_shed(_ContextHandler("logger", 100))
+        assert shedder.snapshot()["queue_depth"] == 5
+
+    @pytest.mark.parametrize(
+        ("priority", "terminal"),
+        [(10, False), (50, False), (60, True)],
+        ids=["safety", "below-min-priority", "terminal"],
+    )
+    def test_protected_handlers_are_never_shed(self, priority: int, terminal: bool) -> None:
+        shedder = _pressured()
+
+        assert not shedder.should_shed(_ContextHandler("kept", priority, terminal))
+
+    def test_min_priority_cannot_reach_safety_band(self) -> None:
+        shedder = _pressured(min_priority=1)
+
+        assert not shedder.should_shed(_ContextHandler("guard", 20))
+        assert shedder.snapshot()["min_priority"] == 21
+
+    def test_sampling_runs_one_in_n(self) -> None:
+        shedder = _pressured(sample_one_in=3)
+        handler = _ContextHandler("advice", 60)
+
+        decisions = [shedder.should_shed(handler) for _ in range(6)]
+
+        assert decisions == [True, True, False, True, True, False]
+        snapshot = shedder.snapshot()
+        assert snapshot["shed_total"] == 4
+        assert snapshot["sampled_total"] == 2
+
+
+class TestChainShedding:
+    """Tests for HandlerChain.execute() with a shedder."""
+
+    def test_shed_handlers_are_skipped_and_reported(self) -> None:
+        chain = HandlerChain()
+        guard = _ContextHandler("guard", 10)
+        advice = _ContextHandler("advice", 60)
+        chain.add(guard)
+        chain.add(advice)
+
+        result = chain.execute({}, shedder=_pressured())
+
+        assert guard.calls == 1
+        assert advice.calls == 0
+        assert result.handlers_shed == ["advice"]
+        assert result.result.context == ["guard"]
+
+
+class TestControllerShedding:
+    """Tests for load shedding in DaemonController."""
+
+    @pytest.fixture
+    def controller(self) -> DaemonController:
+        controller = DaemonController()
+        router = EventRouter()
+        router.register(EventType.PRE_TOOL_USE, _ContextHandler("advice", 60))
+        router.register(EventType.STATUS_LINE, _ContextHandler("segment", 60))
+        controller._router = router
+        controller._initialised = True
+        controller.load_shedder.configure(enabled=True, p95_threshold_ms=100.0)
+        for _ in range(20):
+            controller.load_shedder.record_latency(_SLOW_MS)
+        return controller
+
+    def test_shed_handlers_are_flagged_in_context(self, controller: DaemonController) -> None:
+        event = HookEvent(event=EventType.PRE_TOOL_USE, hook_input=HookInput(tool_name="Bash"))
+
+        result = controller.process_event(event)
+
+        assert result.handlers_shed == ["advice"]
+        assert any(ctx.startswith(SHED_CONTEXT_PREFIX) for ctx in result.result.context)
+        assert controller.get_health()["load_shedding"]["shed_total"] == 1
+
+    def test_status_line_is_never_shed(self, controller: DaemonController) -> None:
+        event = HookEvent(event=EventType.STATUS_LINE, hook_input=HookInput())
+
+        result = controller.process_event(event)
+
+        assert result.result.context == ["segment"]
@@ -6,12 +6,15 @@ PseudoEventConfig, PseudoEventDispatcher, and result merging.
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult
+from claude_code_hooks_daemon.core.deferred import collect_deferred, release_deferred
 from claude_code_hooks_daemon.core.event import EventType
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
 from claude_code_hooks_daemon.core.pseudo_event import (
@@ -497,3 +500,197 @@ class TestMergePseudoResults:
         merged = merge_pseudo_results(real, pseudo)
         assert merged.result.decision == Decision.DENY
         assert merged.result.reason == "First denial"
+
+
+class TestPseudoEventDispatcherExportRestore:
+    """Test moving dispatcher state to another daemon process."""
+
+    def test_counters_carry_on_after_restore(self) -> None:
+        """A restored dispatcher fires where the previous one would have."""
+        config = PseudoEventConfig.from_dict(
+            "nitpick", {"triggers": ["pre_tool_use:1/3"], "handlers": {}}
+        )
+        chain = MagicMock()
+        chain.execute.return_value = ChainExecutionResult(result=HookResult.allow())
+
+        source = PseudoEventDispatcher()
+        source.register(config, setup_fn=lambda hook_input, sid: hook_input, chain=chain)
+        for _ in range(2):
+            source.check_and_fire(EventType.PRE_TOOL_USE, {}, "session-1")
+
+        target = PseudoEventDispatcher()
+        target.register(config, setup_fn=lambda hook_input, sid: hook_input, chain=chain)
+        target.restore(source.export())
+
+        assert len(target.check_and_fire(EventType.PRE_TOOL_USE, {}, "session-1")) == 1
+
+    def test_forget_session_drops_counters_and_setup_state(self) -> None:
+        """A forgotten session starts counting again from zero."""
+        config = PseudoEventConfig.from_dict(
+            "nitpick", {"triggers": ["pre_tool_use:1/2"], "handlers": {}}
+        )
+        chain = MagicMock()
+        chain.execute.return_value = ChainExecutionResult(result=HookResult.allow())
+        setup = MagicMock(spec=["__call__", "export", "restore", "forget_session"])
+        setup.return_value = {}
+        dispatcher = PseudoEventDispatcher()
+        dispatcher.register(config, setup_fn=setup, chain=chain)
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {}, "session-1")
+
+        dispatcher.forget_session("session-1")
+
+        setup.forget_session.assert_called_once_with("session-1")
+        assert dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {}, "session-1") == []
+
+
+# ─── Background evaluation ───
+
+
+class TestPseudoEventDispatcherBackground:
+    """Test background pseudo-events with results delivered on the next event."""
+
+    def _make_dispatcher(
+        self, trigger_str: str = "pre_tool_use:1/1", **options: Any
+    ) -> tuple[PseudoEventDispatcher, MagicMock]:
+        """Create dispatcher with one background pseudo-event returning context."""
+        config = PseudoEventConfig.from_dict(
+            "nitpick",
+            {"triggers": [trigger_str], "handlers": {}, "background": True, **options},
+        )
+        chain = MagicMock()
+        chain.execute.side_effect = lambda hook_input: ChainExecutionResult(
+            result=HookResult(context=[f"finding {hook_input['n']}"])
+        )
+        setup_fn = MagicMock(side_effect=lambda hook_input, sid: hook_input)
+        dispatcher = PseudoEventDispatcher()
+        dispatcher.register(config, setup_fn=setup_fn, chain=chain)
+        return dispatcher, setup_fn
+
+    def test_from_dict_background_options(self) -> None:
+        config = PseudoEventConfig.from_dict(
+            "nitpick",
+            {"triggers": ["stop:1/1"], "background": True, "max_staleness_seconds": 60},
+        )
+
+        assert config.background is True
+        assert config.max_staleness_seconds == 60.0
+
+    def test_from_dict_rejects_non_positive_staleness(self) -> None:
+        with pytest.raises(ValueError, match="max_staleness_seconds"):
+            PseudoEventConfig.from_dict(
+                "nitpick", {"triggers": ["stop:1/1"], "max_staleness_seconds": 0}
+            )
+
+    def test_result_delivered_on_next_eligible_event(self) -> None:
+        dispatcher, _ = self._make_dispatcher("pre_tool_use:1/2")
+        delivered = [
+            [r.context for r in dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": n}, "s")]
+            for n in range(1, 6)
+        ]
+
+        # Fires on events 2 and 4 (fraction kept); each result rides on the next event
+        assert delivered == [[], [], [["finding 2"]], [], [["finding 4"]]]
+
+    def test_not_delivered_on_other_event_types(self) -> None:
+        dispatcher, _ = self._make_dispatcher()
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s")
+
+        assert dispatcher.check_and_fire(EventType.STOP, {"n": 2}, "s") == []
+        assert len(dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 3}, "s")) == 1
+
+    def test_results_are_per_session(self) -> None:
+        dispatcher, _ = self._make_dispatcher()
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s1")
+
+        assert dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 2}, "s2") == []
+
+    def test_stale_results_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.pseudo_event.time.monotonic", lambda: now[0]
+        )
+        dispatcher, _ = self._make_dispatcher(max_staleness_seconds=30)
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s")
+        now[0] += 31
+
+        assert dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 2}, "s") == []
+
+    def test_forget_session_drops_parked_results(self) -> None:
+        dispatcher, _ = self._make_dispatcher()
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s")
+
+        dispatcher.forget_session("s")
+
+        assert dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 2}, "s") == []
+
+    def test_evaluated_after_the_response(self) -> None:
+        dispatcher, setup_fn = self._make_dispatcher()
+
+        with collect_deferred() as tasks:
+            assert dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s") == []
+        setup_fn.assert_not_called()
+        release_deferred(tasks)
+
+        setup_fn.assert_called_once()
+
+    def test_background_pool_runs_fires_off_the_deferred_thread(self) -> None:
+        dispatcher, setup_fn = self._make_dispatcher()
+        fired_on: list[str] = []
+        setup_fn.side_effect = lambda hook_input, sid: (
+            fired_on.append(threading.current_thread().name) or hook_input
+        )
+        dispatcher.start_background()
+        try:
+            dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s")
+            for _ in range(500):
+                if dispatcher._parked:
+                    break
+                time.sleep(0.01)
+        finally:
+            dispatcher.shutdown_background()
+
+        assert fired_on[0].startswith("hooks-daemon-pseudo-event")
+        results = dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 2}, "s")
+        assert [r.context for r in results] == [["finding 1"]]
+
+    def test_fires_for_one_session_never_overlap(self) -> None:
+        dispatcher, setup_fn = self._make_dispatcher()
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def setup(hook_input: dict[str, Any], sid: str) -> dict[str, Any]:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return hook_input
+
+        setup_fn.side_effect = setup
+        registered = dispatcher._registered[0]
+        threads = [
+            threading.Thread(target=dispatcher._fire, args=(registered, {"n": n}, "s"))
+            for n in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert peak[0] == 1
+
+    def test_shut_down_pool_drops_fires(self) -> None:
+        dispatcher, setup_fn = self._make_dispatcher()
+        dispatcher.start_background()
+        dispatcher.shutdown_background()
+        dispatcher.start_background()
+        pool = dispatcher._background
+        assert pool is not None
+        pool.shutdown()
+
+        dispatcher.check_and_fire(EventType.PRE_TOOL_USE, {"n": 1}, "s")
+
+        setup_fn.assert_not_called()
+        dispatcher.shutdown_background()
@@ -322,7 +322,9 @@ class TestEventRouter:
         """
         from claude_code_hooks_daemon.core.chain import ChainExecutionResult, HandlerChain
 
-        def mock_execute(self, hook_input, strict_mode=False):
+        def mock_execute(
+            self, hook_input, strict_mode=False, shedder=None, segment_cache=None, pool=None
+        ):
             # Return DENY result but with empty handlers_executed list
             return ChainExecutionResult(
                 result=HookResult.deny(reason="Edge case denial"),
@@ -0,0 +1,138 @@
+"""Tests for the status line segment cache."""
+
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.core.chain import HandlerChain
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.core.segment_cache import SegmentCache, file_mtime_ns
+
+
+class _Segment(Handler):
+    """Status segment that counts how often it is computed."""
+
+    def __init__(self, name: str, ttl: float | None) -> None:
+        super().__init__(name=name, priority=10, terminal=False)
+        self.segment_ttl_seconds = ttl  # type: ignore[misc]
+        self.key: Hashable = None
+        self.calls = 0
+
+    def segment_cache_key(self, hook_input: dict[str, Any]) -> Hashable:
+        return self.key
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        self.calls += 1
+        return HookResult(context=[f"{self.name} #{self.calls}"])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr("claude_code_hooks_daemon.core.segment_cache.time.monotonic", clock)
+    return clock
+
+
+class TestSegmentCache:
+    """Tests for SegmentCache.handle()."""
+
+    def test_reused_within_ttl(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        segment = _Segment("branch", ttl=30.0)
+
+        first = cache.handle(segment, {})
+        clock.now += 29.0
+        second = cache.handle(segment, {})
+
+        assert segment.calls == 1
+        assert second.context == first.context
+        assert cache.stats() == {"segments": 1, "hits": 1, "misses": 1}
+
+    def test_recomputed_after_ttl(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        segment = _Segment("branch", ttl=30.0)
+
+        cache.handle(segment, {})
+        clock.now += 30.0
+        cache.handle(segment, {})
+
+        assert segment.calls == 2
+
+    def test_recomputed_when_key_changes(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        segment = _Segment("branch", ttl=30.0)
+
+        cache.handle(segment, {})
+        segment.key = "moved"
+        result = cache.handle(segment, {})
+
+        assert segment.calls == 2
+        assert result.context == ["branch #2"]
+
+    def test_handlers_without_ttl_always_run(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        segment = _Segment("clock", ttl=None)
+
+        cache.handle(segment, {})
+        cache.handle(segment, {})
+
+        assert segment.calls == 2
+        assert cache.stats()["segments"] == 0
+
+    def test_cached_result_is_not_shared(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        segment = _Segment("branch", ttl=30.0)
+
+        cache.handle(segment, {}).add_handler("mutated")
+        result = cache.handle(segment, {})
+
+        assert "mutated" not in result.handlers_matched
+
+    def test_chain_uses_cache_for_status_segments(self, clock: _Clock) -> None:
+        cache = SegmentCache()
+        cached = _Segment("branch", ttl=30.0)
+        volatile = _Segment("clock", ttl=None)
+        chain = HandlerChain()
+        chain.add(cached)
+        chain.add(volatile)
+
+        chain.execute({}, segment_cache=cache)
+        result = chain.execute({}, segment_cache=cache)
+
+        assert (cached.calls, volatile.calls) == (1, 2)
+        assert result.result.context == ["branch #1", "clock #2"]
+
+
+class TestFileMtime:
+    """Tests for file_mtime_ns()."""
+
+    def test_missing_file_is_none(self, tmp_path: Path) -> None:
+        assert file_mtime_ns(tmp_path / "missing") is None
+
+    def test_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "settings.json"
+        path.write_text("{}")
+
+        assert file_mtime_ns(path) == path.stat().st_mtime_ns
@@ -3,6 +3,7 @@
 TDD RED phase: These tests define the expected API for SessionState.
 """
 
+import json
 from datetime import datetime
 
 import pytest
@@ -231,3 +232,35 @@ class TestSessionStateReset:
         assert state.context_used_percentage == 0.0
         assert state.last_updated is None
         assert state.is_populated is False
+
+
+class TestSessionStateExportRestore:
+    """Test SessionState.export()/restore()."""
+
+    def test_round_trip(self) -> None:
+        """restore() reproduces the exported state."""
+        source = SessionState()
+        source.update_from_status_event(
+            {
+                "model": {"id": "claude-opus-4-6", "display_name": "Opus"},
+                "context_window": {"used_percentage": 42.0},
+            }
+        )
+        target = SessionState()
+
+        target.restore(json.loads(json.dumps(source.export())))
+
+        assert target.model_id == "claude-opus-4-6"
+        assert target.context_used_percentage == 42.0
+        assert target.last_updated == source.last_updated
+
+    def test_newer_state_is_kept(self) -> None:
+        """restore() does not overwrite state from a StatusLine event seen since."""
+        source = SessionState()
+        source.update_from_status_event({"model": {"id": "old-model"}})
+        target = SessionState()
+        target.update_from_status_event({"model": {"id": "new-model"}})
+
+        target.restore(source.export())
+
+        assert target.model_id == "new-model"
@@ -0,0 +1,173 @@
+"""Tests for daemon traffic capture."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import TrafficCaptureConfig
+from claude_code_hooks_daemon.core.chain import ChainExecutionResult
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.daemon.capture import (
+    CAPTURE_FORMAT_VERSION,
+    TrafficCapture,
+    decision_from_response,
+    redact_payload,
+)
+
+
+def _read_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestDecisionFromResponse:
+    """Tests for normalising decisions across response shapes."""
+
+    @pytest.mark.parametrize(
+        ("event", "result", "expected"),
+        [
+            ("PreToolUse", HookResult.deny("no"), "deny"),
+            ("PreToolUse", HookResult.ask("sure?"), "ask"),
+            ("PreToolUse", HookResult.allow(), "allow"),
+            ("PostToolUse", HookResult.deny("bad"), "deny"),
+            ("Stop", HookResult.deny("keep going"), "deny"),
+            ("PermissionRequest", HookResult.deny("no"), "deny"),
+            ("Status", HookResult.allow(context=["x"]), "allow"),
+            ("SessionStart", HookResult.allow(context=["hello"]), "allow"),
+        ],
+    )
+    def test_decision_for_each_event_shape(
+        self, event: str, result: HookResult, expected: str
+    ) -> None:
+        assert decision_from_response(result.to_json(event)) == expected
+
+    def test_error_response(self) -> None:
+        assert decision_from_response({"error": "boom"}) == "error"
+
+
+class TestRedactPayload:
+    """Tests for content redaction."""
+
+    def test_none_mode_returns_payload_unchanged(self) -> None:
+        payload = {"tool_input": {"content": "secret"}}
+        assert redact_payload(payload, "none") is payload
+
+    def test_redact_mode_replaces_content_fields_recursively(self) -> None:
+        payload = {
+            "event": "PreToolUse",
+            "hook_input": {
+                "tool_name": "Write",
+                "tool_input": {"file_path": "/a.py", "content": "secret"},
+                "edits": [{"old_string": "a", "new_string": "b"}],
+            },
+        }
+
+        redacted = redact_payload(payload, "redact")
+
+        tool_input = redacted["hook_input"]["tool_input"]
+        assert tool_input["file_path"] == "/a.py"
+        assert tool_input["content"] == "<redacted:6 chars>"
+        assert redacted["hook_input"]["edits"].startswith("<redacted:")
+        assert payload["hook_input"]["tool_input"]["content"] == "secret"
+
+    def test_hash_mode_is_stable(self) -> None:
+        first = redact_payload({"prompt": "hello"}, "hash")
+        second = redact_payload({"prompt": "hello"}, "hash")
+        assert first == second
+        assert first["prompt"].startswith("sha256:")
+        assert "hello" not in json.dumps(first)
+
+
+class TestTrafficCapture:
+    """Tests for the JSONL capture writer."""
+
+    def test_record_writes_versioned_entry(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(path, max_bytes=1_000_000, backup_count=1)
+        chain_result = ChainExecutionResult(
+            result=HookResult.deny("no"), handler_timings_ms={"guard": 0.5}
+        )
+
+        capture.record(
+            {"event": "PreToolUse", "hook_input": {"tool_name": "Bash"}},
+            {"hookSpecificOutput": {"permissionDecision": "deny"}},
+            1.25,
+            chain_result,
+            timestamp=100.0,
+        )
+
+        entries = _read_lines(path)
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["v"] == CAPTURE_FORMAT_VERSION
+        assert entry["ts"] == 100.0
+        assert entry["decision"] == "deny"
+        assert entry["elapsed_ms"] == 1.25
+        assert entry["handlers"] == {"guard": 0.5}
+        assert entry["redact"] == "none"
+        assert capture.records_written == 1
+
+    def test_record_applies_redaction(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(path, max_bytes=1_000_000, backup_count=1, redact="redact")
+
+        capture.record(
+            {"event": "UserPromptSubmit", "hook_input": {"prompt": "my password"}}, {}, 0.1
+        )
+
+        assert "my password" not in path.read_text()
+        assert _read_lines(path)[0]["redact"] == "redact"
+
+    def test_rotation_keeps_backups(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(path, max_bytes=1024, backup_count=2)
+        big_request = {"event": "PreToolUse", "hook_input": {"command": "x" * 800}}
+
+        for _ in range(8):
+            capture.record(big_request, {}, 0.1)
+
+        assert path.exists()
+        assert (tmp_path / "capture.jsonl.1").exists()
+        assert (tmp_path / "capture.jsonl.2").exists()
+        assert not (tmp_path / "capture.jsonl.3").exists()
+
+    def test_rotation_without_backups_truncates(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(path, max_bytes=1024, backup_count=0)
+        big_request = {"event": "PreToolUse", "hook_input": {"command": "x" * 1200}}
+
+        capture.record(big_request, {}, 0.1)
+        capture.record(big_request, {}, 0.1)
+
+        assert len(_read_lines(path)) == 1
+        assert not (tmp_path / "capture.jsonl.1").exists()
+
+    def test_write_failure_is_swallowed(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(path, max_bytes=1024, backup_count=0)
+        path.mkdir()  # Opening a directory for append raises OSError
+
+        capture.record({"event": "Stop", "hook_input": {}}, {}, 0.1)
+
+        assert capture.records_written == 0
+
+
+class TestTrafficCaptureFromConfig:
+    """Tests for building a capture writer from configuration."""
+
+    def test_disabled_returns_none(self, tmp_path: Path) -> None:
+        config = TrafficCaptureConfig(path=str(tmp_path / "capture.jsonl"))
+        assert TrafficCapture.from_config(config) is None
+
+    def test_enabled_without_path_returns_none(self) -> None:
+        assert TrafficCapture.from_config(TrafficCaptureConfig(enabled=True)) is None
+
+    def test_enabled_with_path_applies_settings(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "capture.jsonl"
+        config = TrafficCaptureConfig(enabled=True, path=str(path), redact="hash")
+
+        capture = TrafficCapture.from_config(config)
+
+        assert capture is not None
+        assert capture.path == path
+        assert path.parent.is_dir()
@@ -8,9 +8,11 @@ Covers critical paths in:
 """
 
 import argparse
+import io
+import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -611,8 +613,22 @@ class TestCmdHandlers:
             assert result == 1
 
 
+def _fake_stream_socket(*lines: dict[str, Any]) -> MagicMock:
+    """Socket whose follow_logs connection yields the given JSON lines."""
+    sock = MagicMock()
+    sock.makefile.return_value = io.StringIO("".join(json.dumps(line) + "\n" for line in lines))
+    return sock
+
+
 class TestCmdLogsFollow:
-    """Tests for cmd_logs follow mode (lines 448-475)."""
+    """Tests for cmd_logs follow mode polling (daemons without follow_logs)."""
+
+    @pytest.fixture(autouse=True)
+    def older_daemon(self) -> Any:
+        """Answer the follow_logs request the way an older daemon does."""
+        sock = _fake_stream_socket({"error": "Unknown system action: follow_logs"})
+        with patch("claude_code_hooks_daemon.daemon.cli.socket.socket", return_value=sock):
+            yield
 
     def test_follow_mode_keyboard_interrupt(self, tmp_path: Path) -> None:
         """Follow mode exits cleanly on KeyboardInterrupt."""
@@ -723,6 +739,48 @@ class TestCmdLogsFollow:
             assert result == 0
 
 
+class TestCmdLogsFollowStream:
+    """Tests for cmd_logs follow mode streaming."""
+
+    def test_prints_backlog_then_streamed_lines(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+        (tmp_path / ".claude" / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+        args = argparse.Namespace(project_root=tmp_path, count=10, level="warning", follow=True)
+        sock = _fake_stream_socket(
+            {"result": {"logs": ["old"], "count": 1, "follow": True}},
+            {"log": "new 1"},
+            {"log": "new 2"},
+        )
+
+        with (
+            patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=12345),
+            patch("claude_code_hooks_daemon.daemon.cli.socket.socket", return_value=sock),
+            patch("claude_code_hooks_daemon.daemon.cli.send_daemon_request") as mock_send,
+        ):
+            result = cmd_logs(args)
+
+        assert result == 0
+        assert capsys.readouterr().out.splitlines()[1:4] == ["old", "new 1", "new 2"]
+        request = json.loads(sock.sendall.call_args[0][0])
+        assert request["hook_input"] == {"action": "follow_logs", "count": 10, "level": "WARNING"}
+        mock_send.assert_not_called()
+
+    def test_cannot_connect(self, tmp_path: Path) -> None:
+        (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+        (tmp_path / ".claude" / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+        args = argparse.Namespace(project_root=tmp_path, count=10, level=None, follow=True)
+        sock = MagicMock()
+        sock.connect.side_effect = ConnectionRefusedError()
+
+        with (
+            patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=12345),
+            patch("claude_code_hooks_daemon.daemon.cli.socket.socket", return_value=sock),
+        ):
+            assert cmd_logs(args) == 1
+
+
 class TestCmdRestart:
     """Tests for cmd_restart command."""
 
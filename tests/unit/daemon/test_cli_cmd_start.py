@@ -6,12 +6,16 @@ which requires careful mocking of os.fork, os.setsid, and related syscalls.
 
 import argparse
 import sys
+import threading
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from claude_code_hooks_daemon.config.models import SessionRegistryConfig
 from claude_code_hooks_daemon.daemon.cli import cmd_start
+from claude_code_hooks_daemon.daemon.readiness import Readiness, ReadinessPipe
 
 
 class TestCmdStartAlreadyRunning:
@@ -31,7 +35,10 @@ class TestCmdStartAlreadyRunning:
                 return_value=9999,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
         ):
             result = cmd_start(args)
             assert result == 0
@@ -40,8 +47,8 @@ class TestCmdStartAlreadyRunning:
 class TestCmdStartParentProcess:
     """Tests for the parent branch after first fork (pid > 0)."""
 
-    def test_parent_success_pid_file_created(self, tmp_path: Path) -> None:
-        """Parent process returns 0 when PID file is created after fork."""
+    def test_parent_success_when_daemon_signals_ready(self, tmp_path: Path, capsys: Any) -> None:
+        """Parent process returns 0 as soon as the daemon reports readiness."""
         args = argparse.Namespace(project_root=tmp_path)
 
         with (
@@ -51,19 +58,23 @@ class TestCmdStartParentProcess:
             ),
             patch(
                 "claude_code_hooks_daemon.daemon.cli.read_pid_file",
-                side_effect=[None, 42],  # First: not running, second: daemon started
+                return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", return_value=100),  # Parent gets child PID
-            patch("time.sleep"),
+            patch.object(ReadinessPipe, "wait", return_value=Readiness(pid=42)),
         ):
             result = cmd_start(args)
             assert result == 0
+            assert "PID: 42" in capsys.readouterr().out
 
-    def test_parent_failure_no_pid_file(self, tmp_path: Path) -> None:
-        """Parent process returns 1 when no PID file created after fork."""
+    def test_parent_failure_reports_startup_error(self, tmp_path: Path, capsys: Any) -> None:
+        """Parent process returns 1 with the daemon's error when startup fails."""
         args = argparse.Namespace(project_root=tmp_path)
 
         with (
@@ -73,16 +84,48 @@ class TestCmdStartParentProcess:
             ),
             patch(
                 "claude_code_hooks_daemon.daemon.cli.read_pid_file",
-                return_value=None,  # Always None - daemon failed to start
+                return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", return_value=100),
-            patch("time.sleep"),
+            patch.object(
+                ReadinessPipe, "wait", return_value=Readiness(error="ValueError: bad config")
+            ),
         ):
             result = cmd_start(args)
             assert result == 1
+            assert "ValueError: bad config" in capsys.readouterr().err
+
+    def test_parent_failure_when_child_exits_silently(self, tmp_path: Path) -> None:
+        """With no daemon holding the pipe, the parent fails immediately (no fixed sleep)."""
+        args = argparse.Namespace(project_root=tmp_path)
+
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_project_path",
+                return_value=tmp_path,
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.read_pid_file",
+                return_value=None,
+            ),
+            patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
+            patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
+            patch("os.fork", return_value=100),
+            patch("time.sleep") as mock_sleep,
+        ):
+            result = cmd_start(args)
+            assert result == 1
+            mock_sleep.assert_not_called()
 
     def test_first_fork_oserror(self, tmp_path: Path) -> None:
         """cmd_start returns 1 when first fork fails with OSError."""
@@ -98,7 +141,10 @@ class TestCmdStartParentProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=OSError("fork failed")),
         ):
@@ -106,6 +152,60 @@ class TestCmdStartParentProcess:
             assert result == 1
 
 
+class TestCmdStartRace:
+    """Tests for two starts racing at cold start."""
+
+    def test_concurrent_starts_build_one_daemon(self, tmp_path: Path, capsys: Any) -> None:
+        """Only the start that locks the project forks; the other reports it running."""
+        args = argparse.Namespace(project_root=tmp_path)
+        # Both starts find no PID file, as when two hooks fire together
+        both_checked = threading.Barrier(2)
+        first_finished = threading.Event()
+        results: list[int] = []
+
+        def read_pid_file(_path: str) -> None:
+            both_checked.wait(timeout=5)
+
+        def fork() -> int:
+            # Keep the winner (and its lock) in place until the loser is done
+            first_finished.wait(timeout=5)
+            return 100
+
+        def start() -> None:
+            results.append(cmd_start(args))
+            first_finished.set()
+
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_project_path",
+                return_value=tmp_path,
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.read_pid_file",
+                side_effect=read_pid_file,
+            ),
+            patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
+            patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
+            patch("os.fork", side_effect=fork) as mock_fork,
+            patch.object(ReadinessPipe, "wait", return_value=Readiness(pid=42)),
+        ):
+            threads = [threading.Thread(target=start) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+
+        assert results == [0, 0]
+        assert mock_fork.call_count == 1
+        out = capsys.readouterr().out
+        assert "Daemon already running (project lock held)" in out
+        assert "Daemon started successfully (PID: 42)" in out
+
+
 class TestCmdStartChildProcess:
     """Tests for the child branch after first fork (pid == 0)."""
 
@@ -123,7 +223,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, 200]),  # First fork: child, second fork: parent
             patch("os.chdir"),
@@ -148,7 +251,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, OSError("second fork failed")]),
             patch("os.chdir"),
@@ -166,6 +272,10 @@ class TestCmdStartChildProcess:
         mock_config = MagicMock()
         mock_config.daemon.socket_path = None
         mock_config.daemon.pid_file_path = None
+        mock_config.daemon.traffic_capture.enabled = False
+        mock_config.daemon.history_store.enabled = False
+        mock_config.daemon.session_snapshot.enabled = False
+        mock_config.daemon.session_registry = SessionRegistryConfig()
         mock_config.daemon.get_socket_path.return_value = tmp_path / "sock"
         mock_config.daemon.get_pid_file_path.return_value = tmp_path / "pid"
         # Set up handler configs
@@ -199,7 +309,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, 0]),  # Both forks return 0 (child)
             patch("os.chdir"),
@@ -233,6 +346,10 @@ class TestCmdStartChildProcess:
         mock_config = MagicMock()
         mock_config.daemon.socket_path = None
         mock_config.daemon.pid_file_path = None
+        mock_config.daemon.traffic_capture.enabled = False
+        mock_config.daemon.history_store.enabled = False
+        mock_config.daemon.session_snapshot.enabled = False
+        mock_config.daemon.session_registry = SessionRegistryConfig()
         mock_config.daemon.get_socket_path.return_value = tmp_path / "sock"
         mock_config.daemon.get_pid_file_path.return_value = tmp_path / "pid"
         for attr in [
@@ -264,7 +381,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, 0]),
             patch("os.chdir"),
@@ -303,6 +423,10 @@ class TestCmdStartChildProcess:
         mock_config = MagicMock()
         mock_config.daemon.socket_path = None
         mock_config.daemon.pid_file_path = None
+        mock_config.daemon.traffic_capture.enabled = False
+        mock_config.daemon.history_store.enabled = False
+        mock_config.daemon.session_snapshot.enabled = False
+        mock_config.daemon.session_registry = SessionRegistryConfig()
         mock_config.daemon.get_socket_path.return_value = tmp_path / "sock"
         mock_config.daemon.get_pid_file_path.return_value = tmp_path / "pid"
         mock_project_handlers = MagicMock()
@@ -337,7 +461,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, 0]),
             patch("os.chdir"),
@@ -380,6 +507,10 @@ class TestCmdStartChildProcess:
         # Paths already set - should NOT call getters
         mock_config.daemon.socket_path = "/existing/socket"
         mock_config.daemon.pid_file_path = "/existing/pid"
+        mock_config.daemon.traffic_capture.enabled = False
+        mock_config.daemon.history_store.enabled = False
+        mock_config.daemon.session_snapshot.enabled = False
+        mock_config.daemon.session_registry = SessionRegistryConfig()
         for attr in [
             "pre_tool_use",
             "post_tool_use",
@@ -409,7 +540,10 @@ class TestCmdStartChildProcess:
                 return_value=None,
             ),
             patch("claude_code_hooks_daemon.daemon.cli.get_socket_path"),
-            patch("claude_code_hooks_daemon.daemon.cli.get_pid_path"),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.get_pid_path",
+                return_value=tmp_path / "daemon.pid",
+            ),
             patch("claude_code_hooks_daemon.daemon.cli.cleanup_socket"),
             patch("os.fork", side_effect=[0, 0]),
             patch("os.chdir"),
@@ -0,0 +1,209 @@
+"""Tests for config hot reload and incremental handler re-registration."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import Config, DaemonConfig
+from claude_code_hooks_daemon.core.event import EventType
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.bootstrap import build_controller, build_handler_config
+from claude_code_hooks_daemon.daemon.config_reload import (
+    ConfigReloader,
+    ReloadStatus,
+    diff_handler_config,
+)
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+_BASE_CONFIG = """\
+version: '1.0'
+daemon:
+  idle_timeout_seconds: 600
+  log_level: INFO
+handlers:
+  pre_tool_use:
+    destructive_git:
+      enabled: true
+"""
+
+
+@pytest.fixture
+def workspace_root(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Create a project with a valid config and initialise ProjectContext."""
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+    config_path.write_text(_BASE_CONFIG)
+    ProjectContext.initialize(config_path)
+    return tmp_path
+
+
+def _config_path(workspace_root: Path) -> Path:
+    return workspace_root / ".claude" / "hooks-daemon.yaml"
+
+
+def _start(workspace_root: Path) -> tuple[DaemonController, ConfigReloader]:
+    config = Config.load(_config_path(workspace_root))
+    controller = build_controller(config, workspace_root)
+    return controller, ConfigReloader(_config_path(workspace_root), controller, config)
+
+
+def _rewrite(workspace_root: Path, text: str) -> None:
+    path = _config_path(workspace_root)
+    path.write_text(text)
+    # Make the change visible even within the filesystem's mtime granularity
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _pre_tool_use(controller: DaemonController) -> dict[str, Any]:
+    chain = controller.get_router().get_chain(EventType.PRE_TOOL_USE)
+    return {h.config_key: h for h in chain}
+
+
+class TestDiffHandlerConfig:
+    """Tests for diff_handler_config()."""
+
+    def test_reports_only_changed_keys(self) -> None:
+        old = {"pre_tool_use": {"a": {"enabled": True}, "b": {"enabled": True}}}
+        new = {"pre_tool_use": {"a": {"enabled": True}, "b": {"enabled": False}, "c": {}}}
+
+        assert diff_handler_config(old, new) == {"pre_tool_use": frozenset({"b", "c"})}
+
+    def test_tag_filter_change_selects_whole_section(self) -> None:
+        old = {"stop": {"a": {}}}
+        new = {"stop": {"a": {}, "disable_tags": ["git"]}}
+
+        assert diff_handler_config(old, new) == {"stop": None}
+
+    def test_identical_configs(self) -> None:
+        config = {"stop": {"a": {"options": {"x": 1}}}}
+
+        assert diff_handler_config(config, json.loads(json.dumps(config))) == {}
+
+
+class TestApplyHandlerConfig:
+    """Tests for DaemonController.apply_handler_config()."""
+
+    def test_disabling_a_handler_keeps_other_instances(self, workspace_root: Path) -> None:
+        controller, _ = _start(workspace_root)
+        before = _pre_tool_use(controller)
+        config = Config.load(_config_path(workspace_root))
+        handler_config = build_handler_config(config)
+        handler_config["pre_tool_use"]["destructive_git"] = {"enabled": False}
+
+        result = controller.apply_handler_config(handler_config)
+
+        after = _pre_tool_use(controller)
+        assert result.status == ReloadStatus.RELOADED
+        assert result.changed == ("pre_tool_use.destructive_git",)
+        assert (result.unregistered, result.registered) == (1, 0)
+        assert "destructive_git" not in after
+        assert all(after[key] is before[key] for key in after)
+
+    def test_priority_change_re_registers_handler(self, workspace_root: Path) -> None:
+        controller, _ = _start(workspace_root)
+        handler_config = build_handler_config(Config.load(_config_path(workspace_root)))
+        handler_config["pre_tool_use"]["destructive_git"] = {"enabled": True, "priority": 42}
+
+        result = controller.apply_handler_config(handler_config)
+
+        assert (result.unregistered, result.registered) == (1, 1)
+        assert _pre_tool_use(controller)["destructive_git"].priority == 42
+
+    def test_unchanged_config_keeps_router(self, workspace_root: Path) -> None:
+        controller, _ = _start(workspace_root)
+        router = controller.get_router()
+
+        result = controller.apply_handler_config(
+            build_handler_config(Config.load(_config_path(workspace_root)))
+        )
+
+        assert result.status == ReloadStatus.UNCHANGED
+        assert controller.get_router() is router
+
+    def test_refused_while_warming(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root, progressive=True)
+
+        with pytest.raises(RuntimeError, match="warming"):
+            controller.apply_handler_config({})
+
+
+class TestConfigReloader:
+    """Tests for ConfigReloader."""
+
+    def test_file_edit_is_detected_and_applied(self, workspace_root: Path) -> None:
+        controller, reloader = _start(workspace_root)
+        assert not reloader.changed()
+
+        _rewrite(workspace_root, _BASE_CONFIG.replace("enabled: true", "enabled: false"))
+        assert reloader.changed()
+        result = reloader.reload()
+
+        assert result.status == ReloadStatus.RELOADED
+        assert "destructive_git" not in _pre_tool_use(controller)
+        assert not reloader.changed()
+
+    def test_invalid_config_is_rejected_and_handlers_kept(self, workspace_root: Path) -> None:
+        controller, reloader = _start(workspace_root)
+        router = controller.get_router()
+
+        _rewrite(workspace_root, "version: '1.0'\nhandlers: [\n")
+        result = reloader.reload()
+
+        assert result.status == ReloadStatus.REJECTED
+        assert result.errors
+        assert controller.get_router() is router
+        assert not reloader.changed()
+
+    def test_startup_only_section_reports_restart(self, workspace_root: Path) -> None:
+        _controller, reloader = _start(workspace_root)
+
+        _rewrite(workspace_root, _BASE_CONFIG.replace("log_level: INFO", "log_level: DEBUG"))
+        result = reloader.reload()
+
+        assert result.status == ReloadStatus.UNCHANGED
+        assert result.restart_required == ("daemon",)
+
+
+class TestServerReloadConfig:
+    """Tests for the reload_config system action."""
+
+    @pytest.mark.anyio
+    async def test_reload_config_action(self, workspace_root: Path) -> None:
+        controller, reloader = _start(workspace_root)
+        daemon = HooksDaemon(DaemonConfig(), controller, config_reloader=reloader)
+        _rewrite(workspace_root, _BASE_CONFIG.replace("enabled: true", "enabled: false"))
+
+        response = await daemon._process_request(
+            json.dumps(
+                {"event": "_system", "hook_input": {"action": "reload_config"}, "request_id": "r1"}
+            )
+        )
+
+        assert response["request_id"] == "r1"
+        assert response["result"]["status"] == ReloadStatus.RELOADED
+        assert response["result"]["changed"] == ["pre_tool_use.destructive_git"]
+
+    @pytest.mark.anyio
+    async def test_reload_config_without_reloader(self) -> None:
+        daemon = HooksDaemon(DaemonConfig(), DaemonController())
+
+        response = await daemon._process_request(
+            json.dumps({"event": "_system", "hook_input": {"action": "reload_config"}})
+        )
+
+        assert "not available" in response["error"]
@@ -1,15 +1,23 @@
 """Tests for DaemonController."""
 
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from unittest.mock import Mock, patch
 
 import pytest
 
+from claude_code_hooks_daemon.core.async_handler import AsyncHandler
 from claude_code_hooks_daemon.core.chain import ChainExecutionResult
-from claude_code_hooks_daemon.core.event import EventType, HookEvent
+from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
 from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.core.router import EventRouter
 from claude_code_hooks_daemon.daemon.controller import (
     DaemonController,
     DaemonStats,
@@ -17,6 +25,8 @@ from claude_code_hooks_daemon.daemon.controller import (
     reset_controller,
 )
 
+T = TypeVar("T")
+
 
 class TestDaemonStats:
     """Tests for DaemonStats class."""
@@ -909,3 +919,151 @@ class TestIntegration:
         assert health["status"] == "healthy"
         assert health["initialised"] is True
         assert health["stats"]["requests_processed"] >= 1
+
+
+class _ContextHandler(Handler):
+    """Non-terminal handler that adds its name as context."""
+
+    def __init__(self, name: str, priority: int) -> None:
+        super().__init__(name=name, priority=priority, terminal=False)
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        return HookResult(context=[self.name])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+class TestParallelChains:
+    """Tests for concurrent handler execution in DaemonController."""
+
+    @pytest.fixture
+    def controller(self) -> DaemonController:
+        controller = DaemonController()
+        router = EventRouter()
+        for event_type in (EventType.STATUS_LINE, EventType.SESSION_START, EventType.PRE_TOOL_USE):
+            router.register(event_type, _ContextHandler("first", 10))
+            router.register(event_type, _ContextHandler("second", 20))
+        controller._router = router
+        controller._initialised = True
+        return controller
+
+    @pytest.mark.parametrize("event_type", [EventType.STATUS_LINE, EventType.SESSION_START])
+    def test_independent_chains_run_in_parallel(
+        self, controller: DaemonController, event_type: EventType
+    ) -> None:
+        result = controller.process_event(HookEvent(event=event_type, hook_input=HookInput()))
+
+        assert result.parallel
+        assert result.result.context == ["first", "second"]
+
+    def test_other_events_run_sequentially(self, controller: DaemonController) -> None:
+        event = HookEvent(event=EventType.PRE_TOOL_USE, hook_input=HookInput(tool_name="Bash"))
+
+        result = controller.process_event(event)
+
+        assert not result.parallel
+        assert result.result.context == ["first", "second"]
+
+    def test_release_threads_shuts_the_pool_down(self, controller: DaemonController) -> None:
+        thread_name = controller._handler_pool.submit(
+            lambda: threading.current_thread().name
+        ).result()
+
+        controller.release_threads()
+
+        assert thread_name.startswith("hooks-daemon-parallel-handler")
+        with pytest.raises(RuntimeError):
+            controller._handler_pool.submit(lambda: None)
+
+
+class _LoopContextHandler(AsyncHandler):
+    """Async handler that records the thread its coroutine ran on."""
+
+    def __init__(self) -> None:
+        super().__init__(name="async", priority=15, terminal=False)
+        self.thread_id: int | None = None
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        return True
+
+    async def handle_async(self, hook_input: dict[str, Any]) -> HookResult:
+        self.thread_id = threading.get_ident()
+        return HookResult(context=["async"])
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return []
+
+
+class TestAsyncHandlerProcessing:
+    """Tests for DaemonController.process_request_traced_async()."""
+
+    @pytest.fixture
+    def async_handler(self) -> _LoopContextHandler:
+        return _LoopContextHandler()
+
+    @pytest.fixture
+    def controller(self, async_handler: _LoopContextHandler) -> DaemonController:
+        controller = DaemonController()
+        router = EventRouter()
+        for event_type in (EventType.STATUS_LINE, EventType.PRE_TOOL_USE):
+            router.register(event_type, _ContextHandler("first", 10))
+            router.register(event_type, _ContextHandler("second", 20))
+        router.register(EventType.STATUS_LINE, async_handler)
+        controller._router = router
+        controller._initialised = True
+        return controller
+
+    @staticmethod
+    def _process_async(
+        controller: DaemonController, request: dict[str, Any]
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None, int]:
+        pool = ThreadPoolExecutor(max_workers=1)
+
+        def offload(func: Callable[..., T], /, *args: Any) -> "asyncio.Future[T]":
+            return asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+        async def scenario() -> tuple[dict[str, Any], ChainExecutionResult | None, int]:
+            response, chain_result = await controller.process_request_traced_async(request, offload)
+            return response, chain_result, threading.get_ident()
+
+        try:
+            return asyncio.run(scenario())
+        finally:
+            pool.shutdown()
+
+    def test_matches_synchronous_processing(
+        self, controller: DaemonController, async_handler: _LoopContextHandler
+    ) -> None:
+        request = {"event": "Status", "hook_input": {"session_id": "s1"}}
+
+        response, chain_result, loop_thread = self._process_async(controller, request)
+        handler_thread = async_handler.thread_id
+
+        assert response == controller.process_request(request)
+        assert chain_result is not None
+        assert chain_result.result.context == ["first", "async", "second"]
+        assert handler_thread == loop_thread
+
+    def test_invalid_request_is_reported(self, controller: DaemonController) -> None:
+        response, chain_result, _ = self._process_async(controller, {"event": "Nope"})
+
+        assert chain_result is None
+        assert response == controller.process_request({"event": "Nope"})
+
+    def test_uses_async_handlers(self, controller: DaemonController) -> None:
+        assert controller.uses_async_handlers("Status")
+        assert not controller.uses_async_handlers("PreToolUse")
+        assert not controller.uses_async_handlers("NoSuchEvent")
+
+    def test_uninitialised_controller_uses_sync_path(self) -> None:
+        assert not DaemonController().uses_async_handlers("Status")
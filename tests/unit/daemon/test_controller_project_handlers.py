@@ -381,6 +381,7 @@ class TestInitialiseWithProjectHandlers:
         mock_load.assert_called_once_with(
             project_handlers_config=project_config,
             workspace_root=tmp_path,
+            router=controller.get_router(),
         )
 
     def test_initialise_skips_project_handlers_when_not_provided(self, tmp_path: Path) -> None:
@@ -0,0 +1,115 @@
+"""Tests for per-session data layer partitions in DaemonController."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.core.data_layer import (
+    get_data_layer,
+    get_session_registry,
+    reset_data_layer,
+)
+from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+
+_HANDLER = "prevent-destructive-git"
+
+_CONFIG = """\
+version: '1.0'
+daemon:
+  idle_timeout_seconds: 600
+  log_level: INFO
+handlers: {}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_data_layer() -> Any:
+    reset_data_layer()
+    yield
+    reset_data_layer()
+
+
+@pytest.fixture
+def controller(tmp_path: Path, monkeypatch: Any) -> DaemonController:
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+    config_path.write_text(_CONFIG)
+    ProjectContext.initialize(config_path)
+    controller = DaemonController()
+    controller.initialise(workspace_root=tmp_path)
+    return controller
+
+
+def _force_push(session_id: str | None) -> HookEvent:
+    return HookEvent(
+        event=EventType.PRE_TOOL_USE,
+        hook_input=HookInput(
+            tool_name="Bash",
+            tool_input={"command": "git push --force origin main"},
+            session_id=session_id,
+        ),
+    )
+
+
+class TestSessionPartitions:
+    """Tests for session-scoped history in process_event()."""
+
+    def test_decisions_are_recorded_per_session(self, controller: DaemonController) -> None:
+        controller.process_event(_force_push("s1"))
+        controller.process_event(_force_push("s1"))
+        controller.process_event(_force_push("s2"))
+
+        registry = get_session_registry()
+        assert registry.acquire("s1").history.count_blocks_by_handler(_HANDLER) == 2
+        assert registry.acquire("s2").history.count_blocks_by_handler(_HANDLER) == 1
+        assert get_data_layer().history.count_blocks() == 0
+
+    def test_events_without_session_use_global_layer(self, controller: DaemonController) -> None:
+        controller.process_event(_force_push(None))
+
+        assert get_data_layer().history.count_blocks_by_handler(_HANDLER) == 1
+        assert len(get_session_registry()) == 0
+
+    def test_session_end_evicts_partition(self, controller: DaemonController) -> None:
+        controller.process_event(_force_push("s1"))
+
+        controller.process_event(
+            HookEvent(event=EventType.SESSION_END, hook_input=HookInput(session_id="s1"))
+        )
+
+        assert len(get_session_registry()) == 0
+        assert controller.get_health()["sessions"]["evicted_total"] == 1
+
+
+class TestSessionStateTransfer:
+    """Tests for partitions in export_state() and import_state()."""
+
+    def test_partitions_survive_export_and_import(self, controller: DaemonController) -> None:
+        controller.process_event(_force_push("s1"))
+        state = controller.export_state()
+
+        reset_data_layer()
+        DaemonController().import_state(state)
+
+        history = get_session_registry().acquire("s1").history
+        assert history.count_blocks_by_handler(_HANDLER) == 1
+
+    def test_max_sessions_keeps_most_recent(self, controller: DaemonController) -> None:
+        for session_id in ("s1", "s2", "s3"):
+            controller.process_event(_force_push(session_id))
+
+        state = controller.export_state(max_sessions=2)
+
+        assert list(state["sessions"]) == ["s2", "s3"]
@@ -28,6 +28,7 @@ class TestEnforceSingleDaemon:
         """When only one daemon exists (current process), no action taken."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         current_pid = os.getpid()
 
@@ -51,6 +52,7 @@ class TestEnforceSingleDaemon:
         """In container with multiple daemons, kills all except current."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         current_pid = os.getpid()
         other_pid_1 = current_pid + 1000
@@ -78,6 +80,7 @@ class TestEnforceSingleDaemon:
         """When PID file exists but process not running, cleanup triggered."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         pid_path = Path("/tmp/test.pid")
         stale_pid = 99999
@@ -108,6 +111,7 @@ class TestEnforceSingleDaemon:
         """Outside container with enforcement enabled, uses conservative cleanup."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         current_pid = os.getpid()
         other_pid = current_pid + 1000
@@ -132,6 +136,7 @@ class TestEnforceSingleDaemon:
         """When no daemon processes exist, do nothing."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         with (
             patch(
@@ -157,6 +162,7 @@ class TestEnforceSingleDaemonKillFailure:
         """When kill_daemon_process returns False, logs error."""
         mock_config = MagicMock()
         mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "scan"
 
         with (
             patch(
@@ -177,3 +183,75 @@ class TestEnforceSingleDaemonKillFailure:
 
         mock_logger.error.assert_called_once()
         assert "12345" in str(mock_logger.error.call_args)
+
+
+class TestEnforceSingleDaemonRegistryDiscovery:
+    """Tests for registry-based daemon discovery (the default)."""
+
+    def test_container_kills_registered_daemons_without_scanning(self) -> None:
+        """Registry discovery finds daemons without walking the process table."""
+        mock_config = MagicMock()
+        mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "registry"
+
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.is_container_environment",
+                return_value=True,
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.find_registered_daemons",
+                return_value=[54321],
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.find_all_daemon_processes"
+            ) as mock_scan,
+            patch("claude_code_hooks_daemon.daemon.enforcement.kill_daemon_process") as mock_kill,
+        ):
+            enforce_single_daemon(config=mock_config, pid_path=Path("/tmp/test.pid"))
+
+        mock_scan.assert_not_called()
+        mock_kill.assert_called_once_with(54321)
+
+    def test_non_container_does_not_look_for_daemons(self) -> None:
+        """Outside containers no discovery runs at all."""
+        mock_config = MagicMock()
+        mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "registry"
+
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.is_container_environment",
+                return_value=False,
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.find_registered_daemons"
+            ) as mock_registry,
+            patch("claude_code_hooks_daemon.daemon.enforcement.read_pid_file", return_value=None),
+        ):
+            enforce_single_daemon(config=mock_config, pid_path=Path("/tmp/test.pid"))
+
+        mock_registry.assert_not_called()
+
+    def test_container_keeps_daemon_handing_over_its_socket(self) -> None:
+        """keep_pid (restart --handoff) is never killed."""
+        mock_config = MagicMock()
+        mock_config.daemon.enforce_single_daemon_process = True
+        mock_config.daemon.enforcement_discovery = "registry"
+
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.is_container_environment",
+                return_value=True,
+            ),
+            patch(
+                "claude_code_hooks_daemon.daemon.enforcement.find_registered_daemons",
+                return_value=[54321, 12345],
+            ),
+            patch("claude_code_hooks_daemon.daemon.enforcement.kill_daemon_process") as mock_kill,
+        ):
+            enforce_single_daemon(
+                config=mock_config, pid_path=Path("/tmp/test.pid"), keep_pid=12345
+            )
+
+        mock_kill.assert_called_once_with(54321)
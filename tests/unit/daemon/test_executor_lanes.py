@@ -0,0 +1,352 @@
+"""Tests for per-event-class executor lanes."""
+
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from claude_code_hooks_daemon.config.models import DaemonConfig, ExecutorLaneConfig
+from claude_code_hooks_daemon.core.deferred import collect_deferred, defer
+from claude_code_hooks_daemon.daemon.executor_lanes import (
+    DEFAULT_LANE_NAME,
+    ExecutorLane,
+    ExecutorLanes,
+    LaneFullError,
+)
+from claude_code_hooks_daemon.daemon.metrics import LaneMetrics
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+_WAIT_TIMEOUT_SECONDS = 5
+
+
+class TestExecutorLaneConfig:
+    """Tests for daemon.executor_lanes validation."""
+
+    def test_default_lanes_split_interactive_events(self) -> None:
+        lanes = DaemonConfig().executor_lanes
+
+        assert "Status" in lanes["interactive"].events
+        assert lanes["background"].events == []
+
+    def test_unknown_event_is_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="unknown event"):
+            DaemonConfig(executor_lanes={"fast": ExecutorLaneConfig(events=["Nope"])})
+
+    def test_event_in_two_lanes_is_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="'Status'"):
+            DaemonConfig(
+                executor_lanes={
+                    "a": ExecutorLaneConfig(events=["Status"]),
+                    "b": ExecutorLaneConfig(events=["Status"]),
+                }
+            )
+
+    def test_no_lanes_is_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="at least one lane"):
+            DaemonConfig(executor_lanes={})
+
+
+class TestExecutorLanesRouting:
+    """Tests for ExecutorLanes.for_event() and from_config()."""
+
+    def test_listed_event_goes_to_its_lane(self) -> None:
+        lanes = ExecutorLanes.from_config(DaemonConfig().executor_lanes, 2)
+
+        assert lanes.for_event("Status").name == "interactive"
+        assert lanes.for_event("PostToolUse").name == "background"
+
+    def test_last_lane_catches_unlisted_events_without_catch_all(self) -> None:
+        lanes = ExecutorLanes.from_config(
+            {
+                "fast": ExecutorLaneConfig(events=["Status"]),
+                "slow": ExecutorLaneConfig(events=["Stop"], max_workers=1),
+            },
+            4,
+        )
+
+        assert lanes.for_event("PreToolUse").name == "slow"
+        assert lanes.max_workers == 5
+
+    def test_empty_config_gets_single_default_lane(self) -> None:
+        lanes = ExecutorLanes.from_config({}, 2)
+
+        assert [lane.name for lane in lanes.lanes] == [DEFAULT_LANE_NAME]
+        assert lanes.for_event("Status").name == DEFAULT_LANE_NAME
+
+
+class TestLaneMetrics:
+    """Tests for LaneMetrics queue accounting."""
+
+    def test_queue_limit_rejects_and_counts(self) -> None:
+        metrics = LaneMetrics(max_queue=1)
+
+        first = metrics.track(lambda: "ok")
+        second = metrics.track(lambda: "ok")
+
+        assert first is not None
+        assert second is None
+        assert metrics.snapshot()["rejected"] == 1
+        assert first() == "ok"
+        assert metrics.track(lambda: "ok") is not None
+
+    def test_wait_samples_are_summarised(self) -> None:
+        metrics = LaneMetrics()
+
+        job = metrics.track(lambda: None)
+        assert job is not None
+        job()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["queued"] == 0
+        assert snapshot["peak_queued"] == 1
+        assert snapshot["queue_wait_ms"]["count"] == 1
+
+
+class TestExecutorLaneRun:
+    """Tests for ExecutorLane.run()."""
+
+    @pytest.mark.anyio
+    async def test_full_queue_raises(self) -> None:
+        lane = ExecutorLane("slow", frozenset(), max_workers=1, max_queue=1)
+        release = threading.Event()
+        running = threading.Event()
+
+        def block() -> None:
+            running.set()
+            release.wait(_WAIT_TIMEOUT_SECONDS)
+
+        first = asyncio.ensure_future(lane.run(None, block))
+        await asyncio.get_running_loop().run_in_executor(None, running.wait)
+        second = asyncio.ensure_future(lane.run(None, block))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(LaneFullError):
+                await lane.run(None, block)
+        finally:
+            release.set()
+            await asyncio.gather(first, second)
+            lane.shutdown()
+
+        assert lane.snapshot()["rejected"] == 1
+
+    @pytest.mark.anyio
+    async def test_job_sees_callers_context(self) -> None:
+        lane = ExecutorLane("default", frozenset(), max_workers=1)
+        try:
+            with collect_deferred() as tasks:
+                await lane.run(None, defer, lambda: None)
+        finally:
+            lane.shutdown()
+
+        assert len(tasks) == 1
+
+    @pytest.mark.anyio
+    async def test_async_job_offloads_to_lane_threads(self) -> None:
+        lane = ExecutorLane("default", frozenset(), max_workers=1)
+
+        async def job(value: int) -> str:
+            name = await lane.offload(lambda: threading.current_thread().name)
+            return f"{name}:{value}"
+
+        try:
+            result = await lane.run_async("s1", job, 7)
+        finally:
+            lane.shutdown()
+
+        assert result == "hooks-daemon-default_0:7"
+        assert lane.snapshot()["running"] == 0
+
+
+class _SlowBackgroundController:
+    """Controller whose PostToolUse requests block until released."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        if request_data["event"] == "PostToolUse":
+            self.started.set()
+            self.release.wait(_WAIT_TIMEOUT_SECONDS)
+        return {"event": request_data["event"]}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return True
+
+
+class _AsyncStatusController(_SlowBackgroundController):
+    """Controller whose Status chain awaits async handlers until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.waiting = 0
+        self.all_waiting = asyncio.Event()
+        self.release_async = asyncio.Event()
+
+    def uses_async_handlers(self, event_type: str) -> bool:
+        return event_type == "Status"
+
+    async def process_request_traced_async(
+        self, request_data: dict[str, Any], offload: Any
+    ) -> tuple[dict[str, Any], None]:
+        await offload(lambda: None)
+        self.waiting += 1
+        if self.waiting == 2:
+            self.all_waiting.set()
+        await self.release_async.wait()
+        return {"event": request_data["event"]}, None
+
+
+def _request(event: str, session_id: str = "s1") -> str:
+    return json.dumps({"event": event, "hook_input": {"session_id": session_id}})
+
+
+class TestServerExecutorLanes:
+    """Tests for lane routing in HooksDaemon._process_request()."""
+
+    def _daemon(
+        self, lanes: dict[str, ExecutorLaneConfig] | None = None
+    ) -> tuple[HooksDaemon, _SlowBackgroundController]:
+        controller = _SlowBackgroundController()
+        config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+        if lanes is not None:
+            config.executor_lanes = lanes
+        return HooksDaemon(config=config, controller=controller), controller
+
+    @pytest.mark.anyio
+    async def test_status_is_not_queued_behind_slow_background_work(self) -> None:
+        daemon, controller = self._daemon(
+            {
+                "interactive": ExecutorLaneConfig(events=["Status"]),
+                "background": ExecutorLaneConfig(max_workers=1),
+            }
+        )
+        slow = [
+            asyncio.ensure_future(daemon._process_request(_request("PostToolUse", f"s{i}")))
+            for i in range(2)
+        ]
+        await asyncio.get_running_loop().run_in_executor(None, controller.started.wait)
+
+        try:
+            status = await asyncio.wait_for(
+                daemon._process_request(_request("Status", "s9")), _WAIT_TIMEOUT_SECONDS
+            )
+            lanes = daemon._handle_system_request({"action": "metrics"}, None)["result"]["lanes"]
+        finally:
+            controller.release.set()
+            await asyncio.gather(*slow)
+
+        assert status == {"event": "Status"}
+        assert lanes["background"]["running"] == 1
+        assert lanes["background"]["queued"] == 1
+        assert lanes["interactive"]["queue_wait_ms"]["count"] == 1
+
+    @pytest.mark.anyio
+    async def test_status_is_not_queued_behind_its_own_session(self) -> None:
+        daemon, controller = self._daemon(
+            {
+                "interactive": ExecutorLaneConfig(events=["Status"]),
+                "background": ExecutorLaneConfig(),
+            }
+        )
+        slow = asyncio.ensure_future(daemon._process_request(_request("PostToolUse")))
+        await asyncio.get_running_loop().run_in_executor(None, controller.started.wait)
+
+        try:
+            status = await asyncio.wait_for(
+                daemon._process_request(_request("Status")), _WAIT_TIMEOUT_SECONDS
+            )
+            still_blocked = not slow.done()
+        finally:
+            controller.release.set()
+            await slow
+
+        assert status == {"event": "Status"}
+        assert still_blocked
+
+    @pytest.mark.anyio
+    async def test_session_is_serialised_across_lanes(self) -> None:
+        daemon, controller = self._daemon(
+            {
+                "interactive": ExecutorLaneConfig(events=["PreToolUse"]),
+                "background": ExecutorLaneConfig(),
+            }
+        )
+        slow = asyncio.ensure_future(daemon._process_request(_request("PostToolUse")))
+        await asyncio.get_running_loop().run_in_executor(None, controller.started.wait)
+
+        pre = asyncio.ensure_future(daemon._process_request(_request("PreToolUse")))
+        await asyncio.sleep(0.05)
+        waited = not pre.done()
+        controller.release.set()
+        await asyncio.gather(slow, pre)
+
+        assert waited
+        assert pre.result() == {"event": "PreToolUse"}
+
+    @pytest.mark.anyio
+    async def test_full_lane_returns_error_response(self) -> None:
+        daemon, controller = self._daemon(
+            {"background": ExecutorLaneConfig(max_workers=1, max_queue=1)}
+        )
+        running = asyncio.ensure_future(daemon._process_request(_request("PostToolUse")))
+        await asyncio.get_running_loop().run_in_executor(None, controller.started.wait)
+        queued = asyncio.ensure_future(daemon._process_request(_request("PostToolUse", "s3")))
+        await asyncio.sleep(0)
+
+        try:
+            response = await daemon._process_request(
+                json.dumps(
+                    {
+                        "event": "PostToolUse",
+                        "hook_input": {"session_id": "s2"},
+                        "request_id": "req-7",
+                    }
+                )
+            )
+        finally:
+            controller.release.set()
+            await asyncio.gather(running, queued)
+
+        assert response == {
+            "error": "executor_lane_full",
+            "lane": "background",
+            "event_type": "PostToolUse",
+            "request_id": "req-7",
+        }
+
+    @pytest.mark.anyio
+    async def test_async_chains_do_not_hold_lane_threads(self) -> None:
+        controller = _AsyncStatusController()
+        config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+        config.executor_lanes = {"interactive": ExecutorLaneConfig(max_workers=1)}
+        daemon = HooksDaemon(config=config, controller=controller)
+        requests = [
+            asyncio.ensure_future(daemon._process_request(_request("Status", f"s{i}")))
+            for i in range(2)
+        ]
+
+        try:
+            # Both wait on their handlers at once although the lane has one thread
+            await asyncio.wait_for(controller.all_waiting.wait(), _WAIT_TIMEOUT_SECONDS)
+            lanes = daemon._handle_system_request({"action": "metrics"}, None)["result"]["lanes"]
+        finally:
+            controller.release_async.set()
+            results = await asyncio.gather(*requests)
+
+        assert results == [{"event": "Status"}, {"event": "Status"}]
+        assert lanes["interactive"]["running"] == 2
@@ -0,0 +1,241 @@
+"""Tests for listening-socket handoff between daemons."""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.constants.modes import DaemonMode
+from claude_code_hooks_daemon.core.data_layer import get_data_layer, reset_data_layer
+from claude_code_hooks_daemon.daemon.cli import cmd_restart
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+from claude_code_hooks_daemon.daemon.handoff import HandoffError, request_handoff, send_handoff_fds
+from claude_code_hooks_daemon.daemon.instances import DaemonInstance, is_project_locked
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+
+def _socket_path() -> Path:
+    # Short path: AF_UNIX paths are limited to ~108 bytes
+    return Path(tempfile.mktemp(suffix=".sock"))
+
+
+def _serve_once(
+    path: Path, reply: dict[str, Any], fds: list[int] | None = None
+) -> threading.Thread:
+    """Answer one handoff request on path, optionally passing descriptors."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+
+    def run() -> None:
+        with server:
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(4096)
+                if fds:
+                    send_handoff_fds(conn.fileno(), *fds)
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+class TestRequestHandoff:
+    """Tests for request_handoff() against a stand-in daemon."""
+
+    def test_receives_listening_socket_lock_and_state(self, tmp_path: Path) -> None:
+        path = _socket_path()
+        handed_path = _socket_path()
+        handed = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        handed.bind(str(handed_path))
+        handed.listen()
+        lock_path = tmp_path / "daemon.pid.lock"
+        lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        reply = {"result": {"pid": 4242, "state": {"mode": {"mode": "unattended"}}}}
+
+        thread = _serve_once(path, reply, [handed.fileno(), lock_fd])
+        try:
+            handoff = request_handoff(path, timeout=5)
+        finally:
+            thread.join()
+            path.unlink()
+
+        with handed, handoff.listen_socket:
+            assert handoff.listen_socket.getsockname() == handed.getsockname()
+            assert os.fstat(handoff.lock_fd).st_ino == lock_path.stat().st_ino
+            assert handoff.pid == 4242
+            assert handoff.state == {"mode": {"mode": "unattended"}}
+        os.close(handoff.lock_fd)
+        os.close(lock_fd)
+        handed_path.unlink()
+
+    def test_daemon_without_handoff_support_raises(self) -> None:
+        path = _socket_path()
+
+        thread = _serve_once(path, {"error": "Unknown system action: handoff"})
+        try:
+            with pytest.raises(HandoffError, match="Unknown system action"):
+                request_handoff(path, timeout=5)
+        finally:
+            thread.join()
+            path.unlink()
+
+
+class TestControllerState:
+    """Tests for DaemonController.export_state()/import_state()."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_data_layer(self) -> Any:
+        reset_data_layer()
+        yield
+        reset_data_layer()
+
+    def test_mode_and_history_survive_the_round_trip(self) -> None:
+        source = DaemonController()
+        source.set_mode(DaemonMode.UNATTENDED, "carry on")
+        get_data_layer().history.record(
+            handler_id="destructive-git", event_type="PreToolUse", decision="deny", tool_name="Bash"
+        )
+        state = json.loads(json.dumps(source.export_state()))
+
+        reset_data_layer()
+        target = DaemonController()
+        target.import_state(state)
+
+        assert target.get_mode() == {"mode": "unattended", "custom_message": "carry on"}
+        assert get_data_layer().history.count_blocks_by_handler("destructive-git") == 1
+
+    def test_unreadable_state_is_ignored(self) -> None:
+        target = DaemonController()
+
+        target.import_state({"mode": {"mode": "no-such-mode"}})
+
+        assert target.get_mode()["mode"] == DaemonMode.DEFAULT
+
+
+class _Controller:
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy", "pid": os.getpid()}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return False
+
+    def export_state(self) -> dict[str, Any]:
+        return {"mode": {"mode": "unattended", "custom_message": "carry on"}}
+
+
+async def _serving(daemon: HooksDaemon) -> "asyncio.Task[None]":
+    task = asyncio.create_task(daemon.start())
+    for _ in range(100):
+        if daemon.server is not None:
+            break
+        await asyncio.sleep(0.02)
+    return task
+
+
+class TestServerHandoff:
+    """Tests for the handoff system action on a running server."""
+
+    @pytest.mark.anyio
+    async def test_replacement_serves_on_the_same_socket(self, tmp_path: Path) -> None:
+        socket_path = _socket_path()
+        pid_path = tmp_path / "daemon.pid"
+        registry_dir = tmp_path / "instances"
+        old_instance = DaemonInstance.acquire(pid_path, registry_dir)
+        old = HooksDaemon(
+            DaemonConfig(socket_path=socket_path), _Controller(), lock_fd=old_instance.lock_fd
+        )
+        old_task = await _serving(old)
+
+        handoff = await asyncio.to_thread(request_handoff, socket_path, 5)
+        await asyncio.wait_for(old_task, timeout=10)
+        old_instance.release()
+
+        assert old.handed_off
+        assert socket_path.exists()
+        assert handoff.pid == os.getpid()
+        assert handoff.state["mode"]["custom_message"] == "carry on"
+
+        new_instance = DaemonInstance.adopt(handoff.lock_fd, registry_dir)
+        assert is_project_locked(pid_path)
+        new = HooksDaemon(
+            DaemonConfig(socket_path=socket_path),
+            _Controller(),
+            listen_socket=handoff.listen_socket,
+            lock_fd=new_instance.lock_fd,
+        )
+        new_task = await _serving(new)
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.write(b'{"event": "_system", "hook_input": {"action": "health"}}\n')
+        response = json.loads(await reader.readline())
+        writer.close()
+        await new.shutdown()
+        await new_task
+        new_instance.release()
+
+        assert response["result"]["status"] == "healthy"
+        assert not socket_path.exists()
+        assert not is_project_locked(pid_path)
+
+    @pytest.mark.anyio
+    async def test_refused_without_project_lock(self) -> None:
+        daemon = HooksDaemon(DaemonConfig(), _Controller())
+
+        response = await daemon._process_request(
+            json.dumps({"event": "_system", "hook_input": {"action": "handoff"}})
+        )
+
+        assert response["error"] == "Socket handoff is not available"
+        assert not daemon.handed_off
+
+
+class TestCmdRestartHandoff:
+    """Tests for restart --handoff."""
+
+    def _restart(self, start_result: int) -> tuple[int, Any, Any]:
+        args = argparse.Namespace(project_root=None, handoff=True, pid_file=None)
+        with (
+            patch("claude_code_hooks_daemon.daemon.cli.get_project_path", return_value=Path("/p")),
+            patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=4242),
+            patch(
+                "claude_code_hooks_daemon.daemon.cli._start_daemon", return_value=start_result
+            ) as start,
+            patch("claude_code_hooks_daemon.daemon.cli.cmd_stop") as stop,
+            patch("claude_code_hooks_daemon.daemon.cli.cmd_start", return_value=0),
+            patch("claude_code_hooks_daemon.daemon.cli._get_current_mode", return_value=None),
+            patch("claude_code_hooks_daemon.daemon.cli.time.sleep"),
+        ):
+            result = cmd_restart(args)
+        return result, start, stop
+
+    def test_hands_over_without_stopping(self) -> None:
+        result, start, stop = self._restart(start_result=0)
+
+        assert result == 0
+        assert start.call_args.kwargs == {"handoff_from": 4242}
+        stop.assert_not_called()
+
+    def test_falls_back_to_stop_and_start(self) -> None:
+        result, _start, stop = self._restart(start_result=1)
+
+        assert result == 0
+        stop.assert_called_once()
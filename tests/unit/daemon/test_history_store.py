@@ -0,0 +1,174 @@
+"""Tests for the SQLite handler decision store."""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import HistoryStoreConfig
+from claude_code_hooks_daemon.core.handler_history import HandlerDecisionRecord, HandlerHistory
+from claude_code_hooks_daemon.daemon.cli import cmd_history
+from claude_code_hooks_daemon.daemon.history_store import HistoryStore, summarise_history
+
+_DAY = 86400
+
+
+def _record(
+    handler_id: str,
+    decision: str,
+    *,
+    tool_name: str = "Bash",
+    session_id: str | None = "s1",
+    timestamp: float | None = None,
+) -> HandlerDecisionRecord:
+    return HandlerDecisionRecord(
+        handler_id=handler_id,
+        event_type="PreToolUse",
+        decision=decision,
+        tool_name=tool_name,
+        reason=None,
+        timestamp=time.time() if timestamp is None else timestamp,
+        session_id=session_id,
+    )
+
+
+def _store(path: Path, records: list[HandlerDecisionRecord]) -> HistoryStore:
+    store = HistoryStore(path, retention_days=7, flush_interval_seconds=0.05)
+    store.start()
+    for record in records:
+        store.add(record)
+    store.close()
+    return store
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore."""
+
+    def test_decisions_are_written_in_wal_mode(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.db"
+
+        store = _store(path, [_record("h1", "deny"), _record("h2", "allow")])
+
+        assert store.written == 2
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0] == 2
+
+    def test_history_records_reach_the_database(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.db"
+        store = HistoryStore(path, retention_days=7, flush_interval_seconds=0.05)
+        store.start()
+        history = HandlerHistory()
+        history.attach_store(store)
+
+        history.record(
+            handler_id="destructive-git",
+            event_type="PreToolUse",
+            decision="deny",
+            tool_name="Bash",
+            session_id="s1",
+        )
+        store.close()
+
+        rows = summarise_history(path, group_by="session")
+        assert rows[0]["key"] == "s1"
+        assert rows[0]["blocks"] == 1
+
+    def test_expired_decisions_are_deleted(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.db"
+        _store(path, [_record("old", "deny", timestamp=time.time() - 30 * _DAY)])
+
+        _store(path, [_record("new", "deny")])
+
+        assert [row["key"] for row in summarise_history(path)] == ["new"]
+
+    def test_unwritable_database_drops_decisions(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        store = _store(blocker / "history.db", [_record("h1", "deny")])
+
+        assert store.written == 0
+        assert store.dropped == 1
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        assert HistoryStore.from_config(HistoryStoreConfig(), tmp_path) is None
+
+
+class TestSummariseHistory:
+    """Tests for summarise_history()."""
+
+    def test_groups_by_handler_with_most_blocks_first(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.db"
+        _store(
+            path,
+            [
+                _record("quiet", "allow"),
+                _record("strict", "deny"),
+                _record("strict", "ask"),
+                _record("quiet", "deny"),
+            ],
+        )
+
+        rows = summarise_history(path, group_by="handler")
+
+        assert [(r["key"], r["blocks"], r["total"]) for r in rows] == [
+            ("strict", 2, 2),
+            ("quiet", 1, 2),
+        ]
+
+    def test_filters_by_session_and_time(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.db"
+        _store(
+            path,
+            [
+                _record("h1", "deny", tool_name="Bash", session_id="s1"),
+                _record("h1", "deny", tool_name="Write", session_id="s2"),
+                _record("h1", "deny", tool_name="Read", timestamp=time.time() - 2 * _DAY),
+            ],
+        )
+
+        rows = summarise_history(path, group_by="tool", session_id="s1", since=time.time() - _DAY)
+
+        assert [r["key"] for r in rows] == ["Bash"]
+
+    def test_unknown_grouping_is_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Cannot group"):
+            summarise_history(tmp_path / "history.db", group_by="reason; DROP TABLE decisions")
+
+
+class TestCmdHistory:
+    """Tests for the history CLI command."""
+
+    def _args(self, db: Path, **overrides: object) -> argparse.Namespace:
+        values: dict[str, object] = {
+            "project_root": None,
+            "by": "handler",
+            "since_hours": None,
+            "session": None,
+            "limit": 20,
+            "db": str(db),
+            "json": True,
+        }
+        values.update(overrides)
+        return argparse.Namespace(**values)
+
+    def test_prints_summary_as_json(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        path = tmp_path / "history.db"
+        _store(path, [_record("strict", "deny")])
+
+        with patch("claude_code_hooks_daemon.daemon.cli.get_project_path", return_value=tmp_path):
+            result = cmd_history(self._args(path))
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out)[0]["key"] == "strict"
+
+    def test_missing_database(self, tmp_path: Path) -> None:
+        with patch("claude_code_hooks_daemon.daemon.cli.get_project_path", return_value=tmp_path):
+            assert cmd_history(self._args(tmp_path / "missing.db")) == 1
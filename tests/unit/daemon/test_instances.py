@@ -0,0 +1,113 @@
+"""Tests for the live daemon registry."""
+
+import os
+import signal
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.daemon.instances import (
+    DaemonAlreadyRunningError,
+    DaemonInstance,
+    find_registered_daemons,
+    is_project_locked,
+)
+
+_IS_DAEMON_PID = "claude_code_hooks_daemon.daemon.instances.is_daemon_pid"
+
+
+def _registered_child(pid_path: Path, registry_dir: Path) -> int:
+    """Fork a child that registers as a daemon and waits to be killed."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the forked child
+        os.close(read_fd)
+        DaemonInstance.acquire(pid_path, registry_dir)
+        os.write(write_fd, b"1")
+        signal.pause()
+        os._exit(0)
+    os.close(write_fd)
+    os.read(read_fd, 1)
+    os.close(read_fd)
+    return pid
+
+
+@pytest.fixture
+def child_daemon(tmp_path: Path) -> Iterator[tuple[int, Path, Path]]:
+    """A forked child holding the project lock and a registry record."""
+    pid_path = tmp_path / "daemon.pid"
+    registry_dir = tmp_path / "instances"
+    pid = _registered_child(pid_path, registry_dir)
+    yield pid, pid_path, registry_dir
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+
+
+class TestDaemonInstance:
+    """Tests for DaemonInstance acquire/release."""
+
+    def test_second_daemon_for_project_is_refused(
+        self, child_daemon: tuple[int, Path, Path]
+    ) -> None:
+        _pid, pid_path, registry_dir = child_daemon
+
+        assert is_project_locked(pid_path)
+        with pytest.raises(DaemonAlreadyRunningError, match="another daemon"):
+            DaemonInstance.acquire(pid_path, registry_dir)
+
+    def test_release_removes_record_and_lock(self, tmp_path: Path) -> None:
+        pid_path = tmp_path / "daemon.pid"
+        registry_dir = tmp_path / "instances"
+        instance = DaemonInstance.acquire(pid_path, registry_dir)
+        assert (registry_dir / f"{os.getpid()}.daemon").exists()
+
+        instance.release()
+
+        assert list(registry_dir.iterdir()) == []
+        assert not is_project_locked(pid_path)
+
+    def test_unusable_registry_still_takes_project_lock(self, tmp_path: Path, caplog: Any) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        pid_path = tmp_path / "daemon.pid"
+
+        instance = DaemonInstance.acquire(pid_path, blocker / "instances")
+
+        assert "not registered" in caplog.text
+        assert is_project_locked(pid_path)
+        instance.release()
+        assert not is_project_locked(pid_path)
+
+
+class TestFindRegisteredDaemons:
+    """Tests for find_registered_daemons()."""
+
+    def test_finds_live_daemon(self, child_daemon: tuple[int, Path, Path]) -> None:
+        pid, _pid_path, registry_dir = child_daemon
+
+        with patch(_IS_DAEMON_PID, return_value=True):
+            assert find_registered_daemons(registry_dir) == [pid]
+
+    def test_prunes_record_of_dead_daemon(self, tmp_path: Path) -> None:
+        registry_dir = tmp_path / "instances"
+        pid = _registered_child(tmp_path / "daemon.pid", registry_dir)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+        with patch(_IS_DAEMON_PID, return_value=True):
+            assert find_registered_daemons(registry_dir) == []
+        assert list(registry_dir.iterdir()) == []
+
+    def test_prunes_locked_record_whose_pid_is_not_a_daemon(
+        self, child_daemon: tuple[int, Path, Path]
+    ) -> None:
+        _pid, _pid_path, registry_dir = child_daemon
+
+        with patch(_IS_DAEMON_PID, return_value=False):
+            assert find_registered_daemons(registry_dir) == []
+
+    def test_missing_registry_is_empty(self, tmp_path: Path) -> None:
+        assert find_registered_daemons(tmp_path / "missing") == []
@@ -0,0 +1,211 @@
+"""Tests for the concurrent multi-session load generator."""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.cli import cmd_loadtest
+from claude_code_hooks_daemon.daemon.loadtest import (
+    LoadProfile,
+    LoadTestReport,
+    build_hook_input,
+    run_load_test_async,
+)
+from claude_code_hooks_daemon.daemon.metrics import ServerMetrics
+
+
+class TestBuildHookInput:
+    """Tests for simulated hook payloads."""
+
+    @pytest.mark.parametrize("event", ["PreToolUse", "PostToolUse"])
+    def test_tool_events_carry_tool_fields(self, event: str) -> None:
+        hook_input = build_hook_input(event, "s1", random.Random(1), cwd="/work")
+        assert hook_input["hook_event_name"] == event
+        assert hook_input["session_id"] == "s1"
+        assert hook_input["tool_name"] in ("Bash", "Read", "Write", "Edit")
+        assert isinstance(hook_input["tool_input"], dict)
+        assert ("tool_response" in hook_input) == (event == "PostToolUse")
+
+    def test_status_event_has_status_fields(self) -> None:
+        hook_input = build_hook_input("Status", "s1", random.Random(1), cwd="/work")
+        assert hook_input["workspace"]["project_dir"] == "/work"
+        assert "context_window" in hook_input
+
+    def test_stop_event_is_not_reentrant(self) -> None:
+        hook_input = build_hook_input("Stop", "s1", random.Random(1))
+        assert hook_input["stop_hook_active"] is False
+
+    def test_same_seed_is_reproducible(self) -> None:
+        first = build_hook_input("PreToolUse", "s1", random.Random(7))
+        second = build_hook_input("PreToolUse", "s1", random.Random(7))
+        assert first == second
+
+
+class TestLoadTestReport:
+    """Tests for report aggregation."""
+
+    def test_saturation_summary(self) -> None:
+        report = LoadTestReport(profile=LoadProfile(sessions=2))
+        report.duration_seconds = 2.0
+        report.latencies_ms["PreToolUse"].extend([1.0, 2.0, 3.0, 4.0])
+        report.errors["Stop"] += 1
+        executor = {"max_workers": 2, "peak_running": 2, "peak_queued": 3}
+        report.samples = [
+            {"t": 0.0, "rss_bytes": 100, "executor": {**executor, "running": 2, "queued": 1}},
+            {"t": 1.0, "rss_bytes": 300, "executor": {**executor, "running": 1, "queued": 0}},
+        ]
+
+        result = report.to_dict()
+
+        assert result["requests"] == 4
+        assert result["errors"] == 1
+        assert result["throughput_rps"] == 2.0
+        assert result["executor"]["saturated_sample_ratio"] == 0.5
+        assert result["executor"]["queued_sample_ratio"] == 0.5
+        assert result["executor"]["peak_queued"] == 3
+        assert result["rss_bytes"] == {"start": 100, "peak": 300, "end": 300}
+
+    def test_no_samples(self) -> None:
+        result = LoadTestReport(profile=LoadProfile()).to_dict()
+        assert result["executor"] == {}
+        assert result["rss_bytes"]["peak"] is None
+
+
+class TestRunLoadTest:
+    """Tests for running the generator against a socket server."""
+
+    @pytest.mark.anyio
+    async def test_sessions_send_mixed_events_and_sample_metrics(self) -> None:
+        socket_path = Path(tempfile.mkdtemp()) / "d.sock"
+        metrics = ServerMetrics()
+        seen_events: list[str] = []
+        seen_sessions: set[str] = set()
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            line = await reader.readline()
+            if not line:
+                # Client gave up before sending (sampler cancelled, session timed out)
+                writer.close()
+                return
+            request = json.loads(line)
+            if request["event"] == "_system":
+                response: dict[str, Any] = {"result": metrics.snapshot(2)}
+            else:
+                seen_events.append(request["event"])
+                seen_sessions.add(request["hook_input"]["session_id"])
+                response = {} if request["event"] != "Stop" else {"error": "boom"}
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=str(socket_path))
+        try:
+            profile = LoadProfile(
+                sessions=3,
+                duration_seconds=0.3,
+                think_time_ms=5.0,
+                sample_interval_seconds=0.05,
+                event_mix={"PreToolUse": 1.0, "Stop": 1.0},
+                seed=3,
+            )
+            report = await run_load_test_async(socket_path, profile)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert seen_sessions == {"loadtest-000", "loadtest-001", "loadtest-002"}
+        assert set(seen_events) == {"PreToolUse", "Stop"}
+        assert report.total_requests == len(seen_events)
+        assert report.errors["Stop"] == len(report.latencies_ms["Stop"])
+        assert report.samples
+        assert report.to_dict()["executor"]["max_workers"] == 2
+
+    @pytest.mark.anyio
+    async def test_unreachable_socket_counts_errors(self, tmp_path: Path) -> None:
+        profile = LoadProfile(
+            sessions=1, duration_seconds=0.05, think_time_ms=10.0, sample_interval_seconds=1.0
+        )
+
+        report = await run_load_test_async(tmp_path / "missing.sock", profile)
+
+        assert report.total_requests == 0
+        assert report.total_errors > 0
+        assert report.failed_samples == 1
+
+
+class TestCmdLoadtest:
+    """Tests for the loadtest CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def _project_context(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+            lambda project_root: "test-repo",
+        )
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+            lambda project_root: project_root,
+        )
+        ProjectContext._initialized = False
+
+    def _args(self, project_root: Path, **overrides: Any) -> argparse.Namespace:
+        (project_root / ".claude" / "hooks-daemon").mkdir(parents=True, exist_ok=True)
+        (project_root / ".claude" / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+        defaults: dict[str, Any] = {
+            "project_root": project_root,
+            "sessions": 2,
+            "duration": 0.1,
+            "think_time_ms": 10.0,
+            "sample_interval": 0.05,
+            "seed": 1,
+            "json": False,
+        }
+        defaults.update(overrides)
+        return argparse.Namespace(**defaults)
+
+    def test_requires_running_daemon(self, tmp_path: Path, capsys: Any) -> None:
+        with patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=None):
+            result = cmd_loadtest(self._args(tmp_path))
+
+        assert result == 1
+        assert "Daemon not running" in capsys.readouterr().err
+
+    def test_prints_report(self, tmp_path: Path, capsys: Any) -> None:
+        report = LoadTestReport(profile=LoadProfile(sessions=2))
+        report.duration_seconds = 1.0
+        report.latencies_ms["Status"].append(1.5)
+        report.samples = [
+            {
+                "rss_bytes": 2048,
+                "executor": {
+                    "max_workers": 4,
+                    "running": 1,
+                    "queued": 0,
+                    "peak_running": 1,
+                    "peak_queued": 0,
+                },
+            }
+        ]
+
+        with (
+            patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=123),
+            patch(
+                "claude_code_hooks_daemon.daemon.loadtest.run_load_test", return_value=report
+            ) as run,
+        ):
+            result = cmd_loadtest(self._args(tmp_path))
+
+        assert result == 0
+        assert run.call_args.args[1].sessions == 2
+        output = capsys.readouterr().out
+        assert "Throughput" in output
+        assert "Executor: 4 workers" in output
+        assert "RSS:" in output
@@ -0,0 +1,194 @@
+"""Tests for deferred startup maintenance."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.cli import _cleanup_stale_files
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+from claude_code_hooks_daemon.daemon.maintenance import MaintenanceQueue, TaskState
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+_INJECTOR = "claude_code_hooks_daemon.daemon.controller.ClaudeMdInjector"
+_REQUEST = {
+    "event": "PreToolUse",
+    "hook_input": {"tool_name": "Bash", "tool_input": {"command": "ls"}, "session_id": "s1"},
+}
+
+
+@pytest.fixture
+def workspace_root(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Create a project and initialise ProjectContext for it."""
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+    config_path.write_text("version: '1.0'\n")
+    ProjectContext.initialize(config_path)
+    return tmp_path
+
+
+class TestMaintenanceQueue:
+    """Tests for MaintenanceQueue."""
+
+    def test_runs_tasks_in_order_and_records_outcomes(self) -> None:
+        ran: list[str] = []
+        queue = MaintenanceQueue()
+        queue.add("first", lambda: ran.append("first") or "did first")
+        queue.add("second", lambda: ran.append("second") or None)
+
+        assert [o["state"] for o in queue.snapshot()] == [TaskState.PENDING] * 2
+        queue.run_all()
+
+        assert ran == ["first", "second"]
+        first, second = queue.snapshot()
+        assert first["state"] == TaskState.OK
+        assert first["detail"] == "did first"
+        assert first["duration_ms"] is not None
+        assert second["detail"] is None
+        assert queue.done
+
+    def test_failed_task_is_recorded_and_the_rest_still_run(self) -> None:
+        def broken() -> str:
+            raise OSError("disk full")
+
+        queue = MaintenanceQueue()
+        queue.add("broken", broken)
+        queue.add("after", lambda: "ok")
+
+        queue.run_all()
+
+        broken_outcome, after = queue.snapshot()
+        assert broken_outcome["state"] == TaskState.FAILED
+        assert broken_outcome["detail"] == "OSError: disk full"
+        assert after["state"] == TaskState.OK
+
+
+class TestControllerDeferredMaintenance:
+    """Tests for DaemonController.initialise(defer_maintenance=True)."""
+
+    def test_deferred_work_does_not_run_during_initialise(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+
+        with patch(_INJECTOR) as injector:
+            controller.initialise(workspace_root=workspace_root, defer_maintenance=True)
+            injector.assert_not_called()
+
+            for _name, task in controller.maintenance_tasks():
+                task()
+
+            injector.return_value.inject.assert_called_once()
+
+    def test_validation_failure_degrades_once_detected(self, workspace_root: Path) -> None:
+        (workspace_root / ".claude" / "hooks-daemon.yaml").write_text("version: 1\n")
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root, defer_maintenance=True)
+
+        assert not controller.is_degraded
+        detail = controller.validate_config()
+
+        assert controller.is_degraded
+        assert "daemon degraded" in detail
+        response = controller.process_request(_REQUEST)
+        assert "configuration" in str(response).lower()
+
+    def test_degraded_startup_skips_injection_and_keeps_its_error(
+        self, workspace_root: Path
+    ) -> None:
+        controller = DaemonController()
+        controller.initialise(
+            workspace_root=workspace_root, progressive=True, defer_maintenance=True
+        )
+        with patch(
+            "claude_code_hooks_daemon.handlers.registry.HandlerRegistry.register_all",
+            side_effect=RuntimeError("boom"),
+        ):
+            controller.complete_startup()
+
+        with patch(_INJECTOR) as injector:
+            assert controller.inject_claude_md().startswith("skipped")
+            assert controller.validate_config().startswith("skipped")
+            injector.assert_not_called()
+        assert "Startup failed" in controller.config_errors[0]
+
+    def test_tasks_require_initialise(self) -> None:
+        with pytest.raises(RuntimeError, match="not initialised"):
+            DaemonController().validate_config()
+
+
+class TestStaleFileCleanupTask:
+    """Tests for the stale runtime file cleanup maintenance task."""
+
+    def test_reports_count_and_writes_status(self, tmp_path: Path) -> None:
+        with (
+            patch(
+                "claude_code_hooks_daemon.daemon.cli.cleanup_stale_daemon_files", return_value=2
+            ) as cleanup,
+            patch("claude_code_hooks_daemon.daemon.cli.write_cleanup_status") as write_status,
+        ):
+            detail = _cleanup_stale_files(tmp_path, 7)
+
+        cleanup.assert_called_once_with(tmp_path, max_age_days=7)
+        write_status.assert_called_once_with(tmp_path, 2)
+        assert detail == "removed 2 file(s) older than 7 days"
+
+
+class _Controller:
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return False
+
+
+class TestServerMaintenance:
+    """Tests for running the maintenance queue once the server is listening."""
+
+    @pytest.mark.anyio
+    async def test_runs_after_ready_and_reports_in_health(self) -> None:
+        socket_path = Path(tempfile.mktemp(suffix=".sock"))
+        events: list[str] = []
+        queue = MaintenanceQueue()
+        queue.add("check", lambda: events.append("maintenance") or "fine")
+        daemon = HooksDaemon(
+            DaemonConfig(socket_path=socket_path),
+            _Controller(),
+            warmup=lambda: events.append("warmup"),
+            on_ready=lambda: events.append("ready"),
+            maintenance=queue,
+        )
+        server_task = asyncio.create_task(daemon.start())
+
+        for _ in range(100):
+            if queue.done:
+                break
+            await asyncio.sleep(0.05)
+        health = daemon._handle_system_request({"action": "health"}, None)
+        await daemon.shutdown()
+        await server_task
+
+        assert events == ["ready", "warmup", "maintenance"]
+        assert health["result"]["maintenance"][0]["state"] == TaskState.OK
+        assert health["result"]["maintenance"][0]["detail"] == "fine"
@@ -1,11 +1,12 @@
 """Tests for MemoryLogHandler."""
 
 import logging
+import sys
 from unittest.mock import MagicMock
 
 import pytest
 
-from claude_code_hooks_daemon.daemon.memory_log_handler import MemoryLogHandler
+from claude_code_hooks_daemon.daemon.memory_log_handler import LogEntry, MemoryLogHandler
 
 
 class TestMemoryLogHandler:
@@ -30,7 +31,7 @@ class TestMemoryLogHandler:
         assert handler.max_records == 1000
 
     def test_emit_stores_record(self, handler: MemoryLogHandler) -> None:
-        """emit should store log record in buffer."""
+        """emit should store a compact entry for the record."""
         record = logging.LogRecord(
             name="test",
             level=logging.INFO,
@@ -44,7 +45,11 @@ class TestMemoryLogHandler:
         handler.emit(record)
 
         assert len(handler.records) == 1
-        assert handler.records[0] is record
+        entry = handler.records[0]
+        assert isinstance(entry, LogEntry)
+        assert entry.message == "Test message"
+        assert entry.levelno == logging.INFO
+        assert entry.created == record.created
 
     def test_emit_multiple_records(self, handler: MemoryLogHandler) -> None:
         """emit should store multiple records in order."""
@@ -65,7 +70,7 @@ class TestMemoryLogHandler:
             handler.emit(record)
 
         assert len(handler.records) == 10
-        assert list(handler.records) == records
+        assert [e.message for e in handler.records] == [r.msg for r in records]
 
     def test_emit_circular_buffer(self) -> None:
         """emit should drop oldest records when buffer is full."""
@@ -86,7 +91,7 @@ class TestMemoryLogHandler:
 
         # Should only have last 5 records
         assert len(handler.records) == 5
-        messages = [r.msg for r in handler.records]
+        messages = [e.message for e in handler.records]
         assert messages == ["Message 5", "Message 6", "Message 7", "Message 8", "Message 9"]
 
     def test_emit_handles_errors(self, handler: MemoryLogHandler) -> None:
@@ -339,3 +344,81 @@ class TestMemoryLogHandler:
 
         # Cleanup
         logger.removeHandler(handler)
+
+
+class TestLevelIndex:
+    """Tests for level-filtered queries and follow subscribers."""
+
+    @pytest.fixture
+    def handler(self) -> MemoryLogHandler:
+        handler = MemoryLogHandler(max_records=6)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        return handler
+
+    @staticmethod
+    def _emit(handler: MemoryLogHandler, level: int, msg: str) -> None:
+        handler.emit(logging.makeLogRecord({"name": "test", "levelno": level, "msg": msg}))
+
+    def test_min_level_with_count(self, handler: MemoryLogHandler) -> None:
+        """count applies to the matching entries, newest kept, oldest first."""
+        for i, level in enumerate([logging.ERROR, logging.INFO, logging.WARNING, logging.INFO]):
+            self._emit(handler, level, f"m{i}")
+
+        assert handler.get_logs(min_level=logging.WARNING) == ["ERROR: m0", "WARNING: m2"]
+        assert handler.get_logs(count=1, min_level=logging.WARNING) == ["WARNING: m2"]
+        assert handler.get_logs(count=0) == []
+
+    def test_index_follows_eviction(self, handler: MemoryLogHandler) -> None:
+        """Entries dropped from the ring are dropped from the level index."""
+        self._emit(handler, logging.ERROR, "old error")
+        for i in range(6):
+            self._emit(handler, logging.INFO, f"info {i}")
+
+        assert handler.get_logs(min_level=logging.ERROR) == []
+        assert len(handler.get_logs(min_level=logging.INFO)) == 6
+
+    def test_custom_level_between_buckets(self, handler: MemoryLogHandler) -> None:
+        """A non-standard level is filtered exactly, not by bucket."""
+        self._emit(handler, logging.WARNING, "warn")
+        self._emit(handler, logging.WARNING + 5, "louder")
+
+        assert [e.message for e in handler.get_entries(min_level=logging.WARNING + 1)] == ["louder"]
+
+    def test_exception_text_is_kept(self, handler: MemoryLogHandler) -> None:
+        """The traceback is rendered at emit time, not kept as exc_info."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, "t.py", 1, "failed", (), sys.exc_info()
+            )
+        handler.emit(record)
+
+        (log,) = handler.get_logs()
+        assert log.startswith("ERROR: failed\nTraceback")
+        assert "ValueError: boom" in log
+
+    def test_subscriber_sees_new_entries(self, handler: MemoryLogHandler) -> None:
+        """Subscribers get each new entry until they unsubscribe."""
+        seen: list[str] = []
+
+        def subscriber(entry: LogEntry) -> None:
+            seen.append(entry.message)
+
+        handler.subscribe(subscriber)
+        self._emit(handler, logging.INFO, "one")
+        handler.unsubscribe(subscriber)
+        self._emit(handler, logging.INFO, "two")
+
+        assert seen == ["one"]
+
+    def test_failing_subscriber_is_removed(self, handler: MemoryLogHandler) -> None:
+        """A subscriber that raises is dropped and the entry is still stored."""
+        subscriber = MagicMock(side_effect=RuntimeError("gone"))
+        handler.subscribe(subscriber)
+
+        self._emit(handler, logging.INFO, "one")
+        self._emit(handler, logging.INFO, "two")
+
+        assert subscriber.call_count == 1
+        assert handler.get_record_count() == 2
@@ -0,0 +1,87 @@
+"""Tests for daemon server concurrency metrics."""
+
+import threading
+
+from claude_code_hooks_daemon.daemon.metrics import ServerMetrics, default_executor_workers
+
+
+class TestDefaultExecutorWorkers:
+    """Tests for default_executor_workers()."""
+
+    def test_matches_stdlib_bounds(self) -> None:
+        workers = default_executor_workers()
+        assert 1 <= workers <= 32
+
+
+class TestServerMetrics:
+    """Tests for ServerMetrics counters."""
+
+    def test_active_requests_and_peak(self) -> None:
+        metrics = ServerMetrics()
+
+        metrics.request_started()
+        metrics.request_started()
+        metrics.request_finished()
+
+        snapshot = metrics.snapshot(4)
+        assert snapshot["requests_total"] == 2
+        assert snapshot["active_requests"] == 1
+        assert snapshot["peak_active_requests"] == 2
+        assert snapshot["executor"]["max_workers"] == 4
+        assert snapshot["rss_bytes"] > 0
+
+    def test_track_moves_job_from_queued_to_running(self) -> None:
+        metrics = ServerMetrics()
+        observed: dict[str, int] = {}
+
+        def job(value: int) -> int:
+            executor = metrics.snapshot(4)["executor"]
+            observed["running"] = executor["running"]
+            observed["queued"] = executor["queued"]
+            return value * 2
+
+        wrapped = metrics.track(job, 21)
+        assert metrics.snapshot(4)["executor"]["queued"] == 1
+
+        assert wrapped() == 42
+        assert observed == {"running": 1, "queued": 0}
+        executor = metrics.snapshot(4)["executor"]
+        assert executor["running"] == 0
+        assert executor["queued"] == 0
+        assert executor["peak_running"] == 1
+        assert executor["peak_queued"] == 1
+
+    def test_track_clears_running_on_exception(self) -> None:
+        metrics = ServerMetrics()
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        wrapped = metrics.track(boom)
+        try:
+            wrapped()
+        except RuntimeError:
+            pass
+
+        assert metrics.snapshot(4)["executor"]["running"] == 0
+
+    def test_concurrent_updates_are_consistent(self) -> None:
+        metrics = ServerMetrics()
+
+        def worker() -> None:
+            for _ in range(500):
+                metrics.request_started()
+                metrics.track(lambda: None)()
+                metrics.request_finished()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot(4)
+        assert snapshot["requests_total"] == 4000
+        assert snapshot["active_requests"] == 0
+        assert snapshot["executor"]["running"] == 0
+        assert snapshot["executor"]["queued"] == 0
@@ -8,6 +8,7 @@ import psutil
 from claude_code_hooks_daemon.constants import Timeout
 from claude_code_hooks_daemon.daemon.process_verification import (
     find_all_daemon_processes,
+    is_daemon_pid,
     is_process_running,
     kill_daemon_process,
 )
@@ -268,3 +269,22 @@ class TestIsProcessRunning:
             result = is_process_running(pid=12345)
 
         assert result is False
+
+
+class TestIsDaemonPid:
+    """Tests for is_daemon_pid()."""
+
+    def test_non_daemon_process(self) -> None:
+        """The test runner itself is not a daemon process."""
+        assert is_daemon_pid(os.getpid()) is False
+
+    def test_missing_process(self) -> None:
+        """A PID with no process is not a daemon."""
+        with patch("pathlib.Path.read_bytes", side_effect=FileNotFoundError):
+            assert is_daemon_pid(999999) is False
+
+    def test_daemon_cmdline_matches(self) -> None:
+        """A NUL-separated cmdline naming the daemon matches."""
+        cmdline = b"python\0-m\0claude_code_hooks_daemon.daemon.cli\0start\0"
+        with patch("pathlib.Path.read_bytes", return_value=cmdline):
+            assert is_daemon_pid(4242) is True
@@ -0,0 +1,208 @@
+"""Tests for progressive daemon startup (critical handlers first, rest in background)."""
+
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.constants.priority import PriorityRange
+from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.core.router import EventRouter
+from claude_code_hooks_daemon.daemon.controller import (
+    WARMING_CONTEXT,
+    WARMING_STATUS,
+    DaemonController,
+)
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+from claude_code_hooks_daemon.handlers.registry import HandlerRegistry
+
+_DESTRUCTIVE_REQUEST = {
+    "event": "PreToolUse",
+    "hook_input": {
+        "tool_name": "Bash",
+        "tool_input": {"command": "git reset --hard HEAD~1"},
+        "session_id": "s1",
+    },
+}
+
+
+@pytest.fixture
+def workspace_root(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Create a project and initialise ProjectContext for it."""
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+    config_path.write_text("version: '1.0'\n")
+    ProjectContext.initialize(config_path)
+    return tmp_path
+
+
+def _priorities(router: EventRouter) -> list[int]:
+    return [h.priority for handlers in router.get_all_handlers().values() for h in handlers]
+
+
+def _names(router: EventRouter) -> dict[str, set[str]]:
+    return {
+        event: {h.name for h in handlers} for event, handlers in router.get_all_handlers().items()
+    }
+
+
+class TestRegisterAllPriorityBand:
+    """Tests for the critical band filter in HandlerRegistry.register_all()."""
+
+    @pytest.mark.parametrize("use_manifest", [True, False])
+    def test_bands_partition_all_handlers(self, workspace_root: Path, use_manifest: bool) -> None:
+        routers: dict[bool | None, EventRouter] = {}
+        for critical in (True, False, None):
+            registry = HandlerRegistry()
+            if not (use_manifest and registry.load_manifest()):
+                registry.discover()
+            routers[critical] = EventRouter()
+            registry.register_all(
+                routers[critical], workspace_root=workspace_root, critical=critical
+            )
+
+        assert all(p <= PriorityRange.CRITICAL_MAX for p in _priorities(routers[True]))
+        assert all(p > PriorityRange.CRITICAL_MAX for p in _priorities(routers[False]))
+        assert sorted(_priorities(routers[True]) + _priorities(routers[False])) == sorted(
+            _priorities(routers[None])
+        )
+
+    def test_config_priority_override_moves_handler_between_bands(
+        self, workspace_root: Path
+    ) -> None:
+        registry = HandlerRegistry()
+        assert registry.load_manifest()
+        router = EventRouter()
+        config = {"pre_tool_use": {"destructive_git": {"priority": 40}}}
+
+        registry.register_all(router, config=config, workspace_root=workspace_root, critical=True)
+
+        classes = {type(h).__name__ for h in router.get_chain(EventType.PRE_TOOL_USE).handlers}
+        assert "SedBlockerHandler" in classes
+        assert "DestructiveGitHandler" not in classes
+
+
+class TestControllerProgressiveStartup:
+    """Tests for DaemonController.initialise(progressive=True) and complete_startup()."""
+
+    def test_serves_critical_handlers_with_warming_context(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root, progressive=True)
+
+        response = controller.process_request(_DESTRUCTIVE_REQUEST)
+
+        assert controller.is_initialised
+        assert controller.is_warming
+        assert controller.get_health()["warming"] is True
+        assert all(p <= PriorityRange.CRITICAL_MAX for p in _priorities(controller.get_router()))
+        output = response["hookSpecificOutput"]
+        assert output["permissionDecision"] == "deny"
+        assert WARMING_CONTEXT in output["additionalContext"]
+
+    def test_status_line_gets_short_warming_marker(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root, progressive=True)
+
+        event = HookEvent(event=EventType.STATUS_LINE, hook_input=HookInput(session_id="s1"))
+        result = controller.process_event(event)
+
+        assert WARMING_STATUS in result.result.context
+        assert WARMING_CONTEXT not in result.result.context
+
+    def test_complete_startup_matches_full_initialise(self, workspace_root: Path) -> None:
+        full = DaemonController()
+        full.initialise(workspace_root=workspace_root)
+        progressive = DaemonController()
+        progressive.initialise(workspace_root=workspace_root, progressive=True)
+
+        progressive.complete_startup()
+
+        assert not progressive.is_warming
+        assert _names(progressive.get_router()) == _names(full.get_router())
+        response = progressive.process_request(_DESTRUCTIVE_REQUEST)
+        assert WARMING_CONTEXT not in response["hookSpecificOutput"].get("additionalContext", "")
+
+    def test_complete_startup_without_pending_work_is_a_no_op(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root)
+        router = controller.get_router()
+
+        controller.complete_startup()
+
+        assert controller.get_router() is router
+
+    def test_failed_warmup_keeps_critical_handlers_and_degrades(self, workspace_root: Path) -> None:
+        controller = DaemonController()
+        controller.initialise(workspace_root=workspace_root, progressive=True)
+        router = controller.get_router()
+
+        with patch.object(HandlerRegistry, "register_all", side_effect=RuntimeError("boom")):
+            controller.complete_startup()
+
+        assert controller.get_router() is router
+        assert not controller.is_warming
+        assert controller.is_degraded
+        assert "RuntimeError: boom" in controller.config_errors[0]
+
+
+class _Controller:
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return False
+
+
+class TestServerWarmup:
+    """Tests for running the warm-up once the server is listening."""
+
+    @pytest.mark.anyio
+    async def test_warmup_runs_after_socket_is_listening(self) -> None:
+        socket_path = Path(tempfile.mktemp(suffix=".sock"))
+        finished = threading.Event()
+        socket_existed: list[bool] = []
+
+        def warmup() -> None:
+            socket_existed.append(socket_path.exists())
+            finished.set()
+
+        daemon = HooksDaemon(DaemonConfig(socket_path=socket_path), _Controller(), warmup=warmup)
+        server_task = asyncio.create_task(daemon.start())
+
+        assert await asyncio.to_thread(finished.wait, 5)
+        await daemon.shutdown()
+        await server_task
+
+        assert socket_existed == [True]
+
+    def test_warmup_errors_are_logged_not_raised(self, caplog: Any) -> None:
+        def warmup() -> None:
+            raise RuntimeError("plugin exploded")
+
+        HooksDaemon._run_warmup(warmup)
+
+        assert "Background warm-up failed" in caplog.text
@@ -0,0 +1,76 @@
+"""Tests for the daemon readiness pipe."""
+
+import os
+import time
+
+from claude_code_hooks_daemon.daemon.readiness import ReadinessPipe
+
+
+def _in_child(pipe: ReadinessPipe, action: str) -> int:
+    """Fork a child that plays the daemon side of the pipe."""
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the forked child
+        pipe.close_read()
+        if action == "ready":
+            pipe.notify_ready()
+        elif action == "fail":
+            pipe.notify_failed("ValueError: bad config\nsecond line")
+        elif action == "hang":
+            time.sleep(2)
+        os._exit(0)
+    return pid
+
+
+class TestReadinessPipe:
+    """Tests for ReadinessPipe across a real fork."""
+
+    def test_ready_reports_daemon_pid(self) -> None:
+        pipe = ReadinessPipe()
+        pid = _in_child(pipe, "ready")
+
+        outcome = pipe.wait(timeout=5)
+        os.waitpid(pid, 0)
+
+        assert outcome.ready
+        assert outcome.pid == pid
+        assert outcome.error is None
+
+    def test_failure_carries_flattened_message(self) -> None:
+        pipe = ReadinessPipe()
+        pid = _in_child(pipe, "fail")
+
+        outcome = pipe.wait(timeout=5)
+        os.waitpid(pid, 0)
+
+        assert not outcome.ready
+        assert outcome.error == "ValueError: bad config second line"
+
+    def test_exit_without_message_is_reported_immediately(self) -> None:
+        pipe = ReadinessPipe()
+        pid = _in_child(pipe, "exit")
+
+        start = time.monotonic()
+        outcome = pipe.wait(timeout=5)
+        os.waitpid(pid, 0)
+
+        assert outcome.error == "daemon exited before it was ready"
+        assert time.monotonic() - start < 2
+
+    def test_timeout(self) -> None:
+        pipe = ReadinessPipe()
+        pid = _in_child(pipe, "hang")
+
+        outcome = pipe.wait(timeout=0.1)
+        os.waitpid(pid, 0)
+
+        assert outcome.error is not None
+        assert "did not become ready within 0.1s" in outcome.error
+
+    def test_notify_is_one_shot(self) -> None:
+        pipe = ReadinessPipe()
+
+        pipe.notify_ready()
+        pipe.notify_failed("ignored")
+        outcome = pipe.wait(timeout=1)
+
+        assert outcome.pid == os.getpid()
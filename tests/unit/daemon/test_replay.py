@@ -0,0 +1,306 @@
+"""Tests for traffic replay and the replay CLI command."""
+
+import argparse
+import json
+import socketserver
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.cli import cmd_replay
+from claude_code_hooks_daemon.daemon.replay import (
+    CapturedRequest,
+    load_capture,
+    replay_in_process,
+    replay_over_socket,
+)
+
+_DENY = {"hookSpecificOutput": {"hookEventName": "PreToolUse", "permissionDecision": "deny"}}
+
+
+@pytest.fixture(autouse=True)
+def mock_git_checks(monkeypatch: Any) -> None:
+    """Mock git repository checks for tests running in tmp directories."""
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+
+
+def _request(command: str) -> dict[str, Any]:
+    return {
+        "event": "PreToolUse",
+        "hook_input": {"tool_name": "Bash", "tool_input": {"command": command}},
+    }
+
+
+def _write_capture(path: Path, entries: list[dict[str, Any]]) -> None:
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+
+class DenyRmController:
+    """Controller that denies any Bash command starting with rm."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        self.requests.append(request_data)
+        command = request_data["hook_input"]["tool_input"]["command"]
+        return _DENY if command.startswith("rm") else {}
+
+
+class TestLoadCapture:
+    """Tests for reading capture files."""
+
+    def test_loads_entries_and_skips_malformed_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        path.write_text(
+            json.dumps({"ts": 1.0, "request": _request("ls"), "decision": "allow"})
+            + "\n{not json\n\n"
+            + json.dumps({"ts": 2.0, "request": "oops"})
+            + "\n"
+            + json.dumps(
+                {"ts": 3.0, "request": _request("rm x"), "decision": "deny", "elapsed_ms": 2.5}
+            )
+            + "\n"
+        )
+
+        records = load_capture(path)
+
+        assert [r.timestamp for r in records] == [1.0, 3.0]
+        assert records[1].decision == "deny"
+        assert records[1].elapsed_ms == 2.5
+        assert records[1].event == "PreToolUse"
+        assert records[1].tool_name == "Bash"
+        assert not records[1].redacted
+
+    def test_marks_records_captured_with_redaction(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.jsonl"
+        _write_capture(
+            path,
+            [
+                {"ts": 1.0, "request": _request("ls"), "decision": "allow", "redact": "hash"},
+                {"ts": 2.0, "request": _request("ls"), "decision": "allow", "redact": "none"},
+            ],
+        )
+
+        records = load_capture(path)
+
+        assert [r.redacted for r in records] == [True, False]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_capture(tmp_path / "missing.jsonl")
+
+
+class TestReplayInProcess:
+    """Tests for in-process replay."""
+
+    def test_reports_totals_and_decision_diffs(self) -> None:
+        records = [
+            CapturedRequest(1.0, _request("ls"), "allow", 1.0),
+            CapturedRequest(2.0, _request("rm -rf /"), "deny", 1.0),
+            CapturedRequest(3.0, _request("rm tmp"), "allow", 1.0),
+        ]
+
+        report = replay_in_process(records, DenyRmController())
+
+        assert report.total == 3
+        assert report.errors == 0
+        assert len(report.latencies_ms) == 3
+        assert len(report.diffs) == 1
+        diff = report.diffs[0]
+        assert (diff.index, diff.expected, diff.actual) == (2, "allow", "deny")
+        summary = report.to_dict()
+        assert summary["mode"] == "in-process"
+        assert summary["latency"]["count"] == 3
+        assert summary["decision_diffs"][0]["tool_name"] == "Bash"
+
+    def test_redacted_diffs_are_marked(self) -> None:
+        records = [
+            CapturedRequest(1.0, _request("rm tmp"), "allow", 1.0, redacted=True),
+            CapturedRequest(2.0, _request("rm tmp"), "allow", 1.0),
+        ]
+
+        report = replay_in_process(records, DenyRmController())
+
+        assert report.redacted == 1
+        assert [d.redacted for d in report.diffs] == [True, False]
+        assert [d.index for d in report.reliable_diffs] == [1]
+        assert report.to_dict()["decision_diffs"][0]["redacted"] is True
+
+    def test_original_speed_sleeps_for_recorded_gaps(self) -> None:
+        records = [
+            CapturedRequest(10.0, _request("ls"), "allow", 1.0),
+            CapturedRequest(10.5, _request("ls"), "allow", 1.0),
+            CapturedRequest(100.0, _request("ls"), "allow", 1.0),
+        ]
+        sleeps: list[float] = []
+
+        replay_in_process(records, DenyRmController(), speed="original", sleep=sleeps.append)
+
+        assert sleeps[0] == pytest.approx(0.5)
+        assert sleeps[1] == 5.0  # Long idle gaps are compressed
+
+    def test_max_speed_never_sleeps(self) -> None:
+        records = [CapturedRequest(float(i), _request("ls"), "allow", 1.0) for i in range(3)]
+        sleeps: list[float] = []
+
+        replay_in_process(records, DenyRmController(), speed="max", sleep=sleeps.append)
+
+        assert sleeps == []
+
+
+class _DenyRmSocketHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        response = DenyRmController().process_request(request)
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+
+@pytest.fixture
+def fake_daemon_socket() -> Iterator[Path]:
+    """Serve DenyRmController over a Unix socket."""
+    socket_path = Path(tempfile.mkdtemp()) / "d.sock"
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), _DenyRmSocketHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestReplayOverSocket:
+    """Tests for socket replay."""
+
+    def test_replays_against_socket(self, fake_daemon_socket: Path) -> None:
+        records = [
+            CapturedRequest(1.0, _request("rm x"), "deny", 1.0),
+            CapturedRequest(2.0, _request("ls"), "allow", 1.0),
+        ]
+
+        report = replay_over_socket(records, fake_daemon_socket)
+
+        assert report.mode == "socket"
+        assert report.total == 2
+        assert report.errors == 0
+        assert report.diffs == []
+
+    def test_connection_failure_counts_as_error(self, tmp_path: Path) -> None:
+        records = [CapturedRequest(1.0, _request("ls"), "allow", 1.0)]
+
+        report = replay_over_socket(records, tmp_path / "nope.sock")
+
+        assert report.errors == 1
+        assert report.diffs[0].actual == "error"
+
+
+class TestCmdReplay:
+    """Tests for the replay CLI command."""
+
+    def _args(self, project_root: Path, capture: Path, **overrides: Any) -> argparse.Namespace:
+        defaults: dict[str, Any] = {
+            "project_root": project_root,
+            "capture": str(capture),
+            "target": "in-process",
+            "speed": "max",
+            "limit": None,
+            "max_diffs": 20,
+            "json": False,
+        }
+        defaults.update(overrides)
+        return argparse.Namespace(**defaults)
+
+    def _project(self, tmp_path: Path) -> Path:
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "hooks-daemon").mkdir(parents=True)
+        (claude_dir / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+        return tmp_path
+
+    def test_missing_capture_returns_1(self, tmp_path: Path, capsys: Any) -> None:
+        project = self._project(tmp_path)
+
+        result = cmd_replay(self._args(project, tmp_path / "missing.jsonl"))
+
+        assert result == 1
+        assert "Capture file not found" in capsys.readouterr().err
+
+    def test_in_process_replay_without_diffs_returns_0(self, tmp_path: Path, capsys: Any) -> None:
+        project = self._project(tmp_path)
+        capture = tmp_path / "capture.jsonl"
+        _write_capture(
+            capture,
+            [
+                {"ts": 1.0, "request": _request("ls"), "decision": "allow"},
+                {"ts": 2.0, "request": _request("rm x"), "decision": "deny"},
+            ],
+        )
+
+        with patch(
+            "claude_code_hooks_daemon.daemon.bootstrap.build_controller",
+            return_value=DenyRmController(),
+        ):
+            result = cmd_replay(self._args(project, capture, json=True))
+
+        assert result == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["total"] == 2
+        assert report["decision_diffs"] == []
+
+    def test_decision_diff_returns_1_and_is_listed(self, tmp_path: Path, capsys: Any) -> None:
+        project = self._project(tmp_path)
+        capture = tmp_path / "capture.jsonl"
+        _write_capture(capture, [{"ts": 1.0, "request": _request("rm x"), "decision": "allow"}])
+
+        with patch(
+            "claude_code_hooks_daemon.daemon.bootstrap.build_controller",
+            return_value=DenyRmController(),
+        ):
+            result = cmd_replay(self._args(project, capture))
+
+        assert result == 1
+        assert "allow -> deny" in capsys.readouterr().out
+
+    def test_redacted_diff_is_marked_and_returns_0(self, tmp_path: Path, capsys: Any) -> None:
+        project = self._project(tmp_path)
+        capture = tmp_path / "capture.jsonl"
+        _write_capture(
+            capture,
+            [{"ts": 1.0, "request": _request("rm x"), "decision": "allow", "redact": "redact"}],
+        )
+
+        with patch(
+            "claude_code_hooks_daemon.daemon.bootstrap.build_controller",
+            return_value=DenyRmController(),
+        ):
+            result = cmd_replay(self._args(project, capture))
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Redacted: 1" in out
+        assert "allow -> deny [redacted]" in out
+
+    def test_socket_target_requires_running_daemon(self, tmp_path: Path, capsys: Any) -> None:
+        project = self._project(tmp_path)
+        capture = tmp_path / "capture.jsonl"
+        _write_capture(capture, [{"ts": 1.0, "request": _request("ls"), "decision": "allow"}])
+
+        with patch("claude_code_hooks_daemon.daemon.cli.read_pid_file", return_value=None):
+            result = cmd_replay(self._args(project, capture, target="socket"))
+
+        assert result == 1
+        assert "Daemon not running" in capsys.readouterr().err
@@ -0,0 +1,120 @@
+"""Tests for HooksDaemon traffic capture integration."""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig, TrafficCaptureConfig
+from claude_code_hooks_daemon.core.chain import ChainExecutionResult
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.daemon.capture import TrafficCapture
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+
+def _make_config(capture: TrafficCaptureConfig) -> DaemonConfig:
+    return DaemonConfig(
+        socket_path=Path(tempfile.mktemp(suffix=".sock")),
+        log_level="DEBUG",
+        traffic_capture=capture,
+    )
+
+
+class TracingFakeController:
+    """Controller implementing both the Controller and TracingController protocols."""
+
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return self.process_request_traced(request_data)[0]
+
+    def process_request_traced(
+        self, request_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], ChainExecutionResult | None]:
+        result = HookResult.deny("blocked")
+        chain_result = ChainExecutionResult(result=result, handler_timings_ms={"guard": 0.25})
+        return result.to_json("PreToolUse"), chain_result
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return True
+
+
+_REQUEST = {
+    "event": "PreToolUse",
+    "hook_input": {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}},
+    "request_id": "req-1",
+}
+
+
+class TestServerCapture:
+    """Tests for capture wiring in HooksDaemon."""
+
+    def test_capture_disabled_by_default(self) -> None:
+        daemon = HooksDaemon(_make_config(TrafficCaptureConfig()), TracingFakeController())
+        assert daemon._capture is None
+
+    @pytest.mark.anyio
+    async def test_request_is_captured_with_handler_timings(self, tmp_path: Path) -> None:
+        capture_path = tmp_path / "capture.jsonl"
+        config = _make_config(TrafficCaptureConfig(enabled=True, path=str(capture_path)))
+        capture = TrafficCapture.from_config(config.traffic_capture)
+        daemon = HooksDaemon(config, TracingFakeController(), capture=capture)
+
+        response = await daemon._process_request(json.dumps(_REQUEST))
+
+        assert response["request_id"] == "req-1"
+        entries = [json.loads(line) for line in capture_path.read_text().splitlines()]
+        assert len(entries) == 1
+        assert entries[0]["request"]["hook_input"]["tool_name"] == "Bash"
+        assert entries[0]["decision"] == "deny"
+        assert entries[0]["handlers"] == {"guard": 0.25}
+        assert "request_id" not in entries[0]["response"]
+
+    @pytest.mark.anyio
+    async def test_system_requests_are_not_captured(self, tmp_path: Path) -> None:
+        capture_path = tmp_path / "capture.jsonl"
+        config = _make_config(TrafficCaptureConfig(enabled=True, path=str(capture_path)))
+        capture = TrafficCapture.from_config(config.traffic_capture)
+        daemon = HooksDaemon(config, TracingFakeController(), capture=capture)
+
+        await daemon._process_request(
+            json.dumps({"event": "_system", "hook_input": {"action": "health"}})
+        )
+
+        assert not capture_path.exists()
+
+
+class TestServerMetricsAction:
+    """Tests for the _system metrics action and executor wiring."""
+
+    def test_executor_uses_configured_worker_count(self) -> None:
+        config = _make_config(TrafficCaptureConfig())
+        config.executor_max_workers = 3
+        daemon = HooksDaemon(config, TracingFakeController())
+
+        response = daemon._handle_system_request({"action": "metrics"}, "req-9")
+
+        assert response["request_id"] == "req-9"
+        lanes = response["result"]["lanes"]
+        assert {lane["max_workers"] for lane in lanes.values()} == {3}
+        assert response["result"]["executor"]["max_workers"] == 3 * len(lanes)
+        assert daemon._get_executor("PreToolUse")._max_workers == 3
+
+    @pytest.mark.anyio
+    async def test_requests_are_counted(self) -> None:
+        daemon = HooksDaemon(_make_config(TrafficCaptureConfig()), TracingFakeController())
+
+        await daemon._process_request(json.dumps(_REQUEST))
+
+        executor = daemon._handle_system_request({"action": "metrics"}, None)["result"]["executor"]
+        assert executor["peak_running"] == 1
+        assert executor["running"] == 0
@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.core.deferred import defer
 from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
 from claude_code_hooks_daemon.daemon.server import (
     HooksDaemon,
@@ -161,6 +162,25 @@ class TestHandleClientException:
         writer.close.assert_called_once()
         writer.wait_closed.assert_awaited_once()
 
+    @pytest.mark.anyio
+    async def test_deferred_tasks_run_after_response_is_written(self) -> None:
+        config = _make_config()
+        daemon = HooksDaemon(config=config, controller=FakeController())
+        reader = AsyncMock(spec=asyncio.StreamReader)
+        writer = AsyncMock(spec=asyncio.StreamWriter)
+        reader.readline.return_value = b'{"event":"PreToolUse","hook_input":{}}\n'
+        order: list[str] = []
+        writer.write.side_effect = lambda _data: order.append("response")
+
+        async def process(_self: Any, _data: str, _writer: Any) -> dict[str, Any]:
+            defer(lambda: order.append("deferred"))
+            return {"result": {}}
+
+        with patch.object(HooksDaemon, "_process_request", process):
+            await daemon._handle_client(reader, writer)
+
+        assert order == ["response", "deferred"]
+
 
 class TestProcessRequestNewController:
     """Tests for _process_request with new Controller protocol."""
@@ -0,0 +1,117 @@
+"""Tests for the server's log queries and logs --follow streaming."""
+
+import asyncio
+import json
+import logging
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.daemon import server
+from claude_code_hooks_daemon.daemon.memory_log_handler import ACTION_FOLLOW_LOGS, MemoryLogHandler
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+
+_TIMEOUT_SECONDS = 5
+
+
+class _Controller:
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+
+@pytest.fixture
+def log_handler(monkeypatch: pytest.MonkeyPatch) -> MemoryLogHandler:
+    handler = MemoryLogHandler(max_records=10)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    monkeypatch.setattr(server, "_memory_log_handler", handler)
+    return handler
+
+
+@pytest.fixture
+def daemon() -> HooksDaemon:
+    config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+    return HooksDaemon(config=config, controller=_Controller())
+
+
+def _emit(handler: MemoryLogHandler, level: int, msg: str) -> None:
+    handler.handle(logging.makeLogRecord({"name": "test", "levelno": level, "msg": msg}))
+
+
+class TestGetMemoryLogs:
+    """Tests for get_memory_logs() level filtering."""
+
+    def test_level_is_a_minimum(self, log_handler: MemoryLogHandler) -> None:
+        _emit(log_handler, logging.INFO, "info")
+        _emit(log_handler, logging.ERROR, "error")
+
+        assert server.get_memory_logs(level="WARNING") == ["ERROR error"]
+
+    def test_unknown_level_is_rejected(self, log_handler: MemoryLogHandler) -> None:
+        with pytest.raises(ValueError, match="LOUD"):
+            server.get_memory_logs(level="LOUD")
+
+
+class TestFollowLogs:
+    """Tests for the follow_logs system action."""
+
+    @pytest.mark.anyio
+    async def test_response_carries_backlog(
+        self, daemon: HooksDaemon, log_handler: MemoryLogHandler
+    ) -> None:
+        _emit(log_handler, logging.INFO, "before")
+
+        response = await daemon._process_request(
+            json.dumps(
+                {"event": "_system", "hook_input": {"action": ACTION_FOLLOW_LOGS, "count": 5}}
+            )
+        )
+
+        assert response["result"]["follow"] is True
+        assert response["result"]["logs"] == ["INFO before"]
+
+    @pytest.mark.anyio
+    async def test_new_entries_stream_until_shutdown(
+        self, daemon: HooksDaemon, log_handler: MemoryLogHandler
+    ) -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=server_sock)
+        client_reader, client_writer = await asyncio.open_connection(sock=client_sock)
+
+        stream = asyncio.ensure_future(daemon._stream_logs(reader, writer, logging.WARNING))
+        await asyncio.sleep(0)
+        _emit(log_handler, logging.INFO, "quiet")
+        _emit(log_handler, logging.WARNING, "loud")
+        line = await asyncio.wait_for(client_reader.readline(), _TIMEOUT_SECONDS)
+        await daemon.shutdown()
+        await asyncio.wait_for(stream, _TIMEOUT_SECONDS)
+
+        assert json.loads(line) == {"log": "WARNING loud"}
+        assert log_handler._subscribers == []
+        writer.close()
+        client_writer.close()
+
+    @pytest.mark.anyio
+    async def test_stream_ends_when_client_closes(
+        self, daemon: HooksDaemon, log_handler: MemoryLogHandler
+    ) -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=server_sock)
+
+        stream = asyncio.ensure_future(daemon._stream_logs(reader, writer, None))
+        await asyncio.sleep(0)
+        client_sock.close()
+        await asyncio.wait_for(stream, _TIMEOUT_SECONDS)
+
+        assert log_handler._subscribers == []
+        assert daemon._log_followers == set()
+        writer.close()
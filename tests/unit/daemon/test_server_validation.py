@@ -18,6 +18,8 @@ def mock_controller():
     """Mock controller for testing."""
     controller = MagicMock()
     controller.dispatch = MagicMock(return_value=MagicMock(to_json=lambda x: {}))
+    # No async handlers: requests take the synchronous executor path
+    controller.uses_async_handlers.return_value = False
     return controller
 
 
@@ -0,0 +1,152 @@
+"""Tests for per-session request lanes."""
+
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+from claude_code_hooks_daemon.daemon.session_lanes import SessionLanes
+
+_WORK_SECONDS = 0.05
+
+
+class TestSessionLanes:
+    """Tests for SessionLanes.run() ordering and bookkeeping."""
+
+    @pytest.mark.anyio
+    async def test_same_session_runs_in_arrival_order(self) -> None:
+        lanes = SessionLanes()
+        order: list[str] = []
+
+        async def job(name: str, delay: float) -> str:
+            order.append(f"start {name}")
+            await asyncio.sleep(delay)
+            order.append(f"end {name}")
+            return name
+
+        results = await asyncio.gather(
+            lanes.run("s1", lambda: job("a", 0.02)),
+            lanes.run("s1", lambda: job("b", 0.0)),
+        )
+
+        assert results == ["a", "b"]
+        assert order == ["start a", "end a", "start b", "end b"]
+        assert lanes.snapshot()["serialised_total"] == 1
+
+    @pytest.mark.anyio
+    async def test_different_sessions_overlap(self) -> None:
+        lanes = SessionLanes()
+        both_started = asyncio.Event()
+        started: list[str] = []
+
+        async def job(name: str) -> None:
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+
+        await asyncio.gather(lanes.run("s1", lambda: job("a")), lanes.run("s2", lambda: job("b")))
+
+        assert sorted(started) == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_depth_is_visible_and_lanes_are_dropped(self) -> None:
+        lanes = SessionLanes()
+        release = asyncio.Event()
+
+        first = asyncio.ensure_future(lanes.run("s1", release.wait))
+        second = asyncio.ensure_future(lanes.run("s1", release.wait))
+        await asyncio.sleep(0)
+        snapshot = lanes.snapshot()
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert snapshot["waiting"] == 1
+        assert snapshot["deepest"] == [{"session_id": "s1", "depth": 2}]
+        assert lanes.snapshot()["active"] == 0
+        assert lanes.depth("s1") == 0
+
+    @pytest.mark.anyio
+    async def test_failed_job_releases_lane(self) -> None:
+        lanes = SessionLanes()
+
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await lanes.run("s1", fail)
+
+        assert await asyncio.wait_for(lanes.run("s1", lambda: asyncio.sleep(0, "ok")), 1) == "ok"
+
+
+class _OverlapController:
+    """Controller that records the most requests it ran at once."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(_WORK_SECONDS)
+        with self._lock:
+            self.running -= 1
+        return {}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return True
+
+
+def _request(session_id: str) -> str:
+    return json.dumps({"event": "PreToolUse", "hook_input": {"session_id": session_id}})
+
+
+class TestServerLanes:
+    """Tests for lane use in HooksDaemon._process_request()."""
+
+    @pytest.fixture
+    def daemon_and_controller(self) -> tuple[HooksDaemon, _OverlapController]:
+        controller = _OverlapController()
+        config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+        return HooksDaemon(config=config, controller=controller), controller
+
+    @pytest.mark.anyio
+    async def test_same_session_never_overlaps(
+        self, daemon_and_controller: tuple[HooksDaemon, _OverlapController]
+    ) -> None:
+        daemon, controller = daemon_and_controller
+
+        await asyncio.gather(*(daemon._process_request(_request("s1")) for _ in range(3)))
+
+        assert controller.peak == 1
+
+    @pytest.mark.anyio
+    async def test_sessions_run_in_parallel(
+        self, daemon_and_controller: tuple[HooksDaemon, _OverlapController]
+    ) -> None:
+        daemon, controller = daemon_and_controller
+
+        await asyncio.gather(*(daemon._process_request(_request(f"s{i}")) for i in range(3)))
+
+        assert controller.peak > 1
+        metrics = daemon._handle_system_request({"action": "metrics"}, None)["result"]
+        assert metrics["session_lanes"]["active"] == 0
@@ -0,0 +1,140 @@
+"""Tests for single-flight coalescing of Status requests."""
+
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import DaemonConfig
+from claude_code_hooks_daemon.daemon.server import HooksDaemon
+from claude_code_hooks_daemon.daemon.single_flight import SingleFlight
+
+_WAIT_TIMEOUT_SECONDS = 5
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.run()."""
+
+    @pytest.mark.anyio
+    async def test_identical_keys_share_one_run(self) -> None:
+        flights = SingleFlight()
+        release = asyncio.Event()
+        runs = 0
+
+        async def job() -> str:
+            nonlocal runs
+            runs += 1
+            await release.wait()
+            return "status"
+
+        waiters = [asyncio.ensure_future(flights.run("s1", job)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["status"] * 3
+        assert runs == 1
+        assert flights.snapshot() == {"in_flight": 0, "coalesced_total": 2}
+
+    @pytest.mark.anyio
+    async def test_different_keys_run_separately(self) -> None:
+        flights = SingleFlight()
+
+        results = await asyncio.gather(
+            flights.run("a", lambda: asyncio.sleep(0, "a")),
+            flights.run("b", lambda: asyncio.sleep(0, "b")),
+        )
+
+        assert results == ["a", "b"]
+        assert flights.snapshot()["coalesced_total"] == 0
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_does_not_cancel_shared_run(self) -> None:
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def job() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flights.run("s1", job))
+        second = asyncio.ensure_future(flights.run("s1", job))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+
+
+class _CountingController:
+    """Controller whose Status requests block until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls = 0
+
+    def process_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        self.release.wait(_WAIT_TIMEOUT_SECONDS)
+        return {"hookSpecificOutput": {"additionalContext": "status"}}
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+    def get_handlers(self) -> dict[str, list[dict[str, Any]]]:
+        return {}
+
+    def get_mode(self) -> dict[str, Any]:
+        return {"mode": "default", "custom_message": None}
+
+    def set_mode(self, mode: Any, custom_message: str | None = None) -> bool:
+        return True
+
+
+def _status(request_id: str, session_id: str = "s1") -> str:
+    return json.dumps(
+        {
+            "event": "Status",
+            "hook_input": {"session_id": session_id, "model": {"id": "m"}},
+            "request_id": request_id,
+        }
+    )
+
+
+class TestServerStatusCoalescing:
+    """Tests for Status coalescing in HooksDaemon._process_request()."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_identical_status_requests_run_once(self) -> None:
+        controller = _CountingController()
+        config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+        daemon = HooksDaemon(config=config, controller=controller)
+
+        requests = [
+            asyncio.ensure_future(daemon._process_request(_status(f"req-{i}"))) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        controller.release.set()
+        responses = await asyncio.gather(*requests)
+
+        assert controller.calls == 1
+        assert [r["request_id"] for r in responses] == ["req-0", "req-1", "req-2"]
+        metrics = daemon._handle_system_request({"action": "metrics"}, None)["result"]
+        assert metrics["status_coalescing"]["coalesced_total"] == 2
+
+    @pytest.mark.anyio
+    async def test_other_sessions_are_not_coalesced(self) -> None:
+        controller = _CountingController()
+        controller.release.set()
+        config = DaemonConfig(socket_path=Path(tempfile.mktemp(suffix=".sock")))
+        daemon = HooksDaemon(config=config, controller=controller)
+
+        await asyncio.gather(
+            daemon._process_request(_status("a", "s1")),
+            daemon._process_request(_status("b", "s2")),
+        )
+
+        assert controller.calls == 2
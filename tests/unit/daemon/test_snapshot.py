@@ -0,0 +1,188 @@
+"""Tests for the session state snapshot carried across restarts."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.config.models import SessionSnapshotConfig
+from claude_code_hooks_daemon.core.data_layer import (
+    get_data_layer,
+    get_session_registry,
+    reset_data_layer,
+)
+from claude_code_hooks_daemon.core.event import EventType, HookEvent, HookInput
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.controller import DaemonController
+from claude_code_hooks_daemon.daemon.snapshot import SNAPSHOT_VERSION, SessionSnapshot
+
+_HOUR = 3600
+
+_CONFIG = """\
+version: '1.0'
+daemon:
+  idle_timeout_seconds: 600
+  log_level: INFO
+handlers: {}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_data_layer() -> Any:
+    reset_data_layer()
+    yield
+    reset_data_layer()
+
+
+def _snapshot(path: Path, max_bytes: int = 1024 * 1024) -> SessionSnapshot:
+    return SessionSnapshot(path, max_age_seconds=_HOUR, max_sessions=5, max_bytes=max_bytes)
+
+
+def _record_blocks(count: int) -> None:
+    for _ in range(count):
+        get_data_layer().history.record(
+            handler_id="destructive-git", event_type="PreToolUse", decision="deny", tool_name="Bash"
+        )
+
+
+class TestSessionSnapshot:
+    """Tests for SessionSnapshot save/load."""
+
+    def test_history_survives_save_and_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        _record_blocks(3)
+
+        assert _snapshot(path).save(DaemonController()) > 0
+        reset_data_layer()
+        DaemonController().import_state(_snapshot(path).load() or {})
+
+        assert get_data_layer().history.count_blocks_by_handler("destructive-git") == 3
+        assert not path.exists()
+
+    def test_mode_is_not_saved(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+
+        _snapshot(path).save(DaemonController())
+
+        assert "mode" not in json.loads(path.read_text())["state"]
+
+    def test_expired_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        saved_at = time.time() - 2 * _HOUR
+        path.write_text(
+            json.dumps({"version": SNAPSHOT_VERSION, "saved_at": saved_at, "state": {}})
+        )
+
+        assert _snapshot(path).load() is None
+        assert not path.exists()
+
+    def test_other_version_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        path.write_text(json.dumps({"version": -1, "saved_at": time.time(), "state": {}}))
+
+        assert _snapshot(path).load() is None
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        path.write_text("{not json")
+
+        assert _snapshot(path).load() is None
+
+    def test_oldest_history_is_dropped_to_fit(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        _record_blocks(200)
+        max_bytes = 4096
+
+        written = _snapshot(path, max_bytes=max_bytes).save(DaemonController())
+
+        records = json.loads(path.read_text())["state"]["handler_history"]["records"]
+        assert 0 < written <= max_bytes
+        assert 0 < len(records) < 200
+
+    def test_session_history_is_dropped_to_fit(self, tmp_path: Path) -> None:
+        path = tmp_path / "session-snapshot.json"
+        history = get_session_registry().acquire("s1").history
+        for _ in range(200):
+            history.record(
+                handler_id="destructive-git",
+                event_type="PreToolUse",
+                decision="deny",
+                tool_name="Bash",
+            )
+
+        written = _snapshot(path, max_bytes=4096).save(DaemonController())
+
+        state = json.loads(path.read_text())["state"]
+        assert 0 < written <= 4096
+        assert 0 < len(state["sessions"]["s1"]["handler_history"]["records"]) < 200
+
+    def test_disabled_in_config(self, tmp_path: Path) -> None:
+        assert SessionSnapshot.from_config(SessionSnapshotConfig(enabled=False), tmp_path) is None
+
+    def test_configured_path(self, tmp_path: Path) -> None:
+        config = SessionSnapshotConfig(path=str(tmp_path / "state.json"), max_age_hours=2)
+
+        snapshot = SessionSnapshot.from_config(config, tmp_path)
+
+        assert snapshot is not None
+        assert snapshot.path == tmp_path / "state.json"
+
+
+class TestLazyRestore:
+    """Tests for DaemonController.restore_state_on_first_request()."""
+
+    @pytest.fixture
+    def controller(self, tmp_path: Path, monkeypatch: Any) -> DaemonController:
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+            lambda project_root: "test-repo",
+        )
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+            lambda project_root: project_root,
+        )
+        ProjectContext._initialized = False
+        (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+        config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+        config_path.write_text(_CONFIG)
+        ProjectContext.initialize(config_path)
+        controller = DaemonController()
+        controller.initialise(workspace_root=tmp_path)
+        return controller
+
+    def test_loader_runs_once_on_first_event(self, controller: DaemonController) -> None:
+        calls: list[int] = []
+        state = {"handler_history": {"total_count": 1, "records": []}}
+
+        def loader() -> dict[str, Any]:
+            calls.append(1)
+            return state
+
+        controller.restore_state_on_first_request(loader)
+        assert calls == []
+
+        event = HookEvent(
+            event=EventType.PRE_TOOL_USE,
+            hook_input=HookInput(tool_name="Bash", tool_input={"command": "ls"}),
+        )
+        controller.process_event(event)
+        controller.process_event(event)
+
+        assert calls == [1]
+        assert get_data_layer().history.total_count >= 1
+
+    def test_failing_loader_is_ignored(self, controller: DaemonController) -> None:
+        def loader() -> dict[str, Any]:
+            raise OSError("disk on fire")
+
+        controller.restore_state_on_first_request(loader)
+        result = controller.process_event(
+            HookEvent(
+                event=EventType.PRE_TOOL_USE,
+                hook_input=HookInput(tool_name="Bash", tool_input={"command": "ls"}),
+            )
+        )
+
+        assert result.result is not None
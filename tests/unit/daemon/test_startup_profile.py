@@ -0,0 +1,203 @@
+"""Tests for the daemon cold-start profile and startup budget."""
+
+import argparse
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.core.router import EventRouter
+from claude_code_hooks_daemon.daemon.cli import cmd_startup_profile
+from claude_code_hooks_daemon.daemon.startup_profile import (
+    HANDLER_INIT_BUDGET_MS,
+    STARTUP_BUDGET_MS,
+    StartupProfile,
+    StartupTimings,
+    parse_importtime,
+    run_startup_profile,
+)
+from claude_code_hooks_daemon.handlers.registry import HandlerRegistry
+
+_IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _weakrefset
+import time:      2000 |       2000 |       typing_extensions
+import time:      5000 |       7000 |     pydantic.main
+import time:      1000 |       8100 |   pydantic
+import time:       300 |        300 |     claude_code_hooks_daemon.handlers.pre_tool_use.sed_blocker
+import time:       200 |        500 |   claude_code_hooks_daemon.handlers.pre_tool_use
+import time:        50 |       8650 | claude_code_hooks_daemon
+import time:       400 |        400 | json
+Transcript file not found: /tmp/x
+"""
+
+
+def _profile(**overrides: Any) -> StartupProfile:
+    values: dict[str, Any] = {
+        "process_wall_ms": 500.0,
+        "total_ms": 400.0,
+        "phases_ms": {"discover": 2.0, "register_all": 20.0},
+        "handler_init_ms": {"FastHandler": 0.5},
+        "imports_ms": {"pydantic": 100.0, "daemon": 50.0},
+        "handler_modules_ms": {},
+    }
+    values.update(overrides)
+    return StartupProfile(**values)
+
+
+@pytest.fixture
+def git_project(tmp_path: Path) -> Path:
+    """Create a minimal git project with a hooks-daemon config."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "remote", "add", "origin", "https://example.com/acme/p.git"],
+        check=True,
+    )
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    (tmp_path / ".claude" / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+    return tmp_path
+
+
+class TestStartupTimings:
+    """Tests for phase timing."""
+
+    def test_phases_are_ordered_and_accumulate(self) -> None:
+        timings = StartupTimings()
+
+        with timings.phase("discover"):
+            pass
+        with timings.phase("register_all"):
+            pass
+        with timings.phase("discover"):
+            pass
+
+        assert list(timings.phases_ms) == ["discover", "register_all"]
+        assert all(ms >= 0 for ms in timings.phases_ms.values())
+
+    def test_phase_is_recorded_when_body_raises(self) -> None:
+        timings = StartupTimings()
+
+        with pytest.raises(ValueError), timings.phase("config_load"):
+            raise ValueError("bad config")
+
+        assert "config_load" in timings.phases_ms
+
+
+class TestParseImporttime:
+    """Tests for -X importtime parsing."""
+
+    def test_groups_attribute_unmatched_children_to_parent_group(self) -> None:
+        groups, _ = parse_importtime(_IMPORTTIME_SAMPLE)
+
+        # pydantic self times plus _weakrefset and typing_extensions it imported
+        assert groups["pydantic"] == pytest.approx(8.1)
+        assert groups["handlers"] == pytest.approx(0.5)
+        assert groups["daemon"] == pytest.approx(0.05)
+        assert groups["other"] == pytest.approx(0.4)
+
+    def test_handler_modules_use_cumulative_time(self) -> None:
+        _, handler_modules = parse_importtime(_IMPORTTIME_SAMPLE)
+
+        assert handler_modules == {
+            "claude_code_hooks_daemon.handlers.pre_tool_use.sed_blocker": pytest.approx(0.3)
+        }
+
+
+class TestStartupProfile:
+    """Tests for budget checks and serialisation."""
+
+    def test_within_budget(self) -> None:
+        assert _profile().over_budget() == []
+
+    def test_reports_total_and_handler_violations(self) -> None:
+        profile = _profile(
+            total_ms=STARTUP_BUDGET_MS + 1,
+            handler_init_ms={"SlowHandler": HANDLER_INIT_BUDGET_MS + 1, "FastHandler": 0.1},
+        )
+
+        violations = profile.over_budget()
+
+        assert len(violations) == 2
+        assert "startup took" in violations[0]
+        assert "SlowHandler.__init__" in violations[1]
+
+    def test_to_dict_includes_import_total(self) -> None:
+        assert _profile().to_dict()["import_total_ms"] == 150.0
+
+
+class TestRegisterAllHandlerTimings:
+    """Tests for handler constructor timing in HandlerRegistry.register_all()."""
+
+    def test_records_constructor_time_per_handler(self, tmp_path: Path) -> None:
+        registry = HandlerRegistry()
+        registry.discover()
+        handler_init_ms: dict[str, float] = {}
+
+        with (
+            patch.object(ProjectContext, "_initialized", True),
+            patch.object(ProjectContext, "project_root", return_value=tmp_path),
+        ):
+            count = registry.register_all(
+                EventRouter(), workspace_root=tmp_path, handler_init_ms=handler_init_ms
+            )
+
+        assert len(handler_init_ms) >= count > 0
+        assert "DestructiveGitHandler" in handler_init_ms
+
+
+class TestStartupBudget:
+    """Cold start must stay within budget so new handlers cannot inflate it unnoticed."""
+
+    def test_cold_start_within_budget(self, git_project: Path) -> None:
+        profile = run_startup_profile(git_project)
+
+        assert profile.over_budget() == []
+        assert "register_all" in profile.phases_ms
+        assert "claude_md_inject" in profile.phases_ms
+        assert profile.handler_init_ms
+        assert profile.imports_ms["pydantic"] > 0
+
+    def test_failed_child_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(RuntimeError, match="Startup profile failed"):
+            run_startup_profile(tmp_path / "not-a-project")
+
+
+class TestCmdStartupProfile:
+    """Tests for the startup-profile CLI command."""
+
+    def _args(self, project_root: Path, **overrides: Any) -> argparse.Namespace:
+        defaults: dict[str, Any] = {
+            "project_root": project_root,
+            "budget_ms": STARTUP_BUDGET_MS,
+            "handler_budget_ms": HANDLER_INIT_BUDGET_MS,
+            "top": 5,
+            "json": False,
+        }
+        defaults.update(overrides)
+        return argparse.Namespace(**defaults)
+
+    def test_prints_breakdown(self, git_project: Path, capsys: Any) -> None:
+        with patch(
+            "claude_code_hooks_daemon.daemon.startup_profile.run_startup_profile",
+            return_value=_profile(),
+        ):
+            result = cmd_startup_profile(self._args(git_project))
+
+        assert result == 0
+        output = capsys.readouterr().out
+        assert "Cold start: 400ms" in output
+        assert "register_all" in output
+
+    def test_over_budget_returns_1(self, git_project: Path, capsys: Any) -> None:
+        with patch(
+            "claude_code_hooks_daemon.daemon.startup_profile.run_startup_profile",
+            return_value=_profile(total_ms=900.0),
+        ):
+            result = cmd_startup_profile(self._args(git_project, budget_ms=500.0, json=True))
+
+        assert result == 1
+        assert json.loads(capsys.readouterr().out)["violations"]
@@ -2,13 +2,16 @@
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from claude_code_hooks_daemon.constants import Timeout
 from claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit import LintOnEditHandler
 
+_RUN_PROCESS = "claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.run_process"
+_COMPILE_PYTHON = "claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.compile_python"
+
 
 @pytest.fixture()
 def handler() -> LintOnEditHandler:
@@ -120,9 +123,9 @@ class TestMatches:
 
 
 class TestHandle:
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_lint_passes(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         test_file = tmp_path / "app.py"
         test_file.write_text("x = 1")
@@ -130,7 +133,7 @@ class TestHandle:
         mock_result.returncode = 0
         mock_result.stdout = ""
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -139,9 +142,9 @@ class TestHandle:
         result = handler.handle(hook_input)
         assert result.decision.value == "allow"
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_lint_fails(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         test_file = tmp_path / "app.py"
         test_file.write_text("x = 1")
@@ -149,7 +152,7 @@ class TestHandle:
         mock_result.returncode = 1
         mock_result.stdout = "SyntaxError: invalid syntax"
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -159,18 +162,15 @@ class TestHandle:
         assert result.decision.value == "deny"
         assert "SyntaxError" in (result.reason or "")
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_timeout(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         import subprocess
 
         test_file = tmp_path / "app.py"
         test_file.write_text("x = 1")
-        mock_subprocess.run.side_effect = subprocess.TimeoutExpired(
-            cmd="python", timeout=Timeout.LINT_CHECK
-        )
-        mock_subprocess.TimeoutExpired = subprocess.TimeoutExpired
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="python", timeout=Timeout.LINT_CHECK)
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -180,11 +180,11 @@ class TestHandle:
         assert result.decision.value == "allow"
         assert "timed out" in (result.reason or "").lower()
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_file_not_found(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
-        mock_subprocess.run.side_effect = FileNotFoundError("python not found")
+        mock_run.side_effect = FileNotFoundError("python not found")
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -201,9 +201,9 @@ class TestHandle:
         result = handler.handle(hook_input)
         assert result.decision.value == "allow"
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_extended_lint_runs_if_default_passes(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         test_file = tmp_path / "script.sh"
         test_file.write_text("#!/bin/bash\necho hello")
@@ -213,7 +213,7 @@ class TestHandle:
         pass_result.returncode = 0
         pass_result.stdout = ""
         pass_result.stderr = ""
-        mock_subprocess.run.return_value = pass_result
+        mock_run.return_value = pass_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -222,11 +222,11 @@ class TestHandle:
         result = handler.handle(hook_input)
         assert result.decision.value == "allow"
         # Should have called subprocess.run at least twice (default + extended)
-        assert mock_subprocess.run.call_count >= 2
+        assert mock_run.call_count >= 2
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_extended_lint_fails(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         test_file = tmp_path / "script.sh"
         test_file.write_text("#!/bin/bash\necho hello")
@@ -241,7 +241,7 @@ class TestHandle:
         fail_result.stdout = "SC2086: Double quote to prevent globbing"
         fail_result.stderr = ""
 
-        mock_subprocess.run.side_effect = [pass_result, fail_result]
+        mock_run.side_effect = [pass_result, fail_result]
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -251,9 +251,9 @@ class TestHandle:
         assert result.decision.value == "deny"
         assert "SC2086" in (result.reason or "")
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_extended_lint_not_found_allows(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """If extended linter is not installed, allow through gracefully."""
         test_file = tmp_path / "script.sh"
@@ -264,7 +264,7 @@ class TestHandle:
         pass_result.stdout = ""
         pass_result.stderr = ""
 
-        mock_subprocess.run.side_effect = [pass_result, FileNotFoundError("shellcheck not found")]
+        mock_run.side_effect = [pass_result, FileNotFoundError("shellcheck not found")]
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -304,8 +304,8 @@ class TestLanguageFilter:
 class TestCommandOverrides:
     """Test command override functionality."""
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
-    def test_default_command_override(self, mock_subprocess: MagicMock, tmp_path: Path) -> None:
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_default_command_override(self, mock_run: AsyncMock, tmp_path: Path) -> None:
         """Test that default command can be overridden via config."""
         handler = LintOnEditHandler()
         handler._command_overrides = {"Python": {"default": "custom-lint {file}", "extended": None}}
@@ -317,7 +317,7 @@ class TestCommandOverrides:
         mock_result.returncode = 0
         mock_result.stdout = ""
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -327,12 +327,12 @@ class TestCommandOverrides:
         assert result.decision.value == "allow"
 
         # Verify custom command was used (only called once since extended is None)
-        assert mock_subprocess.run.call_count == 1
-        call_args = mock_subprocess.run.call_args[0][0]
+        assert mock_run.call_count == 1
+        call_args = mock_run.call_args[0][0]
         assert "custom-lint" in call_args[0]
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
-    def test_extended_command_override(self, mock_subprocess: MagicMock, tmp_path: Path) -> None:
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_extended_command_override(self, mock_run: AsyncMock, tmp_path: Path) -> None:
         """Test that extended command can be overridden via config."""
         handler = LintOnEditHandler()
         handler._command_overrides = {"Shell": {"extended": "custom-shellcheck {file}"}}
@@ -346,7 +346,7 @@ class TestCommandOverrides:
         pass_result.stderr = ""
 
         # Default passes, then extended with custom command
-        mock_subprocess.run.return_value = pass_result
+        mock_run.return_value = pass_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -356,11 +356,11 @@ class TestCommandOverrides:
         assert result.decision.value == "allow"
 
         # Should call subprocess twice (default + extended)
-        assert mock_subprocess.run.call_count >= 2
+        assert mock_run.call_count >= 2
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_extended_command_disabled_via_null_override(
-        self, mock_subprocess: MagicMock, tmp_path: Path
+        self, mock_run: AsyncMock, tmp_path: Path
     ) -> None:
         """Test that extended command can be disabled by setting to None."""
         handler = LintOnEditHandler()
@@ -373,7 +373,7 @@ class TestCommandOverrides:
         pass_result.returncode = 0
         pass_result.stdout = ""
         pass_result.stderr = ""
-        mock_subprocess.run.return_value = pass_result
+        mock_run.return_value = pass_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -383,7 +383,7 @@ class TestCommandOverrides:
         assert result.decision.value == "allow"
 
         # Should only call default lint (extended disabled)
-        assert mock_subprocess.run.call_count == 1
+        assert mock_run.call_count == 1
 
 
 class TestEdgeCases:
@@ -417,9 +417,9 @@ class TestEdgeCases:
         result = handler.handle(hook_input)
         assert result.decision.value == "allow"
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_lint_error_with_both_stdout_and_stderr(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """Test that both stdout and stderr are included in error message."""
         test_file = tmp_path / "app.py"
@@ -429,7 +429,7 @@ class TestEdgeCases:
         mock_result.returncode = 1
         mock_result.stdout = "Error in stdout"
         mock_result.stderr = "Error in stderr"
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -440,9 +440,9 @@ class TestEdgeCases:
         assert "Error in stdout" in (result.reason or "")
         assert "Error in stderr" in (result.reason or "")
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_lint_error_with_only_stderr(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """Test that stderr is used when stdout is empty."""
         test_file = tmp_path / "app.py"
@@ -452,7 +452,7 @@ class TestEdgeCases:
         mock_result.returncode = 1
         mock_result.stdout = ""
         mock_result.stderr = "Error in stderr only"
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -486,9 +486,9 @@ class TestModuleRoot:
         result = LintOnEditHandler._find_module_root(str(go_file), "go.mod")
         assert result is None
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_go_lint_uses_module_root_as_cwd(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """Go lint commands run with cwd set to module root."""
         go_mod = tmp_path / "go.mod"
@@ -502,7 +502,7 @@ class TestModuleRoot:
         mock_result.returncode = 0
         mock_result.stdout = ""
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -510,12 +510,12 @@ class TestModuleRoot:
         }
         handler.handle(hook_input)
 
-        call_kwargs = mock_subprocess.run.call_args[1]
+        call_kwargs = mock_run.call_args[1]
         assert call_kwargs.get("cwd") == str(tmp_path)
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_go_lint_uses_package_dir_not_single_file(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """Go lint vets the package directory, not a single file."""
         go_mod = tmp_path / "go.mod"
@@ -529,7 +529,7 @@ class TestModuleRoot:
         mock_result.returncode = 0
         mock_result.stdout = ""
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -537,14 +537,14 @@ class TestModuleRoot:
         }
         handler.handle(hook_input)
 
-        call_args = mock_subprocess.run.call_args[0][0]
+        call_args = mock_run.call_args[0][0]
         command_str = " ".join(call_args)
         assert "./internal/github/" in command_str
         assert str(go_file) not in command_str
 
-    @patch("claude_code_hooks_daemon.handlers.post_tool_use.lint_on_edit.subprocess")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_non_go_lint_does_not_set_cwd(
-        self, mock_subprocess: MagicMock, handler: LintOnEditHandler, tmp_path: Path
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
     ) -> None:
         """Non-Go lint commands don't set cwd."""
         test_file = tmp_path / "app.py"
@@ -554,7 +554,7 @@ class TestModuleRoot:
         mock_result.returncode = 0
         mock_result.stdout = ""
         mock_result.stderr = ""
-        mock_subprocess.run.return_value = mock_result
+        mock_run.return_value = mock_result
 
         hook_input: dict[str, Any] = {
             "tool_name": "Write",
@@ -562,7 +562,7 @@ class TestModuleRoot:
         }
         handler.handle(hook_input)
 
-        call_kwargs = mock_subprocess.run.call_args[1]
+        call_kwargs = mock_run.call_args[1]
         assert call_kwargs.get("cwd") is None
 
 
@@ -574,3 +574,75 @@ class TestAcceptanceTests:
     def test_returns_at_least_one_test(self, handler: LintOnEditHandler) -> None:
         tests = handler.get_acceptance_tests()
         assert len(tests) >= 1
+
+
+class TestLintService:
+    """Caching and in-process checks via the lint service."""
+
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_unchanged_content_is_not_relinted(
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
+    ) -> None:
+        test_file = tmp_path / "script.sh"
+        test_file.write_text("#!/bin/bash\necho hello")
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+        hook_input: dict[str, Any] = {
+            "tool_name": "Write",
+            "tool_input": {"file_path": str(test_file)},
+        }
+
+        handler.handle(hook_input)
+        handler.handle(hook_input)
+        assert mock_run.call_count == 2
+
+        test_file.write_text("#!/bin/bash\necho changed")
+        handler.handle(hook_input)
+        assert mock_run.call_count == 4
+
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_python_syntax_checked_in_process(
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
+    ) -> None:
+        test_file = tmp_path / "app.py"
+        test_file.write_text("def broken(:\n")
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        result = handler.handle({"tool_name": "Write", "tool_input": {"file_path": str(test_file)}})
+
+        assert result.decision.value == "deny"
+        assert "SyntaxError" in (result.reason or "")
+        # Only the extended linter (ruff) started a process
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][0] == "ruff"
+
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_unreadable_python_file_fails_without_py_compile(
+        self, mock_run: AsyncMock, handler: LintOnEditHandler, tmp_path: Path
+    ) -> None:
+        test_file = tmp_path / "app.py"
+        test_file.write_text("x = 1\n")
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+        denied = PermissionError(13, "Permission denied", str(test_file))
+
+        with patch(_COMPILE_PYTHON, side_effect=denied):
+            result = handler.handle(
+                {"tool_name": "Write", "tool_input": {"file_path": str(test_file)}}
+            )
+
+        assert result.decision.value == "deny"
+        assert "Permission denied" in (result.reason or "")
+        # Only the extended linter (ruff) started a process
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][0] == "ruff"
@@ -1,10 +1,16 @@
 """Tests for ValidateEslintOnWriteHandler."""
 
+from concurrent.futures import Future
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+_RUN_PROCESS = (
+    "claude_code_hooks_daemon.handlers.post_tool_use.validate_eslint_on_write.run_process"
+)
+
 
 @pytest.fixture(autouse=True)
 def mock_project_context():
@@ -29,6 +35,10 @@ from claude_code_hooks_daemon.core.hook_result import Decision
 from claude_code_hooks_daemon.handlers.post_tool_use.validate_eslint_on_write import (
     ValidateEslintOnWriteHandler,
 )
+from claude_code_hooks_daemon.strategies.lint.eslint_worker import (
+    EslintFileResult,
+    EslintWorkerError,
+)
 
 
 class TestValidateEslintOnWriteHandler:
@@ -184,7 +194,7 @@ class TestValidateEslintOnWriteHandler:
 
         assert handler.matches(hook_input) is False
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_eslint_success(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -204,7 +214,7 @@ class TestValidateEslintOnWriteHandler:
         assert result.decision == Decision.ALLOW
         mock_run.assert_called_once()
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_eslint_failure(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -229,7 +239,7 @@ class TestValidateEslintOnWriteHandler:
         assert "ESLint validation FAILED" in result.reason
         assert "ESLint error output" in result.reason
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_eslint_with_stderr(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -253,7 +263,7 @@ class TestValidateEslintOnWriteHandler:
         assert result.decision == Decision.DENY
         assert "stderr output" in result.reason
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_worktree_file(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -276,7 +286,7 @@ class TestValidateEslintOnWriteHandler:
         assert result.decision == Decision.ALLOW
         mock_run.assert_called_once()
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_timeout(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -298,7 +308,7 @@ class TestValidateEslintOnWriteHandler:
         assert result.decision == Decision.DENY
         assert "timed out" in result.reason
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_exception(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -330,7 +340,7 @@ class TestValidateEslintOnWriteHandler:
         assert result.decision == Decision.ALLOW
         assert "No file path found" in result.reason
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_eslint_command_structure(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -381,7 +391,7 @@ class TestValidateEslintOnWriteHandler:
 
     # Tests for advisory mode (no llm: commands)
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_advisory_mode_skips_eslint_validation(
         self, mock_run: MagicMock, tmp_path: Path
     ) -> None:
@@ -406,7 +416,7 @@ class TestValidateEslintOnWriteHandler:
         assert "ADVISORY" in result.reason
         mock_run.assert_not_called()
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_advisory_mode_suggests_llm_lint(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Advisory mode suggests creating llm:lint script."""
         with patch(
@@ -430,7 +440,7 @@ class TestValidateEslintOnWriteHandler:
         assert "package.json" in result.reason
         mock_run.assert_not_called()
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_advisory_mode_includes_guide_path(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Advisory mode includes path to LLM command wrapper guide."""
         with patch(
@@ -454,7 +464,7 @@ class TestValidateEslintOnWriteHandler:
         assert "llm-command-wrappers.md" in result.reason
         mock_run.assert_not_called()
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_enforcement_mode_runs_eslint(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Enforcement mode (llm commands exist) runs ESLint as before."""
         with patch(
@@ -486,11 +496,11 @@ class TestNodeModulesBinPath:
     def handler(self, tmp_path: Path) -> ValidateEslintOnWriteHandler:
         return ValidateEslintOnWriteHandler(workspace_root=tmp_path)
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_node_modules_bin_prepended_to_path_when_exists(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
-        """subprocess.run env must include node_modules/.bin when directory exists."""
+        """run_process env must include node_modules/.bin when directory exists."""
         bin_dir = tmp_path / "node_modules" / ".bin"
         bin_dir.mkdir(parents=True)
 
@@ -505,7 +515,7 @@ class TestNodeModulesBinPath:
         assert "env" in call_kwargs
         assert str(bin_dir) in call_kwargs["env"]["PATH"]
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_node_modules_bin_first_in_path(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -524,7 +534,7 @@ class TestNodeModulesBinPath:
         entries = env_path.split(":")
         assert entries[0] == str(bin_dir)
 
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_env_passed_even_without_node_modules(
         self, mock_run: MagicMock, handler: ValidateEslintOnWriteHandler, tmp_path: Path
     ) -> None:
@@ -539,3 +549,106 @@ class TestNodeModulesBinPath:
 
         call_kwargs = mock_run.call_args[1]
         assert "env" in call_kwargs
+
+
+_GET_ESLINT_WORKER = (
+    "claude_code_hooks_daemon.handlers.post_tool_use.validate_eslint_on_write.get_eslint_worker"
+)
+
+
+def _worker_returning(outcome: EslintFileResult | Exception) -> MagicMock:
+    """Fake persistent worker whose lint() resolves with the given outcome."""
+
+    def lint(file_path: str) -> Future[EslintFileResult]:
+        future: Future[EslintFileResult] = Future()
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        return future
+
+    worker = MagicMock()
+    worker.lint.side_effect = lint
+    return worker
+
+
+class TestPersistentWorker:
+    """Tests for the persistent_worker option."""
+
+    @pytest.fixture
+    def handler(self, tmp_path: Path) -> ValidateEslintOnWriteHandler:
+        handler = ValidateEslintOnWriteHandler(workspace_root=tmp_path)
+        handler._persistent_worker = True
+        return handler
+
+    @pytest.fixture
+    def hook_input(self, tmp_path: Path) -> dict[str, Any]:
+        test_file = tmp_path / "test.ts"
+        test_file.write_text("const x = 1;")
+        return {"tool_name": "Write", "tool_input": {"file_path": str(test_file)}}
+
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
+    def test_errors_deny_without_spawning_tsx(
+        self,
+        mock_run: MagicMock,
+        handler: ValidateEslintOnWriteHandler,
+        hook_input: dict[str, Any],
+    ) -> None:
+        worker = _worker_returning(EslintFileResult(errors=1, warnings=0, output="1 problem"))
+
+        with patch(_GET_ESLINT_WORKER, return_value=worker):
+            result = handler.handle(hook_input)
+
+        assert result.decision == Decision.DENY
+        assert "ESLint validation FAILED" in result.reason
+        assert "1 problem" in result.reason
+        mock_run.assert_not_called()
+
+    def test_unchanged_content_is_not_linted_again(
+        self, handler: ValidateEslintOnWriteHandler, hook_input: dict[str, Any]
+    ) -> None:
+        worker = _worker_returning(EslintFileResult(errors=0, warnings=0, output=""))
+
+        with patch(_GET_ESLINT_WORKER, return_value=worker):
+            first = handler.handle(hook_input)
+            second = handler.handle(hook_input)
+
+        assert first.decision == Decision.ALLOW
+        assert second.decision == Decision.ALLOW
+        assert worker.lint.call_count == 1
+
+    def test_identical_content_in_another_file_is_linted(
+        self, handler: ValidateEslintOnWriteHandler, hook_input: dict[str, Any], tmp_path: Path
+    ) -> None:
+        other = tmp_path / "other.ts"
+        other.write_text("const x = 1;")
+        worker = _worker_returning(EslintFileResult(errors=1, warnings=0, output="1 problem"))
+
+        with patch(_GET_ESLINT_WORKER, return_value=worker):
+            handler.handle(hook_input)
+            result = handler.handle({"tool_name": "Write", "tool_input": {"file_path": str(other)}})
+
+        assert worker.lint.call_count == 2
+        assert f"ESLint validation FAILED for {other}" in result.reason
+
+    def test_worker_failure_denies(
+        self, handler: ValidateEslintOnWriteHandler, hook_input: dict[str, Any]
+    ) -> None:
+        worker = _worker_returning(EslintWorkerError("Cannot find module 'eslint'"))
+
+        with patch(_GET_ESLINT_WORKER, return_value=worker):
+            result = handler.handle(hook_input)
+
+        assert result.decision == Decision.DENY
+        assert "Failed to run ESLint: Cannot find module 'eslint'" in result.reason
+
+    def test_worker_timeout_denies(
+        self, handler: ValidateEslintOnWriteHandler, hook_input: dict[str, Any]
+    ) -> None:
+        worker = _worker_returning(TimeoutError("timed out"))
+
+        with patch(_GET_ESLINT_WORKER, return_value=worker):
+            result = handler.handle(hook_input)
+
+        assert result.decision == Decision.DENY
+        assert "ESLint timed out" in result.reason
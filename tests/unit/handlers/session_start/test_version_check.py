@@ -3,11 +3,12 @@
 Tests version checking on new sessions with 1-day cache.
 """
 
+import asyncio
 import json
 import subprocess
 import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,6 +16,8 @@ from claude_code_hooks_daemon.constants import HandlerID, Priority
 from claude_code_hooks_daemon.core.hook_result import Decision
 from claude_code_hooks_daemon.handlers.session_start.version_check import VersionCheckHandler
 
+_RUN_PROCESS = "claude_code_hooks_daemon.handlers.session_start.version_check.run_process"
+
 
 @pytest.fixture
 def handler() -> VersionCheckHandler:
@@ -202,7 +205,7 @@ def test_cache_validity_malformed_cache(handler: VersionCheckHandler, tmp_path:
 
 
 @patch("claude_code_hooks_daemon.handlers.session_start.version_check.__version__", "2.6.1")
-@patch("claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run")
+@patch(_RUN_PROCESS, new_callable=AsyncMock)
 def test_handle_returns_upgrade_notice_when_outdated(
     mock_run: MagicMock,
     handler: VersionCheckHandler,
@@ -228,7 +231,7 @@ def test_handle_returns_upgrade_notice_when_outdated(
 
 
 @patch("claude_code_hooks_daemon.handlers.session_start.version_check.__version__", "2.7.0")
-@patch("claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run")
+@patch(_RUN_PROCESS, new_callable=AsyncMock)
 def test_handle_returns_no_context_when_up_to_date(
     mock_run: MagicMock,
     handler: VersionCheckHandler,
@@ -250,7 +253,7 @@ def test_handle_returns_no_context_when_up_to_date(
     assert result.context == []
 
 
-@patch("claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run")
+@patch(_RUN_PROCESS, new_callable=AsyncMock)
 def test_handle_uses_cache_when_valid(
     mock_run: MagicMock,
     handler: VersionCheckHandler,
@@ -278,7 +281,7 @@ def test_handle_uses_cache_when_valid(
     assert result.context == []
 
 
-@patch("claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run")
+@patch(_RUN_PROCESS, new_callable=AsyncMock)
 def test_handle_writes_cache_after_check(
     mock_run: MagicMock,
     handler: VersionCheckHandler,
@@ -305,7 +308,7 @@ def test_handle_writes_cache_after_check(
     assert "is_outdated" in cache_data
 
 
-@patch("claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run")
+@patch(_RUN_PROCESS, new_callable=AsyncMock)
 def test_handle_fails_silently_on_git_error(
     mock_run: MagicMock,
     handler: VersionCheckHandler,
@@ -383,68 +386,68 @@ def test_is_resume_session_handles_os_error(handler: VersionCheckHandler) -> Non
 
 def test_get_latest_version_skips_empty_lines(handler: VersionCheckHandler) -> None:
     """_get_latest_version skips empty lines in git output."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="\n\nabc123\trefs/tags/v2.7.0\n",
         )
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version == "2.7.0"
 
 
 def test_get_latest_version_returns_none_on_empty_output(handler: VersionCheckHandler) -> None:
     """_get_latest_version returns None when git returns no tags."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="\n\n",
         )
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version is None
 
 
 def test_get_latest_version_parses_git_output(handler: VersionCheckHandler) -> None:
     """_get_latest_version parses git ls-remote output correctly."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="abc123\trefs/tags/v2.7.0\ndef456\trefs/tags/v2.6.1\n",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version == "2.7.0"
 
 
 def test_get_latest_version_handles_no_v_prefix(handler: VersionCheckHandler) -> None:
     """_get_latest_version handles tags without 'v' prefix."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="abc123\trefs/tags/2.7.0\n",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version == "2.7.0"
 
 
 def test_get_latest_version_returns_none_on_error(handler: VersionCheckHandler) -> None:
     """_get_latest_version returns None on git error."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=1,
             stderr="error",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version is None
 
 
 def test_get_latest_version_returns_none_on_timeout(handler: VersionCheckHandler) -> None:
     """_get_latest_version returns None on timeout."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.side_effect = subprocess.TimeoutExpired("git", 5)
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version is None
 
 
@@ -476,37 +479,37 @@ def test_write_cache_oserror(handler: VersionCheckHandler, tmp_path: Path) -> No
 
 def test_get_latest_version_empty_lines(handler: VersionCheckHandler) -> None:
     """_get_latest_version handles output with empty lines."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="\n\nabc123\trefs/tags/v2.8.0\n\n",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version == "2.8.0"
 
 
 def test_get_latest_version_no_v_prefix_tag(handler: VersionCheckHandler) -> None:
     """_get_latest_version returns tag without v prefix as-is."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="abc123\trefs/tags/2.8.0\n",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version == "2.8.0"
 
 
 def test_get_latest_version_no_valid_tags(handler: VersionCheckHandler) -> None:
     """_get_latest_version returns None when no valid tags found."""
-    with patch("subprocess.run") as mock_run:
+    with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout="",
         )
 
-        version = handler._get_latest_version()
+        version = asyncio.run(handler._get_latest_version())
         assert version is None
 
 
@@ -539,9 +542,7 @@ def test_handle_with_cached_outdated_result(
 
     with (
         patch.object(handler, "_get_cache_file", return_value=cache_file),
-        patch(
-            "claude_code_hooks_daemon.handlers.session_start.version_check.subprocess.run"
-        ) as mock_run,
+        patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run,
     ):
         mock_run.return_value = MagicMock(
             returncode=0,
@@ -1,12 +1,16 @@
 """Tests for GitBranchHandler."""
 
+import asyncio
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from claude_code_hooks_daemon.handlers.status_line import GitBranchHandler
 
+_RUN_PROCESS = "claude_code_hooks_daemon.handlers.status_line.git_branch.run_process"
+
 
 class TestGitBranchHandler:
     """Tests for GitBranchHandler."""
@@ -43,7 +47,7 @@ class TestGitBranchHandler:
         mock_result_symbolic_ref.returncode = 0
         mock_result_symbolic_ref.stdout = b"refs/remotes/origin/main\n"
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_result_toplevel,
                 mock_result_branch,
@@ -63,7 +67,7 @@ class TestGitBranchHandler:
         mock_result = MagicMock()
         mock_result.returncode = 1
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch(_RUN_PROCESS, new_callable=AsyncMock, return_value=mock_result):
             result = handler.handle(hook_input)
 
         assert result.decision == "allow"
@@ -89,7 +93,7 @@ class TestGitBranchHandler:
         """Test silent failure on git errors."""
         hook_input = {"workspace": {"current_dir": str(tmp_path)}}
 
-        with patch("subprocess.run", side_effect=Exception("Git error")):
+        with patch(_RUN_PROCESS, new_callable=AsyncMock, side_effect=Exception("Git error")):
             result = handler.handle(hook_input)
 
         assert result.decision == "allow"
@@ -105,7 +109,7 @@ class TestGitBranchHandler:
         mock_result_branch = MagicMock()
         mock_result_branch.stdout = b"\n"
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [mock_result_toplevel, mock_result_branch]
             result = handler.handle(hook_input)
 
@@ -126,7 +130,7 @@ class TestGitBranchHandler:
         mock_result_symbolic_ref.returncode = 0
         mock_result_symbolic_ref.stdout = b"refs/remotes/origin/main\n"
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_result_toplevel,
                 mock_result_branch,
@@ -174,7 +178,7 @@ class TestGitBranchColorCoding:
         hook_input = {"workspace": {"current_dir": str(tmp_path)}}
         side_effects = self._make_run_side_effects("main")
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = side_effects
             result = handler.handle(hook_input)
 
@@ -187,7 +191,7 @@ class TestGitBranchColorCoding:
         hook_input = {"workspace": {"current_dir": str(tmp_path)}}
         side_effects = self._make_run_side_effects("feature/my-feature")
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = side_effects
             result = handler.handle(hook_input)
 
@@ -206,7 +210,7 @@ class TestGitBranchColorCoding:
             symbolic_ref_stdout=b"refs/remotes/origin/develop\n",
         )
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = side_effects
             result = handler.handle(hook_input)
 
@@ -230,7 +234,7 @@ class TestGitBranchColorCoding:
         mock_show_ref_main = MagicMock()
         mock_show_ref_main.returncode = 0  # 'main' exists locally
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_toplevel,
                 mock_branch_result,
@@ -260,7 +264,7 @@ class TestGitBranchColorCoding:
         mock_show_ref_master = MagicMock()
         mock_show_ref_master.returncode = 0  # 'master' exists
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_toplevel,
                 mock_branch_result,
@@ -294,7 +298,7 @@ class TestGitBranchColorCoding:
         mock_show_ref_master_fail = MagicMock()
         mock_show_ref_master_fail.returncode = 1
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_toplevel,
                 mock_branch_result,
@@ -319,7 +323,7 @@ class TestGitBranchColorCoding:
         mock_result_toplevel = MagicMock()
         mock_result_toplevel.returncode = 0
 
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 mock_result_toplevel,
                 subprocess.CalledProcessError(1, "git"),
@@ -329,14 +333,31 @@ class TestGitBranchColorCoding:
         assert result.decision == "allow"
         assert len(result.context) == 0
 
+    def test_missed_deadline_shows_nothing(self, handler: GitBranchHandler, tmp_path: Path) -> None:
+        """A repo slower than the handler deadline yields an empty segment, not an error."""
+
+        async def slow_git(*args: object, **kwargs: object) -> None:
+            await asyncio.sleep(5)
+
+        handler.handle_deadline_seconds = 0.05  # type: ignore[misc]
+        hook_input = {"workspace": {"current_dir": str(tmp_path)}}
+
+        with patch(_RUN_PROCESS, side_effect=slow_git):
+            result = handler.handle(hook_input)
+
+        assert result.decision == "allow"
+        assert result.context == []
+
     def test_get_default_branch_timeout_returns_none(
         self, handler: GitBranchHandler, tmp_path: Path
     ) -> None:
         """_get_default_branch returns None when subprocess times out."""
         import subprocess
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
-            result = handler._get_default_branch(str(tmp_path))
+        with patch(
+            _RUN_PROCESS, new_callable=AsyncMock, side_effect=subprocess.TimeoutExpired("git", 5)
+        ):
+            result = asyncio.run(handler._get_default_branch(str(tmp_path)))
 
         assert result is None
 
@@ -357,14 +378,14 @@ class TestGitBranchColorCoding:
             return [mock_toplevel, mock_branch, mock_symbolic_ref]
 
         # First call: 3 subprocess invocations (toplevel + branch + symbolic-ref)
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = make_mocks("main")
             handler.handle(hook_input)
             first_call_count = mock_run.call_count
         assert first_call_count == 3
 
         # Second call: only 2 subprocess invocations (toplevel + branch; no symbolic-ref)
-        with patch("subprocess.run") as mock_run:
+        with patch(_RUN_PROCESS, new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
                 MagicMock(returncode=0),
                 MagicMock(stdout=b"feature/x\n"),
@@ -372,3 +393,40 @@ class TestGitBranchColorCoding:
             handler.handle(hook_input)
             second_call_count = mock_run.call_count
         assert second_call_count == 2
+
+
+class TestGitBranchSegmentCacheKey:
+    """Tests for the status segment cache key."""
+
+    @pytest.fixture
+    def handler(self) -> GitBranchHandler:
+        return GitBranchHandler()
+
+    def test_key_follows_head_mtime(self, handler: GitBranchHandler, tmp_path: Path) -> None:
+        head = tmp_path / ".git" / "HEAD"
+        head.parent.mkdir()
+        head.write_text("ref: refs/heads/main\n")
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+        hook_input = {"workspace": {"current_dir": str(subdir)}}
+
+        before = handler.segment_cache_key(hook_input)
+        head.write_text("ref: refs/heads/feature\n")
+        os.utime(head, ns=(0, head.stat().st_mtime_ns + 1_000_000))
+
+        assert handler.segment_cache_key(hook_input) != before
+
+    def test_worktree_git_file_is_followed(self, handler: GitBranchHandler, tmp_path: Path) -> None:
+        gitdir = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        gitdir.mkdir(parents=True)
+        (gitdir / "HEAD").write_text("ref: refs/heads/wt\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {gitdir}\n")
+
+        key = handler.segment_cache_key({"workspace": {"current_dir": str(worktree)}})
+
+        assert key == (str(worktree), (gitdir / "HEAD").stat().st_mtime_ns)
+
+    def test_key_without_workspace_is_none(self, handler: GitBranchHandler) -> None:
+        assert handler.segment_cache_key({}) is None
@@ -0,0 +1,178 @@
+"""Tests for the prebuilt handler manifest."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.core.router import EventRouter
+from claude_code_hooks_daemon.daemon.cli import cmd_generate_handler_manifest
+from claude_code_hooks_daemon.handlers.manifest import (
+    MANIFEST_PATH,
+    MANIFEST_VERSION,
+    HandlerManifest,
+    ManifestEntry,
+    build_manifest,
+    load_manifest,
+    write_manifest,
+)
+from claude_code_hooks_daemon.handlers.registry import HandlerRegistry
+
+_GIT_STASH_MODULE = "claude_code_hooks_daemon.handlers.pre_tool_use.git_stash"
+_GH_PR_COMMENTS_MODULE = "claude_code_hooks_daemon.handlers.pre_tool_use.gh_pr_comments"
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Initialise ProjectContext for a temporary project."""
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+        lambda project_root: "test-repo",
+    )
+    monkeypatch.setattr(
+        "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+        lambda project_root: project_root,
+    )
+    ProjectContext._initialized = False
+    (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+    config_path = tmp_path / ".claude" / "hooks-daemon.yaml"
+    config_path.write_text("version: '1.0'\n")
+    ProjectContext.initialize(config_path)
+    return tmp_path
+
+
+def _registered(router: EventRouter) -> set[tuple[str, str, int]]:
+    return {
+        (event_type.value, type(handler).__name__, handler.priority)
+        for event_type, chain in router._chains.items()
+        for handler in chain
+    }
+
+
+class TestHandlerManifest:
+    """Tests for manifest serialisation and staleness checks."""
+
+    def _manifest(self) -> HandlerManifest:
+        entry = ManifestEntry(
+            config_key="git_stash",
+            module=_GIT_STASH_MODULE,
+            class_name="GitStashHandler",
+            event_type="PreToolUse",
+            tags=("git",),
+            priority=20,
+        )
+        return HandlerManifest(
+            handlers={"pre_tool_use": {"git_stash": entry}},
+            modules={"pre_tool_use": ("git_stash",)},
+        )
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.json"
+        write_manifest(self._manifest(), path)
+
+        assert HandlerManifest.from_dict(json.loads(path.read_text())) == self._manifest()
+
+    def test_unsupported_version_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported"):
+            HandlerManifest.from_dict({"version": MANIFEST_VERSION + 1})
+
+    def test_invalid_structure_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid"):
+            HandlerManifest.from_dict({"version": MANIFEST_VERSION, "handlers": {"x": {"y": {}}}})
+
+    def test_load_falls_back_when_module_list_is_stale(self, tmp_path: Path) -> None:
+        (tmp_path / "pre_tool_use").mkdir()
+        (tmp_path / "pre_tool_use" / "git_stash.py").write_text("")
+        path = tmp_path / "manifest.json"
+        write_manifest(self._manifest(), path)
+        assert load_manifest(path) is not None
+
+        (tmp_path / "pre_tool_use" / "new_handler.py").write_text("")
+
+        assert load_manifest(path) is None
+
+    def test_load_missing_or_corrupt_returns_none(self, tmp_path: Path) -> None:
+        corrupt = tmp_path / "manifest.json"
+        corrupt.write_text("[1, 2")
+
+        assert load_manifest(tmp_path / "missing.json") is None
+        assert load_manifest(corrupt) is None
+
+    def test_load_class_rejects_non_handler(self) -> None:
+        entry = ManifestEntry("x", "json", "dumps", "PreToolUse", (), 0)
+
+        with pytest.raises(TypeError, match="not a Handler subclass"):
+            entry.load_class()
+
+
+class TestShippedManifest:
+    """The shipped manifest must match the handler tree."""
+
+    def test_shipped_manifest_is_current(self, project: Path) -> None:
+        shipped = load_manifest(MANIFEST_PATH)
+
+        assert shipped is not None, "Run 'generate-handler-manifest'"
+        assert shipped.to_dict() == build_manifest().to_dict()
+
+
+class TestRegisterAllWithManifest:
+    """Tests for manifest-driven registration in HandlerRegistry."""
+
+    def test_registers_same_handlers_as_scan(self, project: Path) -> None:
+        scanned = HandlerRegistry()
+        scanned.discover()
+        scan_router = EventRouter()
+        scanned.register_all(scan_router, workspace_root=project)
+
+        manifest_registry = HandlerRegistry()
+        assert manifest_registry.load_manifest()
+        manifest_router = EventRouter()
+        manifest_registry.register_all(manifest_router, workspace_root=project)
+
+        assert _registered(manifest_router) == _registered(scan_router)
+
+    def test_disabled_and_tag_filtered_handlers_are_not_imported(
+        self, project: Path, monkeypatch: Any
+    ) -> None:
+        skipped = [_GIT_STASH_MODULE, _GH_PR_COMMENTS_MODULE]
+        for module in skipped:
+            monkeypatch.delitem(sys.modules, module, raising=False)
+        registry = HandlerRegistry()
+        assert registry.load_manifest()
+        config = {"pre_tool_use": {"git_stash": {"enabled": False}, "disable_tags": ["github"]}}
+
+        registry.register_all(EventRouter(), config=config, workspace_root=project)
+
+        assert not [module for module in skipped if module in sys.modules]
+
+    def test_import_failure_skips_handler(self, project: Path, tmp_path: Path) -> None:
+        manifest = HandlerManifest(
+            handlers={
+                "pre_tool_use": {
+                    "missing": ManifestEntry(
+                        "missing", "no.such.module", "MissingHandler", "PreToolUse", (), 10
+                    )
+                }
+            },
+            modules={},
+        )
+        path = tmp_path / "manifest.json"
+        write_manifest(manifest, path)
+        registry = HandlerRegistry()
+        assert registry.load_manifest(path)
+
+        assert registry.register_all(EventRouter(), workspace_root=project) == 0
+
+
+class TestCmdGenerateHandlerManifest:
+    """Tests for the generate-handler-manifest CLI command."""
+
+    def test_check_passes_for_shipped_manifest(self, project: Path, capsys: Any) -> None:
+        args = argparse.Namespace(project_root=project, check=True)
+
+        assert cmd_generate_handler_manifest(args) == 0
+        assert "current" in capsys.readouterr().out
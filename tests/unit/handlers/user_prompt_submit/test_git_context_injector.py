@@ -1,7 +1,7 @@
 """Comprehensive tests for GitContextInjectorHandler."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,6 +15,9 @@ _MOCK_PROJECT_ROOT = patch(
     "claude_code_hooks_daemon.handlers.user_prompt_submit.git_context_injector.ProjectContext.project_root",
     return_value=Path("/fake/project"),
 )
+_RUN_PROCESS = (
+    "claude_code_hooks_daemon.handlers.user_prompt_submit.git_context_injector.run_process"
+)
 
 
 class TestGitContextInjectorHandler:
@@ -51,7 +54,7 @@ class TestGitContextInjectorHandler:
 
     # handle() - Git Available Tests
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_adds_git_status_context(self, mock_run, _mock_ctx, handler):
         """Should add git status to context when git is available."""
         mock_run.return_value = MagicMock(
@@ -69,7 +72,7 @@ class TestGitContextInjectorHandler:
         assert "On branch main" in "\n".join(result.context)
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_adds_branch_name(self, mock_run, _mock_ctx, handler):
         """Should include current branch in context."""
         mock_run.return_value = MagicMock(
@@ -84,7 +87,7 @@ class TestGitContextInjectorHandler:
         assert "feature/new-handler" in context_text
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_adds_uncommitted_changes_info(self, mock_run, _mock_ctx, handler):
         """Should include uncommitted changes info."""
         mock_run.return_value = MagicMock(
@@ -100,7 +103,7 @@ class TestGitContextInjectorHandler:
 
     # handle() - Git Not Available Tests
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run", side_effect=FileNotFoundError)
+    @patch(_RUN_PROCESS, new_callable=AsyncMock, side_effect=FileNotFoundError)
     def test_handle_git_not_installed(self, mock_run, _mock_ctx, handler):
         """Should return silent allow when git is not installed."""
         hook_input = {"prompt": "Test"}
@@ -110,7 +113,7 @@ class TestGitContextInjectorHandler:
         assert result.context == []
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_not_a_git_repository(self, mock_run, _mock_ctx, handler):
         """Should return silent allow when not in a git repository."""
         mock_run.return_value = MagicMock(
@@ -125,7 +128,7 @@ class TestGitContextInjectorHandler:
         assert result.context == []
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_git_command_timeout(self, mock_run, _mock_ctx, handler):
         """Should handle git command timeout gracefully."""
         import subprocess
@@ -142,7 +145,7 @@ class TestGitContextInjectorHandler:
 
     # Result Properties Tests
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_has_no_reason(self, mock_run, _mock_ctx, handler):
         """Should not provide reason."""
         mock_run.return_value = MagicMock(returncode=0, stdout="Clean repo")
@@ -153,7 +156,7 @@ class TestGitContextInjectorHandler:
         assert result.reason is None
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_has_no_guidance(self, mock_run, _mock_ctx, handler):
         """Should not provide guidance."""
         mock_run.return_value = MagicMock(returncode=0, stdout="Clean repo")
@@ -164,7 +167,7 @@ class TestGitContextInjectorHandler:
         assert result.guidance is None
 
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_returns_hook_result_instance(self, mock_run, _mock_ctx, handler):
         """Should return HookResult instance."""
         mock_run.return_value = MagicMock(returncode=0, stdout="Clean repo")
@@ -176,7 +179,7 @@ class TestGitContextInjectorHandler:
 
     # Integration Tests
     @_MOCK_PROJECT_ROOT
-    @patch("subprocess.run")
+    @patch(_RUN_PROCESS, new_callable=AsyncMock)
     def test_handle_calls_git_status_with_correct_args(self, mock_run, _mock_ctx, handler):
         """Should call git status with correct arguments."""
         mock_run.return_value = MagicMock(returncode=0, stdout="Status")
@@ -188,5 +191,5 @@ class TestGitContextInjectorHandler:
         call_args = mock_run.call_args
         assert "git" in call_args[0][0]
         assert "status" in call_args[0][0]
-        assert call_args[1].get("capture_output") is True
+        assert call_args[1].get("timeout") == Timeout.GIT_CONTEXT
         assert call_args[1].get("text") is True
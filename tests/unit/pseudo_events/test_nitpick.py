@@ -260,3 +260,41 @@ class TestNitpickSetupState:
         assert result["assistant_messages"][0]["content"] == "Short"
 
         path.unlink()
+
+
+class TestNitpickSetupExportRestore:
+    """Test moving NitpickState to another daemon process."""
+
+    def test_restored_state_reads_only_new_messages(self, tmp_path: Path) -> None:
+        """A restored session resumes from the saved transcript offset."""
+        path = tmp_path / "transcript.jsonl"
+        _write_transcript(path, [_assistant_entry("Old message", "uuid-1")])
+        hook_input: dict[str, Any] = {HookInputField.TRANSCRIPT_PATH: str(path)}
+        source = NitpickSetup()
+        source(hook_input, "session-1")
+
+        target = NitpickSetup()
+        target.restore(json.loads(json.dumps(source.export())))
+        with path.open("a") as f:
+            f.write(json.dumps(_assistant_entry("New message", "uuid-2")) + "\n")
+        result = target(hook_input, "session-1")
+
+        assert result is not None
+        assert [m["content"] for m in result["assistant_messages"]] == ["New message"]
+
+    def test_export_keeps_most_recent_sessions(self) -> None:
+        """max_sessions keeps the sessions started last."""
+        setup = NitpickSetup()
+        for session_id in ("a", "b", "c"):
+            setup({HookInputField.TRANSCRIPT_PATH: "/nonexistent/transcript.jsonl"}, session_id)
+
+        assert list(setup.export(max_sessions=2)) == ["b", "c"]
+
+    def test_forget_session(self) -> None:
+        """A forgotten session's audit position is dropped."""
+        setup = NitpickSetup()
+        setup({HookInputField.TRANSCRIPT_PATH: "/nonexistent/transcript.jsonl"}, "a")
+
+        setup.forget_session("a")
+
+        assert setup.get_state("a") is None
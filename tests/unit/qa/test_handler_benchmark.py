@@ -0,0 +1,228 @@
+"""Tests for the handler microbenchmark suite."""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_code_hooks_daemon.core.event import EventType
+from claude_code_hooks_daemon.core.handler import Handler
+from claude_code_hooks_daemon.core.hook_result import HookResult
+from claude_code_hooks_daemon.core.project_context import ProjectContext
+from claude_code_hooks_daemon.daemon.cli import cmd_benchmark_handlers
+from claude_code_hooks_daemon.qa.handler_benchmark import (
+    BENCHMARK_FORMAT_VERSION,
+    acceptance_fixtures,
+    benchmark_handler,
+    compare_benchmarks,
+    large_input_fixtures,
+    run_benchmarks,
+)
+
+
+class _FakeTest:
+    def __init__(self, command: str) -> None:
+        self.command = command
+
+
+class RmHandler(Handler):
+    """Matches Bash commands starting with rm; raises on 'boom'."""
+
+    def __init__(self) -> None:
+        super().__init__(handler_id="rm-handler", priority=10, terminal=True)
+
+    def matches(self, hook_input: dict[str, Any]) -> bool:
+        command = hook_input.get("tool_input", {}).get("command", "")
+        if command == "boom":
+            raise RuntimeError("boom")
+        return bool(command.startswith("rm"))
+
+    def handle(self, hook_input: dict[str, Any]) -> HookResult:
+        return HookResult.deny("no rm")
+
+    def get_acceptance_tests(self) -> list[Any]:
+        return [_FakeTest("rm -rf /tmp/x"), _FakeTest("ls"), _FakeTest("boom")]
+
+    def get_claude_md(self) -> str | None:
+        return None
+
+
+def _baseline(**metrics: float | None) -> dict[str, Any]:
+    entry = {"matches_us": 10.0, "large_input_us": 100.0, "handle_us": 50.0}
+    entry.update(metrics)
+    return {"version": BENCHMARK_FORMAT_VERSION, "handlers": {"RmHandler": entry}}
+
+
+class TestFixtures:
+    """Tests for fixture generation."""
+
+    def test_bash_commands_become_bash_tool_calls(self) -> None:
+        fixtures = acceptance_fixtures(RmHandler(), EventType.PRE_TOOL_USE)
+
+        assert [f["tool_input"]["command"] for f in fixtures] == ["rm -rf /tmp/x", "ls", "boom"]
+        assert all(f["tool_name"] == "Bash" for f in fixtures)
+
+    def test_write_instruction_becomes_write_tool_call(self) -> None:
+        class WriteHandler(RmHandler):
+            def get_acceptance_tests(self) -> list[Any]:
+                return [
+                    _FakeTest(
+                        "Use the Write tool to write to /workspace/notes.md with content '# Hi'"
+                    )
+                ]
+
+        (fixture,) = acceptance_fixtures(WriteHandler(), EventType.PRE_TOOL_USE)
+
+        assert fixture["tool_name"] == "Write"
+        assert fixture["tool_input"] == {"file_path": "/workspace/notes.md", "content": "# Hi"}
+
+    def test_prompt_events_carry_command_as_prompt(self) -> None:
+        (fixture,) = acceptance_fixtures(
+            type("P", (RmHandler,), {"get_acceptance_tests": lambda self: [_FakeTest("hi")]})(),
+            EventType.USER_PROMPT_SUBMIT,
+        )
+        assert fixture["prompt"] == "hi"
+        assert fixture["hook_event_name"] == "UserPromptSubmit"
+
+    def test_large_tool_inputs(self) -> None:
+        fixtures = large_input_fixtures(EventType.PRE_TOOL_USE)
+
+        by_tool = {f["tool_name"]: f["tool_input"] for f in fixtures}
+        assert by_tool["Bash"]["command"].count("|") > 400
+        assert len(by_tool["Write"]["content"]) == 1024 * 1024
+        assert len(by_tool["Edit"]["old_string"]) == 256 * 1024
+
+    def test_events_without_payloads_have_no_large_inputs(self) -> None:
+        assert large_input_fixtures(EventType.SESSION_END) == []
+
+
+class TestBenchmarkHandler:
+    """Tests for timing a single handler."""
+
+    def test_times_matches_and_handle_and_counts_errors(self) -> None:
+        result = benchmark_handler(RmHandler(), EventType.PRE_TOOL_USE, repeats=2)
+
+        assert result.name == "RmHandler"
+        assert result.event == "PreToolUse"
+        assert result.fixtures == 6  # 3 acceptance + 3 generated
+        assert result.matched == 1
+        assert result.errors == 1
+        assert result.matches_us is not None
+        assert result.large_input_us is not None
+        assert result.handle_us is not None
+
+
+class TestCompareBenchmarks:
+    """Tests for regression detection."""
+
+    def test_slowdown_past_tolerance_and_delta_is_a_regression(self) -> None:
+        regressions = compare_benchmarks(_baseline(), _baseline(large_input_us=200.0))
+
+        assert len(regressions) == 1
+        assert regressions[0].metric == "large_input_us"
+        assert regressions[0].ratio == pytest.approx(2.0)
+
+    def test_small_absolute_slowdown_is_ignored(self) -> None:
+        assert compare_benchmarks(_baseline(), _baseline(matches_us=25.0)) == []
+
+    def test_within_tolerance_is_ignored(self) -> None:
+        assert compare_benchmarks(_baseline(), _baseline(large_input_us=140.0)) == []
+
+    def test_missing_metrics_and_new_handlers_are_ignored(self) -> None:
+        current = _baseline(handle_us=None)
+        current["handlers"]["NewHandler"] = {"matches_us": 1000.0}
+
+        assert compare_benchmarks(_baseline(), current) == []
+
+    def test_unsupported_version_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported"):
+            compare_benchmarks({"version": 99}, _baseline())
+
+
+class TestRunBenchmarks:
+    """Tests for running the suite over discovered handlers."""
+
+    def test_runs_selected_builtin_handler(self) -> None:
+        run = run_benchmarks(repeats=1, only=["DestructiveGitHandler"]).to_dict()
+
+        assert run["version"] == BENCHMARK_FORMAT_VERSION
+        assert list(run["handlers"]) == ["DestructiveGitHandler"]
+        entry = run["handlers"]["DestructiveGitHandler"]
+        assert entry["event"] == "PreToolUse"
+        assert entry["matched"] > 0
+        assert entry["handle_us"] is not None
+
+
+class TestCmdBenchmarkHandlers:
+    """Tests for the benchmark-handlers CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path: Path, monkeypatch: Any) -> None:
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_repo_name",
+            lambda project_root: "test-repo",
+        )
+        monkeypatch.setattr(
+            "claude_code_hooks_daemon.core.project_context.ProjectContext._get_git_toplevel",
+            lambda project_root: project_root,
+        )
+        ProjectContext._initialized = False
+        (tmp_path / ".claude" / "hooks-daemon").mkdir(parents=True)
+        (tmp_path / ".claude" / "hooks-daemon.yaml").write_text("version: '1.0'\n")
+
+    def _args(self, project_root: Path, **overrides: Any) -> argparse.Namespace:
+        defaults: dict[str, Any] = {
+            "project_root": project_root,
+            "repeats": 1,
+            "handler": ["DestructiveGitHandler"],
+            "save": None,
+            "baseline": None,
+            "tolerance": 0.5,
+            "min_delta_us": 20.0,
+            "json": False,
+        }
+        defaults.update(overrides)
+        return argparse.Namespace(**defaults)
+
+    def test_save_writes_baseline(self, tmp_path: Path, capsys: Any) -> None:
+        baseline = tmp_path / "baseline.json"
+
+        result = cmd_benchmark_handlers(self._args(tmp_path, save=baseline))
+
+        assert result == 0
+        assert "DestructiveGitHandler" in json.loads(baseline.read_text())["handlers"]
+        assert "Baseline written" in capsys.readouterr().out
+
+    def test_regression_against_baseline_returns_1(self, tmp_path: Path, capsys: Any) -> None:
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps(
+                {
+                    "version": BENCHMARK_FORMAT_VERSION,
+                    "handlers": {
+                        "DestructiveGitHandler": {
+                            "matches_us": 0.0001,
+                            "large_input_us": 0.0001,
+                            "handle_us": 0.0001,
+                        }
+                    },
+                }
+            )
+        )
+
+        result = cmd_benchmark_handlers(
+            self._args(tmp_path, baseline=baseline, min_delta_us=0.0, json=True)
+        )
+
+        assert result == 1
+        output = json.loads(capsys.readouterr().out)
+        assert output["regressions"]
+        assert output["regressions"][0]["handler"] == "DestructiveGitHandler"
+
+    def test_unreadable_baseline_returns_1(self, tmp_path: Path, capsys: Any) -> None:
+        result = cmd_benchmark_handlers(self._args(tmp_path, baseline=tmp_path / "missing.json"))
+
+        assert result == 1
+        assert "Cannot read benchmark baseline" in capsys.readouterr().err
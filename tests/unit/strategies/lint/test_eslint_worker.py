@@ -0,0 +1,197 @@
+"""Tests for the persistent ESLint worker (driven by a fake worker program)."""
+
+import os
+import sys
+from concurrent.futures import wait
+from pathlib import Path
+
+import pytest
+
+from claude_code_hooks_daemon.strategies.lint.eslint_worker import (
+    EslintWorker,
+    EslintWorkerError,
+)
+
+# Speaks the worker protocol: a file containing "bad" has one error, "slow"
+# never answers, "crash" exits, "skip" is left out of the reply. Each
+# request's file list is logged. Paths under FAKE_REAL_DIR are reported
+# under FAKE_ALIAS_DIR, as ESLint reports paths through a symlink.
+_FAKE_WORKER = r"""
+import json, os, sys, time
+real, alias = os.environ.get("FAKE_REAL_DIR"), os.environ.get("FAKE_ALIAS_DIR")
+for line in sys.stdin:
+    request = json.loads(line)
+    with open("requests.log", "a") as log:
+        log.write(" ".join(sorted(os.path.basename(f) for f in request["files"])) + "\n")
+    files = {}
+    for path in request["files"]:
+        text = open(path).read()
+        if "crash" in text:
+            sys.stderr.write("worker crashed\n")
+            sys.exit(1)
+        if "slow" in text:
+            time.sleep(30)
+        if "skip" in text:
+            continue
+        errors = 1 if "bad" in text else 0
+        if real and alias:
+            path = path.replace(real, alias, 1)
+        files[path] = {"errors": errors, "warnings": 0, "output": "1 problem" if errors else ""}
+    print(json.dumps({"id": request["id"], "files": files}), flush=True)
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / ".git").mkdir()
+    return tmp_path
+
+
+def _worker(workspace: Path, **kwargs: float) -> EslintWorker:
+    return EslintWorker(workspace, command=[sys.executable, "-c", _FAKE_WORKER], **kwargs)
+
+
+def _requests(workspace: Path) -> list[str]:
+    return (workspace / "requests.log").read_text().splitlines()
+
+
+def _pid(worker: EslintWorker) -> int:
+    process = worker._process
+    assert process is not None
+    return process.pid
+
+
+class TestEslintWorker:
+    def test_lints_file(self, workspace: Path) -> None:
+        good = workspace / "good.ts"
+        bad = workspace / "bad.ts"
+        good.write_text("ok")
+        bad.write_text("bad")
+        worker = _worker(workspace, debounce_seconds=0.01)
+        try:
+            good_result = worker.lint(str(good)).result(timeout=10)
+            bad_result = worker.lint(str(bad)).result(timeout=10)
+        finally:
+            worker.close()
+
+        assert good_result.passed
+        assert not bad_result.passed
+        assert bad_result.output == "1 problem"
+
+    def test_writes_in_window_share_one_request(self, workspace: Path) -> None:
+        for name in ("a.ts", "b.ts"):
+            (workspace / name).write_text("ok")
+        worker = _worker(workspace, debounce_seconds=0.2)
+        try:
+            futures = [
+                worker.lint(str(workspace / "a.ts")),
+                worker.lint(str(workspace / "b.ts")),
+                worker.lint(str(workspace / "a.ts")),
+            ]
+            wait(futures, timeout=10)
+        finally:
+            worker.close()
+
+        assert futures[0] is futures[2]
+        assert _requests(workspace) == ["a.ts b.ts"]
+
+    def test_process_reused_across_batches(self, workspace: Path) -> None:
+        source = workspace / "app.ts"
+        source.write_text("ok")
+        worker = _worker(workspace, debounce_seconds=0.01)
+        try:
+            worker.lint(str(source)).result(timeout=10)
+            first = _pid(worker)
+            worker.lint(str(source)).result(timeout=10)
+            assert _pid(worker) == first
+        finally:
+            worker.close()
+
+    def test_config_change_restarts(self, workspace: Path) -> None:
+        config = workspace / "eslint.config.js"
+        config.write_text("")
+        source = workspace / "app.ts"
+        source.write_text("ok")
+        worker = _worker(workspace, debounce_seconds=0.01)
+        try:
+            worker.lint(str(source)).result(timeout=10)
+            first = _pid(worker)
+            stat = config.stat()
+            os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            worker.lint(str(source)).result(timeout=10)
+            assert _pid(worker) != first
+        finally:
+            worker.close()
+
+    def test_crash_is_reported_after_one_restart(self, workspace: Path) -> None:
+        source = workspace / "app.ts"
+        source.write_text("crash")
+        worker = _worker(workspace, debounce_seconds=0.01)
+        try:
+            with pytest.raises(EslintWorkerError, match="worker crashed"):
+                worker.lint(str(source)).result(timeout=10)
+            source.write_text("ok")
+            assert worker.lint(str(source)).result(timeout=10).passed
+        finally:
+            worker.close()
+
+        assert len(_requests(workspace)) == 3
+
+    def test_timeout(self, workspace: Path) -> None:
+        source = workspace / "app.ts"
+        source.write_text("slow")
+        worker = _worker(workspace, debounce_seconds=0.01, timeout=0.2)
+        try:
+            with pytest.raises(TimeoutError):
+                worker.lint(str(source)).result(timeout=10)
+            assert worker._process is None
+        finally:
+            worker.close()
+
+    def test_missing_command(self, workspace: Path) -> None:
+        source = workspace / "app.ts"
+        source.write_text("ok")
+        worker = EslintWorker(
+            workspace, debounce_seconds=0.01, command=["no-such-command-for-hooks-daemon-tests"]
+        )
+
+        with pytest.raises(EslintWorkerError, match="Failed to start"):
+            worker.lint(str(source)).result(timeout=10)
+        worker.close()
+
+    def test_close_fails_queued_files(self, workspace: Path) -> None:
+        worker = _worker(workspace, debounce_seconds=30)
+        future = worker.lint(str(workspace / "app.ts"))
+
+        worker.close()
+
+        with pytest.raises(EslintWorkerError, match="shut down"):
+            future.result(timeout=1)
+
+    def test_file_missing_from_reply_fails(self, workspace: Path) -> None:
+        source = workspace / "app.ts"
+        source.write_text("skip")
+        worker = _worker(workspace, debounce_seconds=0.01)
+        try:
+            with pytest.raises(EslintWorkerError, match="no result"):
+                worker.lint(str(source)).result(timeout=10)
+        finally:
+            worker.close()
+
+    def test_reply_through_symlinked_path_matches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        real = tmp_path / "real"
+        (real / ".git").mkdir(parents=True)
+        alias = tmp_path / "alias"
+        alias.symlink_to(real)
+        (real / "app.ts").write_text("bad")
+        monkeypatch.setenv("FAKE_REAL_DIR", str(real))
+        monkeypatch.setenv("FAKE_ALIAS_DIR", str(alias))
+        worker = _worker(alias, debounce_seconds=0.01)
+        try:
+            result = worker.lint(str(alias / "app.ts")).result(timeout=10)
+        finally:
+            worker.close()
+
+        assert not result.passed
@@ -0,0 +1,187 @@
+"""Tests for the lint service (cached, coalesced lint runs)."""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from claude_code_hooks_daemon.core.hook_result import Decision, HookResult
+from claude_code_hooks_daemon.strategies.lint.service import (
+    LintService,
+    compile_python,
+    config_stamp,
+    content_digest,
+    is_py_compile,
+    lint_cache_key,
+)
+
+
+class TestContentDigest:
+    def test_changes_with_content(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.py"
+        path.write_text("x = 1\n")
+        first = content_digest(path)
+        path.write_text("x = 2\n")
+
+        assert first is not None
+        assert content_digest(path) != first
+
+    def test_missing_file_is_none(self, tmp_path: Path) -> None:
+        assert content_digest(tmp_path / "missing.py") is None
+
+    def test_directory_hashes_files_with_suffix(self, tmp_path: Path) -> None:
+        (tmp_path / "a.go").write_text("package a\n")
+        first = content_digest(tmp_path, ".go")
+        (tmp_path / "notes.txt").write_text("ignored")
+        unchanged = content_digest(tmp_path, ".go")
+        (tmp_path / "b.go").write_text("package a\n")
+
+        assert unchanged == first
+        assert content_digest(tmp_path, ".go") != first
+
+
+class TestConfigStamp:
+    def test_finds_config_up_to_project_root(self, tmp_path: Path) -> None:
+        project = tmp_path / "project"
+        (project / ".git").mkdir(parents=True)
+        (project / "pyproject.toml").write_text("")
+        (tmp_path / "ruff.toml").write_text("")
+        source = project / "src" / "app.py"
+        source.parent.mkdir()
+        source.write_text("")
+
+        stamp = config_stamp(source)
+
+        assert [path for path, _ in stamp] == [str(project / "pyproject.toml")]
+
+    def test_cache_key_changes_with_config_mtime(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        config = tmp_path / "ruff.toml"
+        config.write_text("")
+        source = tmp_path / "app.py"
+        source.write_text("x = 1\n")
+        first = lint_cache_key("ruff check app.py", source)
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert lint_cache_key("ruff check app.py", source) != first
+
+
+class TestPyCompile:
+    def test_recognises_stock_command(self) -> None:
+        assert is_py_compile([sys.executable, "-m", "py_compile", "app.py"])
+        assert is_py_compile(["python3", "-m", "py_compile", "app.py"])
+        assert not is_py_compile(["ruff", "check", "app.py"])
+        assert not is_py_compile([sys.executable, "-m", "py_compile", "-q", "app.py"])
+
+    def test_valid_source(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.py"
+        path.write_text("x = 1\n")
+
+        assert compile_python(str(path)) is None
+
+    def test_syntax_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.py"
+        path.write_text("def broken(:\n")
+
+        error = compile_python(str(path))
+
+        assert error is not None
+        assert "SyntaxError" in error
+        assert "app.py" in error
+
+
+def _deny() -> HookResult:
+    return HookResult(decision=Decision.DENY, reason="lint failed")
+
+
+class TestLintService:
+    def test_caches_verdicts(self) -> None:
+        service = LintService()
+        calls: list[str] = []
+
+        async def job() -> HookResult | None:
+            calls.append("run")
+            return _deny()
+
+        async def lint_twice() -> list[HookResult | None]:
+            return [await service.run("key", job), await service.run("key", job)]
+
+        first, second = asyncio.run(lint_twice())
+
+        assert calls == ["run"]
+        assert second is not None and second.reason == "lint failed"
+        assert second is not first
+        assert service.stats() == {"cached": 1, "hits": 1, "misses": 1, "coalesced": 0}
+
+    def test_advisory_results_not_cached(self) -> None:
+        service = LintService()
+        calls: list[str] = []
+
+        async def job() -> HookResult | None:
+            calls.append("run")
+            return HookResult(decision=Decision.ALLOW, reason="Lint check timed out")
+
+        async def lint_twice() -> None:
+            await service.run("key", job)
+            await service.run("key", job)
+
+        asyncio.run(lint_twice())
+
+        assert calls == ["run", "run"]
+
+    def test_identical_runs_in_flight_are_shared(self) -> None:
+        service = LintService()
+        calls: list[str] = []
+
+        async def job() -> HookResult | None:
+            calls.append("run")
+            await asyncio.sleep(0.01)
+            return None
+
+        async def lint_concurrently() -> list[HookResult | None]:
+            return list(await asyncio.gather(*(service.run("key", job) for _ in range(3))))
+
+        assert asyncio.run(lint_concurrently()) == [None, None, None]
+        assert calls == ["run"]
+        assert service.stats()["coalesced"] == 2
+
+    def test_no_key_always_runs(self) -> None:
+        service = LintService()
+        calls: list[str] = []
+
+        async def job() -> HookResult | None:
+            calls.append("run")
+            return None
+
+        async def lint_twice() -> None:
+            await service.run(None, job)
+            await service.run(None, job)
+
+        asyncio.run(lint_twice())
+
+        assert calls == ["run", "run"]
+        assert service.stats()["cached"] == 0
+
+    def test_failed_run_is_not_cached(self) -> None:
+        service = LintService()
+
+        async def job() -> HookResult | None:
+            raise RuntimeError("linter crashed")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(service.run("key", job))
+
+        assert service.stats()["cached"] == 0
+
+    def test_not_cached_when_content_changed_during_run(self) -> None:
+        service = LintService()
+
+        async def job() -> HookResult | None:
+            return None
+
+        asyncio.run(service.run("key", job, revalidate=lambda: "changed-key"))
+
+        assert service.stats()["cached"] == 0
@@ -0,0 +1,44 @@
+"""Tests for latency statistics utilities."""
+
+import pytest
+
+from claude_code_hooks_daemon.utils.latency import percentile, summarise_latencies
+
+
+class TestPercentile:
+    """Tests for percentile()."""
+
+    def test_empty_sample_returns_zero(self) -> None:
+        assert percentile([], 50) == 0.0
+
+    def test_single_value(self) -> None:
+        assert percentile([4.2], 99) == 4.2
+
+    def test_interpolates_between_ranks(self) -> None:
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+
+    @pytest.mark.parametrize("pct", [-1, 101])
+    def test_out_of_range_raises(self, pct: float) -> None:
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            percentile([1.0], pct)
+
+
+class TestSummariseLatencies:
+    """Tests for summarise_latencies()."""
+
+    def test_empty_sample(self) -> None:
+        summary = summarise_latencies([])
+        assert summary["count"] == 0
+        assert summary["p99_ms"] == 0.0
+
+    def test_summary_fields(self) -> None:
+        summary = summarise_latencies([float(v) for v in range(1, 101)])
+        assert summary["count"] == 100
+        assert summary["min_ms"] == 1.0
+        assert summary["max_ms"] == 100.0
+        assert summary["mean_ms"] == 50.5
+        assert summary["p50_ms"] == pytest.approx(50.5)
+        assert summary["p95_ms"] == pytest.approx(95.05)